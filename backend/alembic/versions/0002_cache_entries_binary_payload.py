@@ -0,0 +1,33 @@
+"""Add binary payload columns to cache_entries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+
+Cache values are stored as compact codec-encoded payloads (msgpack/Arrow,
+optionally compressed) in data_blob, tagged by data_format. Rows with a NULL
+data_format keep using the JSONB data column.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("cache_entries", sa.Column("data_format", sa.Text(), nullable=True))
+    op.add_column("cache_entries", sa.Column("data_blob", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Binary rows cannot be represented in the JSONB column
+    op.execute("DELETE FROM cache_entries WHERE data_format IS NOT NULL")
+    op.drop_column("cache_entries", "data_blob")
+    op.drop_column("cache_entries", "data_format")
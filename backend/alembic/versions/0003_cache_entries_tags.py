@@ -0,0 +1,40 @@
+"""Add dependency tags to cache_entries
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+
+Cache entries carry the tags they depend on (e.g. "gene:123", "source:gnomad",
+"view:gene_scores"). A GIN index on the array backs tag-based invalidation, so a
+data update evicts only the entries that depend on it instead of whole namespaces.
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "cache_entries",
+        sa.Column(
+            "tags",
+            postgresql.ARRAY(sa.Text()),
+            server_default=sa.text("'{}'::text[]"),
+            nullable=False,
+        ),
+    )
+    op.create_index("idx_cache_entries_tags", "cache_entries", ["tags"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_cache_entries_tags", table_name="cache_entries")
+    op.drop_column("cache_entries", "tags")
@@ -0,0 +1,44 @@
+"""Add data_versions registry table
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+
+One row per tracked table or view with a monotonically increasing version.
+Writers bump it after committing; caches and HTTP ETags include it in their keys.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "data_versions",
+        sa.Column("name", sa.Text(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO data_versions (name, version)
+        VALUES ('genes', 1), ('gene_evidence', 1), ('gene_annotations', 1), ('gene_scores', 1)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("data_versions")
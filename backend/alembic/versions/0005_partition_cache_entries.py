@@ -0,0 +1,246 @@
+"""Partition cache_entries by namespace
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+cache_entries becomes a LIST-partitioned table keyed on namespace, with one
+partition per long-lived namespace and a DEFAULT partition for the rest.
+Clearing a namespace truncates its partition and expired-entry cleanup
+reclaims whole partitions instead of DELETEing across the table, so the
+table no longer bloats and cleanup no longer competes with the API for I/O.
+
+The primary key and the unique cache-key constraint must include the
+partition key, so they become (namespace, id) and (namespace, cache_key).
+cache_stats is rebuilt on partition-level catalog statistics.
+"""
+
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# Namespaces with a dedicated partition; anything else lands in cache_entries_default
+PARTITIONED_NAMESPACES = [
+    "annotations",
+    "clingen",
+    "clinvar",
+    "descartes",
+    "ensembl",
+    "files",
+    "gencc",
+    "gnomad",
+    "gtex",
+    "hgnc",
+    "hpo",
+    "http",
+    "mpo_mgi",
+    "network_analysis",
+    "panelapp",
+    "pubtator",
+    "string_ppi",
+    "uniprot",
+]
+
+_OLD_INDEXES = [
+    "idx_cache_entries_expires_at",
+    "idx_cache_entries_last_accessed",
+    "idx_cache_entries_namespace",
+    "idx_cache_entries_namespace_key",
+    "idx_cache_entries_tags",
+    "ix_cache_entries_id",
+]
+
+_COLUMNS = (
+    "id, cache_key, namespace, data, data_format, data_blob, created_at, expires_at, "
+    "last_accessed, access_count, data_size, metadata, tags"
+)
+
+_COLUMN_DEFINITIONS = """
+    id BIGINT NOT NULL DEFAULT nextval('cache_entries_id_seq'),
+    cache_key TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    data JSONB NOT NULL,
+    data_format TEXT,
+    data_blob BYTEA,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ,
+    last_accessed TIMESTAMPTZ NOT NULL DEFAULT now(),
+    access_count INTEGER NOT NULL DEFAULT 1,
+    data_size INTEGER,
+    metadata JSONB NOT NULL DEFAULT '{}',
+    tags TEXT[] NOT NULL DEFAULT '{}'
+"""
+
+# Partitions are emptied by TRUNCATE; only the chunked DELETE path leaves dead rows,
+# so vacuum partitions early rather than waiting for 20% of the rows to be dead.
+_PARTITION_STORAGE = (
+    "WITH (autovacuum_vacuum_scale_factor = 0.02, autovacuum_analyze_scale_factor = 0.02)"
+)
+
+_CACHE_PARTITIONS_VIEW = r"""
+    CREATE VIEW cache_partitions AS
+    SELECT c.relname::text AS partition_name,
+        (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'IN \(''(.+)''\)'))[1]
+            AS namespace,
+        pg_get_expr(c.relpartbound, c.oid) = 'DEFAULT' AS is_default
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'cache_entries'::regclass
+"""
+
+_CACHE_STATS_VIEW = """
+    CREATE VIEW cache_stats AS
+    SELECT p.namespace,
+        p.partition_name,
+        s.n_live_tup AS total_entries,
+        s.n_dead_tup AS dead_entries,
+        pg_total_relation_size(s.relid) AS total_size_bytes,
+        NULL::bigint AS total_accesses,
+        NULL::numeric AS avg_accesses,
+        greatest(s.n_live_tup - e.expired_entries, 0) AS active_entries,
+        e.expired_entries,
+        e.last_access_time,
+        NULL::timestamptz AS oldest_entry,
+        NULL::timestamptz AS newest_entry,
+        greatest(s.last_vacuum, s.last_autovacuum) AS last_vacuum
+    FROM cache_partitions p
+    JOIN pg_stat_user_tables s
+        ON s.relname = p.partition_name AND s.schemaname = current_schema()
+    CROSS JOIN LATERAL (
+        SELECT
+            (SELECT count(*) FROM cache_entries ce
+                WHERE ce.namespace = p.namespace AND ce.expires_at <= now())
+                AS expired_entries,
+            (SELECT max(ce.last_accessed) FROM cache_entries ce
+                WHERE ce.namespace = p.namespace) AS last_access_time
+    ) e
+    WHERE NOT p.is_default
+    UNION ALL
+    SELECT d.namespace,
+        'cache_entries_default'::text AS partition_name,
+        count(*) AS total_entries,
+        NULL::bigint AS dead_entries,
+        sum(COALESCE(d.data_size, pg_column_size(d.data))) AS total_size_bytes,
+        sum(d.access_count) AS total_accesses,
+        avg(d.access_count) AS avg_accesses,
+        count(*) FILTER (WHERE d.expires_at IS NULL OR d.expires_at > now())
+            AS active_entries,
+        count(*) FILTER (WHERE d.expires_at <= now()) AS expired_entries,
+        max(d.last_accessed) AS last_access_time,
+        min(d.created_at) AS oldest_entry,
+        max(d.created_at) AS newest_entry,
+        NULL::timestamptz AS last_vacuum
+    FROM cache_entries_default d
+    GROUP BY d.namespace
+"""
+
+_LEGACY_CACHE_STATS_VIEW = """
+    CREATE VIEW cache_stats AS
+    SELECT cache_entries.namespace,
+        count(*) AS total_entries,
+        sum(COALESCE(cache_entries.data_size, pg_column_size(cache_entries.data)))
+            AS total_size_bytes,
+        sum(cache_entries.access_count) AS total_accesses,
+        avg(cache_entries.access_count) AS avg_accesses,
+        count(*) FILTER (WHERE cache_entries.expires_at IS NULL
+            OR cache_entries.expires_at > now()) AS active_entries,
+        count(*) FILTER (WHERE cache_entries.expires_at IS NOT NULL
+            AND cache_entries.expires_at <= now()) AS expired_entries,
+        max(cache_entries.last_accessed) AS last_access_time,
+        min(cache_entries.created_at) AS oldest_entry,
+        max(cache_entries.created_at) AS newest_entry
+    FROM cache_entries
+    GROUP BY cache_entries.namespace
+"""
+
+
+def _create_indexes() -> None:
+    op.execute(
+        "CREATE INDEX idx_cache_entries_expires_at ON cache_entries (expires_at) "
+        "WHERE expires_at IS NOT NULL"
+    )
+    op.execute("CREATE INDEX idx_cache_entries_last_accessed ON cache_entries (last_accessed)")
+    op.execute("CREATE INDEX idx_cache_entries_tags ON cache_entries USING gin (tags)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP VIEW IF EXISTS cache_stats")
+    op.execute("ALTER TABLE cache_entries RENAME TO cache_entries_unpartitioned")
+    op.execute(
+        "ALTER TABLE cache_entries_unpartitioned "
+        "RENAME CONSTRAINT cache_entries_pkey TO cache_entries_unpartitioned_pkey"
+    )
+    for index_name in _OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER SEQUENCE cache_entries_id_seq OWNED BY NONE")
+
+    op.execute(
+        f"""
+        CREATE TABLE cache_entries (
+            {_COLUMN_DEFINITIONS},
+            CONSTRAINT cache_entries_pkey PRIMARY KEY (namespace, id),
+            CONSTRAINT uq_cache_entries_namespace_key UNIQUE (namespace, cache_key)
+        ) PARTITION BY LIST (namespace)
+        """
+    )
+    for namespace in PARTITIONED_NAMESPACES:
+        op.execute(
+            f"CREATE TABLE cache_entries_{namespace} PARTITION OF cache_entries "
+            f"FOR VALUES IN ('{namespace}') {_PARTITION_STORAGE}"
+        )
+    op.execute(
+        f"CREATE TABLE cache_entries_default PARTITION OF cache_entries DEFAULT "
+        f"{_PARTITION_STORAGE}"
+    )
+    _create_indexes()
+
+    op.execute(
+        f"INSERT INTO cache_entries ({_COLUMNS}) SELECT {_COLUMNS} FROM cache_entries_unpartitioned"
+    )
+    op.execute("DROP TABLE cache_entries_unpartitioned")
+    op.execute("ALTER SEQUENCE cache_entries_id_seq OWNED BY cache_entries.id")
+
+    op.execute(_CACHE_PARTITIONS_VIEW)
+    op.execute(_CACHE_STATS_VIEW)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP VIEW IF EXISTS cache_stats")
+    op.execute("DROP VIEW IF EXISTS cache_partitions")
+    op.execute("ALTER TABLE cache_entries RENAME TO cache_entries_partitioned")
+    op.execute(
+        "ALTER TABLE cache_entries_partitioned "
+        "RENAME CONSTRAINT cache_entries_pkey TO cache_entries_partitioned_pkey"
+    )
+    for index_name in _OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER SEQUENCE cache_entries_id_seq OWNED BY NONE")
+
+    op.execute(
+        f"""
+        CREATE TABLE cache_entries (
+            {_COLUMN_DEFINITIONS},
+            CONSTRAINT cache_entries_pkey PRIMARY KEY (id),
+            CONSTRAINT uq_cache_entries_cache_key UNIQUE (cache_key)
+        )
+        """
+    )
+    _create_indexes()
+    op.execute("CREATE INDEX idx_cache_entries_namespace ON cache_entries (namespace)")
+    op.execute(
+        "CREATE INDEX idx_cache_entries_namespace_key ON cache_entries (namespace, cache_key)"
+    )
+    op.execute("CREATE INDEX ix_cache_entries_id ON cache_entries (id)")
+
+    op.execute(
+        f"INSERT INTO cache_entries ({_COLUMNS}) SELECT {_COLUMNS} FROM cache_entries_partitioned"
+    )
+    op.execute("DROP TABLE cache_entries_partitioned")
+    op.execute("ALTER SEQUENCE cache_entries_id_seq OWNED BY cache_entries.id")
+
+    op.execute(_LEGACY_CACHE_STATS_VIEW)
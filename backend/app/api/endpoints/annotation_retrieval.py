@@ -35,7 +35,7 @@ async def get_gene_annotations(
     Returns:
         Dictionary with annotations grouped by source
     """
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import annotation_tags, get_cache_service
 
     # Check cache first
     cache_service = get_cache_service(db)
@@ -83,7 +83,11 @@ async def get_gene_annotations(
     from app.core.constants import CACHE_TTL_LONG
 
     await cache_service.set(
-        key=cache_key, value=result, namespace="annotations", ttl=CACHE_TTL_LONG
+        key=cache_key,
+        value=result,
+        namespace="annotations",
+        ttl=CACHE_TTL_LONG,
+        tags=annotation_tags(gene_id, source),
     )
 
     return result
@@ -103,7 +107,7 @@ async def get_gene_annotation_summary(
     Returns:
         Summary of key annotation fields
     """
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     # Check cache first
     cache_service = get_cache_service(db)
@@ -169,7 +173,11 @@ async def get_gene_annotation_summary(
     from app.core.constants import CACHE_TTL_EXTENDED
 
     await cache_service.set(
-        key=cache_key, value=summary, namespace="annotations", ttl=CACHE_TTL_EXTENDED
+        key=cache_key,
+        value=summary,
+        namespace="annotations",
+        ttl=CACHE_TTL_EXTENDED,
+        tags=[gene_tag(gene_id)],
     )
 
     return summary
@@ -99,7 +99,7 @@ async def update_gene_annotations(
 
 async def _update_single_source(gene_id: int, source_name: str, source_class: type) -> None:
     """Update a single annotation source for a gene."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
     from app.core.database import SessionLocal
 
     db = SessionLocal()
@@ -118,7 +118,7 @@ async def _update_single_source(gene_id: int, source_name: str, source_class: ty
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene_id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(gene_id)])
 
             await logger.info(
                 f"{source_name} annotation updated for gene",
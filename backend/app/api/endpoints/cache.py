@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
+from app.core.cache_bus import cache_bus
 from app.core.cache_service import get_cache_service
 from app.core.cached_http_client import get_cached_http_client
 from app.core.config import settings
@@ -46,6 +47,15 @@ class CacheStatsResponse(BaseModel):
     hit_rate: float = Field(ge=0.0, le=1.0, description="Cache hit rate")
     total_size_bytes: int = Field(ge=0, description="Total cache size in bytes")
     total_size_mb: float = Field(ge=0.0, description="Total cache size in MB")
+    memory_bytes: int = Field(default=0, ge=0, description="Bytes held in memory cache")
+    memory_max_bytes: int = Field(default=0, ge=0, description="Memory cache byte budget")
+    memory_evictions: int = Field(default=0, ge=0, description="Memory cache evictions")
+    memory_rejections: int = Field(
+        default=0, ge=0, description="Entries not admitted to memory cache"
+    )
+    memory_namespaces: dict[str, dict[str, int | None]] = Field(
+        default_factory=dict, description="Memory cache entries, bytes and quota per namespace"
+    )
 
 
 class NamespaceStatsResponse(BaseModel):
@@ -145,6 +155,11 @@ async def get_cache_stats(
             hit_rate=stats.get("hit_rate", 0.0),
             total_size_bytes=stats.get("total_size", 0),
             total_size_mb=total_size_mb,
+            memory_bytes=stats.get("memory_bytes", 0),
+            memory_max_bytes=stats.get("memory_max_bytes", 0),
+            memory_evictions=stats.get("memory_evictions", 0),
+            memory_rejections=stats.get("memory_rejections", 0),
+            memory_namespaces=stats.get("memory_namespaces", {}),
         )
 
     except Exception as e:
@@ -186,9 +201,10 @@ async def get_namespace_stats(
             total_entries=stats.get("total_entries", 0),
             active_entries=stats.get("active_entries", 0),
             expired_entries=stats.get("expired_entries", 0),
-            total_accesses=stats.get("total_accesses", 0),
-            avg_accesses=stats.get("avg_accesses", 0.0),
-            total_size_bytes=stats.get("total_size_bytes", 0),
+            # Access counters are only tracked for namespaces without a partition
+            total_accesses=stats.get("total_accesses") or 0,
+            avg_accesses=float(stats.get("avg_accesses") or 0.0),
+            total_size_bytes=stats.get("total_size_bytes") or 0,
             last_access_time=stats.get("last_access_time"),
             oldest_entry=stats.get("oldest_entry"),
             newest_entry=stats.get("newest_entry"),
@@ -237,7 +253,10 @@ async def get_cache_health(db: AsyncSession = Depends(get_db)) -> CacheHealthRes
             issues.append(f"Low cache hit rate: {hit_rate:.1%}")
 
         memory_entries = stats.get("memory_entries", 0)
-        if memory_entries >= settings.CACHE_MAX_MEMORY_SIZE * 0.9:  # 90% full
+        memory_max_bytes = stats.get("memory_max_bytes", 0)
+        if memory_entries >= settings.CACHE_MAX_MEMORY_SIZE * 0.9 or (
+            memory_max_bytes and stats.get("memory_bytes", 0) >= memory_max_bytes * 0.9
+        ):  # 90% full
             issues.append("Memory cache near capacity")
 
         # Determine overall status
@@ -443,6 +462,11 @@ async def get_cache_config() -> dict[str, Any]:
         "enabled": settings.CACHE_ENABLED,
         "default_ttl": settings.CACHE_DEFAULT_TTL,
         "max_memory_size": settings.CACHE_MAX_MEMORY_SIZE,
+        "max_memory_mb": settings.CACHE_MAX_MEMORY_MB,
+        "namespace_memory_quotas_mb": settings.CACHE_NAMESPACE_MEMORY_QUOTAS_MB,
+        "admission_enabled": settings.CACHE_ADMISSION_ENABLED,
+        "codec": settings.CACHE_CODEC,
+        "compression": settings.CACHE_COMPRESSION,
         "cleanup_interval": settings.CACHE_CLEANUP_INTERVAL,
         "namespace_ttls": {
             "hgnc": get_source_cache_ttl("HGNC"),
@@ -452,6 +476,9 @@ async def get_cache_config() -> dict[str, Any]:
             "hpo": get_source_cache_ttl("HPO"),
             "clingen": get_source_cache_ttl("ClinGen"),
         },
+        "namespace_soft_ttls": dict(get_cache_service().namespace_soft_ttls),
+        "invalidation_bus": cache_bus.get_stats(),
+        "write_behind": get_cache_service().write_behind.get_stats(),
         "http_cache": {
             "enabled": settings.HTTP_CACHE_ENABLED,
             "directory": settings.HTTP_CACHE_DIR,
@@ -488,6 +515,10 @@ async def get_prometheus_metrics(db: AsyncSession = Depends(get_db)) -> Response
         metrics.append("# TYPE cache_memory_entries gauge")
         metrics.append(f"cache_memory_entries {stats.get('memory_entries', 0)}")
 
+        metrics.append("# HELP cache_memory_bytes Current bytes held in memory cache")
+        metrics.append("# TYPE cache_memory_bytes gauge")
+        metrics.append(f"cache_memory_bytes {stats.get('memory_bytes', 0)}")
+
         metrics.append("# HELP cache_db_entries Current number of entries in database cache")
         metrics.append("# TYPE cache_db_entries gauge")
         metrics.append(f"cache_db_entries {stats.get('db_entries', 0)}")
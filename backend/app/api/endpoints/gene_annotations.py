@@ -58,7 +58,7 @@ async def get_gene_annotations(
     Returns:
         Dictionary with annotations grouped by source
     """
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import annotation_tags, get_cache_service
 
     # Check cache first
     cache_service = get_cache_service(db)
@@ -103,7 +103,13 @@ async def get_gene_annotations(
         )
 
     # Cache the result
-    await cache_service.set(key=cache_key, value=result, namespace="annotations", ttl=3600)
+    await cache_service.set(
+        key=cache_key,
+        value=result,
+        namespace="annotations",
+        ttl=3600,
+        tags=annotation_tags(gene_id, source),
+    )
 
     return result
 
@@ -122,7 +128,7 @@ async def get_gene_annotation_summary(
     Returns:
         Summary of key annotation fields
     """
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     # Check cache first
     cache_service = get_cache_service(db)
@@ -185,7 +191,9 @@ async def get_gene_annotation_summary(
     }
 
     # Cache the result
-    await cache_service.set(key=cache_key, value=summary, namespace="annotations", ttl=7200)
+    await cache_service.set(
+        key=cache_key, value=summary, namespace="annotations", ttl=7200, tags=[gene_tag(gene_id)]
+    )
 
     return summary
 
@@ -259,7 +267,7 @@ async def update_gene_annotations(
 
 async def _update_hgnc_annotation(gene: Gene, db: Session) -> None:
     """Background task to update HGNC annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = HGNCAnnotationSource(db)
@@ -268,7 +276,7 @@ async def _update_hgnc_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info("HGNC annotation updated for gene", gene_symbol=gene.approved_symbol)
         else:
@@ -283,7 +291,7 @@ async def _update_hgnc_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_gnomad_annotation(gene: Gene, db: Session) -> None:
     """Background task to update gnomAD annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = GnomADAnnotationSource(db)
@@ -292,7 +300,7 @@ async def _update_gnomad_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info(
                 "gnomAD annotation updated for gene", gene_symbol=gene.approved_symbol
@@ -309,7 +317,7 @@ async def _update_gnomad_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_gtex_annotation(gene: Gene, db: Session) -> None:
     """Background task to update GTEx annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = GTExAnnotationSource(db)
@@ -318,7 +326,7 @@ async def _update_gtex_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info("GTEx annotation updated for gene", gene_symbol=gene.approved_symbol)
         else:
@@ -333,7 +341,7 @@ async def _update_gtex_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_descartes_annotation(gene: Gene, db: Session) -> None:
     """Background task to update Descartes annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = DescartesAnnotationSource(db)
@@ -342,7 +350,7 @@ async def _update_descartes_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info(
                 "Descartes annotation updated for gene", gene_symbol=gene.approved_symbol
@@ -359,7 +367,7 @@ async def _update_descartes_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_hpo_annotation(gene: Gene, db: Session) -> None:
     """Background task to update HPO annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = HPOAnnotationSource(db)
@@ -368,7 +376,7 @@ async def _update_hpo_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info("HPO annotation updated for gene", gene_symbol=gene.approved_symbol)
         else:
@@ -383,7 +391,7 @@ async def _update_hpo_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_clinvar_annotation(gene: Gene, db: Session) -> None:
     """Background task to update ClinVar annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = ClinVarAnnotationSource(db)
@@ -393,7 +401,7 @@ async def _update_clinvar_annotation(gene: Gene, db: Session) -> None:
             # Transaction is already committed by store_annotation when not in batch mode
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info(
                 "ClinVar annotation updated for gene", gene_symbol=gene.approved_symbol
@@ -410,7 +418,7 @@ async def _update_clinvar_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_mpo_mgi_annotation(gene: Gene, db: Session) -> None:
     """Background task to update MPO/MGI annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = MPOMGIAnnotationSource(db)
@@ -419,7 +427,7 @@ async def _update_mpo_mgi_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info(
                 "MPO/MGI annotation updated for gene", gene_symbol=gene.approved_symbol
@@ -436,7 +444,7 @@ async def _update_mpo_mgi_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_string_ppi_annotation(gene: Gene, db: Session) -> None:
     """Background task to update STRING PPI annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = StringPPIAnnotationSource(db)
@@ -445,7 +453,7 @@ async def _update_string_ppi_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info(
                 "STRING PPI annotation updated for gene", gene_symbol=gene.approved_symbol
@@ -462,7 +470,7 @@ async def _update_string_ppi_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_ensembl_annotation(gene: Gene, db: Session) -> None:
     """Background task to update Ensembl annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = EnsemblAnnotationSource(db)
@@ -471,7 +479,7 @@ async def _update_ensembl_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info(
                 "Ensembl annotation updated for gene", gene_symbol=gene.approved_symbol
@@ -488,7 +496,7 @@ async def _update_ensembl_annotation(gene: Gene, db: Session) -> None:
 
 async def _update_uniprot_annotation(gene: Gene, db: Session) -> None:
     """Background task to update UniProt annotation."""
-    from app.core.cache_service import get_cache_service
+    from app.core.cache_service import gene_tag, get_cache_service
 
     try:
         source = UniProtAnnotationSource(db)
@@ -497,7 +505,7 @@ async def _update_uniprot_annotation(gene: Gene, db: Session) -> None:
         if success:
             # Invalidate cache for this gene
             cache_service = get_cache_service(db)
-            await cache_service.delete(f"{gene.id}:*", namespace="annotations")
+            await cache_service.invalidate_tags([gene_tag(int(gene.id))])
 
             await logger.info(
                 "UniProt annotation updated for gene", gene_symbol=gene.approved_symbol
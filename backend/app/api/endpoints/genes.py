@@ -3,7 +3,6 @@ Gene API endpoints - JSON:API compliant using reusable components
 """
 
 import time
-from functools import lru_cache
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query, Request, Response
@@ -12,7 +11,16 @@ from sqlalchemy.orm import Session
 from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import get_db
-from app.core.cache_service import get_cache_service
+from app.core.cache_service import get_cache_service, view_tag
+from app.core.config import settings
+from app.core.data_versions import (
+    GENE_EVIDENCE,
+    GENE_SCORES,
+    GENES,
+    bump_data_versions_async,
+    data_versions,
+    etag_matches,
+)
 from app.core.datasource_config import API_DEFAULTS_CONFIG
 from app.core.exceptions import GeneNotFoundError, ValidationError
 from app.core.jsonapi import (
@@ -39,7 +47,8 @@ logger = get_logger(__name__)
 # Cache constants for CacheService integration
 METADATA_CACHE_KEY = "filter_metadata"
 METADATA_CACHE_NAMESPACE = "genes_metadata"
-METADATA_CACHE_TTL = 300  # 5 minutes
+METADATA_CACHE_TTL = 3600  # 1 hour hard limit
+METADATA_CACHE_SOFT_TTL = 300  # Served stale and refreshed in background after 5 minutes
 
 HPO_CACHE_NAMESPACE = "hpo_classifications"
 HPO_CACHE_TTL = 3600  # 1 hour
@@ -47,6 +56,13 @@ HPO_CACHE_TTL = 3600  # 1 hour
 GENE_IDS_CACHE_NAMESPACE = "gene_ids"
 GENE_IDS_CACHE_TTL = 3600  # 1 hour
 
+# Keyed on the genes data version, so the TTL only bounds memory use
+GENE_COUNT_CACHE_NAMESPACE = "gene_count"
+GENE_COUNT_CACHE_TTL = 86400  # 24 hours
+
+# Tables the gene list response is computed from (ETag validators)
+GENE_LIST_DEPENDENCIES = (GENES, GENE_EVIDENCE, GENE_SCORES)
+
 # Note: Gene annotations endpoints are in annotation_retrieval, annotation_updates,
 # and percentile_management modules
 
@@ -54,13 +70,39 @@ GENE_IDS_CACHE_TTL = 3600  # 1 hour
 async def get_filter_metadata(db: Session) -> dict[str, Any]:
     """Get filter metadata with CacheService caching."""
     cache = get_cache_service(db)
-    cached: dict[str, Any] | None = await cache.get(
-        METADATA_CACHE_KEY, namespace=METADATA_CACHE_NAMESPACE
+    metadata: dict[str, Any] = await cache.get_or_set(
+        METADATA_CACHE_KEY,
+        lambda: _compute_filter_metadata(db),
+        namespace=METADATA_CACHE_NAMESPACE,
+        ttl=METADATA_CACHE_TTL,
+        tags=[view_tag("gene_scores")],
+    )
+    return metadata
+
+
+def _load_filter_metadata(_key: Any) -> dict[str, Any]:
+    """Background loader for stale-while-revalidate refreshes (own session)."""
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return _compute_filter_metadata(db)
+    finally:
+        db.close()
+
+
+def register_metadata_cache_loader() -> None:
+    """Serve filter metadata stale-while-revalidate instead of recomputing on expiry."""
+    get_cache_service().register_loader(
+        METADATA_CACHE_NAMESPACE,
+        _load_filter_metadata,
+        soft_ttl=METADATA_CACHE_SOFT_TTL,
+        ttl=METADATA_CACHE_TTL,
     )
-    if cached is not None:
-        return cached
 
-    # Fetch fresh data
+
+def _compute_filter_metadata(db: Session) -> dict[str, Any]:
+    """Compute filter metadata from gene_scores and gene_evidence."""
     max_count_result = db.execute(text("SELECT MAX(evidence_count) FROM gene_scores")).scalar()
     sources_result = db.execute(
         text("SELECT DISTINCT source_name FROM gene_evidence ORDER BY source_name")
@@ -91,20 +133,12 @@ async def get_filter_metadata(db: Session) -> dict[str, Any]:
     tier_meta["well_supported"]["total"] = sum(tier_meta["well_supported"].values())
     tier_meta["emerging_evidence"]["total"] = sum(tier_meta["emerging_evidence"].values())
 
-    metadata = {
+    return {
         "max_count": max_count_result or 0,
         "sources": [row[0] for row in sources_result],
         "tier_distribution": tier_meta,
     }
 
-    await cache.set(
-        METADATA_CACHE_KEY,
-        metadata,
-        namespace=METADATA_CACHE_NAMESPACE,
-        ttl=METADATA_CACHE_TTL,
-    )
-    return metadata
-
 
 async def invalidate_metadata_cache(db: Session) -> None:
     """Invalidate metadata cache via CacheService."""
@@ -134,28 +168,28 @@ def clear_gene_ids_cache_sync() -> None:
     logger.sync_info("Gene IDs cache cleared (sync)")
 
 
-@lru_cache(maxsize=1)
-def get_total_gene_count(db_session_id: int) -> int:
+async def get_total_gene_count(db: Session) -> int:
     """
     Get total gene count with caching.
 
-    Count changes rarely (only when genes added). Uses session ID to
-    invalidate cache on new sessions. FastAPI recommended pattern.
+    The cache key includes the genes data version, so the count is served
+    from cache until genes are added or removed and recomputed right after.
 
     Args:
-        db_session_id: Database session ID (use id(db) to get unique ID)
+        db: Database session
 
     Returns:
         int: Total number of genes in database
     """
-    from app.core.database import SessionLocal
-
-    db = SessionLocal()
-    try:
-        result = db.execute(text("SELECT COUNT(*) FROM genes")).scalar()
-        return result or 0
-    finally:
-        db.close()
+    cache = get_cache_service(db)
+    count: int = await cache.get_or_set(
+        "total",
+        lambda: db.execute(text("SELECT COUNT(*) FROM genes")).scalar() or 0,
+        namespace=GENE_COUNT_CACHE_NAMESPACE,
+        ttl=GENE_COUNT_CACHE_TTL,
+        depends_on=[GENES],
+    )
+    return count
 
 
 def log_slow_query(
@@ -262,7 +296,7 @@ async def get_genes(
     ),
     # JSON:API sorting
     sort: str | None = Depends(get_sort_param("-evidence_score,approved_symbol")),
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     """
     Get genes with JSON:API compliant response using reusable components.
 
@@ -274,7 +308,17 @@ async def get_genes(
     NEW: filter[ids] - Filter by comma-separated gene IDs for URL state restoration.
               Used when users share network analysis URLs with specific gene sets.
               Example: /api/genes?filter[ids]=1,2,3,4,5&page[size]=100
+
+    Responses carry an ETag derived from the data versions of the underlying
+    tables; a matching If-None-Match is answered with 304 Not Modified.
     """
+    etag = await data_versions.etag_async(
+        GENE_LIST_DEPENDENCIES, settings.APP_VERSION, request.url.path, request.url.query
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     # IMPORTANT: Do NOT cache filter[ids] queries because:
     # 1. They are paginated requests (page 1, 2, 3, etc.)
     # 2. Cache key doesn't include page number, causing all pages to return same cached result
@@ -536,8 +580,8 @@ async def get_genes(
 
     # Add zero-score filtering metadata
     if hide_zero_scores:
-        # Use cached total gene count (session ID invalidates cache on new sessions)
-        total_all_genes = get_total_gene_count(id(db))
+        # Cached total gene count (recomputed when the genes data version changes)
+        total_all_genes = await get_total_gene_count(db)
         response["meta"]["total_genes"] = total_all_genes
         response["meta"]["hidden_zero_scores"] = total_all_genes - total
     else:
@@ -799,6 +843,7 @@ async def create_gene(
 
     # Create gene
     gene = gene_crud.create(db, gene_in)
+    await bump_data_versions_async(GENES)
 
     # Format as JSON:API
     return {
@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, File, Form, UploadFile
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.data_versions import GENE_EVIDENCE, GENES, bump_data_versions_async
 from app.core.database import get_db
 from app.core.dependencies import require_curator
 from app.core.exceptions import DataSourceError, ValidationError
@@ -299,6 +300,7 @@ async def upload_evidence_file(
         await logger.info("Evidence storage complete", stats=evidence_stats)
 
         db.commit()
+        await bump_data_versions_async(GENES, GENE_EVIDENCE)
 
         await logger.info("Database committed")
 
@@ -487,6 +489,7 @@ async def delete_by_identifier(
         stats = await manager.delete_by_identifier(identifier, current_user.username)
 
         db.commit()
+        await bump_data_versions_async(GENE_EVIDENCE)
 
         await logger.info(
             "Deletion complete", source=source_name, identifier=identifier, stats=stats
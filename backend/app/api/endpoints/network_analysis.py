@@ -2,7 +2,11 @@
 Network Analysis API endpoints - PPI networks and functional enrichment
 """
 
+import hashlib
+import inspect
+import json
 import time
+from collections.abc import Callable
 from typing import Any
 
 import igraph as ig
@@ -37,6 +41,18 @@ network_service = NetworkAnalysisService()
 enrichment_service = EnrichmentService()
 
 
+def network_cache_key(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+    """Cache key of a graph endpoint: the request body and the STRING edge source.
+
+    Graphs built from the STRING edge store and from the stored annotations
+    differ, so their responses must not share cache entries.
+    """
+    body = inspect.signature(func).bind(*args, **kwargs).arguments["body"]
+    body_json = json.dumps(body.model_dump(), sort_keys=True, default=str)
+    raw_key = f"{func.__name__}:{body_json}:{network_service.string_edge_source()}"
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
 def igraph_to_cytoscape(
     graph: ig.Graph, gene_id_to_symbol: dict[int, str], cluster_colors: dict[int, str] | None = None
 ) -> dict[str, Any]:
@@ -140,7 +156,7 @@ def generate_cluster_colors(num_clusters: int) -> dict[int, str]:
 
 @router.post("/build", response_model=NetworkBuildResponse)
 @limiter.limit(LIMIT_NETWORK)
-@cache(namespace="network_analysis", ttl=3600)
+@cache(namespace="network_analysis", ttl=3600, key_builder=network_cache_key)
 async def build_network(
     request: Request,
     response: Response,
@@ -228,7 +244,7 @@ async def build_network(
 
 @router.post("/cluster", response_model=NetworkClusterResponse)
 @limiter.limit(LIMIT_NETWORK)
-@cache(namespace="network_analysis", ttl=3600)
+@cache(namespace="network_analysis", ttl=3600, key_builder=network_cache_key)
 async def cluster_network(
     request: Request,
     response: Response,
@@ -361,7 +377,7 @@ async def cluster_network(
 
 @router.post("/subgraph", response_model=NetworkBuildResponse)
 @limiter.limit(LIMIT_NETWORK)
-@cache(namespace="network_analysis", ttl=3600)
+@cache(namespace="network_analysis", ttl=3600, key_builder=network_cache_key)
 async def extract_subgraph(
     request: Request,
     response: Response,
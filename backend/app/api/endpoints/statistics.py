@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import get_db
+from app.core.cache_service import get_cache_service, view_tag
 from app.core.database import SessionLocal
 from app.core.exceptions import ValidationError
 from app.core.rate_limit import LIMIT_STATISTICS, limiter
@@ -20,6 +21,12 @@ from app.crud.statistics import statistics_crud
 
 router = APIRouter()
 
+# Dashboard summary; "api:statistics" is cleared when the statistics views change
+SUMMARY_CACHE_KEY = "summary"
+SUMMARY_CACHE_NAMESPACE = "api:statistics"
+SUMMARY_CACHE_TTL = 3600  # 1 hour hard limit
+SUMMARY_CACHE_SOFT_TTL = 300  # Served stale and refreshed in background after 5 minutes
+
 
 @router.get("/source-overlaps")
 @limiter.limit(LIMIT_STATISTICS)
@@ -263,6 +270,78 @@ async def get_evidence_composition(
         ) from e
 
 
+async def _compute_statistics_summary() -> dict[str, Any]:
+    """Compute the dashboard summary (opens its own sessions)."""
+
+    # Run all three heavy queries in parallel with separate sessions
+    def _get_overlaps() -> dict[str, Any]:
+        with SessionLocal() as s:
+            return statistics_crud.get_source_overlaps(s)
+
+    def _get_composition() -> dict[str, Any]:
+        with SessionLocal() as s:
+            return statistics_crud.get_evidence_composition(s)
+
+    def _get_distributions() -> dict[str, Any]:
+        with SessionLocal() as s:
+            return statistics_crud.get_source_distributions(s)
+
+    def _get_pairwise_overlaps() -> list[dict[str, Any]]:
+        with SessionLocal() as s:
+            return statistics_crud.get_pairwise_overlaps_from_view(s)
+
+    overlap_data, composition_data, distribution_data, pairwise_overlaps = await asyncio.gather(
+        run_in_threadpool(_get_overlaps),
+        run_in_threadpool(_get_composition),
+        run_in_threadpool(_get_distributions),
+        run_in_threadpool(_get_pairwise_overlaps),
+    )
+
+    # Extract key summary metrics
+    return {
+        "overview": {
+            "total_genes": overlap_data["total_unique_genes"],
+            "active_sources": len(overlap_data["sets"]),
+            "total_intersections": len(overlap_data["intersections"]),
+            "genes_in_all_sources": overlap_data["overlap_statistics"]["genes_in_all_sources"],
+        },
+        "quality": {
+            "avg_sources_per_gene": composition_data["summary_statistics"]["avg_sources_per_gene"],
+            "total_evidence_records": composition_data["summary_statistics"][
+                "total_evidence_records"
+            ],
+            "high_confidence_genes": sum(
+                item["gene_count"]
+                for item in composition_data["evidence_quality_distribution"]
+                if item.get("tier_label", "").startswith("Comprehensive")
+                or item.get("tier_label", "").startswith("Multi-Source")
+            ),
+        },
+        "coverage": {
+            "single_source_genes": overlap_data["overlap_statistics"]["single_source_combinations"],
+            "multi_source_genes": overlap_data["total_unique_genes"]
+            - overlap_data["overlap_statistics"]["single_source_combinations"],
+            "source_distribution_variety": len(distribution_data),
+        },
+        "pairwise_overlaps": pairwise_overlaps,
+    }
+
+
+async def _load_statistics_summary(_key: Any) -> dict[str, Any]:
+    """Background loader for stale-while-revalidate refreshes."""
+    return await _compute_statistics_summary()
+
+
+def register_statistics_cache_loader() -> None:
+    """Serve the statistics summary stale-while-revalidate instead of recomputing on expiry."""
+    get_cache_service().register_loader(
+        SUMMARY_CACHE_NAMESPACE,
+        _load_statistics_summary,
+        soft_ttl=SUMMARY_CACHE_SOFT_TTL,
+        ttl=SUMMARY_CACHE_TTL,
+    )
+
+
 @router.get("/summary")
 @limiter.limit(LIMIT_STATISTICS)
 async def get_statistics_summary(
@@ -277,63 +356,14 @@ async def get_statistics_summary(
     start_time = time.time()
 
     try:
-        # Run all three heavy queries in parallel with separate sessions
-        def _get_overlaps() -> dict[str, Any]:
-            with SessionLocal() as s:
-                return statistics_crud.get_source_overlaps(s)
-
-        def _get_composition() -> dict[str, Any]:
-            with SessionLocal() as s:
-                return statistics_crud.get_evidence_composition(s)
-
-        def _get_distributions() -> dict[str, Any]:
-            with SessionLocal() as s:
-                return statistics_crud.get_source_distributions(s)
-
-        def _get_pairwise_overlaps() -> list[dict[str, Any]]:
-            with SessionLocal() as s:
-                return statistics_crud.get_pairwise_overlaps_from_view(s)
-
-        overlap_data, composition_data, distribution_data, pairwise_overlaps = await asyncio.gather(
-            run_in_threadpool(_get_overlaps),
-            run_in_threadpool(_get_composition),
-            run_in_threadpool(_get_distributions),
-            run_in_threadpool(_get_pairwise_overlaps),
+        summary: dict[str, Any] = await get_cache_service(db).get_or_set(
+            SUMMARY_CACHE_KEY,
+            _compute_statistics_summary,
+            namespace=SUMMARY_CACHE_NAMESPACE,
+            ttl=SUMMARY_CACHE_TTL,
+            tags=[view_tag("gene_scores")],
         )
 
-        # Extract key summary metrics
-        summary = {
-            "overview": {
-                "total_genes": overlap_data["total_unique_genes"],
-                "active_sources": len(overlap_data["sets"]),
-                "total_intersections": len(overlap_data["intersections"]),
-                "genes_in_all_sources": overlap_data["overlap_statistics"]["genes_in_all_sources"],
-            },
-            "quality": {
-                "avg_sources_per_gene": composition_data["summary_statistics"][
-                    "avg_sources_per_gene"
-                ],
-                "total_evidence_records": composition_data["summary_statistics"][
-                    "total_evidence_records"
-                ],
-                "high_confidence_genes": sum(
-                    item["gene_count"]
-                    for item in composition_data["evidence_quality_distribution"]
-                    if item.get("tier_label", "").startswith("Comprehensive")
-                    or item.get("tier_label", "").startswith("Multi-Source")
-                ),
-            },
-            "coverage": {
-                "single_source_genes": overlap_data["overlap_statistics"][
-                    "single_source_combinations"
-                ],
-                "multi_source_genes": overlap_data["total_unique_genes"]
-                - overlap_data["overlap_statistics"]["single_source_combinations"],
-                "source_distribution_variety": len(distribution_data),
-            },
-            "pairwise_overlaps": pairwise_overlaps,
-        }
-
         query_duration_ms = round((time.time() - start_time) * 1000, 2)
 
         return ResponseBuilder.build_success_response(
@@ -55,6 +55,20 @@ async def startup(ctx: dict[str, Any]) -> None:
         conn.execute(text("SELECT 1"))
 
     ctx["db_initialized"] = True
+
+    # Keep this worker's L1 cache coherent with the API workers
+    from app.core.cache_bus import cache_bus
+
+    await cache_bus.start()
+
+    from app.core.startup import start_cache_write_behind
+
+    await start_cache_write_behind()
+
+    # One connection pool per external host, shared by all sources of this worker
+    from app.core.http_pool import get_shared_http_pool
+
+    get_shared_http_pool()
     logger.sync_info("ARQ Worker startup complete - database connection verified")
 
 
@@ -71,6 +85,16 @@ async def shutdown(ctx: dict[str, Any]) -> None:
 
     await close_arq_pool()
 
+    from app.core.cache_bus import cache_bus
+    from app.core.startup import flush_cache_write_behind
+
+    await flush_cache_write_behind()
+    await cache_bus.stop()
+
+    from app.core.http_pool import close_shared_http_pool
+
+    await close_shared_http_pool()
+
     logger.sync_info("ARQ Worker shutdown complete")
 
 
@@ -0,0 +1,351 @@
+"""
+Cross-process L1 cache coherence via PostgreSQL LISTEN/NOTIFY.
+
+Every uvicorn and ARQ worker keeps its own in-memory (L1) cache in front of the
+shared database (L2) cache. Without coordination, a delete or namespace clear in
+one process leaves stale copies in the L1 caches of all other processes until
+their TTL expires.
+
+The invalidation bus publishes each invalidation on a NOTIFY channel and every
+process applies the invalidations it receives to its own L1:
+- ``keys``: drop specific cache keys (set/delete of individual entries)
+- ``tags``: drop entries carrying any of the tags (data-dependency invalidation)
+- ``namespace``: drop all entries of a namespace
+- ``all``: drop the whole L1
+- ``data_versions``: reload the data-version snapshot (see data_versions)
+
+Key invalidations are coalesced for a short window so bulk writes produce a few
+notifications instead of one per key. Messages carry the origin process id and
+are ignored by the process that sent them.
+
+If the listener connection is lost, notifications may have been missed, so the
+process clears its whole L1 after reconnecting.
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+from typing import Any
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHANNEL = "cache_invalidation"
+
+# NOTIFY payloads are limited to 8000 bytes; stay well below
+MAX_PAYLOAD_BYTES = 7000
+
+
+class CacheInvalidationBus:
+    """
+    Publishes and receives L1 cache invalidations between processes.
+
+    Args:
+        channel: NOTIFY channel name
+        flush_delay: Seconds to coalesce key invalidations before publishing
+        health_check_interval: Seconds between listener connection checks
+    """
+
+    def __init__(
+        self,
+        channel: str = CHANNEL,
+        flush_delay: float = 0.05,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        self.channel = channel
+        self.flush_delay = flush_delay
+        self.health_check_interval = health_check_interval
+        self.origin = uuid.uuid4().hex
+
+        self._pending_keys: set[str] = set()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._conn: Any | None = None
+        self._watchdog_task: asyncio.Task[None] | None = None
+        self._running = False
+
+        self.published = 0
+        self.received = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Start listening for invalidations from other processes."""
+        if self._running or not settings.CACHE_INVALIDATION_BUS_ENABLED:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        try:
+            await self._listen()
+        except Exception as e:
+            # Keep running: the watchdog retries the connection
+            logger.sync_warning("Cache invalidation listener not connected", error=str(e))
+        self._watchdog_task = asyncio.create_task(self._watchdog())
+        logger.sync_info("Cache invalidation bus started", channel=self.channel)
+
+    async def stop(self) -> None:
+        """Stop listening and flush pending invalidations."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._watchdog_task:
+            self._watchdog_task.cancel()
+            try:
+                await self._watchdog_task
+            except asyncio.CancelledError:
+                pass
+            self._watchdog_task = None
+
+        self._flush()
+        self._disconnect()
+        logger.sync_info(
+            "Cache invalidation bus stopped", published=self.published, received=self.received
+        )
+
+    def _connect(self) -> Any:
+        """Open a dedicated autocommit connection that LISTENs on the channel."""
+        from app.core.database import engine
+
+        # Detached from the pool: LISTEN state must not leak to other users
+        pooled = engine.raw_connection()
+        pooled.detach()
+        conn: Any = pooled.dbapi_connection  # psycopg2 connection
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel}")
+        return conn
+
+    async def _listen(self) -> None:
+        conn = await asyncio.to_thread(self._connect)
+        self._conn = conn
+        asyncio.get_running_loop().add_reader(conn.fileno(), self._on_readable)
+        logger.sync_debug("Cache invalidation listener connected", channel=self.channel)
+
+    def _disconnect(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if self._loop:
+                self._loop.remove_reader(conn.fileno())
+        except Exception:
+            pass  # Connection may already be closed
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    async def _watchdog(self) -> None:
+        """Check the listener connection periodically and reconnect if needed."""
+        while self._running:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                if self._conn is None:
+                    raise ConnectionError("listener not connected")
+                await asyncio.to_thread(self._ping)
+                # Notifications consumed by the ping are queued on the connection
+                self._drain()
+            except Exception as e:
+                logger.sync_warning("Cache invalidation listener lost", error=str(e))
+                await self._reconnect()
+
+    def _ping(self) -> None:
+        with self._conn.cursor() as cursor:  # type: ignore[union-attr]
+            cursor.execute("SELECT 1")
+
+    async def _reconnect(self) -> None:
+        self._disconnect()
+        try:
+            await self._listen()
+        except Exception as e:
+            logger.sync_warning("Cache invalidation listener reconnect failed", error=str(e))
+            return
+        # Invalidations sent while disconnected were missed
+        self._apply({"op": "all"})
+
+    # Receiving
+
+    def _on_readable(self) -> None:
+        """Drain notifications from the listener connection (event loop callback)."""
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            conn.poll()
+        except Exception as e:
+            logger.sync_warning("Cache invalidation listener error", error=str(e))
+            self._disconnect()
+            return
+        self._drain()
+
+    def _drain(self) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            try:
+                message = json.loads(notify.payload)
+            except ValueError:
+                logger.sync_warning("Invalid cache invalidation payload", payload=notify.payload)
+                continue
+            if message.get("origin") == self.origin:
+                continue
+            self.received += 1
+            self._apply(message)
+
+    def _apply(self, message: dict[str, Any]) -> None:
+        """Apply an invalidation to this process's L1 cache."""
+        from app.core import cache_service as cache_module
+        from app.core.data_versions import data_versions
+
+        op = message.get("op")
+        if op in ("data_versions", "all"):
+            # "all" follows a reconnect: version bumps may have been missed too
+            data_versions.invalidate()
+            if op == "data_versions":
+                return
+
+        cache = cache_module.cache_service
+        if cache is None:
+            return
+
+        if op == "keys":
+            cache.evict_local(cache_keys=message.get("keys", []))
+        elif op == "tags":
+            cache.evict_local(tags=message.get("tags", []))
+        elif op == "namespace":
+            cache.evict_local(namespace=message.get("namespace"))
+        elif op == "all":
+            cache.evict_local()
+        else:
+            logger.sync_warning("Unknown cache invalidation", op=op)
+
+    # Publishing
+
+    def publish_keys(self, cache_keys: list[str]) -> None:
+        """Invalidate cache keys in other processes (coalesced)."""
+        if not self._running or not cache_keys:
+            return
+
+        with self._pending_lock:
+            self._pending_keys.update(cache_keys)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.call_later, self.flush_delay, self._flush_async)
+        else:
+            self._flush()
+
+    def publish_tags(self, tags: list[str]) -> None:
+        """Invalidate tagged entries in other processes."""
+        if self._running and tags:
+            self._publish(self._chunk("tags", tags))
+
+    def publish_namespace(self, namespace: str) -> None:
+        """Invalidate a namespace in other processes."""
+        if self._running:
+            self._publish([{"op": "namespace", "namespace": namespace}])
+
+    def publish_data_versions(self) -> None:
+        """Make other processes reload their data-version snapshot."""
+        if self._running:
+            self._send([{"op": "data_versions"}])
+
+    def publish_all(self) -> None:
+        """Invalidate the whole L1 cache in other processes."""
+        if self._running:
+            self._publish([{"op": "all"}])
+
+    def _publish(self, messages: list[dict[str, Any]]) -> None:
+        """Send messages, handing the NOTIFY to the executor when called on the loop."""
+        loop = self._loop
+        try:
+            running: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and running is loop:
+            loop.run_in_executor(None, self._send, messages)
+        else:
+            # Worker threads (the *_sync cache paths) may block
+            self._send(messages)
+
+    def _flush_async(self) -> None:
+        # NOTIFY is a short round trip; keep it off the event loop anyway
+        if self._loop is not None:
+            self._loop.run_in_executor(None, self._flush)
+
+    def _flush(self) -> None:
+        """Publish coalesced key invalidations."""
+        with self._pending_lock:
+            keys, self._pending_keys = sorted(self._pending_keys), set()
+            self._flush_scheduled = False
+        if keys:
+            self._send(self._chunk_keys(keys))
+
+    def _chunk_keys(self, keys: list[str]) -> list[dict[str, Any]]:
+        """Split keys into messages that fit the NOTIFY payload limit."""
+        return self._chunk("keys", keys)
+
+    def _chunk(self, op: str, values: list[str]) -> list[dict[str, Any]]:
+        """Split an op's values (keys or tags) into messages under the payload limit."""
+        messages: list[dict[str, Any]] = []
+        chunk: list[str] = []
+        size = 0
+        for value in values:
+            value_size = len(value) + 4  # quotes and separator
+            if chunk and size + value_size > MAX_PAYLOAD_BYTES:
+                messages.append({"op": op, op: chunk})
+                chunk, size = [], 0
+            chunk.append(value)
+            size += value_size
+        if chunk:
+            messages.append({"op": op, op: chunk})
+        return messages
+
+    def _send(self, messages: list[dict[str, Any]]) -> None:
+        from app.core.database import engine
+
+        try:
+            with engine.connect() as conn:
+                for message in messages:
+                    payload = json.dumps({"origin": self.origin, **message})
+                    conn.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": self.channel, "payload": payload},
+                    )
+                conn.commit()
+            self.published += len(messages)
+        except Exception as e:
+            # Other processes fall back to TTL expiry for this invalidation
+            logger.sync_error("Failed to publish cache invalidation", error=str(e))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Bus status for monitoring."""
+        return {
+            "running": self._running,
+            "connected": self._conn is not None,
+            "channel": self.channel,
+            "published": self.published,
+            "received": self.received,
+        }
+
+
+# Singleton instance for the process
+cache_bus = CacheInvalidationBus()
@@ -0,0 +1,270 @@
+"""
+Binary codecs for L2 (database) cache values.
+
+Values are encoded to bytes and stored in ``cache_entries.data_blob`` together
+with a format tag in ``cache_entries.data_format``. The tag names the codec and
+optional compression, e.g. ``"msgpack+zstd"`` or ``"arrow"``, so every row is
+self-describing and the codec can change without invalidating existing rows.
+Rows without a tag are legacy JSONB rows and are decoded by CacheService.
+
+Codecs:
+- ``msgpack``: general values (dicts, lists, scalars)
+- ``orjson``: JSON bytes, used when msgpack is not selected or available
+- ``json``: stdlib fallback for ``orjson``
+- ``arrow``: pandas DataFrames as Arrow IPC streams (requires pyarrow)
+- ``dataframe``: DataFrames via msgpack in ``split`` orient (pyarrow fallback)
+
+Compression:
+- ``zstd`` when the zstandard package is installed, otherwise ``zlib``
+- Only applied to payloads of at least ``min_compress_bytes``
+"""
+
+import json
+import zlib
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import msgpack
+
+    _HAS_MSGPACK = True
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+    _HAS_MSGPACK = False
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _HAS_ORJSON = False
+
+try:
+    import zstandard
+
+    _HAS_ZSTD = True
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+    _HAS_ZSTD = False
+
+try:
+    import pyarrow
+
+    _HAS_PYARROW = True
+except ImportError:
+    pyarrow = None  # type: ignore[assignment]
+    _HAS_PYARROW = False
+
+
+class CodecError(ValueError):
+    """Raised when a value cannot be encoded or a payload cannot be decoded."""
+
+
+def _to_builtin(value: Any) -> Any:
+    """Fallback conversion for types the binary codecs don't support natively."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, set | frozenset):
+        return list(value)
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    # Mirror json.dumps(default=str) used for the legacy JSONB format
+    return str(value)
+
+
+def _is_dataframe(value: Any) -> bool:
+    try:
+        import pandas as pd
+
+        return isinstance(value, pd.DataFrame)
+    except ImportError:
+        return False
+
+
+# Serializers: name -> (encode, decode)
+
+
+def _msgpack_encode(value: Any) -> bytes:
+    return bytes(msgpack.packb(value, default=_to_builtin, use_bin_type=True))
+
+
+def _msgpack_decode(payload: bytes) -> Any:
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+def _orjson_encode(value: Any) -> bytes:
+    return bytes(orjson.dumps(value, default=_to_builtin, option=orjson.OPT_NON_STR_KEYS))
+
+
+def _json_encode(value: Any) -> bytes:
+    return json.dumps(value, default=_to_builtin, ensure_ascii=False).encode("utf-8")
+
+
+def _json_decode(payload: bytes) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _arrow_encode(df: Any) -> bytes:
+    table = pyarrow.Table.from_pandas(df, preserve_index=True)
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue().to_pybytes())
+
+
+def _arrow_decode(payload: bytes) -> Any:
+    with pyarrow.ipc.open_stream(payload) as reader:
+        return reader.read_all().to_pandas()
+
+
+def _dataframe_encode(df: Any) -> bytes:
+    return _msgpack_encode(df.to_dict(orient="split"))
+
+
+def _dataframe_decode(payload: bytes) -> Any:
+    import pandas as pd
+
+    split = _msgpack_decode(payload)
+    return pd.DataFrame(split["data"], index=split["index"], columns=split["columns"])
+
+
+_SERIALIZERS: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "msgpack": (_msgpack_encode, _msgpack_decode),
+    "orjson": (_orjson_encode, _json_decode),
+    "json": (_json_encode, _json_decode),
+    "arrow": (_arrow_encode, _arrow_decode),
+    "dataframe": (_dataframe_encode, _dataframe_decode),
+}
+
+_AVAILABLE = {
+    "msgpack": _HAS_MSGPACK,
+    "orjson": _HAS_ORJSON,
+    "json": True,
+    "arrow": _HAS_PYARROW,
+    "dataframe": _HAS_MSGPACK,
+}
+
+
+# Compressors: name -> (compress, decompress)
+
+
+def _zstd_compress(payload: bytes) -> bytes:
+    return bytes(zstandard.ZstdCompressor(level=3).compress(payload))
+
+
+def _zstd_decompress(payload: bytes) -> bytes:
+    return bytes(zstandard.ZstdDecompressor().decompress(payload))
+
+
+def _zlib_compress(payload: bytes) -> bytes:
+    return zlib.compress(payload, 1)
+
+
+_COMPRESSORS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zstd": (_zstd_compress, _zstd_decompress),
+    "zlib": (_zlib_compress, zlib.decompress),
+}
+
+
+class CacheCodec:
+    """
+    Encodes cache values to tagged binary payloads and decodes them back.
+
+    Args:
+        serializer: Preferred serializer for general values ("msgpack", "orjson", "json")
+        compression: Compression to apply ("auto", "zstd", "zlib" or "none")
+        min_compress_bytes: Payloads smaller than this are stored uncompressed
+    """
+
+    def __init__(
+        self,
+        serializer: str = "msgpack",
+        compression: str = "auto",
+        min_compress_bytes: int = 1024,
+    ) -> None:
+        if serializer not in ("msgpack", "orjson", "json"):
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+
+        if not _AVAILABLE[serializer]:
+            fallback = "orjson" if _HAS_ORJSON else "json"
+            logger.sync_warning(
+                "Cache serializer not available, falling back",
+                serializer=serializer,
+                fallback=fallback,
+            )
+            serializer = fallback
+
+        if compression == "auto":
+            compression = "zstd" if _HAS_ZSTD else "zlib"
+        elif compression == "zstd" and not _HAS_ZSTD:
+            logger.sync_warning("zstandard not installed, using zlib for cache compression")
+            compression = "zlib"
+        elif compression not in ("zlib", "none"):
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        self.serializer = serializer
+        self.compression = None if compression == "none" else compression
+        self.min_compress_bytes = min_compress_bytes
+
+    def encode(self, value: Any) -> tuple[str, bytes]:
+        """
+        Encode a value.
+
+        Returns:
+            Tuple of (format tag, payload)
+        """
+        if _is_dataframe(value):
+            serializer = "arrow" if _HAS_PYARROW else "dataframe"
+        else:
+            serializer = self.serializer
+        if not _AVAILABLE[serializer]:
+            raise CodecError(
+                f"Cannot encode {type(value).__name__}: {serializer} requires a missing package"
+            )
+
+        encode, _ = _SERIALIZERS[serializer]
+        try:
+            payload = encode(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise CodecError(f"Cannot encode {type(value).__name__} with {serializer}") from e
+
+        if self.compression and len(payload) >= self.min_compress_bytes:
+            compress, _ = _COMPRESSORS[self.compression]
+            compressed = compress(payload)
+            # Incompressible payloads are stored as-is
+            if len(compressed) < len(payload):
+                return f"{serializer}+{self.compression}", compressed
+
+        return serializer, payload
+
+    @staticmethod
+    def decode(data_format: str, payload: bytes | memoryview) -> Any:
+        """Decode a payload produced by ``encode`` from its format tag."""
+        serializer, _, compression = data_format.partition("+")
+        if serializer not in _SERIALIZERS:
+            raise CodecError(f"Unknown cache data format: {data_format}")
+        if not _AVAILABLE[serializer]:
+            raise CodecError(f"Cache data format {data_format} requires a missing package")
+
+        data = bytes(payload)
+        try:
+            if compression:
+                if compression not in _COMPRESSORS or (compression == "zstd" and not _HAS_ZSTD):
+                    raise CodecError(f"Unsupported cache compression: {data_format}")
+                _, decompress = _COMPRESSORS[compression]
+                data = decompress(data)
+
+            _, decode = _SERIALIZERS[serializer]
+            return decode(data)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Cannot decode cache payload ({data_format}): {e}") from e
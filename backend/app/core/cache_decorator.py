@@ -72,20 +72,10 @@ def cache(
                 raw_key = ":".join(key_parts)
                 cache_key = hashlib.sha256(raw_key.encode()).hexdigest()
 
-            # Try to get from cache
-            cached_value = await cache_service.get(cache_key, namespace)
-            if cached_value is not None:
-                logger.sync_debug(f"Cache hit for {func.__name__}", key=cache_key)
-                return cached_value
-
-            # Execute function
-            result = await func(*args, **kwargs)
-
-            # Cache the result
-            await cache_service.set(cache_key, result, namespace, ttl)
-            logger.sync_debug(f"Cached result for {func.__name__}", key=cache_key)
-
-            return result
+            # Get from cache or execute; concurrent misses share one execution
+            return await cache_service.get_or_set(
+                cache_key, functools.partial(func, *args, **kwargs), namespace, ttl
+            )
 
         return wrapper
 
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from functools import wraps
 from typing import Any
 
-from app.core.cache_service import CacheService
+from app.core.cache_service import CacheService, view_tag
 from app.core.logging import get_logger
 from app.core.view_monitoring import track_cache_invalidation
 
@@ -132,6 +132,12 @@ class CacheInvalidationManager:
             f"Invalidating caches for table {table_name}", affected_views=list(affected_views)
         )
 
+        # Entries tagged with an affected view, wherever their namespace
+        if affected_views:
+            await self.cache_service.invalidate_tags(
+                [view_tag(view_name) for view_name in affected_views]
+            )
+
         for view_name in affected_views:
             dep = self.VIEW_DEPENDENCIES.get(view_name)
             if dep:
@@ -171,6 +177,9 @@ class CacheInvalidationManager:
         invalidated: list[str] = []
 
         dep = self.VIEW_DEPENDENCIES.get(view_name)
+        # Entries tagged with the view, whether or not it has registered namespaces
+        await self.cache_service.invalidate_tags([view_tag(view_name)])
+
         if dep:
             logger.sync_info(f"Invalidating caches for view {view_name}")
 
@@ -0,0 +1,314 @@
+"""
+Size-aware L1 memory cache for CacheService.
+
+Replaces an entry-count bounded LRU with a byte budget so that a handful of
+multi-megabyte network or annotation blobs cannot push out thousands of small,
+hot entries (e.g. HGNC lookups). Provides:
+- A global byte budget plus an optional entry cap
+- Per-namespace byte quotas (a namespace only evicts its own entries when over quota)
+- TinyLFU-style admission: a new entry that would evict others is only admitted
+  if it is requested at least as often as the entries it would displace
+- Per-namespace memory accounting for monitoring
+
+The class implements the mapping interface CacheService uses. Lookups go through
+``get()``, which updates recency and the frequency sketch; ``[]`` only peeks.
+It is not thread-safe on its own; callers hold ``CacheService._memory_lock``.
+"""
+
+import hashlib
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Containers larger than this are sized from a sample and extrapolated
+_SIZE_SAMPLE_LIMIT = 64
+
+# Translation table halving every byte, used to age sketch counters in C
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Estimate the in-memory size of a value in bytes.
+
+    Walks dicts, lists, tuples and sets recursively. Large containers are sized
+    from a sample of their items, so the cost is bounded for big blobs. Values
+    with a ``value`` attribute (CacheEntry) are sized by that attribute.
+    """
+    if _depth == 0 and hasattr(value, "value") and hasattr(value, "namespace"):
+        value = value.value
+
+    try:
+        import pandas as pd
+
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(deep=True).sum())
+    except ImportError:
+        pass
+
+    size = sys.getsizeof(value)
+    if _depth > 8:
+        return size
+
+    if isinstance(value, dict):
+        items = list(value.items())
+        sample = items[:_SIZE_SAMPLE_LIMIT]
+        sampled = sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in sample
+        )
+        if sample:
+            size += sampled * len(items) // len(sample)
+    elif isinstance(value, list | tuple | set | frozenset):
+        seq = list(value) if isinstance(value, set | frozenset) else value
+        head = seq[:_SIZE_SAMPLE_LIMIT]
+        sampled = sum(estimate_size(v, _depth + 1) for v in head)
+        if head:
+            size += sampled * len(seq) // len(head)
+
+    return size
+
+
+class FrequencySketch:
+    """
+    Count-min sketch with periodic aging, used as the TinyLFU frequency filter.
+
+    Counters saturate at 15 and are halved every ``sample_size`` increments so
+    that popularity reflects recent traffic rather than all-time counts.
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    def __init__(self, width: int, sample_size: int) -> None:
+        # Round width up to a power of two so indexes can be masked
+        self.width = 1 << max(4, (max(width, 16) - 1).bit_length())
+        self.sample_size = max(sample_size, 1)
+        self._mask = self.width - 1
+        self._table = [bytearray(self.width) for _ in range(self.DEPTH)]
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        return [
+            int.from_bytes(digest[i * 4 : i * 4 + 4], "little") & self._mask
+            for i in range(self.DEPTH)
+        ]
+
+    def increment(self, key: str) -> None:
+        """Record one access to a key."""
+        for row, idx in zip(self._table, self._indexes(key), strict=True):
+            if row[idx] < self.MAX_COUNT:
+                row[idx] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        """Estimated access frequency of a key."""
+        return min(row[idx] for row, idx in zip(self._table, self._indexes(key), strict=True))
+
+    def _age(self) -> None:
+        self._table = [bytearray(row.translate(_HALVE)) for row in self._table]
+        self._additions //= 2
+
+
+class SizeAwareLRUCache(MutableMapping[str, Any]):
+    """
+    LRU cache bounded by total bytes, with per-namespace byte quotas and
+    TinyLFU-style admission.
+
+    Args:
+        max_bytes: Global memory budget for all namespaces
+        max_entries: Optional cap on number of entries (kept for compatibility
+            with the previous entry-count bound)
+        namespace_quotas: Optional byte quota per namespace
+        getsizeof: Function returning the size of a stored value in bytes
+        admission: Enable frequency-based admission when eviction is needed
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: int | None = None,
+        namespace_quotas: dict[str, int] | None = None,
+        getsizeof: Callable[[Any], int] = estimate_size,
+        admission: bool = True,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.namespace_quotas = dict(namespace_quotas or {})
+        self.getsizeof = getsizeof
+        self.admission = admission
+
+        # key -> (value, size, namespace)
+        self._data: dict[str, tuple[Any, int, str]] = {}
+        self._order: OrderedDict[str, None] = OrderedDict()
+        self._namespace_order: dict[str, OrderedDict[str, None]] = {}
+        self._namespace_bytes: dict[str, int] = {}
+        self._currsize = 0
+
+        self._sketch = FrequencySketch(
+            width=(max_entries or 1024) * 4, sample_size=(max_entries or 1024) * 10
+        )
+        self.evictions = 0
+        self.rejections = 0
+
+    # Compatibility with cachetools.LRUCache attributes
+
+    @property
+    def maxsize(self) -> int | None:
+        return self.max_entries
+
+    @property
+    def currsize(self) -> int:
+        """Bytes currently used by all entries."""
+        return self._currsize
+
+    # Mapping interface
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: str) -> Any:
+        # Peek without touching recency, so items()/values() scans don't reorder
+        return self._data[key][0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up a key, marking it recently used and recording the access."""
+        self._sketch.increment(key)
+        if key not in self._data:
+            return default
+        value, _, namespace = self._data[key]
+        self._order.move_to_end(key)
+        self._namespace_order[namespace].move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        namespace = getattr(value, "namespace", "default")
+        size = self.getsizeof(value)
+        quota = self.namespace_quotas.get(namespace, self.max_bytes)
+
+        if size > quota or size > self.max_bytes:
+            if key in self._data:
+                # Never keep an outdated value behind a rejected update
+                self._remove(key)
+            self.rejections += 1
+            logger.sync_debug(
+                "Entry larger than memory quota, not cached in L1",
+                namespace=namespace,
+                size=size,
+                quota=quota,
+            )
+            return
+
+        if key in self._data:
+            # Updates replace the existing entry and are always admitted
+            self._remove(key)
+        else:
+            victims = self._select_victims(namespace, size)
+            if victims and self.admission and not self._admit(key, victims):
+                self.rejections += 1
+                return
+
+        self._evict_for(namespace, size)
+        self._data[key] = (value, size, namespace)
+        self._order[key] = None
+        self._namespace_order.setdefault(namespace, OrderedDict())[key] = None
+        self._namespace_bytes[namespace] = self._namespace_bytes.get(namespace, 0) + size
+        self._currsize += size
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._data:
+            raise KeyError(key)
+        self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._order.clear()
+        self._namespace_order.clear()
+        self._namespace_bytes.clear()
+        self._currsize = 0
+
+    # Eviction and admission
+
+    def _remove(self, key: str) -> None:
+        _, size, namespace = self._data.pop(key)
+        del self._order[key]
+        ns_order = self._namespace_order[namespace]
+        del ns_order[key]
+        if not ns_order:
+            del self._namespace_order[namespace]
+        self._namespace_bytes[namespace] -= size
+        if self._namespace_bytes[namespace] <= 0:
+            del self._namespace_bytes[namespace]
+        self._currsize -= size
+
+    def _select_victims(self, namespace: str, size: int) -> list[str]:
+        """Keys that would be evicted, in order, to make room for a new entry."""
+        victims: list[str] = []
+        chosen: set[str] = set()
+        freed = 0
+
+        quota = self.namespace_quotas.get(namespace)
+        if quota is not None:
+            ns_over = self._namespace_bytes.get(namespace, 0) + size - quota
+            for key in self._namespace_order.get(namespace, ()):
+                if ns_over <= 0:
+                    break
+                victims.append(key)
+                chosen.add(key)
+                entry_size = self._data[key][1]
+                ns_over -= entry_size
+                freed += entry_size
+
+        bytes_over = self._currsize + size - freed - self.max_bytes
+        entries_over = (
+            len(self._data) + 1 - len(victims) - self.max_entries
+            if self.max_entries is not None
+            else 0
+        )
+        for key in self._order:
+            if bytes_over <= 0 and entries_over <= 0:
+                break
+            if key in chosen:
+                continue
+            victims.append(key)
+            bytes_over -= self._data[key][1]
+            entries_over -= 1
+
+        return victims
+
+    def _admit(self, key: str, victims: list[str]) -> bool:
+        """TinyLFU admission: the candidate must be at least as popular as its victims."""
+        candidate = self._sketch.estimate(key)
+        victim = max(self._sketch.estimate(v) for v in victims)
+        return candidate >= victim
+
+    def _evict_for(self, namespace: str, size: int) -> None:
+        for key in self._select_victims(namespace, size):
+            self._remove(key)
+            self.evictions += 1
+
+    # Monitoring
+
+    def namespace_usage(self) -> dict[str, dict[str, int | None]]:
+        """Entries, bytes and quota per namespace currently held in memory."""
+        return {
+            namespace: {
+                "entries": len(self._namespace_order.get(namespace, ())),
+                "bytes": used,
+                "quota_bytes": self.namespace_quotas.get(namespace),
+            }
+            for namespace, used in sorted(self._namespace_bytes.items())
+        }
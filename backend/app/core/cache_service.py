@@ -2,35 +2,115 @@
 Modern cache service for the kidney genetics database.
 
 This module provides a unified caching interface that combines:
-- L1 (Memory): Fast in-memory LRU cache for hot data
-- L2 (Database): PostgreSQL-backed persistent cache for sharing across instances
+- L1 (Memory): Fast in-memory LRU cache for hot data, bounded by bytes per namespace
+- L2 (Database): PostgreSQL-backed persistent cache for sharing across instances,
+  stored as compact tagged binary payloads (see cache_codecs)
 - Intelligent TTL management per data source
+- Stale-while-revalidate for namespaces with a registered loader
+- Cross-process L1 invalidation via Postgres LISTEN/NOTIFY (see cache_bus)
+- Write-behind batching of L2 writes and access statistics (see cache_write_behind)
+- Tag-based invalidation of entries by the data they depend on (gene, source, view)
+- Data-versioned keys that change when the underlying tables change (see data_versions)
 - Cache statistics and monitoring
 """
 
 import asyncio
 import hashlib
+import inspect
 import json
 import threading
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Any, TypeVar, cast
 
 import cachetools  # type: ignore[import-untyped]
-from sqlalchemy import text
+from sqlalchemy import CursorResult, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.cache_bus import cache_bus
+from app.core.cache_codecs import CacheCodec, CodecError
+from app.core.cache_memory import SizeAwareLRUCache
+from app.core.cache_write_behind import WriteBehindBuffer
 from app.core.config import settings
+from app.core.data_versions import data_versions
 from app.core.datasource_config import get_source_cache_ttl
 from app.core.logging import get_logger
+from app.db.safe_sql import safe_identifier
 
 logger = get_logger(__name__)
 
 T = TypeVar("T")
 
 
+# Multi-row upsert of cache entries from parallel arrays (one round trip per chunk)
+_UPSERT_MANY_SQL = text(
+    """
+    INSERT INTO cache_entries
+    (cache_key, namespace, data, data_format, data_blob, expires_at, data_size, metadata,
+     tags)
+    SELECT t.cache_key, t.namespace, CAST(t.data AS jsonb), t.data_format, t.data_blob,
+           t.expires_at, t.data_size, CAST(t.metadata AS jsonb),
+           ARRAY(SELECT jsonb_array_elements_text(CAST(t.tags AS jsonb)))
+    FROM unnest(
+        CAST(:cache_keys AS text[]),
+        CAST(:namespaces AS text[]),
+        CAST(:datas AS text[]),
+        CAST(:data_formats AS text[]),
+        CAST(:data_blobs AS bytea[]),
+        CAST(:expires_ats AS timestamptz[]),
+        CAST(:data_sizes AS integer[]),
+        CAST(:metadatas AS text[]),
+        CAST(:tags AS text[])
+    ) AS t(cache_key, namespace, data, data_format, data_blob, expires_at, data_size,
+           metadata, tags)
+    ON CONFLICT (namespace, cache_key)
+    DO UPDATE SET
+        data = EXCLUDED.data,
+        data_format = EXCLUDED.data_format,
+        data_blob = EXCLUDED.data_blob,
+        expires_at = EXCLUDED.expires_at,
+        last_accessed = NOW(),
+        access_count = cache_entries.access_count + 1,
+        data_size = EXCLUDED.data_size,
+        metadata = EXCLUDED.metadata,
+        tags = EXCLUDED.tags
+    """
+)
+
+# Coalesced access-count increments from parallel arrays
+_ACCESS_COUNTS_SQL = text(
+    """
+    UPDATE cache_entries AS c
+    SET last_accessed = NOW(), access_count = c.access_count + u.hits
+    FROM unnest(
+        CAST(:cache_keys AS text[]), CAST(:namespaces AS text[]), CAST(:hits AS integer[])
+    ) AS u(cache_key, namespace, hits)
+    WHERE c.namespace = u.namespace AND c.cache_key = u.cache_key
+"""
+)
+
+# Entries by key; namespaces are passed alongside for partition pruning
+_DELETE_KEYS_SQL = text(
+    "DELETE FROM cache_entries WHERE namespace = ANY(:namespaces) AND cache_key = ANY(:cache_keys)"
+)
+
+# Entries sharing any tag with the array (uses the GIN index on tags)
+_DELETE_TAGS_SQL = text("DELETE FROM cache_entries WHERE tags && CAST(:tags AS text[])")
+
+# cache_entries is LIST-partitioned by namespace; NULL namespace = the DEFAULT partition
+_PARTITIONS_SQL = text("SELECT namespace, partition_name FROM cache_partitions")
+_PARTITION_ROWS_SQL = text(
+    "SELECT n_live_tup FROM pg_stat_user_tables WHERE relid = CAST(:partition AS regclass)"
+)
+
+
+def _versioned(key: Any, token: str) -> str:
+    normalized = key if isinstance(key, str) else json.dumps(key, sort_keys=True, default=str)
+    return f"{normalized}@{token}"
+
+
 class CacheEntry:
     """Represents a cache entry with metadata."""
 
@@ -41,6 +121,8 @@ class CacheEntry:
         namespace: str = "default",
         ttl: int | None = None,
         metadata: dict[str, Any] | None = None,
+        soft_ttl: int | None = None,
+        tags: Iterable[str] | None = None,
     ):
         self.key = key
         self.value = value
@@ -48,9 +130,13 @@ class CacheEntry:
         self.created_at = datetime.now(timezone.utc)
         self.ttl = ttl
         self.expires_at = self.created_at + timedelta(seconds=ttl) if ttl is not None else None
+        self.stale_at = (
+            self.created_at + timedelta(seconds=soft_ttl) if soft_ttl is not None else None
+        )
         self.last_accessed = self.created_at
         self.access_count = 1
         self.metadata = metadata or {}
+        self.tags = frozenset(tags) if tags else frozenset()
 
     def is_expired(self) -> bool:
         """Check if the cache entry has expired."""
@@ -58,6 +144,12 @@ class CacheEntry:
             return False
         return datetime.now(timezone.utc) > self.expires_at
 
+    def is_stale(self) -> bool:
+        """Check if the entry is past its soft TTL (still servable, needs refresh)."""
+        if self.stale_at is None:
+            return False
+        return datetime.now(timezone.utc) > self.stale_at
+
     def touch(self) -> None:
         """Update access statistics."""
         self.last_accessed = datetime.now(timezone.utc)
@@ -76,8 +168,16 @@ class CacheStats:
         self.sets = 0
         self.deletes = 0
         self.errors = 0
+        self.coalesced = 0
+        self.stale_hits = 0
+        self.refreshes = 0
         self.total_size = 0
         self.memory_entries = 0
+        self.memory_bytes = 0
+        self.memory_max_bytes = 0
+        self.memory_evictions = 0
+        self.memory_rejections = 0
+        self.memory_namespaces: dict[str, dict[str, int | None]] = {}
         self.db_entries = 0
         self.operations_since_persist = 0
         self._last_persist_time = time.monotonic()
@@ -108,6 +208,18 @@ class CacheStats:
             self.errors += 1
             self.operations_since_persist += 1
 
+    def record_coalesced(self) -> None:
+        with self._lock:
+            self.coalesced += 1
+
+    def record_stale_hit(self) -> None:
+        with self._lock:
+            self.stale_hits += 1
+
+    def record_refresh(self) -> None:
+        with self._lock:
+            self.refreshes += 1
+
     def should_persist(self) -> bool:
         with self._lock:
             if self.operations_since_persist >= self.PERSIST_THRESHOLD:
@@ -135,9 +247,17 @@ class CacheStats:
             "sets": self.sets,
             "deletes": self.deletes,
             "errors": self.errors,
+            "coalesced": self.coalesced,
+            "stale_hits": self.stale_hits,
+            "refreshes": self.refreshes,
             "hit_rate": self.hit_rate,
             "total_size": self.total_size,
             "memory_entries": self.memory_entries,
+            "memory_bytes": self.memory_bytes,
+            "memory_max_bytes": self.memory_max_bytes,
+            "memory_evictions": self.memory_evictions,
+            "memory_rejections": self.memory_rejections,
+            "memory_namespaces": self.memory_namespaces,
             "db_entries": self.db_entries,
         }
 
@@ -160,10 +280,45 @@ class CacheService:
 
         # L1 Cache: In-memory LRU cache with thread-safe access
         self._memory_lock = threading.Lock()
-        self.memory_cache: cachetools.LRUCache = cachetools.LRUCache(
-            maxsize=settings.CACHE_MAX_MEMORY_SIZE
+        # Bounded by bytes with per-namespace quotas so large blobs (network
+        # analysis, annotations) cannot evict thousands of small hot entries
+        self.memory_cache: SizeAwareLRUCache | cachetools.LRUCache = SizeAwareLRUCache(
+            max_bytes=settings.CACHE_MAX_MEMORY_MB * 1024 * 1024,
+            max_entries=settings.CACHE_MAX_MEMORY_SIZE,
+            namespace_quotas={
+                namespace: mb * 1024 * 1024
+                for namespace, mb in settings.CACHE_NAMESPACE_MEMORY_QUOTAS_MB.items()
+            },
+            admission=settings.CACHE_ADMISSION_ENABLED,
         )
 
+        # L2 codec: None keeps the legacy JSONB storage format
+        self.codec: CacheCodec | None = (
+            None
+            if settings.CACHE_CODEC == "jsonb"
+            else CacheCodec(
+                serializer=settings.CACHE_CODEC,
+                compression=settings.CACHE_COMPRESSION,
+                min_compress_bytes=settings.CACHE_COMPRESSION_MIN_BYTES,
+            )
+        )
+
+        # Write-behind: buffered L2 writes and access-count increments, flushed
+        # in batches by a background task once started
+        self.write_behind = WriteBehindBuffer(
+            interval=settings.CACHE_WRITE_BEHIND_INTERVAL,
+            max_pending=settings.CACHE_WRITE_BEHIND_MAX_PENDING,
+        )
+
+        # In-flight get_or_set computations, keyed by cache key (single-flight)
+        self._inflight_lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+        # Stale-while-revalidate: loaders and in-progress background refreshes
+        self._loaders: dict[str, Callable[[Any], Any]] = {}
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+
         # Cache statistics
         self.stats = CacheStats()
 
@@ -180,6 +335,14 @@ class CacheService:
             "default": settings.CACHE_DEFAULT_TTL,
         }
 
+        # Soft TTL per namespace (stale-while-revalidate), set via register_loader.
+        # Past the soft TTL, get() serves the stale value and refreshes it in the
+        # background; the hard TTL above still bounds how stale a value can get.
+        self.namespace_soft_ttls: dict[str, int] = {}
+
+        # cache_entries partition per namespace (None = DEFAULT partition), loaded lazily
+        self._partitions: dict[str | None, str] | None = None
+
         logger.sync_info("CacheService initialized", enabled=self.enabled)
 
     def _generate_cache_key(self, key: Any, namespace: str = "default") -> str:
@@ -199,10 +362,144 @@ class CacheService:
         key_hash = hashlib.sha256(f"{namespace}:{normalized_key}".encode()).hexdigest()
         return f"{namespace}:{key_hash}"
 
+    @staticmethod
+    def _namespace_of(cache_key: str) -> str:
+        """Namespace prefix of a generated cache key (the partition key of cache_entries)."""
+        return cache_key.rsplit(":", 1)[0]
+
+    @classmethod
+    def _namespaces_of(cls, cache_keys: Iterable[str]) -> list[str]:
+        """Distinct namespaces of cache keys, so multi-key statements prune partitions."""
+        return sorted({cls._namespace_of(k) for k in cache_keys})
+
+    @staticmethod
+    def versioned_key(key: Any, depends_on: Iterable[str]) -> str:
+        """
+        Fold the current data versions of the given tables into a key.
+
+        Entries stored under a versioned key are never served after one of
+        the tables changes, because the next lookup uses a different key.
+        """
+        return _versioned(key, data_versions.token(depends_on))
+
+    @staticmethod
+    async def versioned_key_async(key: Any, depends_on: Iterable[str]) -> str:
+        """``versioned_key`` that reloads stale data versions off the event loop."""
+        return _versioned(key, await data_versions.token_async(depends_on))
+
     def _get_ttl_for_namespace(self, namespace: str) -> int:
         """Get TTL for a specific namespace."""
         return self.namespace_ttls.get(namespace, self.namespace_ttls["default"])
 
+    @staticmethod
+    def _new_entry(
+        key: Any,
+        value: Any,
+        namespace: str,
+        ttl: int,
+        soft_ttl: int | None,
+        tags: Iterable[str] | None,
+    ) -> CacheEntry:
+        """Create an entry for storage, recording soft TTL and tags in its metadata."""
+        entry = CacheEntry(key, value, namespace, ttl, soft_ttl=soft_ttl, tags=tags)
+        # Persisted so other instances reading from L2 see the same soft TTL and tags
+        if entry.stale_at is not None:
+            entry.metadata["stale_at"] = entry.stale_at.isoformat()
+        if entry.tags:
+            entry.metadata["tags"] = sorted(entry.tags)
+        return entry
+
+    @staticmethod
+    def _entry_from_db(
+        key: Any, value: Any, namespace: str, ttl: int, metadata: dict[str, Any]
+    ) -> CacheEntry:
+        """Create an L1 entry for a value read from L2, restoring soft TTL and tags."""
+        entry = CacheEntry(key, value, namespace, ttl, tags=metadata.get("tags"))
+        stale_at = metadata.get("stale_at")
+        if stale_at:
+            entry.stale_at = datetime.fromisoformat(stale_at)
+        return entry
+
+    def register_loader(
+        self,
+        namespace: str,
+        loader: Callable[[Any], Any],
+        soft_ttl: int,
+        ttl: int | None = None,
+    ) -> None:
+        """
+        Enable stale-while-revalidate for a namespace.
+
+        Args:
+            namespace: Cache namespace
+            loader: Called with the original key to recompute a value. May be
+                sync (run in a worker thread) or async. Must not depend on a
+                request-scoped database session.
+            soft_ttl: Seconds after which entries are served stale and refreshed
+            ttl: Optional hard TTL for the namespace (defaults to existing TTL)
+        """
+        if ttl is not None:
+            self.namespace_ttls[namespace] = ttl
+        if soft_ttl >= self._get_ttl_for_namespace(namespace):
+            logger.sync_warning(
+                "Soft TTL is not below hard TTL, stale values will never be served",
+                namespace=namespace,
+                soft_ttl=soft_ttl,
+            )
+        self._loaders[namespace] = loader
+        self.namespace_soft_ttls[namespace] = soft_ttl
+        logger.sync_info("Registered cache loader", namespace=namespace, soft_ttl=soft_ttl)
+
+    def _schedule_refresh(self, key: Any, namespace: str, cache_key: str) -> None:
+        """Refresh a stale entry in the background, at most once per key at a time."""
+        loader = self._loaders.get(namespace)
+        if loader is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        with self._inflight_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        task = loop.create_task(self._refresh(key, namespace, cache_key, loader))
+        # Keep a strong reference so the task is not garbage collected mid-flight
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(
+        self, key: Any, namespace: str, cache_key: str, loader: Callable[[Any], Any]
+    ) -> None:
+        """Recompute a stale entry through its namespace loader and store it."""
+        try:
+            if asyncio.iscoroutinefunction(loader):
+                value = await loader(key)
+            else:
+                value = await asyncio.to_thread(loader, key)
+                if inspect.isawaitable(value):
+                    value = await value
+
+            if value is not None:
+                # The refreshed value depends on the same data as the stale one
+                with self._memory_lock:
+                    stale_entry = self.memory_cache.get(cache_key)
+                tags = stale_entry.tags if stale_entry is not None else None
+                await self.set(key, value, namespace, tags=tags)
+                self.stats.record_refresh()
+                logger.sync_debug("Cache entry refreshed", namespace=namespace, key=str(key))
+        except Exception as e:
+            self.stats.record_error()
+            logger.sync_error(
+                "Background cache refresh failed", namespace=namespace, key=str(key), error=str(e)
+            )
+        finally:
+            with self._inflight_lock:
+                self._refreshing.discard(cache_key)
+
     def _serialize_value(self, value: Any) -> str:
         """Serialize a value for storage with pandas DataFrame support."""
         try:
@@ -304,18 +601,22 @@ class CacheService:
         """
         Get a value from cache.
 
-        Checks L1 (memory) first, then L2 (database).
+        Checks L1 (memory) first, then L2 (database). Entries past their
+        namespace soft TTL are returned immediately and refreshed in the
+        background through the namespace loader (stale-while-revalidate).
         """
         if not self.enabled:
             return default
 
         cache_key = self._generate_cache_key(key, namespace)
+        stale: bool | None = None
+        value: Any = None
 
         try:
             # L1 Cache: Check memory first
             with self._memory_lock:
-                if cache_key in self.memory_cache:
-                    entry = self.memory_cache[cache_key]
+                entry = self.memory_cache.get(cache_key)
+                if entry is not None:
                     if not entry.is_expired():
                         entry.touch()
                         self.stats.record_hit()
@@ -323,27 +624,47 @@ class CacheService:
                             logger.sync_debug(
                                 "Cache hit (memory)", namespace=namespace, key=str(key)
                             )
-                        return entry.value
+                        stale = entry.is_stale()
+                        value = entry.value
                     else:
                         # Remove expired entry
                         del self.memory_cache[cache_key]
 
+            if stale is not None:
+                if stale:
+                    self.stats.record_stale_hit()
+                    self._schedule_refresh(key, namespace, cache_key)
+                return value
+
+            # Written but not yet flushed to L2 (e.g. evicted from L1 meanwhile)
+            pending = self.write_behind.get(cache_key)
+            if pending is not None and not pending.is_expired():
+                with self._memory_lock:
+                    self.memory_cache[cache_key] = pending
+                self.stats.record_hit()
+                return pending.value
+
             # L2 Cache: Check database (no lock held during I/O)
             if self.db_session:
-                db_entry = await self._get_from_db(cache_key)
+                db_row = await self._get_row_from_db(cache_key)
+                db_entry, db_metadata = db_row if db_row else (None, {})
                 if db_entry:
-                    # Update access statistics in DB
-                    await self._update_access_stats(cache_key)
+                    # Update access statistics in DB (batched when write-behind runs)
+                    if not self.write_behind.add_access([cache_key]):
+                        await self._update_access_stats(cache_key)
 
                     # Store in memory cache for future hits
                     ttl = self._get_ttl_for_namespace(namespace)
-                    memory_entry = CacheEntry(key, db_entry, namespace, ttl)
+                    memory_entry = self._entry_from_db(key, db_entry, namespace, ttl, db_metadata)
                     with self._memory_lock:
                         self.memory_cache[cache_key] = memory_entry
 
                     self.stats.record_hit()
                     if settings.LOG_LEVEL == "DEBUG":
                         logger.sync_debug("Cache hit (database)", namespace=namespace, key=str(key))
+                    if memory_entry.is_stale():
+                        self.stats.record_stale_hit()
+                        self._schedule_refresh(key, namespace, cache_key)
                     return db_entry
 
             # Cache miss
@@ -359,12 +680,19 @@ class CacheService:
             return default
 
     async def set(
-        self, key: Any, value: Any, namespace: str = "default", ttl: int | None = None
+        self,
+        key: Any,
+        value: Any,
+        namespace: str = "default",
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
     ) -> bool:
         """
         Set a value in cache.
 
-        Stores in both L1 (memory) and L2 (database).
+        Stores in both L1 (memory) and L2 (database). ``tags`` name the data the
+        value depends on (e.g. ``gene:123``, ``source:gnomad``) so it can be
+        evicted with invalidate_tags() when that data changes.
         """
         if not self.enabled:
             return False
@@ -374,17 +702,26 @@ class CacheService:
         if ttl is None:
             ttl = self._get_ttl_for_namespace(namespace)
 
+        soft_ttl = self.namespace_soft_ttls.get(namespace)
+        if soft_ttl is not None and soft_ttl >= ttl:
+            soft_ttl = None
+
         try:
             # Create cache entry
-            entry = CacheEntry(key, value, namespace, ttl)
+            entry = self._new_entry(key, value, namespace, ttl, soft_ttl, tags)
 
             # L1 Cache: Store in memory
             with self._memory_lock:
                 self.memory_cache[cache_key] = entry
 
-            # L2 Cache: Store in database (no lock held during I/O)
-            if self.db_session:
-                await self._set_in_db(cache_key, entry)
+            # L2 Cache: Store in database (no lock held during I/O), or queue it for
+            # the write-behind flush, which also publishes the invalidation
+            buffered = bool(self.db_session) and self.write_behind.add_write(cache_key, entry)
+            if not buffered:
+                if self.db_session:
+                    await self._set_in_db(cache_key, entry)
+                # Other processes must not keep serving their previous L1 copy
+                cache_bus.publish_keys([cache_key])
 
             self.stats.record_set()
             logger.sync_debug("Cache set", namespace=namespace, key=str(key), ttl=ttl)
@@ -417,9 +754,12 @@ class CacheService:
                     del self.memory_cache[cache_key]
 
             # L2 Cache: Remove from database (no lock held during I/O)
+            self.write_behind.discard([cache_key])
             if self.db_session:
                 await self._delete_from_db(cache_key)
 
+            cache_bus.publish_keys([cache_key])
+
             self.stats.record_delete()
             logger.sync_debug("Cache delete", namespace=namespace, key=str(key))
             return True
@@ -431,32 +771,289 @@ class CacheService:
             )
             return False
 
+    async def get_many(self, keys: list[Any], namespace: str = "default") -> dict[Any, Any]:
+        """
+        Get multiple values from cache in one pass.
+
+        Resolves L1 (memory) first, then fetches all L1 misses from L2 with a
+        single query and bumps their access statistics with a single UPDATE.
+
+        Returns:
+            Dictionary mapping each found key to its value (misses are omitted)
+        """
+        if not self.enabled or not keys:
+            return {}
+
+        results: dict[Any, Any] = {}
+        stale_keys: list[tuple[Any, str]] = []
+        missing: dict[str, Any] = {}
+
+        try:
+            # L1 Cache: Check memory first
+            with self._memory_lock:
+                for key in keys:
+                    cache_key = self._generate_cache_key(key, namespace)
+                    entry = self.memory_cache.get(cache_key)
+                    if entry is not None and not entry.is_expired():
+                        entry.touch()
+                        results[key] = entry.value
+                        if entry.is_stale():
+                            stale_keys.append((key, cache_key))
+                    else:
+                        if entry is not None:
+                            del self.memory_cache[cache_key]
+                        missing[cache_key] = key
+
+            # L2 Cache: One round trip for all L1 misses (no lock held during I/O)
+            if missing and self.db_session:
+                db_rows = await self._get_many_from_db(list(missing))
+                if db_rows and not self.write_behind.add_access(list(db_rows)):
+                    await self._update_access_stats_many(list(db_rows))
+
+                ttl = self._get_ttl_for_namespace(namespace)
+                memory_entries = {}
+                for cache_key, (value, metadata) in db_rows.items():
+                    if not value:
+                        continue
+                    key = missing.pop(cache_key)
+                    results[key] = value
+                    memory_entry = self._entry_from_db(key, value, namespace, ttl, metadata)
+                    if memory_entry.is_stale():
+                        stale_keys.append((key, cache_key))
+                    memory_entries[cache_key] = memory_entry
+
+                with self._memory_lock:
+                    for cache_key, memory_entry in memory_entries.items():
+                        self.memory_cache[cache_key] = memory_entry
+
+            for _ in range(len(results)):
+                self.stats.record_hit()
+            for _ in range(len(missing)):
+                self.stats.record_miss()
+            for key, cache_key in stale_keys:
+                self.stats.record_stale_hit()
+                self._schedule_refresh(key, namespace, cache_key)
+
+            logger.sync_debug(
+                "Cache get_many",
+                namespace=namespace,
+                requested=len(keys),
+                hits=len(results),
+                misses=len(missing),
+            )
+            return results
+
+        except Exception as e:
+            self.stats.record_error()
+            logger.sync_error(
+                "Error getting cache entries", namespace=namespace, count=len(keys), error=str(e)
+            )
+            return results
+
+    async def set_many(
+        self,
+        items: dict[Any, Any],
+        namespace: str = "default",
+        ttl: int | None = None,
+        tags: dict[Any, Iterable[str]] | None = None,
+    ) -> bool:
+        """
+        Set multiple values in cache.
+
+        Stores all entries in L1 (memory) and writes them to L2 (database)
+        with one multi-row upsert per chunk. ``tags`` optionally maps keys to
+        their dependency tags.
+        """
+        if not self.enabled or not items:
+            return False
+
+        if ttl is None:
+            ttl = self._get_ttl_for_namespace(namespace)
+
+        soft_ttl = self.namespace_soft_ttls.get(namespace)
+        if soft_ttl is not None and soft_ttl >= ttl:
+            soft_ttl = None
+
+        try:
+            entries: dict[str, CacheEntry] = {}
+            for key, value in items.items():
+                entry_tags = tags.get(key) if tags else None
+                entry = self._new_entry(key, value, namespace, ttl, soft_ttl, entry_tags)
+                entries[self._generate_cache_key(key, namespace)] = entry
+
+            # L1 Cache: Store in memory
+            with self._memory_lock:
+                for cache_key, entry in entries.items():
+                    self.memory_cache[cache_key] = entry
+
+            # L2 Cache: Store in database (no lock held during I/O)
+            # Entries not queued for the write-behind flush are written through
+            write_through = (
+                {
+                    cache_key: entry
+                    for cache_key, entry in entries.items()
+                    if not self.write_behind.add_write(cache_key, entry)
+                }
+                if self.db_session
+                else entries
+            )
+            if write_through:
+                if self.db_session:
+                    await self._set_many_in_db(write_through)
+                cache_bus.publish_keys(list(write_through))
+
+            for _ in range(len(entries)):
+                self.stats.record_set()
+            logger.sync_debug("Cache set_many", namespace=namespace, count=len(entries), ttl=ttl)
+            return True
+
+        except Exception as e:
+            self.stats.record_error()
+            logger.sync_error(
+                "Error setting cache entries",
+                namespace=namespace,
+                count=len(items),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return False
+
+    async def delete_many(self, keys: list[Any], namespace: str = "default") -> int:
+        """
+        Delete multiple values from cache.
+
+        Returns:
+            Number of entries removed from memory and database
+        """
+        if not self.enabled or not keys:
+            return 0
+
+        cache_keys = [self._generate_cache_key(key, namespace) for key in keys]
+
+        try:
+            count = 0
+
+            # L1 Cache: Remove from memory
+            with self._memory_lock:
+                for cache_key in cache_keys:
+                    if cache_key in self.memory_cache:
+                        del self.memory_cache[cache_key]
+                        count += 1
+
+            # L2 Cache: Remove from database in one statement
+            self.write_behind.discard(cache_keys)
+            if self.db_session:
+                db_count = await self._delete_many_from_db(cache_keys)
+                count = max(count, db_count)
+
+            cache_bus.publish_keys(cache_keys)
+
+            for _ in range(len(cache_keys)):
+                self.stats.record_delete()
+            logger.sync_debug("Cache delete_many", namespace=namespace, count=count)
+            return count
+
+        except Exception as e:
+            self.stats.record_error()
+            logger.sync_error(
+                "Error deleting cache entries", namespace=namespace, count=len(keys), error=str(e)
+            )
+            return 0
+
     async def get_or_set(
         self,
         key: Any,
         fetch_func: Callable[[], Any],
         namespace: str = "default",
         ttl: int | None = None,
+        distributed: bool | None = None,
+        tags: Iterable[str] | None = None,
+        depends_on: Iterable[str] | None = None,
     ) -> Any:
         """
         Get value from cache or fetch and cache it.
 
-        This implements the cache-aside pattern.
+        This implements the cache-aside pattern with single-flight coalescing:
+        concurrent misses for the same key in this process await one shared
+        computation instead of each running fetch_func. With ``distributed``
+        (default: CACHE_DISTRIBUTED_LOCK_ENABLED) the leader additionally takes
+        a PostgreSQL advisory lock so only one worker recomputes a hot key.
+        With ``depends_on`` the key includes the data versions of those tables.
         """
+        if depends_on:
+            key = await self.versioned_key_async(key, depends_on)
+
         # Try to get from cache first
         cached_value = await self.get(key, namespace)
         if cached_value is not None:
             return cached_value
 
-        # Fetch the value
+        cache_key = self._generate_cache_key(key, namespace)
+        loop = asyncio.get_running_loop()
+
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            # Futures are bound to a loop; never share across threads/loops
+            is_leader = future is None or future.get_loop() is not loop
+            if is_leader:
+                future = loop.create_future()
+                self._inflight[cache_key] = future
+        future = cast(asyncio.Future[Any], future)
+
+        if not is_leader:
+            self.stats.record_coalesced()
+            logger.sync_debug("Cache miss coalesced", namespace=namespace, key=str(key))
+            try:
+                # Shield so a cancelled follower does not cancel the shared result
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Leader was cancelled; retry and let one of the followers lead
+                return await self.get_or_set(key, fetch_func, namespace, ttl, distributed, tags)
+
+        # Mark a stored exception as retrieved even when nobody is waiting on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
         try:
-            if asyncio.iscoroutinefunction(fetch_func):
-                value = await fetch_func()
+            if distributed is None:
+                distributed = settings.CACHE_DISTRIBUTED_LOCK_ENABLED
+            if distributed:
+                value = await self._fetch_with_distributed_lock(
+                    cache_key, key, fetch_func, namespace, ttl, tags
+                )
             else:
-                value = fetch_func()
+                value = await self._fetch_and_set(key, fetch_func, namespace, ttl, tags)
+            future.set_result(value)
+            return value
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(cache_key) is future:
+                    del self._inflight[cache_key]
+
+    async def _fetch_and_set(
+        self,
+        key: Any,
+        fetch_func: Callable[[], Any],
+        namespace: str,
+        ttl: int | None,
+        tags: Iterable[str] | None = None,
+    ) -> Any:
+        """Run the fetch function and store its result."""
+        try:
+            value = fetch_func()
+            if inspect.isawaitable(value):
+                value = await value
 
             # Cache the fetched value
-            await self.set(key, value, namespace, ttl)
+            await self.set(key, value, namespace, ttl, tags)
             return value
 
         except Exception as e:
@@ -465,6 +1062,109 @@ class CacheService:
             )
             raise
 
+    async def _fetch_with_distributed_lock(
+        self,
+        cache_key: str,
+        key: Any,
+        fetch_func: Callable[[], Any],
+        namespace: str,
+        ttl: int | None,
+        tags: Iterable[str] | None = None,
+    ) -> Any:
+        """
+        Fetch under a cross-worker PostgreSQL advisory lock.
+
+        The lock is held on a dedicated pool connection (session-level advisory
+        locks belong to a connection, not to the shared cache session). After the
+        lock is acquired L2 is re-checked, so workers that waited pick up the
+        value computed by the worker that held the lock. If the lock cannot be
+        obtained within CACHE_DISTRIBUTED_LOCK_TIMEOUT the value is computed
+        anyway rather than failing the request.
+        """
+        lock_id = self._get_lock_id(cache_key)
+        conn = await self._acquire_distributed_lock(lock_id)
+        try:
+            if conn is not None and self.db_session:
+                db_row = await self._get_row_from_db(cache_key)
+                db_value, db_metadata = db_row if db_row else (None, {})
+                if db_value is not None:
+                    memory_entry = self._entry_from_db(
+                        key,
+                        db_value,
+                        namespace,
+                        ttl or self._get_ttl_for_namespace(namespace),
+                        db_metadata,
+                    )
+                    with self._memory_lock:
+                        self.memory_cache[cache_key] = memory_entry
+                    self.stats.record_hit()
+                    return db_value
+
+            return await self._fetch_and_set(key, fetch_func, namespace, ttl, tags)
+        finally:
+            if conn is not None:
+                await asyncio.to_thread(self._release_distributed_lock, conn, lock_id)
+
+    @staticmethod
+    def _get_lock_id(cache_key: str) -> int:
+        """Derive a signed 64-bit advisory lock ID from a cache key."""
+        digest = hashlib.sha256(f"cache_{cache_key}".encode()).digest()[:8]
+        return int.from_bytes(digest, byteorder="big", signed=True)
+
+    async def _acquire_distributed_lock(self, lock_id: int) -> Any | None:
+        """
+        Acquire an advisory lock on a dedicated connection with timeout.
+
+        Returns:
+            The connection holding the lock, or None if not acquired
+        """
+        try:
+            from app.core.database import engine
+
+            conn = await asyncio.to_thread(engine.connect)
+        except Exception as e:
+            logger.sync_error("Could not open connection for cache lock", error=str(e))
+            return None
+
+        def try_lock() -> bool:
+            result = conn.execute(
+                text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": lock_id}
+            )
+            acquired = bool(result.scalar())
+            # Commit so the connection is not left idle in transaction while we wait
+            conn.commit()
+            return acquired
+
+        wait_time = 0.05
+        deadline = time.monotonic() + settings.CACHE_DISTRIBUTED_LOCK_TIMEOUT
+        try:
+            while True:
+                if await asyncio.to_thread(try_lock):
+                    return conn
+                if time.monotonic() >= deadline:
+                    logger.sync_warning(
+                        "Timed out waiting for distributed cache lock", lock_id=lock_id
+                    )
+                    break
+                await asyncio.sleep(wait_time)
+                wait_time = min(wait_time * 2.0, 1.0)  # Cap at 1 second
+        except Exception as e:
+            logger.sync_error("Error acquiring distributed cache lock", error=str(e))
+
+        await asyncio.to_thread(conn.close)
+        return None
+
+    @staticmethod
+    def _release_distributed_lock(conn: Any, lock_id: int) -> None:
+        """Release an advisory lock and return its connection to the pool."""
+        try:
+            conn.execute(text("SELECT pg_advisory_unlock(:lock_id)"), {"lock_id": lock_id})
+            conn.commit()
+        except Exception as e:
+            logger.sync_error("Error releasing distributed cache lock", error=str(e))
+        finally:
+            conn.close()
+
     async def clear_namespace(self, namespace: str) -> int:
         """Clear all cache entries in a namespace."""
         if not self.enabled:
@@ -483,10 +1183,13 @@ class CacheService:
                     count += 1
 
             # L2 Cache: Clear database entries (no lock held during I/O)
+            self.write_behind.discard_namespace(namespace)
             if self.db_session:
                 db_count = await self._clear_namespace_from_db(namespace)
                 count += db_count
 
+            cache_bus.publish_namespace(namespace)
+
             logger.sync_info("Cleared entries from namespace", namespace=namespace, count=count)
             return count
 
@@ -512,8 +1215,13 @@ class CacheService:
                     del self.memory_cache[key]
                     count += 1
 
-            # L2 Cache: Clear database entries in chunks
-            if self.db_session:
+            # L2 Cache: Truncate the namespace's partition, else delete in chunks
+            self.write_behind.discard_namespace(namespace)
+            partition = self._get_partitions_sync().get(namespace) if self.db_session else None
+            truncated = self._truncate_partition_sync(partition) if partition else None
+            if truncated is not None:
+                count += truncated
+            elif self.db_session:
                 # Use chunked deletion to prevent long locks
                 chunk_size = 1000
                 while True:
@@ -542,6 +1250,8 @@ class CacheService:
                     # Small delay between chunks
                     time.sleep(0.01)
 
+            cache_bus.publish_namespace(namespace)
+
             logger.sync_info("Cleared namespace", namespace=namespace, count=count)
             return count
 
@@ -552,6 +1262,112 @@ class CacheService:
                 self.db_session.rollback()
             return 0
 
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Remove all entries carrying any of the given tags.
+
+        Evicts matching entries from L1, drops pending write-behind writes and
+        deletes matching L2 rows through the GIN-indexed tags column, so only
+        entries that depend on the changed data are lost.
+
+        Returns:
+            Number of entries removed from memory and database
+        """
+        tag_list = sorted(set(tags))
+        if not self.enabled or not tag_list:
+            return 0
+
+        try:
+            count = self.evict_local(tags=tag_list)
+
+            self.write_behind.discard_tags(tag_list)
+            if self.db_session:
+                db_count = await self._invalidate_tags_in_db(tag_list)
+                count = max(count, db_count)
+
+            cache_bus.publish_tags(tag_list)
+
+            logger.sync_info("Invalidated cache tags", tags=len(tag_list), count=count)
+            return count
+
+        except Exception as e:
+            self.stats.record_error()
+            logger.sync_error("Error invalidating cache tags", tags=len(tag_list), error=str(e))
+            return 0
+
+    def invalidate_tags_sync(self, tags: Iterable[str]) -> int:
+        """Synchronous version of invalidate_tags for thread pool execution."""
+        tag_list = sorted(set(tags))
+        if not self.enabled or not tag_list:
+            return 0
+
+        try:
+            count = self.evict_local(tags=tag_list)
+
+            self.write_behind.discard_tags(tag_list)
+            if self.db_session:
+                db = cast(Session, self.db_session)
+                db_count = 0
+                for i in range(0, len(tag_list), self.DB_BATCH_SIZE):
+                    result = cast(
+                        CursorResult[Any],
+                        db.execute(
+                            _DELETE_TAGS_SQL, {"tags": tag_list[i : i + self.DB_BATCH_SIZE]}
+                        ),
+                    )
+                    db_count += result.rowcount or 0
+                    db.commit()
+                count = max(count, db_count)
+
+            cache_bus.publish_tags(tag_list)
+
+            logger.sync_info("Invalidated cache tags", tags=len(tag_list), count=count)
+            return count
+
+        except Exception as e:
+            self.stats.record_error()
+            logger.sync_error("Error invalidating cache tags", tags=len(tag_list), error=str(e))
+            if self.db_session:
+                self.db_session.rollback()
+            return 0
+
+    def evict_local(
+        self,
+        namespace: str | None = None,
+        cache_keys: list[str] | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> int:
+        """
+        Remove entries from L1 (memory) only, leaving L2 untouched.
+
+        Applies invalidations published by other processes. Evicts the given
+        cache keys, or all entries carrying any of the tags, or all entries of
+        a namespace, or the whole L1 when none is given.
+
+        Returns:
+            Number of entries removed from memory
+        """
+        with self._memory_lock:
+            if cache_keys is not None:
+                keys_to_remove = [k for k in cache_keys if k in self.memory_cache]
+            elif tags is not None:
+                tag_set = frozenset(tags)
+                keys_to_remove = [
+                    k for k, v in self.memory_cache.items() if not v.tags.isdisjoint(tag_set)
+                ]
+            elif namespace is not None:
+                keys_to_remove = [
+                    k for k, v in self.memory_cache.items() if v.namespace == namespace
+                ]
+            else:
+                count = len(self.memory_cache)
+                self.memory_cache.clear()
+                return count
+
+            for key in keys_to_remove:
+                del self.memory_cache[key]
+            return len(keys_to_remove)
+
     async def cleanup_expired(self) -> int:
         """Remove expired entries from cache."""
         if not self.enabled:
@@ -587,6 +1403,12 @@ class CacheService:
             # Update current stats
             with self._memory_lock:
                 self.stats.memory_entries = len(self.memory_cache)
+                if isinstance(self.memory_cache, SizeAwareLRUCache):
+                    self.stats.memory_bytes = self.memory_cache.currsize
+                    self.stats.memory_max_bytes = self.memory_cache.max_bytes
+                    self.stats.memory_evictions = self.memory_cache.evictions
+                    self.stats.memory_rejections = self.memory_cache.rejections
+                    self.stats.memory_namespaces = self.memory_cache.namespace_usage()
 
             if self.db_session:
                 self.stats.db_entries = await self._get_db_entry_count(namespace)
@@ -608,6 +1430,11 @@ class CacheService:
 
     async def _get_from_db(self, cache_key: str) -> Any | None:
         """Get entry from database cache."""
+        row = await self._get_row_from_db(cache_key)
+        return row[0] if row else None
+
+    async def _get_row_from_db(self, cache_key: str) -> tuple[Any, dict[str, Any]] | None:
+        """Get entry value and its metadata from database cache."""
         if not self.db_session:
             return None
 
@@ -616,88 +1443,134 @@ class CacheService:
 
             query = text(
                 """
-                SELECT data, expires_at
+                SELECT data, data_format, data_blob, expires_at, metadata
                 FROM cache_entries
-                WHERE cache_key = :cache_key
+                WHERE namespace = :namespace AND cache_key = :cache_key
                 AND (expires_at IS NULL OR expires_at > NOW())
             """
             )
+            params = {"namespace": self._namespace_of(cache_key), "cache_key": cache_key}
 
             if isinstance(self.db_session, AsyncSession):
-                result = await self.db_session.execute(query, {"cache_key": cache_key})
+                result = await self.db_session.execute(query, params)
             else:
-                result = self.db_session.execute(query, {"cache_key": cache_key})
+                result = self.db_session.execute(query, params)
 
             row = result.fetchone()
 
             if row:
-                # JSONB columns are automatically deserialized by PostgreSQL
-                # Check if it's already a dict (JSONB) or a string (TEXT)
-                if isinstance(row.data, dict):
-                    return row.data
-                else:
-                    # Deserialize and handle corrupted entries
-                    deserialized = self._deserialize_value(row.data)
-                    if deserialized is None:
-                        # Remove corrupted entry from database
-                        logger.sync_warning("Removing corrupted cache entry", cache_key=cache_key)
-                        await self._delete_from_db(cache_key)
-                    return deserialized
+                metadata = row.metadata if isinstance(row.metadata, dict) else {}
+                deserialized = self._decode_db_row(row)
+                if deserialized is None:
+                    # Remove corrupted entry from database
+                    logger.sync_warning("Removing corrupted cache entry", cache_key=cache_key)
+                    await self._delete_from_db(cache_key)
+                return deserialized, metadata
             return None
 
         except Exception as e:
             logger.sync_error("Database cache get error", error=str(e))
             return None
 
+    def _decode_db_row(self, row: Any) -> Any:
+        """
+        Decode the value of a cache_entries row.
+
+        Rows with a data_format tag hold a binary payload in data_blob; rows
+        without one are legacy JSONB rows.
+        """
+        if row.data_format:
+            try:
+                return CacheCodec.decode(row.data_format, row.data_blob)
+            except CodecError as e:
+                logger.sync_error("Error decoding cache payload", error=str(e))
+                return None
+        # JSONB columns are automatically deserialized by PostgreSQL
+        return self._deserialize_value(row.data)
+
+    def _encode_db_value(self, value: Any) -> tuple[str, str | None, bytes | None, int]:
+        """
+        Convert a value to the columns stored in cache_entries.
+
+        Uses the binary codec when enabled, falling back to the legacy JSONB
+        format for values the codec cannot encode.
+
+        Returns:
+            Tuple of (JSON string for data, data_format tag, data_blob, size in bytes)
+        """
+        if self.codec is not None:
+            try:
+                data_format, payload = self.codec.encode(value)
+                return "null", data_format, payload, len(payload)
+            except CodecError as e:
+                logger.sync_warning("Falling back to JSONB cache storage", error=str(e))
+
+        data_json, data_size = self._prepare_db_value(value)
+        return data_json, None, None, data_size
+
+    def _prepare_db_value(self, value: Any) -> tuple[str, int]:
+        """
+        Convert a value to the JSON string stored in the JSONB data column.
+
+        Returns:
+            Tuple of (JSON string, size in bytes)
+        """
+        # For JSONB column, we can store the value directly as dict/list
+        # Handle pandas DataFrame
+        try:
+            import pandas as pd
+
+            if isinstance(value, pd.DataFrame):
+                # Serialize DataFrame using _serialize_value
+                serialized_data = self._serialize_value(value)
+                data_value = json.loads(serialized_data)  # Convert back to dict for JSONB
+            else:
+                raise ImportError  # Skip to normal handling
+        except ImportError:
+            # pandas not available or not a DataFrame - use normal handling
+            # Handle Pydantic BaseModel (v2)
+            if hasattr(value, "model_dump"):
+                data_value = value.model_dump()
+            # Handle Pydantic BaseModel (v1)
+            elif hasattr(value, "dict"):
+                data_value = value.dict()
+            # Handle dict/list directly
+            elif isinstance(value, dict | list):
+                data_value = value
+            # For other types, serialize using _serialize_value
+            else:
+                serialized_data = self._serialize_value(value)
+                data_value = json.loads(serialized_data)
+
+        data_json = json.dumps(data_value)
+        return data_json, len(data_json.encode("utf-8"))
+
     async def _set_in_db(self, cache_key: str, entry: CacheEntry) -> bool:
         """Set entry in database cache."""
         if not self.db_session:
             return False
 
         try:
-            # For JSONB column, we can store the value directly as dict/list
-            # Handle pandas DataFrame
-            try:
-                import pandas as pd
-
-                if isinstance(entry.value, pd.DataFrame):
-                    # Serialize DataFrame using _serialize_value
-                    serialized_data = self._serialize_value(entry.value)
-                    data_value = json.loads(serialized_data)  # Convert back to dict for JSONB
-                    data_size = len(serialized_data.encode("utf-8"))
-                else:
-                    raise ImportError  # Skip to normal handling
-            except ImportError:
-                # pandas not available or not a DataFrame - use normal handling
-                # Handle Pydantic BaseModel (v2)
-                if hasattr(entry.value, "model_dump"):
-                    data_value = entry.value.model_dump()
-                # Handle Pydantic BaseModel (v1)
-                elif hasattr(entry.value, "dict"):
-                    data_value = entry.value.dict()
-                # Handle dict/list directly
-                elif isinstance(entry.value, dict | list):
-                    data_value = entry.value
-                # For other types, serialize using _serialize_value
-                else:
-                    serialized_data = self._serialize_value(entry.value)
-                    data_value = json.loads(serialized_data)
-
-                data_size = len(json.dumps(data_value).encode("utf-8"))
+            data_json, data_format, data_blob, data_size = self._encode_db_value(entry.value)
 
             query = text(
                 """
                 INSERT INTO cache_entries
-                (cache_key, namespace, data, expires_at, data_size, metadata)
-                VALUES (:cache_key, :namespace, CAST(:data AS jsonb), :expires_at, :data_size, CAST(:metadata AS jsonb))
-                ON CONFLICT (cache_key)
+                (cache_key, namespace, data, data_format, data_blob, expires_at, data_size, metadata,
+                 tags)
+                VALUES (:cache_key, :namespace, CAST(:data AS jsonb), :data_format, :data_blob,
+                        :expires_at, :data_size, CAST(:metadata AS jsonb), CAST(:tags AS text[]))
+                ON CONFLICT (namespace, cache_key)
                 DO UPDATE SET
                     data = EXCLUDED.data,
+                    data_format = EXCLUDED.data_format,
+                    data_blob = EXCLUDED.data_blob,
                     expires_at = EXCLUDED.expires_at,
                     last_accessed = NOW(),
                     access_count = cache_entries.access_count + 1,
                     data_size = EXCLUDED.data_size,
-                    metadata = EXCLUDED.metadata
+                    metadata = EXCLUDED.metadata,
+                    tags = EXCLUDED.tags
             """
             )
 
@@ -709,10 +1582,13 @@ class CacheService:
                     {
                         "cache_key": cache_key,
                         "namespace": entry.namespace,
-                        "data": json.dumps(data_value),  # Pass as JSON string for JSONB casting
+                        "data": data_json,  # Pass as JSON string for JSONB casting
+                        "data_format": data_format,
+                        "data_blob": data_blob,
                         "expires_at": entry.expires_at,
                         "data_size": data_size,
                         "metadata": json.dumps(entry.metadata),
+                        "tags": sorted(entry.tags),
                     },
                 )
                 await self.db_session.commit()
@@ -722,10 +1598,13 @@ class CacheService:
                     {
                         "cache_key": cache_key,
                         "namespace": entry.namespace,
-                        "data": json.dumps(data_value),  # Pass as JSON string for JSONB casting
+                        "data": data_json,  # Pass as JSON string for JSONB casting
+                        "data_format": data_format,
+                        "data_blob": data_blob,
                         "expires_at": entry.expires_at,
                         "data_size": data_size,
                         "metadata": json.dumps(entry.metadata),
+                        "tags": sorted(entry.tags),
                     },
                 )
                 self.db_session.commit()
@@ -788,12 +1667,15 @@ class CacheService:
         try:
             from sqlalchemy.ext.asyncio import AsyncSession
 
-            query = text("DELETE FROM cache_entries WHERE cache_key = :cache_key")
+            query = text(
+                "DELETE FROM cache_entries WHERE namespace = :namespace AND cache_key = :cache_key"
+            )
+            params = {"namespace": self._namespace_of(cache_key), "cache_key": cache_key}
             if isinstance(self.db_session, AsyncSession):
-                await self.db_session.execute(query, {"cache_key": cache_key})
+                await self.db_session.execute(query, params)
                 await self.db_session.commit()
             else:
-                self.db_session.execute(query, {"cache_key": cache_key})
+                self.db_session.execute(query, params)
                 self.db_session.commit()
             return True
 
@@ -807,6 +1689,252 @@ class CacheService:
             logger.sync_error("Database cache delete error", error=str(e))
             return False
 
+    # Maximum rows per multi-key statement, keeps parameter arrays reasonable
+    DB_BATCH_SIZE = 1000
+
+    async def _execute_db(self, query: Any, params: dict[str, Any], commit: bool = False) -> Any:
+        """Execute a statement on the sync or async session."""
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        if isinstance(self.db_session, AsyncSession):
+            result = await self.db_session.execute(query, params)
+            if commit:
+                await self.db_session.commit()
+        else:
+            result = self.db_session.execute(query, params)  # type: ignore[union-attr]
+            if commit:
+                self.db_session.commit()  # type: ignore[union-attr]
+        return result
+
+    async def _rollback_db(self) -> None:
+        """Roll back the session, ignoring errors on a dead connection."""
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        try:
+            if isinstance(self.db_session, AsyncSession):
+                await self.db_session.rollback()
+            elif self.db_session:
+                self.db_session.rollback()
+        except Exception:
+            pass  # Rollback may fail if connection is dead
+
+    async def _get_many_from_db(
+        self, cache_keys: list[str]
+    ) -> dict[str, tuple[Any, dict[str, Any]]]:
+        """Get entries and their metadata for many keys with one query per chunk."""
+        if not self.db_session or not cache_keys:
+            return {}
+
+        query = text(
+            """
+            SELECT cache_key, data, data_format, data_blob, metadata
+            FROM cache_entries
+            WHERE namespace = ANY(:namespaces) AND cache_key = ANY(:cache_keys)
+            AND (expires_at IS NULL OR expires_at > NOW())
+        """
+        )
+
+        rows: dict[str, tuple[Any, dict[str, Any]]] = {}
+        corrupted: list[str] = []
+        try:
+            for i in range(0, len(cache_keys), self.DB_BATCH_SIZE):
+                chunk = cache_keys[i : i + self.DB_BATCH_SIZE]
+                result = await self._execute_db(
+                    query, {"namespaces": self._namespaces_of(chunk), "cache_keys": chunk}
+                )
+                for row in result.fetchall():
+                    metadata = row.metadata if isinstance(row.metadata, dict) else {}
+                    deserialized = self._decode_db_row(row)
+                    if deserialized is None:
+                        corrupted.append(row.cache_key)
+                    rows[row.cache_key] = (deserialized, metadata)
+
+            if corrupted:
+                # Remove corrupted entries from database
+                logger.sync_warning("Removing corrupted cache entries", count=len(corrupted))
+                await self._delete_many_from_db(corrupted)
+            return rows
+
+        except Exception as e:
+            await self._rollback_db()
+            logger.sync_error("Database cache get_many error", error=str(e))
+            return rows
+
+    async def _set_many_in_db(self, entries: dict[str, CacheEntry]) -> bool:
+        """Upsert many entries with one multi-row INSERT per chunk."""
+        if not self.db_session or not entries:
+            return False
+
+        items = list(entries.items())
+        try:
+            for i in range(0, len(items), self.DB_BATCH_SIZE):
+                chunk = items[i : i + self.DB_BATCH_SIZE]
+                await self._execute_db(
+                    _UPSERT_MANY_SQL, self._build_upsert_params(chunk), commit=True
+                )
+            return True
+
+        except Exception as e:
+            await self._rollback_db()
+            logger.sync_error(
+                "Database cache set_many error",
+                error=str(e),
+                error_type=type(e).__name__,
+                count=len(entries),
+            )
+            return False
+
+    def _build_upsert_params(self, chunk: list[tuple[str, CacheEntry]]) -> dict[str, list[Any]]:
+        """Parallel parameter arrays for _UPSERT_MANY_SQL."""
+        params: dict[str, list[Any]] = {
+            "cache_keys": [],
+            "namespaces": [],
+            "datas": [],
+            "data_formats": [],
+            "data_blobs": [],
+            "expires_ats": [],
+            "data_sizes": [],
+            "metadatas": [],
+            "tags": [],
+        }
+        for cache_key, entry in chunk:
+            data_json, data_format, data_blob, data_size = self._encode_db_value(entry.value)
+            params["cache_keys"].append(cache_key)
+            params["namespaces"].append(entry.namespace)
+            params["datas"].append(data_json)
+            params["data_formats"].append(data_format)
+            params["data_blobs"].append(data_blob)
+            params["expires_ats"].append(entry.expires_at)
+            params["data_sizes"].append(data_size)
+            params["metadatas"].append(json.dumps(entry.metadata))
+            params["tags"].append(json.dumps(sorted(entry.tags)))
+        return params
+
+    async def _flush_write_behind(
+        self, entries: dict[str, CacheEntry], access: dict[str, int]
+    ) -> None:
+        """Write buffered entries and access counts to L2 (write-behind flush)."""
+        await asyncio.to_thread(self._flush_write_behind_sync, entries, access)
+        # Other processes may re-read L2 now that the new values are visible
+        cache_bus.publish_keys(list(entries))
+
+    def _flush_write_behind_sync(
+        self, entries: dict[str, CacheEntry], access: dict[str, int]
+    ) -> None:
+        # Own session: the shared db_session belongs to whichever request set it last
+        from app.core.database import SessionLocal
+
+        items = list(entries.items())
+        access_items = list(access.items())
+        with SessionLocal() as db:
+            try:
+                for i in range(0, len(items), self.DB_BATCH_SIZE):
+                    chunk = items[i : i + self.DB_BATCH_SIZE]
+                    db.execute(_UPSERT_MANY_SQL, self._build_upsert_params(chunk))
+                for i in range(0, len(access_items), self.DB_BATCH_SIZE):
+                    access_chunk = access_items[i : i + self.DB_BATCH_SIZE]
+                    db.execute(
+                        _ACCESS_COUNTS_SQL,
+                        {
+                            "cache_keys": [k for k, _ in access_chunk],
+                            "namespaces": [self._namespace_of(k) for k, _ in access_chunk],
+                            "hits": [n for _, n in access_chunk],
+                        },
+                    )
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+        logger.sync_debug("Cache write-behind flushed", writes=len(items), access=len(access))
+
+    async def _delete_write_behind_tombstones(self, cache_keys: list[str]) -> None:
+        """Delete keys removed from the cache while their write-behind batch was flushed."""
+        await asyncio.to_thread(self._delete_write_behind_tombstones_sync, cache_keys)
+
+    def _delete_write_behind_tombstones_sync(self, cache_keys: list[str]) -> None:
+        from app.core.database import SessionLocal
+
+        with SessionLocal() as db:
+            try:
+                for i in range(0, len(cache_keys), self.DB_BATCH_SIZE):
+                    chunk = cache_keys[i : i + self.DB_BATCH_SIZE]
+                    db.execute(
+                        _DELETE_KEYS_SQL,
+                        {"namespaces": self._namespaces_of(chunk), "cache_keys": chunk},
+                    )
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+        logger.sync_debug("Cache write-behind tombstones deleted", keys=len(cache_keys))
+
+    async def start_write_behind(self) -> None:
+        """Start buffering L2 writes and access statistics (needs a running loop)."""
+        if settings.CACHE_WRITE_BEHIND_ENABLED:
+            self.write_behind.start(self._flush_write_behind, self._delete_write_behind_tombstones)
+
+    async def stop_write_behind(self) -> None:
+        """Stop buffering and flush everything still pending."""
+        await self.write_behind.stop()
+
+    async def _invalidate_tags_in_db(self, tags: list[str]) -> int:
+        """Delete entries carrying any of the tags with one statement per chunk."""
+        try:
+            count = 0
+            for i in range(0, len(tags), self.DB_BATCH_SIZE):
+                chunk = tags[i : i + self.DB_BATCH_SIZE]
+                result = await self._execute_db(_DELETE_TAGS_SQL, {"tags": chunk}, commit=True)
+                count += result.rowcount or 0
+            return count
+
+        except Exception as e:
+            await self._rollback_db()
+            logger.sync_error("Database cache tag invalidation error", error=str(e))
+            return 0
+
+    async def _delete_many_from_db(self, cache_keys: list[str]) -> int:
+        """Delete many entries with one statement per chunk."""
+        if not self.db_session or not cache_keys:
+            return 0
+
+        try:
+            count = 0
+            for i in range(0, len(cache_keys), self.DB_BATCH_SIZE):
+                chunk = cache_keys[i : i + self.DB_BATCH_SIZE]
+                result = await self._execute_db(
+                    _DELETE_KEYS_SQL,
+                    {"namespaces": self._namespaces_of(chunk), "cache_keys": chunk},
+                    commit=True,
+                )
+                count += result.rowcount or 0
+            return count
+
+        except Exception as e:
+            await self._rollback_db()
+            logger.sync_error("Database cache delete_many error", error=str(e))
+            return 0
+
+    async def _update_access_stats_many(self, cache_keys: list[str]) -> None:
+        """Update access statistics for many cache entries in one statement."""
+        if not self.db_session or not cache_keys:
+            return
+
+        query = text(
+            """
+            UPDATE cache_entries
+            SET last_accessed = NOW(), access_count = access_count + 1
+            WHERE namespace = ANY(:namespaces) AND cache_key = ANY(:cache_keys)
+        """
+        )
+        params = {"namespaces": self._namespaces_of(cache_keys), "cache_keys": cache_keys}
+        try:
+            await self._execute_db(query, params, commit=True)
+        except Exception as e:
+            await self._rollback_db()
+            logger.sync_error("Database access stats update error", error=str(e))
+
     async def _update_access_stats(self, cache_key: str) -> None:
         """Update access statistics for a cache entry."""
         if not self.db_session:
@@ -819,15 +1947,16 @@ class CacheService:
                 """
                 UPDATE cache_entries
                 SET last_accessed = NOW(), access_count = access_count + 1
-                WHERE cache_key = :cache_key
+                WHERE namespace = :namespace AND cache_key = :cache_key
             """
             )
+            params = {"namespace": self._namespace_of(cache_key), "cache_key": cache_key}
 
             if isinstance(self.db_session, AsyncSession):
-                await self.db_session.execute(query, {"cache_key": cache_key})
+                await self.db_session.execute(query, params)
                 await self.db_session.commit()
             else:
-                self.db_session.execute(query, {"cache_key": cache_key})
+                self.db_session.execute(query, params)
                 self.db_session.commit()
 
         except Exception as e:
@@ -847,6 +1976,13 @@ class CacheService:
         try:
             from sqlalchemy.ext.asyncio import AsyncSession
 
+            partition = (await self._get_partitions()).get(namespace)
+            if partition:
+                rows = await self._execute_db(_PARTITION_ROWS_SQL, {"partition": partition})
+                count = int(rows.scalar() or 0)
+                if await self._truncate_partition(partition):
+                    return count
+
             query = text("DELETE FROM cache_entries WHERE namespace = :namespace")
             if isinstance(self.db_session, AsyncSession):
                 result = await self.db_session.execute(query, {"namespace": namespace})
@@ -867,37 +2003,156 @@ class CacheService:
             return 0
 
     async def _cleanup_expired_from_db(self) -> int:
-        """Remove expired entries from database."""
+        """
+        Remove expired entries from database, one partition at a time.
+
+        A partition holding only expired rows is truncated; otherwise its expired
+        rows are deleted in small chunks with pauses, so cleanup never holds long
+        locks or saturates I/O while the API is serving requests.
+        """
         if not self.db_session:
             return 0
 
         try:
-            from sqlalchemy.ext.asyncio import AsyncSession
+            partitions = await self._get_partitions()
+            if not partitions:
+                # Unpartitioned table (schema before migration 0005)
+                return await self._delete_expired_in_chunks("cache_entries")
 
-            query = text(
-                """
-                DELETE FROM cache_entries
-                WHERE expires_at IS NOT NULL AND expires_at <= NOW()
-            """
+            count = 0
+            for partition in partitions.values():
+                count += await self._reclaim_partition(partition)
+            return count
+
+        except Exception as e:
+            await self._rollback_db()
+            logger.sync_error("Database cleanup error", error=str(e))
+            return 0
+
+    # Expired-entry cleanup deletes at most this many rows per statement
+    CLEANUP_CHUNK_SIZE = 5000
+    # Pause between cleanup chunks (seconds), leaving I/O to API queries
+    CLEANUP_CHUNK_PAUSE = 0.05
+    # Longest wait for a partition lock before TRUNCATE is skipped
+    PARTITION_LOCK_TIMEOUT = "2s"
+
+    async def _get_partitions(self) -> dict[str | None, str]:
+        """cache_entries partitions keyed by namespace (None for the DEFAULT partition)."""
+        if self._partitions is None:
+            try:
+                result = await self._execute_db(_PARTITIONS_SQL, {})
+                self._partitions = {row.namespace: row.partition_name for row in result.fetchall()}
+            except Exception as e:
+                await self._rollback_db()
+                logger.sync_warning("Could not load cache partitions", error=str(e))
+                return {}
+        return self._partitions
+
+    def _get_partitions_sync(self) -> dict[str | None, str]:
+        """Synchronous version of _get_partitions for thread pool execution."""
+        if self._partitions is None:
+            db = cast(Session, self.db_session)
+            try:
+                result = db.execute(_PARTITIONS_SQL)
+                self._partitions = {row.namespace: row.partition_name for row in result.fetchall()}
+            except Exception as e:
+                db.rollback()
+                logger.sync_warning("Could not load cache partitions", error=str(e))
+                return {}
+        return self._partitions
+
+    async def _reclaim_partition(self, partition: str) -> int:
+        """Drop the expired rows of one partition, truncating it if nothing else is left."""
+        table = safe_identifier(partition)
+        result = await self._execute_db(
+            text(f"SELECT count(*) FROM {table} WHERE expires_at <= NOW()"), {}
+        )
+        expired = int(result.scalar() or 0)
+        if not expired:
+            return 0
+        if await self._truncate_partition(partition, only_if_expired=True):
+            return expired
+        return await self._delete_expired_in_chunks(table)
+
+    async def _truncate_partition(self, partition: str, only_if_expired: bool = False) -> bool:
+        """
+        TRUNCATE a cache_entries partition, giving up if its lock is not granted quickly.
+
+        With only_if_expired, writers are locked out first and the partition is
+        truncated only if every row in it has expired.
+        """
+        table = safe_identifier(partition)
+        try:
+            await self._execute_db(
+                text(f"SET LOCAL lock_timeout = '{self.PARTITION_LOCK_TIMEOUT}'"), {}
             )
+            if only_if_expired:
+                await self._execute_db(text(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE"), {})
+                live = await self._execute_db(
+                    text(
+                        f"SELECT EXISTS (SELECT 1 FROM {table} "
+                        "WHERE expires_at IS NULL OR expires_at > NOW())"
+                    ),
+                    {},
+                )
+                if live.scalar():
+                    await self._rollback_db()
+                    return False
+            await self._execute_db(text(f"TRUNCATE {table}"), {}, commit=True)
+            return True
 
-            if isinstance(self.db_session, AsyncSession):
-                result = await self.db_session.execute(query)
-                await self.db_session.commit()
-            else:
-                result = self.db_session.execute(query)
-                self.db_session.commit()
-            return cast(int, result.rowcount)
+        except Exception as e:
+            await self._rollback_db()
+            logger.sync_warning(
+                "Cache partition truncate skipped", partition=partition, error=str(e)
+            )
+            return False
+
+    def _truncate_partition_sync(self, partition: str) -> int | None:
+        """
+        Synchronous TRUNCATE of a namespace partition.
+
+        Returns the number of rows dropped, or None if the partition lock was
+        not granted in time.
+        """
+        db = cast(Session, self.db_session)
+        table = safe_identifier(partition)
+        try:
+            rows = db.execute(_PARTITION_ROWS_SQL, {"partition": table}).scalar() or 0
+            db.execute(text(f"SET LOCAL lock_timeout = '{self.PARTITION_LOCK_TIMEOUT}'"))
+            db.execute(text(f"TRUNCATE {table}"))
+            db.commit()
+            return int(rows)
 
         except Exception as e:
-            from sqlalchemy.ext.asyncio import AsyncSession
+            db.rollback()
+            logger.sync_warning(
+                "Cache partition truncate skipped", partition=partition, error=str(e)
+            )
+            return None
 
-            if isinstance(self.db_session, AsyncSession):
-                await self.db_session.rollback()
-            else:
-                self.db_session.rollback()
-            logger.sync_error("Database cleanup error", error=str(e))
-            return 0
+    async def _delete_expired_in_chunks(self, table: str) -> int:
+        """Delete expired rows of a table in CLEANUP_CHUNK_SIZE batches, pausing in between."""
+        query = text(
+            f"""
+            DELETE FROM {table}
+            WHERE ctid = ANY(ARRAY(
+                SELECT ctid FROM {table}
+                WHERE expires_at IS NOT NULL AND expires_at <= NOW()
+                LIMIT :chunk_size
+            ))
+        """
+        )
+        count = 0
+        while True:
+            result = await self._execute_db(
+                query, {"chunk_size": self.CLEANUP_CHUNK_SIZE}, commit=True
+            )
+            deleted = result.rowcount or 0
+            count += deleted
+            if deleted < self.CLEANUP_CHUNK_SIZE:
+                return count
+            await asyncio.sleep(self.CLEANUP_CHUNK_PAUSE)
 
     async def _get_db_entry_count(self, namespace: str | None = None) -> int:
         """Get count of entries in database."""
@@ -907,27 +2162,36 @@ class CacheService:
         try:
             from sqlalchemy.ext.asyncio import AsyncSession
 
+            # Partition-level statistics (estimates), so no table scan per call
             if namespace:
-                query = text("SELECT COUNT(*) FROM cache_entries WHERE namespace = :namespace")
+                query = text(
+                    "SELECT COALESCE(sum(total_entries), 0) FROM cache_stats "
+                    "WHERE namespace = :namespace"
+                )
                 if isinstance(self.db_session, AsyncSession):
                     result = await self.db_session.execute(query, {"namespace": namespace})
                 else:
                     result = self.db_session.execute(query, {"namespace": namespace})
             else:
-                query = text("SELECT COUNT(*) FROM cache_entries")
+                query = text("SELECT COALESCE(sum(total_entries), 0) FROM cache_stats")
                 if isinstance(self.db_session, AsyncSession):
                     result = await self.db_session.execute(query)
                 else:
                     result = self.db_session.execute(query)
 
-            return result.scalar() or 0
+            return int(result.scalar() or 0)
 
         except Exception as e:
             logger.sync_error("Database entry count error", error=str(e))
             return 0
 
     async def _get_namespace_stats(self, namespace: str) -> dict[str, Any]:
-        """Get statistics for a specific namespace."""
+        """
+        Get statistics for a specific namespace.
+
+        Namespaces with their own partition report catalog statistics (row and
+        size estimates, index-bound expiry counts) without scanning the table.
+        """
         if not self.db_session:
             return {}
 
@@ -959,7 +2223,9 @@ class CacheService:
         try:
             from sqlalchemy.ext.asyncio import AsyncSession
 
-            query = text("SELECT DISTINCT namespace FROM cache_entries ORDER BY namespace")
+            query = text(
+                "SELECT namespace FROM cache_stats WHERE total_entries > 0 ORDER BY namespace"
+            )
             if isinstance(self.db_session, AsyncSession):
                 result = await self.db_session.execute(query)
             else:
@@ -1045,6 +2311,46 @@ async def cache_delete(
     return await cache.delete(key, namespace)
 
 
+async def cache_get_many(
+    keys: list[str], namespace: str = "default", db_session: Session | AsyncSession | None = None
+) -> dict[str, Any]:
+    """Get multiple values from cache (misses are omitted)."""
+    cache = get_cache_service(db_session)
+    return await cache.get_many(keys, namespace)
+
+
+async def cache_set_many(
+    items: dict[str, Any],
+    namespace: str = "default",
+    ttl: int | None = None,
+    db_session: Session | AsyncSession | None = None,
+) -> bool:
+    """Set multiple values in cache."""
+    cache = get_cache_service(db_session)
+    return await cache.set_many(items, namespace, ttl)
+
+
+# Tag naming conventions for invalidate_tags()
+def gene_tag(gene_id: int) -> str:
+    """Tag for entries derived from a gene's data."""
+    return f"gene:{gene_id}"
+
+
+def source_tag(source: str) -> str:
+    """Tag for entries derived from one data source."""
+    return f"source:{source.lower()}"
+
+
+def view_tag(view_name: str) -> str:
+    """Tag for entries derived from a database view."""
+    return f"view:{view_name}"
+
+
+def annotation_tags(gene_id: int, source: str | None = None) -> list[str]:
+    """Tags for a gene's cached annotations, optionally limited to one source."""
+    return [gene_tag(gene_id), source_tag(source)] if source else [gene_tag(gene_id)]
+
+
 # Annotation-specific helper methods for compatibility
 async def get_annotation(
     gene_id: int, source: str | None = None, db_session: Session | AsyncSession | None = None
@@ -1068,30 +2374,15 @@ async def set_annotation(
     """Cache annotation data for a gene (compatibility method)."""
     cache = get_cache_service(db_session)
     key = f"{gene_id}:{source or 'all'}"
-    return await cache.set(key, data, namespace="annotations", ttl=ttl)
+    return await cache.set(
+        key, data, namespace="annotations", ttl=ttl, tags=annotation_tags(gene_id, source)
+    )
 
 
 async def invalidate_gene(gene_id: int, db_session: Session | AsyncSession | None = None) -> int:
-    """Invalidate all cached data for a specific gene."""
+    """Invalidate all cached data tagged with a specific gene."""
     cache = get_cache_service(db_session)
-    count = 0
-
-    # Clear from all namespaces
-    for namespace in [
-        "annotations",
-        "summary",
-        "hgnc",
-        "gnomad",
-        "gtex",
-        "hpo",
-        "clinvar",
-        "string_ppi",
-    ]:
-        pattern_key = f"{gene_id}:*"
-        if await cache.delete(pattern_key, namespace):
-            count += 1
-
-    return count
+    return await cache.invalidate_tags([gene_tag(gene_id)])
 
 
 async def get_summary(
@@ -1113,7 +2404,9 @@ async def set_summary(
 ) -> bool:
     """Cache annotation summary."""
     cache = get_cache_service(db_session)
-    return await cache.set(f"summary:{gene_id}", data, namespace="annotations", ttl=ttl)
+    return await cache.set(
+        f"summary:{gene_id}", data, namespace="annotations", ttl=ttl, tags=[gene_tag(gene_id)]
+    )
 
 
 async def clear_all_annotations(db_session: Session | AsyncSession | None = None) -> int:
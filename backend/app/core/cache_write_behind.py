@@ -0,0 +1,265 @@
+"""
+Write-behind buffer for L2 (database) cache writes.
+
+Cache hits served from L2 used to issue one UPDATE each for access statistics,
+and every set wrote its row synchronously. On a read-heavy API this turns cache
+hits into write traffic. The buffer instead:
+- Coalesces pending sets per cache key (last write wins)
+- Coalesces access-count increments per cache key
+- Flushes both periodically, or early when the buffer fills, in one batch
+
+The buffer is bounded: once ``max_pending`` writes are queued, ``add_write``
+returns False and the caller writes through synchronously. It only buffers
+while started, so scripts and tests without a running flusher keep the
+write-through behaviour. ``stop()`` performs a final flush on shutdown.
+
+A batch stays readable through ``get()`` while it is being flushed. Keys
+deleted, discarded or tag-invalidated during a flush may still be written
+by it; they are recorded as tombstones and deleted from L2 once the flush
+has committed.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+FlushFunc = Callable[[dict[str, Any], dict[str, int]], Awaitable[None]]
+DeleteFunc = Callable[[list[str]], Awaitable[Any]]
+
+
+class WriteBehindBuffer:
+    """
+    Bounded buffer of pending L2 writes and access-count increments.
+
+    Args:
+        interval: Seconds between periodic flushes
+        max_pending: Maximum number of buffered writes before callers write through
+    """
+
+    def __init__(self, interval: float = 2.0, max_pending: int = 5000) -> None:
+        self.interval = interval
+        self.max_pending = max_pending
+
+        self._lock = threading.Lock()
+        self._writes: dict[str, Any] = {}
+        self._access: dict[str, int] = {}
+        # Batch being written by the running flush, and keys removed meanwhile
+        self._flushing: dict[str, Any] = {}
+        self._tombstones: set[str] = set()
+
+        self._flush_func: FlushFunc | None = None
+        self._delete_func: DeleteFunc | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+        self.flushes = 0
+        self.flushed_writes = 0
+        self.flushed_access = 0
+        self.write_throughs = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    # Lifecycle
+
+    def start(self, flush_func: FlushFunc, delete_func: DeleteFunc | None = None) -> None:
+        """
+        Start the periodic flusher on the running event loop.
+
+        Args:
+            flush_func: Writes a batch of entries and access increments to L2
+            delete_func: Deletes keys from L2 that were removed while their
+                batch was being flushed
+        """
+        if self._task is not None:
+            return
+        self._flush_func = flush_func
+        self._delete_func = delete_func
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.sync_info(
+            "Cache write-behind started", interval=self.interval, max_pending=self.max_pending
+        )
+
+    async def stop(self) -> None:
+        """Stop the flusher and flush everything still pending."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await self.flush()
+        logger.sync_info(
+            "Cache write-behind stopped",
+            flushes=self.flushes,
+            flushed_writes=self.flushed_writes,
+            flushed_access=self.flushed_access,
+        )
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def _wake(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # Buffering
+
+    def add_write(self, cache_key: str, entry: Any) -> bool:
+        """
+        Queue a write. Returns False if the caller must write through
+        (flusher not running or buffer full).
+        """
+        if self._task is None:
+            return False
+        with self._lock:
+            if cache_key not in self._writes and len(self._writes) >= self.max_pending:
+                self.write_throughs += 1
+                accepted = False
+            else:
+                self._writes[cache_key] = entry
+                accepted = True
+            full = len(self._writes) >= self.max_pending
+        if full:
+            # Flush early instead of waiting for the interval
+            self._wake()
+        return accepted
+
+    def add_access(self, cache_keys: list[str]) -> bool:
+        """Queue access-count increments. Returns False if not buffering."""
+        if self._task is None:
+            return False
+        with self._lock:
+            for cache_key in cache_keys:
+                self._access[cache_key] = self._access.get(cache_key, 0) + 1
+        return True
+
+    def get(self, cache_key: str) -> Any | None:
+        """A pending or in-flight (not yet committed) write for a key."""
+        with self._lock:
+            entry = self._writes.get(cache_key)
+            return entry if entry is not None else self._flushing.get(cache_key)
+
+    def discard(self, cache_keys: list[str]) -> None:
+        """Drop pending writes for deleted keys so a flush cannot resurrect them."""
+        with self._lock:
+            for cache_key in cache_keys:
+                self._writes.pop(cache_key, None)
+                self._access.pop(cache_key, None)
+            self._discard_flushing(cache_keys)
+
+    def discard_namespace(self, namespace: str) -> None:
+        """Drop pending writes for a cleared namespace."""
+        with self._lock:
+            for cache_key in [
+                k for k, v in self._writes.items() if getattr(v, "namespace", None) == namespace
+            ]:
+                del self._writes[cache_key]
+            self._discard_flushing(
+                [k for k, v in self._flushing.items() if getattr(v, "namespace", None) == namespace]
+            )
+
+    def discard_tags(self, tags: list[str]) -> None:
+        """Drop pending writes carrying any of the invalidated tags."""
+        tag_set = frozenset(tags)
+        with self._lock:
+            for cache_key in [
+                k for k, v in self._writes.items() if not tag_set.isdisjoint(getattr(v, "tags", ()))
+            ]:
+                del self._writes[cache_key]
+            self._discard_flushing(
+                [
+                    k
+                    for k, v in self._flushing.items()
+                    if not tag_set.isdisjoint(getattr(v, "tags", ()))
+                ]
+            )
+
+    def _discard_flushing(self, cache_keys: list[str]) -> None:
+        """Tombstone in-flight keys; the running flush may still write them (lock held)."""
+        for cache_key in cache_keys:
+            if self._flushing.pop(cache_key, None) is not None:
+                self._tombstones.add(cache_key)
+
+    # Flushing
+
+    async def flush(self) -> None:
+        """Flush all pending writes and access increments in one batch."""
+        with self._lock:
+            writes, self._writes = self._writes, {}
+            access, self._access = self._access, {}
+            # A copy, so discards don't change the batch while it is written
+            self._flushing = dict(writes)
+        if not writes and not access:
+            return
+        if self._flush_func is None:
+            self._end_flush()
+            return
+
+        try:
+            await self._flush_func(writes, access)
+            self.flushes += 1
+            self.flushed_writes += len(writes)
+            self.flushed_access += len(access)
+        except Exception as e:
+            # Cache data only: dropped writes are recomputed on the next miss
+            logger.sync_error(
+                "Cache write-behind flush failed",
+                error=str(e),
+                writes=len(writes),
+                access=len(access),
+            )
+        finally:
+            tombstones = self._end_flush()
+
+        if tombstones and self._delete_func is not None:
+            try:
+                await self._delete_func(tombstones)
+            except Exception as e:
+                logger.sync_error(
+                    "Cache write-behind tombstone delete failed",
+                    error=str(e),
+                    keys=len(tombstones),
+                )
+
+    def _end_flush(self) -> list[str]:
+        """Forget the in-flight batch; returns the keys removed while it was written."""
+        with self._lock:
+            self._flushing = {}
+            tombstones, self._tombstones = self._tombstones, set()
+        return sorted(tombstones)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Buffer status for monitoring."""
+        with self._lock:
+            pending_writes = len(self._writes)
+            pending_access = len(self._access)
+            flushing_writes = len(self._flushing)
+        return {
+            "running": self.running,
+            "pending_writes": pending_writes,
+            "pending_access": pending_access,
+            "flushing_writes": flushing_writes,
+            "flushes": self.flushes,
+            "flushed_writes": self.flushed_writes,
+            "flushed_access": self.flushed_access,
+            "write_throughs": self.write_throughs,
+        }
@@ -19,6 +19,8 @@ from sqlalchemy.orm import Session
 
 from app.core.cache_service import CacheService, get_cache_service
 from app.core.config import settings
+from app.core.domain_rate_limiter import LOCAL_RESPONSE
+from app.core.http_pool import create_async_client
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -32,8 +34,13 @@ class CachedHttpClient:
     - Database fallback cache for offline scenarios
     - Automatic retry logic with exponential backoff
     - Circuit breaker pattern for resilience
+    - Coalescing of identical concurrent GETs into one upstream request
     """
 
+    # GET kwargs that don't change the response; requests with any other kwargs
+    # (auth, cookies, ...) are never coalesced
+    _COALESCABLE_KWARGS = frozenset({"params", "headers", "timeout"})
+
     def __init__(
         self,
         cache_service: CacheService | None = None,
@@ -52,7 +59,7 @@ class CachedHttpClient:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Create async HTTP client (plain httpx, no hishel caching layer)
-        self.http_client = httpx.AsyncClient(
+        self.http_client = create_async_client(
             timeout=httpx.Timeout(timeout),
             follow_redirects=True,
         )
@@ -60,6 +67,13 @@ class CachedHttpClient:
         # Circuit breaker state per domain
         self.circuit_breakers: dict[str, dict[str, Any]] = {}
 
+        # In-flight GETs keyed by method + URL + params + headers, with the
+        # (namespace, cache_key) the leader stores its fallback entry under
+        self._inflight: dict[
+            str, tuple[asyncio.Future[httpx.Response], tuple[str, str | None]]
+        ] = {}
+        self.coalesced_requests = 0
+
         logger.sync_info("CachedHttpClient initialized", cache_dir=str(self.cache_dir))
 
     def _get_domain(self, url: str) -> str:
@@ -125,9 +139,10 @@ class CachedHttpClient:
             fallback_ttl: TTL for database cache fallback
             force_refresh: Force refresh bypassing cache
             **kwargs: Additional arguments for httpx
-        """
-        domain = self._get_domain(url)
 
+        Concurrent identical GETs (same URL, params and headers) share one
+        upstream request and its response; force_refresh requests always go out.
+        """
         # Build full URL with query parameters for cache key generation
         # This ensures each unique request gets its own cache entry
         if "params" in kwargs and kwargs["params"]:
@@ -138,6 +153,76 @@ class CachedHttpClient:
         else:
             full_url_for_cache = url
 
+        request_key = None if force_refresh else self._request_key(full_url_for_cache, kwargs)
+        if request_key is None:
+            return await self._get(
+                url, full_url_for_cache, namespace, cache_key, fallback_ttl, force_refresh, kwargs
+            )
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(request_key)
+        # Futures are bound to a loop; never share across loops
+        if inflight is not None and inflight[0].get_loop() is loop:
+            shared, leader_target = inflight
+            self.coalesced_requests += 1
+            logger.sync_debug("HTTP GET coalesced", url=full_url_for_cache)
+            try:
+                # Shield so a cancelled follower does not cancel the shared request
+                response = await asyncio.shield(shared)
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+                # Leader was cancelled; retry and let one of the followers lead
+                return await self.get(
+                    url, namespace, cache_key, fallback_ttl, force_refresh, **kwargs
+                )
+            if (namespace, cache_key) != leader_target:
+                await self._store_fallback_cache(
+                    full_url_for_cache, response, namespace, cache_key, fallback_ttl
+                )
+            return response
+
+        future: asyncio.Future[httpx.Response] = loop.create_future()
+        # Mark a stored exception as retrieved even when nobody is waiting on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[request_key] = (future, (namespace, cache_key))
+        try:
+            response = await self._get(
+                url, full_url_for_cache, namespace, cache_key, fallback_ttl, force_refresh, kwargs
+            )
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            current = self._inflight.get(request_key)
+            if current is not None and current[0] is future:
+                del self._inflight[request_key]
+
+    def _request_key(self, full_url: str, kwargs: dict[str, Any]) -> str | None:
+        """Identity of a GET for coalescing, or None if it must not be shared."""
+        if not self._COALESCABLE_KWARGS.issuperset(kwargs):
+            return None
+        headers = sorted((str(k).lower(), str(v)) for k, v in (kwargs.get("headers") or {}).items())
+        return f"GET {full_url} {headers}"
+
+    async def _get(
+        self,
+        url: str,
+        full_url_for_cache: str,
+        namespace: str,
+        cache_key: str | None,
+        fallback_ttl: int,
+        force_refresh: bool,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        """Send one GET upstream with retries, circuit breaker and fallback cache."""
+        domain = self._get_domain(url)
+
         # Check circuit breaker
         if self._is_circuit_open(domain):
             logger.sync_warning("Circuit breaker open, attempting cache fallback", domain=domain)
@@ -355,6 +440,7 @@ class CachedHttpClient:
                 headers=cached_response.get("headers", {}),
                 content=content,
                 request=httpx.Request("GET", url),
+                extensions={LOCAL_RESPONSE: True},
             )
             return response
         else:
@@ -479,6 +565,12 @@ class CachedHttpClient:
         # Circuit breaker stats
         stats["circuit_breakers"] = self.circuit_breakers.copy()
 
+        # Request coalescing stats
+        stats["coalescing"] = {
+            "in_flight": len(self._inflight),
+            "coalesced_requests": self.coalesced_requests,
+        }
+
         # Database cache stats
         try:
             db_stats = await self.cache_service.get_stats()
@@ -59,9 +59,27 @@ class Settings(BaseSettings):
     # Cache System Configuration
     CACHE_ENABLED: bool = True
     CACHE_DEFAULT_TTL: int = 3600  # 1 hour default TTL
-    CACHE_MAX_MEMORY_SIZE: int = 1000  # Maximum entries in memory cache
+    CACHE_MAX_MEMORY_SIZE: int = 10000  # Maximum entries in memory cache
+    CACHE_MAX_MEMORY_MB: int = 256  # L1 memory budget in MB (primary bound)
+    CACHE_NAMESPACE_MEMORY_QUOTAS_MB: dict[str, int] = {  # Per-namespace L1 byte quotas
+        "network_analysis": 64,
+        "annotations": 64,
+    }
+    CACHE_ADMISSION_ENABLED: bool = True  # TinyLFU admission for L1 when eviction is needed
+    CACHE_CODEC: str = "msgpack"  # L2 serializer: msgpack, orjson, json or jsonb (legacy)
+    CACHE_COMPRESSION: str = "auto"  # L2 compression: auto (zstd, else zlib), zstd, zlib, none
+    CACHE_COMPRESSION_MIN_BYTES: int = 1024  # Smaller L2 payloads are stored uncompressed
+    CACHE_INVALIDATION_BUS_ENABLED: bool = True  # Sync L1 invalidations via LISTEN/NOTIFY
+    CACHE_WRITE_BEHIND_ENABLED: bool = True  # Batch L2 writes and access stats in the background
+    CACHE_WRITE_BEHIND_INTERVAL: float = 2.0  # Seconds between write-behind flushes
+    CACHE_WRITE_BEHIND_MAX_PENDING: int = (
+        5000  # Buffered writes before falling back to write-through
+    )
     CACHE_CLEANUP_INTERVAL: int = 3600  # Cleanup expired entries every hour
+    DATA_VERSION_REFRESH_INTERVAL: float = 5.0  # Max age (s) of a process's data-version snapshot
     CACHE_REDIS_URL: str | None = None  # Optional Redis URL for future use
+    CACHE_DISTRIBUTED_LOCK_ENABLED: bool = False  # Coalesce get_or_set misses across workers
+    CACHE_DISTRIBUTED_LOCK_TIMEOUT: float = 10.0  # Max seconds to wait for another worker
 
     # HTTP Cache settings
     HTTP_CACHE_ENABLED: bool = True
@@ -69,6 +87,20 @@ class Settings(BaseSettings):
     HTTP_CACHE_MAX_SIZE_MB: int = 500  # Maximum cache size in MB
     HTTP_CACHE_TTL_DEFAULT: int = 3600  # Default HTTP cache TTL
 
+    # Record/replay of external HTTP responses for offline, repeatable runs
+    HTTP_CASSETTE_MODE: str = "off"  # off | record | replay
+    HTTP_CASSETTE_DIR: str = ".cache/cassettes"
+    HTTP_CASSETTE_LATENCY_MS: float = 0.0  # Delay added to each replayed response
+
+    # Shared per-domain connection pools for outgoing requests
+    HTTP_POOL_HTTP2: bool = True  # Multiplex over HTTP/2 when h2 is installed
+    HTTP_POOL_MAX_CONNECTIONS: int = 20  # Per domain
+    HTTP_POOL_MAX_KEEPALIVE: int = 10  # Idle connections kept per domain
+    HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept
+
+    # Adaptive per-domain rate limits learned between runs ("" = don't persist)
+    RATE_LIMIT_STATE_FILE: str = ".cache/rate_limits.json"
+
     # Background Tasks
     AUTO_UPDATE_ENABLED: bool = True
 
@@ -87,6 +119,11 @@ class Settings(BaseSettings):
     STRING_DATA_DIR: str = "./data/string/v12.0"
     STRING_CACHE_TTL_DAYS: int = 30
 
+    # Local ontology releases for hierarchy lookups ("" URL = use the API only)
+    ONTOLOGY_DATA_DIR: str = "./data/ontologies"
+    HPO_ONTOLOGY_URL: str = "https://purl.obolibrary.org/obo/hp.obo"
+    MP_ONTOLOGY_URL: str = "https://purl.obolibrary.org/obo/mp.obo"
+
     # Gene Normalization
     HGNC_BATCH_SIZE: int = 50  # Genes per HGNC API batch request
     HGNC_RETRY_ATTEMPTS: int = 3  # Retry attempts for failed requests
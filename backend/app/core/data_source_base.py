@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.core.cache_service import CacheService
 from app.core.cached_http_client import CachedHttpClient
+from app.core.data_versions import GENE_EVIDENCE, GENES, bump_data_versions_async
 from app.core.logging import get_logger
 from app.core.progress_tracker import ProgressTracker
 from app.crud.gene import gene_crud
@@ -275,6 +276,8 @@ class DataSourceClient(ABC):
 
         # Get list of gene symbols for batch normalization
         gene_symbols = list(gene_data.keys())
+        genes_before = stats["genes_created"]
+        evidence_before = stats["evidence_created"] + stats["evidence_updated"]
 
         # Normalize gene symbols in batches
         batch_size = 50
@@ -353,6 +356,15 @@ class DataSourceClient(ABC):
                 items_failed=batch_failed,
             )
 
+        # Batches are committed: move cached results derived from these tables on
+        changed = []
+        if stats["genes_created"] > genes_before:
+            changed.append(GENES)
+        if stats["evidence_created"] + stats["evidence_updated"] > evidence_before:
+            changed.append(GENE_EVIDENCE)
+        if changed:
+            await bump_data_versions_async(*changed)
+
     async def _get_or_create_gene(
         self, db: Session, norm_result: dict[str, Any], original_symbol: str, stats: dict[str, Any]
     ) -> Gene | None:
@@ -0,0 +1,225 @@
+"""
+Global data-version registry.
+
+Each tracked table or view (genes, gene_evidence, gene_annotations, gene_scores)
+has a monotonically increasing version in the ``data_versions`` table. Writers
+bump the version after committing their changes; readers fold the current
+versions into cache keys and HTTP ETags. Cached results then never need a TTL
+for correctness: once the data changes, the key changes and the old entry is
+simply never read again.
+
+Versions are read from the database at most every
+DATA_VERSION_REFRESH_INTERVAL seconds per process. A bump also publishes a
+``data_versions`` message on the cache invalidation bus so other processes
+reload immediately; the interval only bounds staleness when the bus is down.
+
+Reads and bumps hit the database through the synchronous engine. Code on
+the event loop uses the ``*_async`` variants, which run those round trips
+in a worker thread.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tables and views whose changes are tracked by the registry
+GENES = "genes"
+GENE_EVIDENCE = "gene_evidence"
+GENE_ANNOTATIONS = "gene_annotations"
+GENE_SCORES = "gene_scores"
+
+TRACKED_TABLES = (GENES, GENE_EVIDENCE, GENE_ANNOTATIONS, GENE_SCORES)
+
+_BUMP_SQL = text(
+    """
+    INSERT INTO data_versions (name, version, updated_at)
+    SELECT name, 1, NOW() FROM unnest(CAST(:names AS text[])) AS name
+    ON CONFLICT (name)
+    DO UPDATE SET version = data_versions.version + 1, updated_at = NOW()
+    RETURNING name, version
+    """
+)
+
+
+class DataVersionRegistry:
+    """
+    Process-local view of the data versions stored in the database.
+
+    Args:
+        refresh_interval: Maximum age in seconds of the local snapshot
+    """
+
+    def __init__(self, refresh_interval: float | None = None) -> None:
+        self.refresh_interval = (
+            settings.DATA_VERSION_REFRESH_INTERVAL if refresh_interval is None else refresh_interval
+        )
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] = {}
+        self._loaded_at: float | None = None
+
+        self.loads = 0
+        self.bumps = 0
+
+    # Reading
+
+    def get(self, name: str) -> int:
+        """Current version of a table or view (0 if never bumped)."""
+        return self.snapshot([name])[name]
+
+    def snapshot(self, names: Iterable[str] | None = None) -> dict[str, int]:
+        """Current versions of the given tables (default: all tracked tables)."""
+        if self._is_stale():
+            self._load()
+        return self._current(names)
+
+    async def snapshot_async(self, names: Iterable[str] | None = None) -> dict[str, int]:
+        """``snapshot`` that reloads a stale snapshot in a worker thread."""
+        if self._is_stale():
+            await asyncio.to_thread(self._load)
+        return self._current(names)
+
+    def token(self, names: Iterable[str] | None = None) -> str:
+        """Stable string of the current versions, for use in cache keys."""
+        return _format_token(self.snapshot(names))
+
+    async def token_async(self, names: Iterable[str] | None = None) -> str:
+        """``token`` for code running on the event loop."""
+        return _format_token(await self.snapshot_async(names))
+
+    def etag(self, names: Iterable[str] | None = None, *parts: Any) -> str:
+        """Weak HTTP ETag for a response derived from the given tables."""
+        return _format_etag(self.token(names), parts)
+
+    async def etag_async(self, names: Iterable[str] | None = None, *parts: Any) -> str:
+        """``etag`` for code running on the event loop."""
+        return _format_etag(await self.token_async(names), parts)
+
+    def invalidate(self) -> None:
+        """Force a reload on the next read (e.g. after another process bumped)."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _is_stale(self) -> bool:
+        with self._lock:
+            loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at > self.refresh_interval
+
+    def _current(self, names: Iterable[str] | None) -> dict[str, int]:
+        with self._lock:
+            return {name: self._versions.get(name, 0) for name in names or TRACKED_TABLES}
+
+    def _load(self) -> None:
+        from app.core.database import engine
+
+        try:
+            with engine.connect() as conn:
+                rows = conn.execute(text("SELECT name, version FROM data_versions")).fetchall()
+            versions = {row.name: row.version for row in rows}
+            with self._lock:
+                self._versions = versions
+                self._loaded_at = time.monotonic()
+            self.loads += 1
+        except Exception as e:
+            # Keep serving the last snapshot; retry after the interval
+            with self._lock:
+                self._loaded_at = time.monotonic()
+            logger.sync_warning("Failed to load data versions", error=str(e))
+
+    # Writing
+
+    def bump(self, *names: str) -> dict[str, int]:
+        """
+        Increment the versions of the given tables.
+
+        Call after the data change is committed: a reader that sees the new
+        version must also see the new data. The bump runs in its own
+        transaction so it never depends on the caller's session.
+
+        Returns:
+            New versions of the bumped tables (empty if the bump failed)
+        """
+        unique = sorted(set(names))
+        if not unique:
+            return {}
+
+        from app.core.database import engine
+
+        try:
+            with engine.begin() as conn:
+                rows = conn.execute(_BUMP_SQL, {"names": unique}).fetchall()
+        except Exception as e:
+            # Readers fall back to the TTLs of the caches that use the versions
+            logger.sync_error("Failed to bump data versions", tables=unique, error=str(e))
+            return {}
+
+        bumped = {row.name: row.version for row in rows}
+        with self._lock:
+            for name, version in bumped.items():
+                self._versions[name] = max(version, self._versions.get(name, 0))
+        self.bumps += 1
+
+        from app.core.cache_bus import cache_bus
+
+        cache_bus.publish_data_versions()
+        logger.sync_info("Bumped data versions", versions=bumped)
+        return bumped
+
+    async def bump_async(self, *names: str) -> dict[str, int]:
+        """``bump`` for code running on the event loop."""
+        return await asyncio.to_thread(self.bump, *names)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Registry status for monitoring."""
+        with self._lock:
+            versions = dict(self._versions)
+        return {
+            "versions": versions,
+            "refresh_interval": self.refresh_interval,
+            "loads": self.loads,
+            "bumps": self.bumps,
+        }
+
+
+def _format_token(versions: dict[str, int]) -> str:
+    return ",".join(f"{name}={versions[name]}" for name in sorted(versions))
+
+
+def _format_etag(token: str, parts: Iterable[Any]) -> str:
+    raw = "|".join([token, *(str(part) for part in parts)])
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value matches *etag* (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+# Singleton instance for the process
+data_versions = DataVersionRegistry()
+
+
+def bump_data_versions(*names: str) -> dict[str, int]:
+    """Increment the versions of the given tables (after committing the change)."""
+    return data_versions.bump(*names)
+
+
+async def bump_data_versions_async(*names: str) -> dict[str, int]:
+    """``bump_data_versions`` for code running on the event loop."""
+    return await data_versions.bump_async(*names)
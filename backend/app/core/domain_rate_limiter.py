@@ -4,38 +4,96 @@ Per-domain rate limiter for outgoing HTTP requests.
 Uses aiolimiter (leaky bucket) + asyncio.Semaphore for per-domain
 rate limiting and concurrency control. Designed for annotation
 pipeline sources that hit multiple external APIs.
+
+Rates are adaptive (AIMD): a domain's rate grows additively after a run
+of successful responses and is cut multiplicatively on 429/503, which
+also pauses the domain for the server's ``Retry-After``.  Learned rates
+are persisted per domain so the next run starts where the last one
+ended instead of at the conservative configured rate.  Rate changes are
+written in batches off the event loop, and each write merges into the
+file so processes sharing it keep each other's rates.
 """
 
 import asyncio
+import json
+import threading
 import time
-from collections.abc import AsyncGenerator
+import uuid
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
-from typing import Any
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, cast
 from urllib.parse import urlparse
 
+import httpx
 from aiolimiter import AsyncLimiter
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Status codes that mean "slow down"
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Response extension marking responses that did not come from the server
+# (cassette replays, database fallback copies); they say nothing about its limits
+LOCAL_RESPONSE = "local_response"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
 
 class DomainLimiter:
-    """Rate limiter + concurrency control for a single domain."""
+    """Adaptive rate limiter + concurrency control for a single domain."""
 
-    def __init__(self, max_rate: float = 5.0, max_concurrent: int = 3):
-        self.max_rate = max_rate
-        self._rate_limiter = AsyncLimiter(max_rate=max_rate, time_period=1.0)
+    def __init__(
+        self,
+        max_rate: float = 5.0,
+        max_concurrent: int = 3,
+        min_rate: float | None = None,
+        rate_ceiling: float | None = None,
+        increase_step: float | None = None,
+        increase_after: int = 20,
+        decrease_factor: float = 0.5,
+        on_rate_change: Callable[[], None] | None = None,
+    ):
+        self.min_rate = min_rate if min_rate is not None else min(max_rate, 0.5)
+        self.rate_ceiling = rate_ceiling if rate_ceiling is not None else max_rate
+        self.increase_step = increase_step if increase_step is not None else max(max_rate / 10, 0.1)
+        self.increase_after = increase_after
+        self.decrease_factor = decrease_factor
+        self._on_rate_change = on_rate_change
         self._semaphore = asyncio.Semaphore(max_concurrent)
         self._paused_until: float = 0.0
+        self._successes = 0
+        self._last_decrease: float = 0.0
+        self._set_rate(max_rate)
 
     @property
     def is_paused(self) -> bool:
         return time.monotonic() < self._paused_until
 
+    @property
+    def min_interval(self) -> float:
+        """Seconds between requests at the current rate."""
+        return 1.0 / self.max_rate
+
     def pause(self, seconds: float) -> None:
         """Pause all requests to this domain (e.g., on 429 Retry-After)."""
-        self._paused_until = time.monotonic() + seconds
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
         logger.sync_info(
             "Domain paused",
             pause_seconds=seconds,
@@ -53,11 +111,62 @@ class DomainLimiter:
             await self._rate_limiter.acquire()
             yield
 
+    async def wait(self) -> None:
+        """Wait for a rate limit slot (pacing only; the concurrency slot is released at once)."""
+        async with self.acquire():
+            return
+
+    def record_response(self, status_code: int, retry_after: str | None = None) -> None:
+        """Feed a response back into the rate: throttling slows down, success speeds up."""
+        if status_code in THROTTLE_STATUS_CODES:
+            self.record_throttle(parse_retry_after(retry_after))
+        elif status_code < 500:
+            self.record_success()
+
+    def record_success(self) -> None:
+        """Additive increase after ``increase_after`` consecutive successes."""
+        self._successes += 1
+        if self._successes < self.increase_after or self.max_rate >= self.rate_ceiling:
+            return
+        self._successes = 0
+        self._set_rate(min(self.max_rate + self.increase_step, self.rate_ceiling))
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease (at most once per interval) and honour Retry-After."""
+        self._successes = 0
+        if retry_after:
+            self.pause(retry_after)
+        now = time.monotonic()
+        # Concurrent requests sent at the old rate all see the throttle; count it once
+        if now - self._last_decrease < max(self.min_interval, 1.0):
+            return
+        self._last_decrease = now
+        self._set_rate(max(self.max_rate * self.decrease_factor, self.min_rate))
+
+    def _set_rate(self, rate: float) -> None:
+        previous = getattr(self, "max_rate", None)
+        self.max_rate = min(max(rate, self.min_rate), self.rate_ceiling)
+        if previous == self.max_rate:
+            return
+        # The bucket holds at least one request so that rates below 1/s work
+        capacity = max(self.max_rate, 1.0)
+        self._rate_limiter = AsyncLimiter(max_rate=capacity, time_period=capacity / self.max_rate)
+        if previous is not None:
+            logger.sync_debug("Domain rate adjusted", previous_rate=previous, rate=self.max_rate)
+            if self._on_rate_change is not None:
+                self._on_rate_change()
+
 
 class DomainRateLimiterRegistry:
     """
     Registry of per-domain rate limiters.
 
+    Domain configs accept ``max_rate`` (starting rate), ``max_concurrent``,
+    and the AIMD bounds ``min_rate`` / ``rate_ceiling`` (defaults: no
+    increase beyond ``max_rate``).  With a ``state_path``, learned rates are
+    loaded from and saved to a JSON file; rate changes are saved at most
+    every ``save_delay`` seconds.
+
     Usage:
         registry = DomainRateLimiterRegistry(
             domain_configs={
@@ -67,6 +176,7 @@ class DomainRateLimiterRegistry:
         limiter = registry.get("rest.ensembl.org")
         async with limiter.acquire():
             response = await client.get(url)
+        registry.record_response(response)
     """
 
     def __init__(
@@ -74,39 +184,144 @@ class DomainRateLimiterRegistry:
         domain_configs: dict[str, dict[str, Any]] | None = None,
         default_max_rate: float = 5.0,
         default_max_concurrent: int = 3,
+        state_path: Path | str | None = None,
+        save_delay: float = 2.0,
     ):
         self._configs = domain_configs or {}
         self._default_max_rate = default_max_rate
         self._default_max_concurrent = default_max_concurrent
         self._limiters: dict[str, DomainLimiter] = {}
+        self._state_path = Path(state_path) if state_path else None
+        self._learned_rates = self._load_state()
+        self.save_delay = save_delay
+        # Rate of each limiter as last saved (or as created); only changes are written
+        self._saved_rates: dict[str, float] = {}
+        self._save_lock = threading.Lock()
+        self._save_scheduled = False
 
-    def get(self, domain: str) -> DomainLimiter:
-        """Get or create a rate limiter for a domain."""
+    def get(self, domain: str, **overrides: Any) -> DomainLimiter:
+        """Get or create a rate limiter for a domain.
+
+        *overrides* (e.g. ``max_rate`` from a source's own configuration)
+        take precedence over the domain config when the limiter is created.
+        A rate learned in an earlier run takes precedence over both.
+        """
         if domain not in self._limiters:
-            config = self._configs.get(domain, {})
-            self._limiters[domain] = DomainLimiter(
-                max_rate=config.get("max_rate", self._default_max_rate),
+            config = {**self._configs.get(domain, {}), **overrides}
+            max_rate = config.get("max_rate", self._default_max_rate)
+            limiter = DomainLimiter(
+                max_rate=max_rate,
                 max_concurrent=config.get("max_concurrent", self._default_max_concurrent),
+                min_rate=config.get("min_rate"),
+                rate_ceiling=max(config.get("rate_ceiling", max_rate), max_rate),
             )
+            learned = self._learned_rates.get(domain)
+            if learned is not None:
+                limiter._set_rate(learned)
+            limiter._on_rate_change = self._schedule_save
+            self._saved_rates[domain] = limiter.max_rate
+            self._limiters[domain] = limiter
         return self._limiters[domain]
 
-    def get_for_url(self, url: str) -> DomainLimiter:
+    def get_for_url(self, url: str, **overrides: Any) -> DomainLimiter:
         """Extract domain from URL and return its limiter."""
         domain = urlparse(url).hostname or "unknown"
-        return self.get(domain)
+        return self.get(domain, **overrides)
 
     def pause_domain(self, domain: str, seconds: float) -> None:
         """Pause all requests to a domain (call on 429 response)."""
         self.get(domain).pause(seconds)
 
+    def record_response(self, response: httpx.Response) -> None:
+        """Feed *response* back to the limiter of its domain, if one is in use."""
+        if response.extensions.get(LOCAL_RESPONSE):
+            return
+        limiter = self._limiters.get(response.request.url.host)
+        if limiter is not None:
+            limiter.record_response(response.status_code, response.headers.get("retry-after"))
+
+    def save_state(self) -> None:
+        """Persist the rates changed in this process, merged into the current file.
+
+        The file is re-read before writing, so rates saved by other
+        processes since this one started are kept.  Blocking; see
+        :meth:`_schedule_save` for calls from the event loop.
+        """
+        if self._state_path is None:
+            return
+        with self._save_lock:
+            changed = {
+                domain: limiter.max_rate
+                for domain, limiter in list(self._limiters.items())
+                if limiter.max_rate != self._saved_rates.get(domain)
+            }
+            if not changed:
+                return
+            state = self._read_state()
+            now = time.time()
+            for domain, rate in changed.items():
+                state[domain] = {"max_rate": round(rate, 3), "updated_at": now}
+            tmp_path = self._state_path.with_name(f"{self._state_path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                self._state_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(json.dumps(dict(sorted(state.items())), indent=2))
+                tmp_path.replace(self._state_path)
+            except OSError as exc:
+                tmp_path.unlink(missing_ok=True)
+                logger.sync_warning("Could not save learned rate limits", error=str(exc))
+                return
+            self._saved_rates.update(changed)
+            self._learned_rates = self._rates_of(state)
+
+    def _schedule_save(self) -> None:
+        """Save rate changes after ``save_delay``, in the default executor.
+
+        AIMD adjusts rates often; this coalesces the writes and keeps the
+        file I/O off the event loop.  Without a running loop the state is
+        saved at once.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_state()
+            return
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            loop.call_later(self.save_delay, self._save_async, loop)
 
-# Default domain rate limits for annotation sources
+    def _save_async(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._save_scheduled = False
+        loop.run_in_executor(None, self.save_state)
+
+    def _load_state(self) -> dict[str, float]:
+        return self._rates_of(self._read_state())
+
+    def _read_state(self) -> dict[str, Any]:
+        if self._state_path is None or not self._state_path.exists():
+            return {}
+        try:
+            state = json.loads(self._state_path.read_text())
+            self._rates_of(state)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.sync_warning("Ignoring unreadable rate limit state", error=str(exc))
+            return {}
+        return cast(dict[str, Any], state)
+
+    @staticmethod
+    def _rates_of(state: dict[str, Any]) -> dict[str, float]:
+        return {domain: float(entry["max_rate"]) for domain, entry in state.items()}
+
+
+# Default domain rate limits for annotation sources.  max_rate is the starting
+# rate; rate_ceiling is the most the adaptive limiter will try (published limits
+# where a service has them: E-utilities allows 10 req/s with an API key, the
+# www.ncbi.nlm.nih.gov web endpoints 3 req/s).
 DEFAULT_DOMAIN_CONFIGS: dict[str, dict[str, Any]] = {
     "ontology.jax.org": {"max_rate": 2.0, "max_concurrent": 2},
-    "www.ncbi.nlm.nih.gov": {"max_rate": 3.0, "max_concurrent": 3},
-    "eutils.ncbi.nlm.nih.gov": {"max_rate": 10.0, "max_concurrent": 3},
+    "www.ncbi.nlm.nih.gov": {"max_rate": 3.0, "max_concurrent": 3, "rate_ceiling": 3.0},
+    "eutils.ncbi.nlm.nih.gov": {"max_rate": 10.0, "max_concurrent": 3, "rate_ceiling": 10.0},
     "rest.ensembl.org": {"max_rate": 15.0, "max_concurrent": 5},
-    "rest.uniprot.org": {"max_rate": 5.0, "max_concurrent": 3},
+    "rest.uniprot.org": {"max_rate": 5.0, "max_concurrent": 3, "rate_ceiling": 50.0},
     "www.genenames.org": {"max_rate": 5.0, "max_concurrent": 3},
     "gnomad.broadinstitute.org": {"max_rate": 5.0, "max_concurrent": 3},
     "search.thegencc.org": {"max_rate": 10.0, "max_concurrent": 5},
@@ -123,9 +338,12 @@ def get_domain_rate_limiter_registry() -> DomainRateLimiterRegistry:
     """Get the shared domain rate limiter registry."""
     global _registry
     if _registry is None:
+        from app.core.config import settings
+
         _registry = DomainRateLimiterRegistry(
             domain_configs=DEFAULT_DOMAIN_CONFIGS,
             default_max_rate=5.0,
             default_max_concurrent=3,
+            state_path=settings.RATE_LIMIT_STATE_FILE or None,
         )
     return _registry
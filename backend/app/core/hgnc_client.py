@@ -248,19 +248,28 @@ class HGNCClientCached:
         if not symbols:
             return {}
 
-        # Check cache for each symbol first
+        # Check cache for all symbols with two batched lookups
         result = {}
         uncached_symbols = []
 
-        for symbol in symbols:
-            cache_key = f"standardize_symbol:{symbol.strip().upper()}"
-            cached_result = await self.cache_service.get(cache_key, self.NAMESPACE)
+        normalized = {symbol: symbol.strip().upper() for symbol in symbols}
+        cached_symbols = await self.cache_service.get_many(
+            [f"standardize_symbol:{norm}" for norm in normalized.values()], self.NAMESPACE
+        )
+        cached_hgnc_ids = await self.cache_service.get_many(
+            [
+                f"symbol_to_hgnc_id:{norm}"
+                for norm in normalized.values()
+                if f"standardize_symbol:{norm}" in cached_symbols
+            ],
+            self.NAMESPACE,
+        )
 
-            if cached_result is not None:
-                # Get additional info from cache
-                hgnc_id_key = f"symbol_to_hgnc_id:{symbol.strip().upper()}"
-                cached_hgnc_id = await self.cache_service.get(hgnc_id_key, self.NAMESPACE)
+        for symbol, norm in normalized.items():
+            cached_result = cached_symbols.get(f"standardize_symbol:{norm}")
 
+            if cached_result is not None:
+                cached_hgnc_id = cached_hgnc_ids.get(f"symbol_to_hgnc_id:{norm}")
                 result[symbol] = {"approved_symbol": cached_result, "hgnc_id": cached_hgnc_id}
             else:
                 uncached_symbols.append(symbol)
@@ -291,6 +300,7 @@ class HGNCClientCached:
             # Process results and cache individually
             result = {}
             found_symbols = set()
+            to_cache: dict[str, str] = {}
 
             for symbol in original_symbols:
                 result[symbol] = {"approved_symbol": symbol, "hgnc_id": None}
@@ -311,10 +321,15 @@ class HGNCClientCached:
                         }
                         found_symbols.add(original_symbol)
 
-                        # Cache the results
-                        await self._cache_symbol_results(original_symbol, approved_symbol, hgnc_id)
+                        to_cache.update(
+                            self._symbol_cache_items(original_symbol, approved_symbol, hgnc_id)
+                        )
                         break
 
+            # Cache all matched results with one batched write
+            if to_cache:
+                await self.cache_service.set_many(to_cache, self.NAMESPACE, self.ttl)
+
             # Process symbols not found in batch with individual lookups
             for original_symbol in original_symbols:
                 if original_symbol not in found_symbols:
@@ -344,20 +359,15 @@ class HGNCClientCached:
                 }
             return result
 
-    async def _cache_symbol_results(
+    def _symbol_cache_items(
         self, original_symbol: str, approved_symbol: str, hgnc_id: str | None
-    ) -> None:
-        """Cache individual symbol results for future use."""
+    ) -> dict[str, str]:
+        """Cache entries for a standardized symbol and its HGNC ID."""
         normalized_symbol = original_symbol.strip().upper()
-
-        # Cache standardized symbol
-        standardize_key = f"standardize_symbol:{normalized_symbol}"
-        await self.cache_service.set(standardize_key, approved_symbol, self.NAMESPACE, self.ttl)
-
-        # Cache HGNC ID if available
+        items = {f"standardize_symbol:{normalized_symbol}": approved_symbol}
         if hgnc_id:
-            hgnc_id_key = f"symbol_to_hgnc_id:{normalized_symbol}"
-            await self.cache_service.set(hgnc_id_key, hgnc_id, self.NAMESPACE, self.ttl)
+            items[f"symbol_to_hgnc_id:{normalized_symbol}"] = hgnc_id
+        return items
 
     async def standardize_symbols_parallel(
         self, symbols: list[str]
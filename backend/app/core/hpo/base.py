@@ -8,6 +8,7 @@ from typing import Any
 
 from app.core.cache_service import CacheService
 from app.core.cached_http_client import CachedHttpClient
+from app.core.http_pool import create_async_client
 from app.core.logging import get_logger
 from app.core.retry_utils import RetryConfig, retry_with_backoff
 
@@ -114,10 +115,8 @@ class HPOAPIBase:
                 raise
 
         # Fallback to basic HTTP request if no cached client
-        import httpx
-
         # Use longer timeout for HPO API - descendants endpoint returns large data (3+ MB)
-        async with httpx.AsyncClient() as client:
+        async with create_async_client() as client:
             response = await client.get(url, params=params, timeout=90.0)
             response.raise_for_status()
             data = response.json()
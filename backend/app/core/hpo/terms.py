@@ -1,17 +1,40 @@
 """
 HPO term operations and hierarchy traversal.
+
+Hierarchy lookups and term details are served from the local HPO release
+(see :mod:`app.core.ontology`); the HPO API is only used when the release
+is unavailable or does not know a term.
 """
 
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
 from app.core.hpo.base import HPOAPIBase
 from app.core.hpo.models import HPOTerm
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from app.core.ontology import OntologyIndex
+
 logger = get_logger(__name__)
 
 
+async def get_hpo_ontology() -> "OntologyIndex | None":
+    """Process-wide index of the local HPO release, or ``None`` if unavailable."""
+    from app.core.ontology import get_ontology
+
+    return await get_ontology("HPO", settings.HPO_ONTOLOGY_URL, prefix="HP:")
+
+
 class HPOTerms(HPOAPIBase):
     """HPO term operations and hierarchy traversal."""
 
+    # Serve hierarchy lookups from the local HPO release when it is available
+    use_local_ontology = True
+
+    async def _local_ontology(self) -> "OntologyIndex | None":
+        return await get_hpo_ontology() if self.use_local_ontology else None
+
     async def get_term(self, hpo_id: str) -> HPOTerm | None:
         """
         Get detailed information about an HPO term.
@@ -22,6 +45,19 @@ class HPOTerms(HPOAPIBase):
         Returns:
             HPOTerm object or None if not found
         """
+        ontology = await self._local_ontology()
+        if ontology is not None and (term := ontology.term(hpo_id)) is not None:
+            return HPOTerm(
+                id=term["id"],
+                name=term["name"],
+                definition=term["definition"],
+                synonyms=term["synonyms"],
+                is_obsolete=term["is_obsolete"],
+                replaced_by=term["replaced_by"],
+                children=term["children"],
+                parents=term["parents"],
+            )
+
         try:
             response = await self._get(
                 f"hp/terms/{hpo_id}",
@@ -53,8 +89,9 @@ class HPOTerms(HPOAPIBase):
         """
         Get all descendant terms using optimal strategy.
 
-        First tries the descendants endpoint (single call), then falls back
-        to recursive children traversal if needed.
+        Uses the local HPO release if it knows the term.  Otherwise tries the
+        descendants endpoint (single call), then falls back to recursive
+        children traversal if needed.
 
         Args:
             hpo_id: HPO term ID
@@ -64,6 +101,10 @@ class HPOTerms(HPOAPIBase):
         Returns:
             Set of HPO term IDs including descendants
         """
+        ontology = await self._local_ontology()
+        if ontology is not None and hpo_id in ontology:
+            return ontology.descendants(hpo_id, include_self=include_self)
+
         descendants = set()
         if include_self:
             descendants.add(hpo_id)
@@ -106,6 +147,9 @@ class HPOTerms(HPOAPIBase):
         """
         Recursively collect descendants via children endpoint.
 
+        Last resort: one request per term, used only without the local HPO
+        release and the descendants endpoint.
+
         Args:
             hpo_id: HPO term ID
             max_depth: Maximum recursion depth
@@ -159,6 +203,10 @@ class HPOTerms(HPOAPIBase):
         Returns:
             List of child HPO term IDs
         """
+        ontology = await self._local_ontology()
+        if ontology is not None and hpo_id in ontology:
+            return ontology.children(hpo_id)
+
         try:
             response = await self._get(
                 f"hp/terms/{hpo_id}/children", cache_key=f"children:{hpo_id}", ttl=self.ttl_stable
@@ -177,34 +225,79 @@ class HPOTerms(HPOAPIBase):
 
         return []
 
-    async def get_ancestors(self, hpo_id: str) -> list[str]:
+    async def get_parents(self, hpo_id: str) -> list[str]:
         """
-        Get ancestor terms (parents up to root).
+        Get immediate parents of an HPO term.
 
         Args:
             hpo_id: HPO term ID
 
         Returns:
-            List of ancestor HPO term IDs
+            List of parent HPO term IDs
         """
+        ontology = await self._local_ontology()
+        if ontology is not None and hpo_id in ontology:
+            return ontology.parents(hpo_id)
+
         try:
             response = await self._get(
                 f"hp/terms/{hpo_id}/parents", cache_key=f"parents:{hpo_id}", ttl=self.ttl_stable
             )
 
             if isinstance(response, list):
-                ancestors = []
+                parents = []
                 for parent in response:
                     parent_id = parent.get("id") if isinstance(parent, dict) else parent
                     if parent_id:
-                        ancestors.append(parent_id)
-                return ancestors
+                        parents.append(parent_id)
+                return parents
 
         except Exception as e:
-            logger.sync_error("Failed to get ancestors for HPO term", hpo_id=hpo_id, error=str(e))
+            logger.sync_error("Failed to get parents for HPO term", hpo_id=hpo_id, error=str(e))
 
         return []
 
+    async def get_ancestors(self, hpo_id: str) -> list[str]:
+        """
+        Get ancestor terms (parents up to root).
+
+        Without the local HPO release, the parents are walked through the API.
+
+        Args:
+            hpo_id: HPO term ID
+
+        Returns:
+            Sorted list of ancestor HPO term IDs
+        """
+        ontology = await self._local_ontology()
+        if ontology is not None and hpo_id in ontology:
+            return sorted(ontology.ancestors(hpo_id))
+
+        ancestors: set[str] = set()
+        pending = [hpo_id]
+        while pending:
+            for parent_id in await self.get_parents(pending.pop()):
+                if parent_id not in ancestors:
+                    ancestors.add(parent_id)
+                    pending.append(parent_id)
+        return sorted(ancestors)
+
+    async def is_descendant_of(self, hpo_id: str, ancestor_id: str) -> bool:
+        """
+        Check whether a term is (a subclass of) another term.
+
+        Args:
+            hpo_id: HPO term ID
+            ancestor_id: Candidate ancestor HPO term ID
+
+        Returns:
+            True if hpo_id equals ancestor_id or is one of its descendants
+        """
+        ontology = await self._local_ontology()
+        if ontology is not None and hpo_id in ontology and ancestor_id in ontology:
+            return ontology.is_a(hpo_id, ancestor_id)
+        return hpo_id in await self.get_descendants(ancestor_id, include_self=True)
+
     async def search_terms(self, query: str, max_results: int = 100) -> list[HPOTerm]:
         """
         Search for HPO terms by text.
@@ -0,0 +1,138 @@
+"""
+Record/replay ("cassette") layer for outgoing HTTP requests.
+
+With ``HTTP_CASSETTE_MODE=record`` every external response is stored in
+``HTTP_CASSETTE_DIR``; with ``HTTP_CASSETTE_MODE=replay`` the same requests
+are answered from that archive without touching the network, optionally
+delayed by ``HTTP_CASSETTE_LATENCY_MS`` to simulate a real link.  That makes
+pipeline runs repeatable offline, e.g. for benchmarking and profiling.
+
+The layer is an httpx transport, so it sits below CachedHttpClient,
+RetryableHTTPClient and the bulk downloads, which create their clients via
+:func:`app.core.http_pool.create_async_client`; recordings are made over the
+shared connection pools.  Bodies are streamed to and from disk, so large
+bulk files are never held in memory.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+
+from app.core.domain_rate_limiter import LOCAL_RESPONSE
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay")
+CHUNK_SIZE = 65536
+
+# Request headers that select a different response and are part of the match
+_MATCHED_HEADERS = ("range", "accept")
+
+
+class _FileByteStream(httpx.AsyncByteStream):
+    """Async byte stream over a recorded body file."""
+
+    def __init__(self, path: Path):
+        self._path = path
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with open(self._path, "rb") as fh:
+            while chunk := fh.read(CHUNK_SIZE):
+                yield chunk
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that records responses to, or replays them from, a directory.
+
+    Requests are matched on method, URL (including query), body and the
+    headers in ``_MATCHED_HEADERS``.  A request with no recording fails in
+    replay mode with :class:`httpx.ConnectError`, like being offline.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        directory: Path,
+        transport: httpx.AsyncBaseTransport | None = None,
+        latency: float = 0.0,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        if mode == "record" and transport is None:
+            raise ValueError("Record mode needs a transport to forward requests to")
+        self.mode = mode
+        self.directory = directory
+        self.latency = latency
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = await self._request_key(request)
+        meta_path, body_path = self._paths(key)
+
+        if self.mode == "replay":
+            if not meta_path.exists():
+                raise httpx.ConnectError(
+                    f"No cassette recording for {request.method} {request.url}", request=request
+                )
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            meta = json.loads(meta_path.read_text())
+            return httpx.Response(
+                meta["status_code"],
+                headers=meta["headers"],
+                stream=_FileByteStream(body_path),
+                request=request,
+                extensions={"cassette": "replay", LOCAL_RESPONSE: True},
+            )
+
+        assert self._transport is not None
+        response = await self._transport.handle_async_request(request)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write the encoded body as received; httpx decodes it again on replay
+        tmp_path = body_path.with_suffix(".tmp")
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        try:
+            with open(tmp_path, "wb") as fh:
+                async for chunk in response.stream:
+                    fh.write(chunk)
+        finally:
+            await response.aclose()
+        tmp_path.replace(body_path)
+        meta = {
+            "method": request.method,
+            "url": str(request.url),
+            "status_code": response.status_code,
+            "headers": response.headers.multi_items(),
+            "recorded_at": time.time(),
+        }
+        meta_path.write_text(json.dumps(meta))
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_FileByteStream(body_path),
+            request=request,
+            extensions={"cassette": "record"},
+        )
+
+    async def aclose(self) -> None:
+        if self._transport is not None:
+            await self._transport.aclose()
+
+    async def _request_key(self, request: httpx.Request) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{request.method} {request.url}\n".encode())
+        for name in _MATCHED_HEADERS:
+            digest.update(f"{name}: {request.headers.get(name, '')}\n".encode())
+        digest.update(await request.aread())
+        return digest.hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.directory / key[:2] / key
+        return base.with_suffix(".json"), base.with_suffix(".body")
@@ -0,0 +1,194 @@
+"""
+Process-wide pool of HTTP connections to external hosts.
+
+Annotation sources, bulk downloads, CachedHttpClient and the HPO client each
+create their own ``httpx.AsyncClient``.  Without sharing, every one of them
+opens its own TLS connections to the same hosts.  The pool keeps one
+connection pool per domain (HTTP/2 when ``h2`` is installed, so requests to
+a host are multiplexed) and hands out a transport that routes each request
+to the pool of its host.  Clients created via :func:`create_async_client`
+use it (through the record/replay cassette when that is enabled), so
+keep-alive connections outlive the individual clients.
+
+Closing a client does not close the shared connections; they are closed
+by :func:`close_shared_http_pool` on worker/application shutdown.
+
+Usage:
+    async with create_async_client(timeout=30.0) as client:
+        response = await client.get(url)
+"""
+
+import asyncio
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.core.http_cassette import CASSETTE_MODES, CassetteTransport
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Routes each request to the pool of its host; closing it leaves the pools open."""
+
+    def __init__(self, pool: "SharedHttpPool"):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self._pool.get(request.url.host or "unknown")
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # Connections are owned by the pool, not by the client using them
+        pass
+
+
+class SharedHttpPool:
+    """
+    Registry of per-domain connection pools.
+
+    Connection pools are bound to the event loop they were opened in, so
+    pools are kept per running loop.  Domains listed in ``domain_limits``
+    get their own ``max_connections`` / ``max_keepalive_connections`` and
+    may turn ``http2`` off.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        domain_limits: dict[str, dict[str, Any]] | None = None,
+        transport_factory: Callable[[str], httpx.AsyncBaseTransport] | None = None,
+    ):
+        self.http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.sync_debug("h2 not installed, shared HTTP pool uses HTTP/1.1")
+        self._limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+        }
+        self._domain_limits = domain_limits or {}
+        self._transport_factory = transport_factory or self._create_transport
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, httpx.AsyncBaseTransport]
+        ] = weakref.WeakKeyDictionary()
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        """Transport for an ``httpx.AsyncClient`` that uses the shared pools."""
+        return _SharedTransport(self)
+
+    def get(self, domain: str) -> httpx.AsyncBaseTransport:
+        """Get or create the connection pool for *domain* in the running loop."""
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        if domain not in pools:
+            pools[domain] = self._transport_factory(domain)
+            logger.sync_debug("Opened shared HTTP pool", domain=domain, http2=self.http2)
+        return pools[domain]
+
+    def domains(self) -> list[str]:
+        """Domains with an open pool in any loop."""
+        return sorted({domain for pools in self._pools.values() for domain in pools})
+
+    async def aclose(self) -> None:
+        """Close the pools of the running loop and forget those of other loops."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        pools = self._pools.pop(loop, {}) if loop is not None else {}
+        # Pools of other (usually finished) loops cannot be closed from here
+        self._pools.clear()
+        for domain, transport in pools.items():
+            try:
+                await transport.aclose()
+            except Exception as exc:
+                logger.sync_warning("Error closing HTTP pool", domain=domain, error=str(exc))
+
+    def _create_transport(self, domain: str) -> httpx.AsyncBaseTransport:
+        limits = {**self._limits, **self._domain_limits.get(domain, {})}
+        http2 = self.http2 and limits.pop("http2", True)
+        return httpx.AsyncHTTPTransport(http2=http2, limits=httpx.Limits(**limits))
+
+
+# Hosts that serve large bulk files in parallel ranges get more connections.
+# They stay on HTTP/1.1: with HTTP/2, httpcore hands concurrent requests to
+# one pending connection, so the range segments would share a single stream.
+DEFAULT_DOMAIN_LIMITS: dict[str, dict[str, Any]] = {
+    "ftp.ncbi.nlm.nih.gov": {"max_connections": 32, "http2": False},
+    "ftp.ensembl.org": {"max_connections": 32, "http2": False},
+    "storage.googleapis.com": {"max_connections": 32, "http2": False},
+    "stringdb-downloads.org": {"max_connections": 32, "http2": False},
+}
+
+# Singleton pool — shared across all annotation and evidence sources
+_pool: SharedHttpPool | None = None
+
+
+def get_shared_http_pool() -> SharedHttpPool:
+    """Get the process-wide HTTP connection pool."""
+    global _pool
+    if _pool is None:
+        from app.core.config import settings
+
+        _pool = SharedHttpPool(
+            http2=settings.HTTP_POOL_HTTP2,
+            max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_POOL_KEEPALIVE_EXPIRY,
+            domain_limits=DEFAULT_DOMAIN_LIMITS,
+        )
+    return _pool
+
+
+async def close_shared_http_pool() -> None:
+    """Shutdown hook: close all shared connections of this process."""
+    global _pool
+    if _pool is None:
+        return
+    pool, _pool = _pool, None
+    logger.sync_info("Closing shared HTTP pool", domains=pool.domains())
+    await pool.aclose()
+
+
+def create_async_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create an ``httpx.AsyncClient`` for an external service.
+
+    Accepts the usual ``httpx.AsyncClient`` arguments.  Unless a
+    ``transport`` is given, requests go over the process-wide connection
+    pools (whose limits replace ``limits`` and ``http2``) and through the
+    cassette when it is enabled.
+    """
+    from app.core.config import settings
+
+    mode = settings.HTTP_CASSETTE_MODE
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"HTTP_CASSETTE_MODE must be one of {CASSETTE_MODES}, got {mode!r}")
+    if "transport" in kwargs:
+        return httpx.AsyncClient(**kwargs)
+
+    if mode == "off":
+        kwargs["transport"] = get_shared_http_pool().transport()
+        return httpx.AsyncClient(**kwargs)
+
+    transport = get_shared_http_pool().transport() if mode == "record" else None
+    kwargs["transport"] = CassetteTransport(
+        mode,
+        Path(settings.HTTP_CASSETTE_DIR),
+        transport,
+        latency=settings.HTTP_CASSETTE_LATENCY_MS / 1000.0,
+    )
+    return httpx.AsyncClient(**kwargs)
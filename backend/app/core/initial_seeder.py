@@ -12,6 +12,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.core.data_versions import GENE_EVIDENCE, GENES, bump_data_versions_async
 from app.core.logging import get_logger
 from app.models.gene import GeneEvidence
 
@@ -190,6 +191,7 @@ async def _seed_source(db: Session, source_name: str, config: dict[str, Any]) ->
         mode="merge",
     )
     db.commit()
+    await bump_data_versions_async(GENES, GENE_EVIDENCE)
 
     total_stored = evidence_stats.get("created", 0) + evidence_stats.get("merged", 0)
     logger.sync_info(
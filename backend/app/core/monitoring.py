@@ -374,14 +374,20 @@ class CacheMonitoringService:
             overall_stats = await self.cache_service.get_stats()
             memory_entries = overall_stats.get("memory_entries", 0)
             max_memory_size = settings.CACHE_MAX_MEMORY_SIZE
+            memory_bytes = overall_stats.get("memory_bytes", 0)
+            memory_max_bytes = overall_stats.get("memory_max_bytes", 0)
 
-            utilization_percent = (
-                (memory_entries / max_memory_size * 100) if max_memory_size > 0 else 0
+            # Utilization is whichever bound (entries or bytes) is closer to its limit
+            utilization_percent = max(
+                (memory_entries / max_memory_size * 100) if max_memory_size > 0 else 0,
+                (memory_bytes / memory_max_bytes * 100) if memory_max_bytes > 0 else 0,
             )
 
             return {
                 "current_entries": memory_entries,
                 "max_entries": max_memory_size,
+                "current_bytes": memory_bytes,
+                "max_bytes": memory_max_bytes,
                 "utilization_percent": round(utilization_percent, 2),
                 "status": (
                     "high"
@@ -0,0 +1,431 @@
+"""
+Local ontology index built from OBO releases (HPO, MP).
+
+Hierarchy lookups used to walk the ontologies through per-term API calls.
+An OBO release is downloaded once (then re-validated with conditional
+requests), parsed into an :class:`OntologyIndex` that holds the transitive
+``is_a`` closure, and kept per process.  Descendant and ancestor sets,
+is-a checks and term names are then in-memory lookups; the ontology APIs
+are only needed when the release cannot be loaded.
+
+Usage::
+
+    ontology = await get_ontology("HPO", settings.HPO_ONTOLOGY_URL, prefix="HP:")
+    if ontology is not None:
+        kidney_terms = ontology.descendants("HP:0010935", include_self=True)
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+import uuid
+import weakref
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, cast
+
+import httpx
+
+from app.core.config import settings
+from app.core.http_pool import create_async_client
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Seconds before a release that could not be loaded is tried again
+LOAD_RETRY_SECONDS = 3600
+
+_QUOTED = re.compile(r'^"((?:[^"\\]|\\.)*)"')
+
+
+def _unquote(value: str) -> str | None:
+    match = _QUOTED.match(value)
+    return match.group(1).replace('\\"', '"') if match else None
+
+
+def parse_obo(path: Path, prefix: str) -> dict[str, dict[str, Any]]:
+    """Parse the ``[Term]`` stanzas of an OBO file whose IDs start with *prefix*.
+
+    Returns:
+        Term ID → ``name``, ``definition``, ``synonyms``, ``parents``
+        (``is_a`` targets), ``alt_ids``, ``is_obsolete`` and ``replaced_by``
+    """
+    terms: dict[str, dict[str, Any]] = {}
+    term: dict[str, Any] | None = None
+
+    def finish() -> None:
+        if term is not None and term["id"].startswith(prefix):
+            terms[term.pop("id")] = term
+
+    with open(path, encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+            if line.startswith("["):
+                finish()
+                term = (
+                    {
+                        "id": "",
+                        "name": "",
+                        "definition": None,
+                        "synonyms": [],
+                        "parents": [],
+                        "alt_ids": [],
+                        "is_obsolete": False,
+                        "replaced_by": None,
+                    }
+                    if line == "[Term]"
+                    else None
+                )
+                continue
+            if term is None or ":" not in line:
+                continue
+
+            tag, value = line.split(":", 1)
+            value = value.strip()
+            if tag == "id":
+                term["id"] = value
+            elif tag == "name":
+                term["name"] = value
+            elif tag == "def":
+                term["definition"] = _unquote(value)
+            elif tag == "synonym":
+                synonym = _unquote(value)
+                if synonym:
+                    term["synonyms"].append(synonym)
+            elif tag == "is_a":
+                # "is_a: HP:0000118 ! Phenotypic abnormality"
+                parent = value.split()[0] if value else ""
+                if parent.startswith(prefix):
+                    term["parents"].append(parent)
+            elif tag == "alt_id":
+                term["alt_ids"].append(value)
+            elif tag == "is_obsolete":
+                term["is_obsolete"] = value == "true"
+            elif tag == "replaced_by":
+                term["replaced_by"] = value
+    finish()
+    return terms
+
+
+class OntologyIndex:
+    """
+    In-memory ``is_a`` hierarchy with a precomputed transitive closure.
+
+    Terms are coded ``0..n-1``; every term stores the codes of all its
+    ancestors and descendants, so closure lookups and is-a checks are set
+    lookups.  Alternative IDs resolve to their primary term.
+    """
+
+    def __init__(self, terms: Mapping[str, Mapping[str, Any]]) -> None:
+        self.ids: list[str] = sorted(terms)
+        self._codes: dict[str, int] = {term_id: i for i, term_id in enumerate(self.ids)}
+        self._terms: list[Mapping[str, Any]] = [terms[term_id] for term_id in self.ids]
+        for code, term in enumerate(self._terms):
+            for alt_id in term.get("alt_ids") or []:
+                self._codes.setdefault(alt_id, code)
+
+        self._parents: list[tuple[int, ...]] = [
+            tuple(self._codes[p] for p in term.get("parents") or [] if p in self._codes)
+            for term in self._terms
+        ]
+        children: list[list[int]] = [[] for _ in self.ids]
+        for code, parents in enumerate(self._parents):
+            for parent in parents:
+                children[parent].append(code)
+        self._children: list[tuple[int, ...]] = [tuple(c) for c in children]
+
+        self._ancestors = self._ancestor_closure()
+        descendants: list[set[int]] = [set() for _ in self.ids]
+        for code, ancestors in enumerate(self._ancestors):
+            for ancestor in ancestors:
+                descendants[ancestor].add(code)
+        self._descendants: list[frozenset[int]] = [frozenset(d) for d in descendants]
+
+    def _ancestor_closure(self) -> list[frozenset[int]]:
+        """Ancestors of every term, computed parents-first (Kahn's algorithm)."""
+        pending = [len(parents) for parents in self._parents]
+        ready = [code for code, count in enumerate(pending) if count == 0]
+        ancestors: list[frozenset[int]] = [frozenset()] * len(self.ids)
+        done = 0
+        while ready:
+            code = ready.pop()
+            done += 1
+            closure: set[int] = set(self._parents[code])
+            for parent in self._parents[code]:
+                closure |= ancestors[parent]
+            ancestors[code] = frozenset(closure)
+            for child in self._children[code]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.append(child)
+        if done < len(self.ids):
+            # is_a cycles are invalid OBO; such terms keep their partial closure
+            logger.sync_warning("Ontology has is_a cycles", terms_in_cycles=len(self.ids) - done)
+        return ancestors
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, term_id: object) -> bool:
+        return term_id in self._codes
+
+    def resolve(self, term_id: str) -> str | None:
+        """Primary ID of *term_id* (which may be an alternative ID)."""
+        code = self._codes.get(term_id)
+        return None if code is None else self.ids[code]
+
+    def term(self, term_id: str) -> dict[str, Any] | None:
+        """All fields of a term, with its direct parents and children."""
+        code = self._codes.get(term_id)
+        if code is None:
+            return None
+        return {
+            **self._terms[code],
+            "id": self.ids[code],
+            "parents": self._ids(self._parents[code]),
+            "children": self._ids(self._children[code]),
+        }
+
+    def name(self, term_id: str) -> str | None:
+        code = self._codes.get(term_id)
+        return None if code is None else self._terms[code].get("name")
+
+    def parents(self, term_id: str) -> list[str]:
+        code = self._codes.get(term_id)
+        return [] if code is None else self._ids(self._parents[code])
+
+    def children(self, term_id: str) -> list[str]:
+        code = self._codes.get(term_id)
+        return [] if code is None else self._ids(self._children[code])
+
+    def ancestors(self, term_id: str, include_self: bool = False) -> set[str]:
+        """All terms *term_id* is a (transitive) subclass of."""
+        return self._closure(self._ancestors, term_id, include_self)
+
+    def descendants(self, term_id: str, include_self: bool = False) -> set[str]:
+        """All (transitive) subclasses of *term_id*."""
+        return self._closure(self._descendants, term_id, include_self)
+
+    def descendants_of_any(self, term_ids: Iterable[str], include_self: bool = True) -> set[str]:
+        """Union of the descendants of *term_ids*."""
+        result: set[str] = set()
+        for term_id in term_ids:
+            result |= self.descendants(term_id, include_self=include_self)
+        return result
+
+    def is_a(self, term_id: str, ancestor_id: str) -> bool:
+        """Whether *term_id* is *ancestor_id* or one of its descendants."""
+        code = self._codes.get(term_id)
+        ancestor = self._codes.get(ancestor_id)
+        if code is None or ancestor is None:
+            return False
+        return code == ancestor or ancestor in self._ancestors[code]
+
+    def _closure(
+        self, closures: list[frozenset[int]], term_id: str, include_self: bool
+    ) -> set[str]:
+        code = self._codes.get(term_id)
+        if code is None:
+            return set()
+        result = {self.ids[c] for c in closures[code]}
+        if include_self:
+            result.update((term_id, self.ids[code]))
+        return result
+
+    def _ids(self, codes: Iterable[int]) -> list[str]:
+        return [self.ids[c] for c in codes]
+
+
+class OntologyRelease:
+    """
+    Locally cached OBO release of one ontology, parsed into an :class:`OntologyIndex`.
+
+    The file is re-validated with a conditional request once it is older
+    than ``cache_ttl_hours``; if the server cannot be reached, the cached
+    file is used.  Parsed terms are stored next to it as JSON, keyed by the
+    file's SHA-256, so an unchanged release is parsed only once per host.
+    """
+
+    cache_ttl_hours = 24 * 30  # Ontologies are released about monthly
+    parser_version = "1"
+
+    def __init__(self, source_name: str, url: str, prefix: str, cache_dir: Path) -> None:
+        self.source_name = source_name
+        self.url = url
+        self.prefix = prefix
+        url_hash = hashlib.sha256(url.encode()).hexdigest()[:12]
+        self.path = cache_dir / f"{source_name.lower()}_{url_hash}.obo"
+        self.meta_path = self.path.with_suffix(".meta.json")
+        self.terms_path = self.path.with_suffix(f".terms.v{self.parser_version}.json")
+
+    async def load(self) -> OntologyIndex:
+        """Download (if stale) and index the release."""
+        meta = await self.download()
+        terms = await asyncio.to_thread(self._parsed_terms, meta.get("sha256"))
+        if not terms:
+            raise ValueError(f"No {self.prefix} terms in {self.url}")
+        return await asyncio.to_thread(OntologyIndex, terms)
+
+    async def download(self) -> dict[str, Any]:
+        """Fetch the release unless the cached copy is fresh; returns its metadata."""
+        meta = self._read_meta()
+        cached = self.path.exists() and meta.get("size_bytes") == self.path.stat().st_size
+        if cached and time.time() - meta.get("ts", 0) < self.cache_ttl_hours * 3600:
+            return meta
+
+        headers = {}
+        if cached and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if cached and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: other processes may refresh the same release
+        tmp_path = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.tmp")
+        digest = hashlib.sha256()
+        try:
+            async with create_async_client(timeout=120.0, follow_redirects=True) as client:
+                async with client.stream("GET", self.url, headers=headers) as response:
+                    if response.status_code == 304:
+                        meta["ts"] = time.time()
+                        self._write_meta(meta)
+                        return meta
+                    response.raise_for_status()
+                    with open(tmp_path, "wb") as f:
+                        async for chunk in response.aiter_bytes():
+                            digest.update(chunk)
+                            f.write(chunk)
+        except (httpx.HTTPError, OSError) as exc:
+            tmp_path.unlink(missing_ok=True)
+            if not cached:
+                raise
+            logger.sync_warning(
+                "Could not re-validate ontology release, using cached copy",
+                ontology=self.source_name,
+                error=str(exc),
+            )
+            return meta
+
+        tmp_path.replace(self.path)
+        meta = {
+            "url": self.url,
+            "size_bytes": self.path.stat().st_size,
+            "sha256": digest.hexdigest(),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "ts": time.time(),
+        }
+        self._write_meta(meta)
+        logger.sync_info(
+            "Downloaded ontology release", ontology=self.source_name, size=meta["size_bytes"]
+        )
+        return meta
+
+    def _parsed_terms(self, sha256: str | None) -> dict[str, dict[str, Any]]:
+        """Terms of the cached release, from the stored parse if the file is unchanged."""
+        try:
+            stored = json.loads(self.terms_path.read_text())
+            if sha256 and stored.get("sha256") == sha256 and stored.get("prefix") == self.prefix:
+                return cast(dict[str, dict[str, Any]], stored["terms"])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        terms = parse_obo(self.path, self.prefix)
+        tmp_path = self.terms_path.with_name(f"{self.terms_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"sha256": sha256, "prefix": self.prefix, "terms": terms})
+            )
+            tmp_path.replace(self.terms_path)
+        except OSError as exc:
+            tmp_path.unlink(missing_ok=True)
+            logger.sync_warning("Could not store parsed ontology", error=str(exc))
+        return terms
+
+    def _read_meta(self) -> dict[str, Any]:
+        try:
+            meta = json.loads(self.meta_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return meta if isinstance(meta, dict) else {}
+
+    def _write_meta(self, meta: dict[str, Any]) -> None:
+        try:
+            self.meta_path.write_text(json.dumps(meta))
+        except OSError as exc:
+            logger.sync_warning("Could not write ontology meta file", error=str(exc))
+
+
+def ontology_data_dir() -> Path:
+    """``ONTOLOGY_DATA_DIR``, with relative paths resolved against the backend directory."""
+    path = Path(settings.ONTOLOGY_DATA_DIR)
+    return path if path.is_absolute() else BACKEND_DIR / path
+
+
+# Process-wide indexes by release URL: (index, monotonic load time)
+_indexes: dict[str, tuple[OntologyIndex, float]] = {}
+# Release URL → monotonic time of the last failed load
+_load_failures: dict[str, float] = {}
+# Per-loop locks so concurrent callers share one load of a release
+_load_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached_index(url: str) -> tuple[OntologyIndex | None, bool]:
+    """(index loaded for *url*, whether it is still fresh)."""
+    cached = _indexes.get(url)
+    if cached is None:
+        return None, False
+    return cached[0], time.monotonic() - cached[1] < OntologyRelease.cache_ttl_hours * 3600
+
+
+async def get_ontology(source_name: str, url: str, prefix: str) -> OntologyIndex | None:
+    """
+    Process-wide index of the OBO release at *url*.
+
+    Returns ``None`` when local ontologies are disabled (empty *url*) or
+    the release cannot be loaded; callers then fall back to their API.
+    Concurrent callers wait for a single load.  A failed load is retried
+    after ``LOAD_RETRY_SECONDS``, and a loaded index is refreshed once the
+    release is older than its cache TTL.
+    """
+    if not url:
+        return None
+
+    index, fresh = _cached_index(url)
+    if fresh:
+        return index
+
+    lock = _load_locks.setdefault(asyncio.get_running_loop(), {}).setdefault(url, asyncio.Lock())
+    async with lock:
+        # Another caller may have loaded the release while this one waited
+        index, fresh = _cached_index(url)
+        if fresh:
+            return index
+        failed_at = _load_failures.get(url)
+        if failed_at is not None and time.monotonic() - failed_at < LOAD_RETRY_SECONDS:
+            return index
+
+        release = OntologyRelease(source_name, url, prefix, ontology_data_dir())
+        try:
+            loaded = await release.load()
+        except (httpx.HTTPError, OSError, ValueError) as exc:
+            _load_failures[url] = time.monotonic()
+            logger.sync_warning(
+                "Local ontology unavailable, falling back to API",
+                ontology=source_name,
+                url=url,
+                error=str(exc),
+            )
+            # An outdated index is better than per-term API calls
+            return index
+
+        _indexes[url] = (loaded, time.monotonic())
+        _load_failures.pop(url, None)
+        logger.sync_info("Loaded local ontology", ontology=source_name, terms=len(loaded))
+        return loaded
@@ -271,6 +271,8 @@ class PipelineOrchestrator:
         """Run aggregation + refresh materialized views (no stage transition)."""
         from starlette.concurrency import run_in_threadpool
 
+        from app.core.cache_service import get_cache_service, view_tag
+        from app.core.data_versions import GENE_SCORES, bump_data_versions
         from app.core.database import SessionLocal
         from app.pipeline.aggregate import update_all_curations
 
@@ -285,6 +287,9 @@ class PipelineOrchestrator:
                     db.execute(text("REFRESH MATERIALIZED VIEW gene_scores"))
                     db.commit()
                     logger.sync_info("Refreshed gene_scores materialized view")
+                    bump_data_versions(GENE_SCORES)
+                    # Cached responses computed from the old scores are now stale
+                    get_cache_service(db).invalidate_tags_sync([view_tag("gene_scores")])
                 except Exception as e:
                     db.rollback()
                     logger.sync_warning(
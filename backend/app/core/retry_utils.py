@@ -171,18 +171,17 @@ def retry_with_backoff(
                             raise
 
                         # Special handling for rate limiting
-                        if e.response.status_code == 429:
-                            # Try to parse Retry-After header
-                            retry_after = e.response.headers.get("retry-after")
-                            if retry_after:
-                                try:
-                                    delay = float(retry_after)
-                                    logger.sync_info(
-                                        "Rate limited. Waiting as requested by server",
-                                        delay_seconds=delay,
-                                    )
-                                except ValueError:
-                                    delay = config.calculate_delay(attempt)
+                        if e.response.status_code in (429, 503):
+                            from app.core.domain_rate_limiter import parse_retry_after
+
+                            # Honour Retry-After (seconds or HTTP date) when given
+                            retry_after = parse_retry_after(e.response.headers.get("retry-after"))
+                            if retry_after is not None:
+                                delay = retry_after
+                                logger.sync_info(
+                                    "Rate limited. Waiting as requested by server",
+                                    delay_seconds=delay,
+                                )
                             else:
                                 delay = config.calculate_delay(attempt)
                         else:
@@ -369,6 +368,7 @@ class RetryableHTTPClient:
     async def get(self, url: str, **kwargs: Any) -> httpx.Response:
         """GET request with retry logic."""
         response = await self.client.get(url, **kwargs)
+        await handle_rate_limit_response(response)
         response.raise_for_status()
         return response
 
@@ -376,6 +376,7 @@ class RetryableHTTPClient:
     async def post(self, url: str, **kwargs: Any) -> httpx.Response:
         """POST request with retry logic."""
         response = await self.client.post(url, **kwargs)
+        await handle_rate_limit_response(response)
         response.raise_for_status()
         return response
 
@@ -413,15 +414,11 @@ class SimpleRateLimiter:
 
 async def handle_rate_limit_response(response: httpx.Response) -> None:
     """
-    If response is 429, pause the domain for Retry-After duration.
+    Feed *response* back to the adaptive rate limiter of its domain.
 
-    Call this after receiving an HTTP response to automatically pause
-    all requests to the same domain when rate-limited.
+    Call this after receiving an HTTP response: 429/503 slow the domain
+    down and pause it for Retry-After, sustained success speeds it up.
     """
-    if response.status_code == 429:
-        from app.core.domain_rate_limiter import get_domain_rate_limiter_registry
+    from app.core.domain_rate_limiter import get_domain_rate_limiter_registry
 
-        retry_after = float(response.headers.get("Retry-After", "60"))
-        domain = response.request.url.host
-        registry = get_domain_rate_limiter_registry()
-        registry.pause_domain(domain, retry_after)
+    get_domain_rate_limiter_registry().record_response(response)
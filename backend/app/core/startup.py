@@ -255,6 +255,55 @@ def validate_dependencies() -> None:
         # Don't re-raise - log the issue but continue startup
 
 
+def register_cache_loaders() -> None:
+    """
+    Register stale-while-revalidate loaders for expensive cached namespaces.
+
+    Entries in these namespaces are served stale past their soft TTL while a
+    background refresh recomputes them, so no request pays the full recompute.
+    Network builds are not registered: their entries are keyed per request
+    body and computed on the request's session, so there is no key-only
+    loader to refresh them with.
+    """
+    try:
+        from app.api.endpoints.genes import register_metadata_cache_loader
+        from app.api.endpoints.statistics import register_statistics_cache_loader
+
+        register_metadata_cache_loader()
+        register_statistics_cache_loader()
+    except Exception as e:
+        logger.sync_error("Failed to register cache loaders", error=e)
+        # Don't re-raise - entries simply expire at their hard TTL
+
+
+async def start_cache_write_behind() -> None:
+    """
+    Start batching L2 cache writes and access statistics in the background.
+
+    Must run inside the event loop that serves requests.
+    """
+    try:
+        from app.core.cache_service import get_cache_service
+
+        await get_cache_service().start_write_behind()
+    except Exception as e:
+        logger.sync_error("Failed to start cache write-behind", error=e)
+        # Don't re-raise - the cache falls back to write-through
+
+
+async def flush_cache_write_behind() -> None:
+    """
+    Shutdown hook: stop the write-behind flusher and flush pending cache writes.
+    """
+    try:
+        from app.core import cache_service as cache_module
+
+        if cache_module.cache_service is not None:
+            await cache_module.cache_service.stop_write_behind()
+    except Exception as e:
+        logger.sync_error("Failed to flush cache write-behind on shutdown", error=e)
+
+
 def run_startup_tasks() -> None:
     """
     Run all startup tasks for the application.
@@ -300,6 +349,9 @@ def run_startup_tasks() -> None:
         # Validate dependencies
         validate_dependencies()
 
+        # Enable stale-while-revalidate for expensive cache namespaces
+        register_cache_loaders()
+
         # Register data sources
         register_data_sources()
 
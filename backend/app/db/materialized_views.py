@@ -14,6 +14,7 @@ from typing import Any
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.data_versions import bump_data_versions
 from app.core.database import get_thread_pool_executor
 from app.core.logging import get_logger
 from app.core.view_monitoring import track_materialized_view_refresh
@@ -353,6 +354,7 @@ class MaterializedViewManager:
             name = safe_identifier(view_name)
             self.db.execute(text(f"REFRESH MATERIALIZED VIEW {refresh_clause} {name}"))
             self.db.commit()
+            bump_data_versions(name)
 
             duration = (datetime.now() - start_time).total_seconds()
 
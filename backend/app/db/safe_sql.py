@@ -9,6 +9,8 @@ import re
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.data_versions import bump_data_versions
+
 VALID_IDENTIFIER_RE = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
 
 
@@ -41,6 +43,7 @@ def refresh_materialized_view(session: Session, view_name: str, concurrent: bool
     clause = "CONCURRENTLY " if concurrent else ""
     session.execute(text(f"REFRESH MATERIALIZED VIEW {clause}{name}"))
     session.commit()
+    bump_data_versions(name)
 
 
 def drop_materialized_view(session: Session, view_name: str) -> None:
@@ -7,26 +7,69 @@ from app.db.replaceable_objects import ReplaceableObject
 
 # Tier 1: Base Views (no dependencies)
 
+cache_partitions = ReplaceableObject(
+    name="cache_partitions",
+    sqltext="""
+    SELECT c.relname::text AS partition_name,
+        (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'IN \\(''(.+)''\\)'))[1]
+            AS namespace,
+        pg_get_expr(c.relpartbound, c.oid) = 'DEFAULT' AS is_default
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'cache_entries'::regclass
+    """,
+    dependencies=[],
+)
+
+# Dedicated partitions report catalog statistics plus index-bound expiry counts;
+# namespaces without a partition are aggregated from the (small) default partition.
 cache_stats = ReplaceableObject(
     name="cache_stats",
     sqltext="""
-    SELECT cache_entries.namespace,
+    SELECT p.namespace,
+        p.partition_name,
+        s.n_live_tup AS total_entries,
+        s.n_dead_tup AS dead_entries,
+        pg_total_relation_size(s.relid) AS total_size_bytes,
+        NULL::bigint AS total_accesses,
+        NULL::numeric AS avg_accesses,
+        greatest(s.n_live_tup - e.expired_entries, 0) AS active_entries,
+        e.expired_entries,
+        e.last_access_time,
+        NULL::timestamptz AS oldest_entry,
+        NULL::timestamptz AS newest_entry,
+        greatest(s.last_vacuum, s.last_autovacuum) AS last_vacuum
+    FROM cache_partitions p
+    JOIN pg_stat_user_tables s
+        ON s.relname = p.partition_name AND s.schemaname = current_schema()
+    CROSS JOIN LATERAL (
+        SELECT
+            (SELECT count(*) FROM cache_entries ce
+                WHERE ce.namespace = p.namespace AND ce.expires_at <= now())
+                AS expired_entries,
+            (SELECT max(ce.last_accessed) FROM cache_entries ce
+                WHERE ce.namespace = p.namespace) AS last_access_time
+    ) e
+    WHERE NOT p.is_default
+    UNION ALL
+    SELECT d.namespace,
+        'cache_entries_default'::text AS partition_name,
         count(*) AS total_entries,
-        sum(COALESCE(cache_entries.data_size, pg_column_size(cache_entries.data)))
-            AS total_size_bytes,
-        sum(cache_entries.access_count) AS total_accesses,
-        avg(cache_entries.access_count) AS avg_accesses,
-        count(*) FILTER (WHERE cache_entries.expires_at IS NULL
-            OR cache_entries.expires_at > now()) AS active_entries,
-        count(*) FILTER (WHERE cache_entries.expires_at IS NOT NULL
-            AND cache_entries.expires_at <= now()) AS expired_entries,
-        max(cache_entries.last_accessed) AS last_access_time,
-        min(cache_entries.created_at) AS oldest_entry,
-        max(cache_entries.created_at) AS newest_entry
-    FROM cache_entries
-    GROUP BY cache_entries.namespace
+        NULL::bigint AS dead_entries,
+        sum(COALESCE(d.data_size, pg_column_size(d.data))) AS total_size_bytes,
+        sum(d.access_count) AS total_accesses,
+        avg(d.access_count) AS avg_accesses,
+        count(*) FILTER (WHERE d.expires_at IS NULL OR d.expires_at > now())
+            AS active_entries,
+        count(*) FILTER (WHERE d.expires_at <= now()) AS expired_entries,
+        max(d.last_accessed) AS last_access_time,
+        min(d.created_at) AS oldest_entry,
+        max(d.created_at) AS newest_entry,
+        NULL::timestamptz AS last_vacuum
+    FROM cache_entries_default d
+    GROUP BY d.namespace
     """,
-    dependencies=[],
+    dependencies=["cache_partitions"],
 )
 
 evidence_source_counts = ReplaceableObject(
@@ -612,6 +655,7 @@ v_literature_publications = ReplaceableObject(
 # IMPORTANT: Only include views that are NOT created by dedicated migrations
 INITIAL_VIEWS = [
     # Core infrastructure views
+    cache_partitions,
     cache_stats,
     evidence_source_counts,
     evidence_classification_weights,
@@ -52,7 +52,11 @@ from app.core.exceptions import (
 from app.core.exceptions import ValidationError as DomainValidationError
 from app.core.logging import configure_logging, get_logger
 from app.core.rate_limit import limiter
-from app.core.startup import run_startup_tasks
+from app.core.startup import (
+    flush_cache_write_behind,
+    run_startup_tasks,
+    start_cache_write_behind,
+)
 from app.middleware.error_handling import register_error_handlers
 from app.middleware.logging_middleware import LoggingMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
@@ -92,6 +96,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.sync_info("Starting event bus for optimized WebSocket communication...")
     await event_bus.start()
 
+    # Keep this worker's L1 cache coherent with other workers
+    from app.core.cache_bus import cache_bus
+
+    await cache_bus.start()
+
+    # Batch L2 cache writes and access statistics
+    await start_cache_write_behind()
+
     logger.sync_info("Starting background task manager...")
 
     # Set up broadcast callback for WebSocket updates (now uses event bus internally)
@@ -129,9 +141,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.sync_info("Shutting down event bus...")
     await event_bus.stop()
 
+    # Flush buffered cache writes before the invalidation bus goes away
+    await flush_cache_write_behind()
+    await cache_bus.stop()
+
     logger.sync_info("Shutting down background task manager...")
     await task_manager.shutdown()
 
+    from app.core.http_pool import close_shared_http_pool
+
+    await close_shared_http_pool()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -6,6 +6,7 @@ from app.models.backup_job import BackupJob, BackupStatus, BackupTrigger
 from app.models.base import Base, TimestampMixin
 from app.models.cache import CacheEntry
 from app.models.data_release import DataRelease
+from app.models.data_version import DataVersion
 from app.models.gene import Gene, GeneCuration, GeneEvidence, PipelineRun
 from app.models.gene_annotation import AnnotationHistory, AnnotationSource, GeneAnnotation
 from app.models.gene_staging import GeneNormalizationLog, GeneNormalizationStaging
@@ -26,6 +27,7 @@ __all__ = [
     "Base",
     "CacheEntry",
     "DataRelease",
+    "DataVersion",
     "DataSourceProgress",
     "Gene",
     "GeneAnnotation",
@@ -4,8 +4,18 @@ Cache model for database-backed caching
 
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, Index, Integer, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -13,16 +23,26 @@ from app.models.base import Base
 
 
 class CacheEntry(Base):
-    """Database cache entry model."""
+    """
+    Database cache entry model.
+
+    The table is LIST-partitioned by namespace (migration 0005), so the primary
+    key and the cache-key uniqueness both include the partition key.
+    """
 
     __tablename__ = "cache_entries"
 
     # Fix: Database has INTEGER id, not UUID
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("nextval('cache_entries_id_seq')"), nullable=False
+    )
     # Fix: Database has VARCHAR(255), but we can safely use Text in model
     cache_key: Mapped[str] = mapped_column(Text, nullable=False)
     namespace: Mapped[str] = mapped_column(Text, nullable=False)
     data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Binary payload and its codec tag (e.g. "msgpack+zstd"); NULL tag = legacy JSONB data
+    data_format: Mapped[str | None] = mapped_column(Text, nullable=True)
+    data_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -33,13 +53,16 @@ class CacheEntry(Base):
     access_count: Mapped[int] = mapped_column(Integer, server_default="1", nullable=False)
     data_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
     metadata_: Mapped[dict] = mapped_column("metadata", JSONB, server_default="{}", nullable=False)
+    # Dependency tags (e.g. "gene:123", "source:gnomad") for targeted invalidation
+    tags: Mapped[list[str]] = mapped_column(ARRAY(Text), server_default="{}", nullable=False)
 
     __table_args__ = (
-        UniqueConstraint("cache_key", name="uq_cache_entries_cache_key"),
-        Index("idx_cache_entries_namespace", "namespace"),
+        PrimaryKeyConstraint("namespace", "id", name="cache_entries_pkey"),
+        UniqueConstraint("namespace", "cache_key", name="uq_cache_entries_namespace_key"),
         Index(
             "idx_cache_entries_expires_at", "expires_at", postgresql_where="expires_at IS NOT NULL"
         ),
         Index("idx_cache_entries_last_accessed", "last_accessed"),
-        Index("idx_cache_entries_namespace_key", "namespace", "cache_key"),
+        Index("idx_cache_entries_tags", "tags", postgresql_using="gin"),
+        {"postgresql_partition_by": "LIST (namespace)"},
     )
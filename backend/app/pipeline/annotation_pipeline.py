@@ -11,6 +11,7 @@ from typing import Any
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.data_versions import GENE_ANNOTATIONS, bump_data_versions_async
 from app.core.database import SessionLocal
 from app.core.logging import get_logger
 from app.core.progress_tracker import ProgressTracker
@@ -256,6 +257,7 @@ class AnnotationPipeline:
 
             # Refresh materialized view ONCE after all sources complete
             if results:
+                await bump_data_versions_async(GENE_ANNOTATIONS)
                 await self._refresh_materialized_view()
 
             # Invalidate API caches after pipeline completion
@@ -808,7 +810,7 @@ class AnnotationPipeline:
         try:
             from concurrent.futures import ThreadPoolExecutor
 
-            from app.core.cache_service import get_cache_service
+            from app.core.cache_service import gene_tag, get_cache_service
 
             if not hasattr(self, "_executor"):
                 self._executor = ThreadPoolExecutor(max_workers=2)
@@ -819,7 +821,10 @@ class AnnotationPipeline:
                     cache_service = get_cache_service(thread_db)
                     if cache_service:
                         cache_service.clear_namespace_sync(source_name.lower())
-                        cache_service.clear_namespace_sync("annotations")
+                        # Only API responses of the updated genes depend on this run
+                        cache_service.invalidate_tags_sync(
+                            [gene_tag(gene_id) for gene_id in gene_ids]
+                        )
                         logger.sync_debug(f"Cleared cache for {source_name}")
                 finally:
                     thread_db.close()
@@ -10,7 +10,9 @@ from typing import Any
 import httpx
 from sqlalchemy.orm import Session
 
-from app.core.cache_service import get_cache_service
+from app.core.cache_service import gene_tag, get_cache_service, source_tag
+from app.core.data_versions import GENE_ANNOTATIONS, bump_data_versions_async
+from app.core.http_pool import create_async_client
 from app.core.logging import get_logger
 from app.core.retry_utils import (
     CircuitBreaker,
@@ -168,10 +170,8 @@ class BaseAnnotationSource(ABC):
             Configured HTTP client with retry logic
         """
         if not self.http_client:
-            base_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(60.0),
-                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
-            )
+            # Connections come from the process-wide per-domain pool
+            base_client = create_async_client(timeout=httpx.Timeout(60.0))
 
             self.http_client = RetryableHTTPClient(
                 client=base_client,
@@ -187,16 +187,16 @@ class BaseAnnotationSource(ABC):
 
         Args:
             url: Optional URL for per-domain rate limiting. If provided,
-                uses the shared DomainRateLimiterRegistry. If not provided,
-                falls back to simple sleep-based delay.
+                uses the shared, adaptive DomainRateLimiterRegistry (starting
+                at ``requests_per_second``). If not provided, falls back to
+                simple sleep-based delay.
         """
         if url:
             from app.core.domain_rate_limiter import get_domain_rate_limiter_registry
 
             registry = get_domain_rate_limiter_registry()
-            limiter = registry.get_for_url(url)
-            async with limiter.acquire():
-                return
+            limiter = registry.get_for_url(url, max_rate=self.requests_per_second)
+            await limiter.wait()
         else:
             delay = 1.0 / self.requests_per_second
             await asyncio.sleep(delay)
@@ -335,25 +335,17 @@ class BaseAnnotationSource(ABC):
     async def _invalidate_api_cache(self, gene_id: int) -> None:
         """
         Invalidate API cache for a gene's annotations (async version).
-        This clears both the specific source cache and the 'all' cache
-        used by the API endpoint.
+        This clears every cached API response tagged with the gene: the
+        per-source, the 'all' and the summary entries.
         """
         try:
             cache_service = get_cache_service(self.session)
-
-            # Invalidate the 'all' cache (used by API when no source specified)
-            cache_key_all = f"{gene_id}:all"
-            await cache_service.delete(cache_key_all, namespace="annotations")
-
-            # Invalidate the specific source cache (source_name is validated in __init__)
-            source_name_lower = self.source_name.lower() if self.source_name else ""
-            cache_key_source = f"{gene_id}:{source_name_lower}"
-            await cache_service.delete(cache_key_source, namespace="annotations")
+            count = await cache_service.invalidate_tags([gene_tag(gene_id)])
 
             logger.sync_debug(
                 f"Invalidated API cache for gene {gene_id}",
                 source=self.source_name,
-                keys=[cache_key_all, cache_key_source],
+                count=count,
             )
         except Exception as e:
             # Don't fail the update if cache invalidation fails
@@ -419,6 +411,7 @@ class BaseAnnotationSource(ABC):
                         value=annotation_data,
                         namespace=source_namespace,
                         ttl=self.cache_ttl_days * 86400,
+                        tags=[source_tag(source_namespace)],
                     )
                     metadata = {"retrieved_at": datetime.utcnow().isoformat(), "from_cache": False}
                 else:
@@ -514,21 +507,27 @@ class BaseAnnotationSource(ABC):
         self.source_record.last_update = datetime.utcnow()
         self.source_record.next_update = datetime.utcnow() + timedelta(days=self.cache_ttl_days)
         self.session.commit()
+        await bump_data_versions_async(GENE_ANNOTATIONS)
 
         # Disable batch mode
         self.batch_mode = False
 
-        # Clear the entire annotations cache namespace after batch update
-        # This is more efficient than clearing individual entries
+        # Evict cached API responses of the processed genes in one tag invalidation
+        # instead of wiping every warm annotation in the namespace
         try:
             cache_service = get_cache_service(self.session)
             if cache_service:
                 try:
                     # We're in an async context (update_all_genes is async)
-                    # Just await the cache clear directly
-                    await cache_service.clear_namespace("annotations")
+                    # Just await the cache invalidation directly
+                    count = await cache_service.invalidate_tags(
+                        [gene_tag(int(gene.id)) for gene in genes]
+                    )
                     logger.sync_info(
-                        "Cleared annotations cache after batch update", source=self.source_name
+                        "Invalidated annotation caches after batch update",
+                        source=self.source_name,
+                        genes=len(genes),
+                        count=count,
                     )
                 except Exception as e:
                     logger.sync_debug(
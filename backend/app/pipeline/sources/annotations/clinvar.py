@@ -11,8 +11,6 @@ vs 3 req/s) when the API fallback is needed.
 """
 
 import asyncio
-import csv
-import gzip
 import os
 from collections import defaultdict
 from datetime import datetime, timezone
@@ -20,6 +18,7 @@ from pathlib import Path
 from typing import Any
 
 import httpx
+import pandas as pd
 from sqlalchemy.orm import Session
 from starlette.concurrency import run_in_threadpool
 
@@ -46,6 +45,57 @@ _ASSEMBLY_PRIORITY: dict[str, int] = {
 # Cap per-gene variant detail lists to bound JSONB size and memory.
 _MAX_DETAIL_VARIANTS = 200
 
+# variant_summary columns used by the bulk parser; all others are skipped
+_VARIANT_COLUMNS = (
+    "GeneSymbol",
+    "VariationID",
+    "Assembly",
+    "Name",
+    "Type",
+    "ClinicalSignificance",
+    "ReviewStatus",
+    "PhenotypeList",
+    "Chromosome",
+    "Start",
+    "Stop",
+)
+
+# Rows per chunk when reading variant_summary (bounds memory per chunk)
+_PARSE_CHUNK_ROWS = 250_000
+
+_INTEGER_RE = r"[+-]?\d+"
+
+
+def _match_target_rows(chunk: pd.DataFrame, target_genes: set[str]) -> pd.DataFrame:
+    """Rows of a variant_summary chunk that belong to a target gene, one per gene.
+
+    ``GeneSymbol`` may list several genes separated by ``;``; such a row
+    is repeated for each target gene.  Adds the columns ``gene``,
+    ``var_id`` (integer VariationID; rows without one are dropped),
+    ``priority`` (assembly priority) and ``row_order`` (row number in
+    the file).
+    """
+    for column in _VARIANT_COLUMNS:
+        if column not in chunk.columns:
+            # Like a missing dict key: "" for fields, unknown assembly for Assembly
+            chunk[column] = "na" if column == "Assembly" else ""
+
+    genes = chunk["GeneSymbol"].str.split(";").explode().str.strip()
+    genes = genes[genes.isin(target_genes)]
+    if genes.empty:
+        return chunk.iloc[0:0]
+
+    rows = chunk.loc[genes.index, list(_VARIANT_COLUMNS)]
+    variation_ids = rows["VariationID"].str.strip()
+    valid = variation_ids.str.fullmatch(_INTEGER_RE).to_numpy(dtype=bool)
+    rows = rows[valid].assign(
+        gene=genes.to_numpy()[valid],
+        var_id=variation_ids[valid].astype("int64"),
+        row_order=genes.index.to_numpy()[valid],
+    )
+    rows["priority"] = rows["Assembly"].map(_ASSEMBLY_PRIORITY).fillna(0).astype("int64")
+    return rows
+
 
 class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     """
@@ -78,6 +128,8 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     bulk_cache_ttl_hours = 168  # 7 days
     bulk_file_format = "txt.gz"
     bulk_file_min_size_bytes = 300_000_000  # ~300 MB; full file is ~414 MB
+    bulk_file_md5_url = bulk_file_url + ".md5"
+    bulk_download_segments = 4
 
     # Review status confidence levels (loaded from configuration)
     _review_confidence_levels: dict[str, int] | None = None
@@ -140,6 +192,9 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
             return
 
         raw_path = await self.download_bulk_file_streaming(force=force)
+        if self._bulk_data is not None and self._is_bulk_content_parsed(raw_path):
+            logger.sync_info("ClinVar bulk file unchanged, keeping parsed data")
+            return
 
         # Offload DB query + heavy file parsing to thread pool
         target_genes = await run_in_threadpool(self._load_target_genes)
@@ -149,12 +204,16 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
             path=str(raw_path),
             target_genes=len(target_genes),
         )
-        self._bulk_data = await run_in_threadpool(
-            self._parse_variant_summary, raw_path, target_genes
+        bulk_data = await run_in_threadpool(
+            self._load_or_parse_bulk,
+            raw_path,
+            lambda: self._parse_variant_summary(raw_path, target_genes),
         )
+        self._bulk_data = bulk_data
+        self._mark_bulk_content_parsed(raw_path)
         logger.sync_info(
             "ClinVar bulk data loaded",
-            gene_count=len(self._bulk_data),
+            gene_count=len(bulk_data),
         )
 
     def parse_bulk_file(self, path: Path) -> dict[str, dict[str, Any]]:
@@ -166,105 +225,78 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         target_genes = self._load_target_genes()
         return self._parse_variant_summary(path, target_genes)
 
+    def bulk_artifact_params(self) -> dict[str, Any]:
+        """The parsed result is filtered to the target genes and uses the confidence levels."""
+        return {
+            "target_genes": sorted(self._load_target_genes()),
+            "confidence_levels": self._get_review_confidence_levels(),
+        }
+
     def _parse_variant_summary(
         self, path: Path, target_genes: set[str]
     ) -> dict[str, dict[str, Any]]:
-        """Stream-parse variant_summary.txt.gz and aggregate per gene.
-
-        Two-pass streaming keeps memory bounded (~70 MB vs ~8.8 GB):
-
-        Pass 1 — Build a compact dedup map ``{gene: {var_id_int: priority}}``.
-                 Only integers are stored, so the map is ~5 MB for 50K variants.
-        Pass 2 — Stream the file again.  For each winning (gene, var_id)
-                 pair, call ``parse_variant_row()`` and feed into a
-                 ``GeneAccumulator`` that aggregates on-the-fly.  Detail
-                 lists are capped at ``_MAX_DETAIL_VARIANTS``.
+        """Parse variant_summary.txt.gz in a single columnar pass and aggregate per gene.
+
+        The file is read in chunks of ``_PARSE_CHUNK_ROWS`` rows, projected
+        to the columns ``parse_variant_row()`` needs, and each chunk is
+        filtered to rows of target genes (see ``_match_target_rows``), so
+        only a small fraction of the ~7M rows is kept.  Duplicates of a
+        (gene, VariationID) pair are dropped with one vectorized sort: the
+        highest assembly priority wins, ties go to the earlier row.  Winning
+        rows are fed to each gene's ``GeneAccumulator`` in file order, so
+        the capped detail lists match row-by-row parsing.
         """
         confidence_levels = self._get_review_confidence_levels()
-        open_fn = gzip.open if str(path).endswith(".gz") else open
-
-        # ---- Pass 1: dedup map (ints only → low memory) ----
-        dedup: dict[str, dict[int, int]] = defaultdict(dict)
-
-        with open_fn(path, "rt", encoding="utf-8", errors="replace") as fh:  # type: ignore[call-overload]
-            reader = csv.DictReader(fh, delimiter="\t")
-            for row in reader:
-                gene_symbol_raw = row.get("GeneSymbol", "")
-                if not gene_symbol_raw:
-                    continue
-
-                row_genes = [g.strip() for g in gene_symbol_raw.split(";")]
-                matching_genes = [g for g in row_genes if g in target_genes]
-                if not matching_genes:
-                    continue
-
-                variation_id = row.get("VariationID", "")
-                if not variation_id:
-                    continue
 
-                try:
-                    var_id_int = int(variation_id)
-                except ValueError:
-                    continue
-
-                assembly = row.get("Assembly", "na")
-                priority = _ASSEMBLY_PRIORITY.get(assembly, 0)
-
-                for gene in matching_genes:
-                    existing_priority = dedup[gene].get(var_id_int)
-                    if existing_priority is None or priority > existing_priority:
-                        dedup[gene][var_id_int] = priority
+        chunks: list[pd.DataFrame] = []
+        offset = 0
+        with pd.read_csv(
+            path,
+            sep="\t",
+            usecols=lambda column: column in _VARIANT_COLUMNS,
+            dtype=str,
+            na_filter=False,
+            chunksize=_PARSE_CHUNK_ROWS,
+            encoding="utf-8",
+            encoding_errors="replace",
+        ) as reader:
+            for chunk in reader:
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                matched = _match_target_rows(chunk, target_genes)
+                if not matched.empty:
+                    chunks.append(matched)
+
+        if chunks:
+            candidates = pd.concat(chunks)
+            # Genes in order of their first row, as accumulators were always created
+            gene_order = candidates["gene"].drop_duplicates().tolist()
+            winners = (
+                candidates.sort_values(
+                    ["priority", "row_order"], ascending=[False, True], kind="stable"
+                )
+                .drop_duplicates(["gene", "var_id"], keep="first")
+                .sort_values("row_order", kind="stable")
+            )
+        else:
+            gene_order = []
+            winners = pd.DataFrame(columns=["gene", *_VARIANT_COLUMNS])
 
         logger.sync_info(
-            "Pass 1 complete: built dedup map",
-            genes_found=len(dedup),
-            total_unique_variants=sum(len(v) for v in dedup.values()),
+            "Parsed ClinVar variant_summary",
+            rows_read=offset,
+            genes_found=len(gene_order),
+            total_unique_variants=len(winners),
         )
 
-        # ---- Pass 2: stream again, aggregate on-the-fly ----
         accumulators: dict[str, GeneAccumulator] = {
-            gene: GeneAccumulator(confidence_levels, _MAX_DETAIL_VARIANTS) for gene in dedup
+            gene: GeneAccumulator(confidence_levels, _MAX_DETAIL_VARIANTS) for gene in gene_order
         }
-
-        with open_fn(path, "rt", encoding="utf-8", errors="replace") as fh:  # type: ignore[call-overload]
-            reader = csv.DictReader(fh, delimiter="\t")
-            for row in reader:
-                gene_symbol_raw = row.get("GeneSymbol", "")
-                if not gene_symbol_raw:
-                    continue
-
-                variation_id = row.get("VariationID", "")
-                if not variation_id:
-                    continue
-
-                try:
-                    var_id_int = int(variation_id)
-                except ValueError:
-                    continue
-
-                assembly = row.get("Assembly", "na")
-                priority = _ASSEMBLY_PRIORITY.get(assembly, 0)
-
-                row_genes = [g.strip() for g in gene_symbol_raw.split(";")]
-
-                for gene in row_genes:
-                    gene_dedup = dedup.get(gene)
-                    if gene_dedup is None:
-                        continue
-                    if gene_dedup.get(var_id_int) != priority:
-                        continue
-
-                    # This is the winning row — parse and aggregate
-                    variant = parse_variant_row(row, confidence_levels)
-                    accumulators[gene].add_variant(variant)
-
-                    # Remove entry to prevent double-counting
-                    del gene_dedup[var_id_int]
-
-        logger.sync_info(
-            "Pass 2 complete: aggregated variants",
-            genes_aggregated=len(accumulators),
-        )
+        for gene, rows in winners.groupby("gene", sort=False):
+            records = rows[list(_VARIANT_COLUMNS)].to_dict("records")
+            accumulators[gene].add_variants(
+                parse_variant_row(row, confidence_levels) for row in records
+            )
 
         # ---- Build results ----
         result: dict[str, dict[str, Any]] = {}
@@ -321,11 +353,11 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     @retry_with_backoff(config=RetryConfig(max_retries=5))
     async def _search_variants(self, gene_symbol: str) -> list[str]:
         """Search for ClinVar variant IDs via eUtils esearch."""
-        await self.apply_rate_limit()
+        search_url = f"{self.base_url}/esearch.fcgi"
+        await self.apply_rate_limit(search_url)
         client = await self.get_http_client()
 
         try:
-            search_url = f"{self.base_url}/esearch.fcgi"
             params = self._ncbi_params(
                 {
                     "db": "clinvar",
@@ -425,11 +457,11 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         if not variant_ids:
             return []
 
-        await self.apply_rate_limit()
+        summary_url = f"{self.base_url}/esummary.fcgi"
+        await self.apply_rate_limit(summary_url)
         client = await self.get_http_client()
 
         try:
-            summary_url = f"{self.base_url}/esummary.fcgi"
             params = self._ncbi_params(
                 {"db": "clinvar", "id": ",".join(variant_ids), "retmode": "json"}
             )
@@ -865,7 +897,7 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         try:
             # Try bulk lookup first
             if self._bulk_data is not None and gene.approved_symbol:
-                bulk_result = self._bulk_data.get(gene.approved_symbol)
+                bulk_result = self._bulk_data.get(str(gene.approved_symbol))
                 if bulk_result is not None:
                     return bulk_result
 
@@ -907,7 +939,7 @@ class ClinVarAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         # Fast bulk lookups
         for gene in genes:
             if self._bulk_data is not None and gene.approved_symbol:
-                bulk_result = self._bulk_data.get(gene.approved_symbol)
+                bulk_result = self._bulk_data.get(str(gene.approved_symbol))
                 if bulk_result is not None:
                     results[gene.id] = bulk_result
                     continue
@@ -6,6 +6,7 @@ making them easy to test in isolation.
 """
 
 import re
+from collections.abc import Iterable
 from typing import Any
 
 # Pre-compiled regexes
@@ -501,6 +502,11 @@ class GeneAccumulator:
             else:
                 self.consequence_categories["other"] += 1
 
+    def add_variants(self, variants: Iterable[dict[str, Any]]) -> None:
+        """Incorporate a batch of parsed variant dicts, in order."""
+        for variant in variants:
+            self.add_variant(variant)
+
     # ------------------------------------------------------------------ #
 
     def finalize(self) -> dict[str, Any]:
@@ -11,11 +11,20 @@ Zero REST API dependency — all data comes from two bulk files:
 """
 
 import csv
+import gzip
+import multiprocessing
+import os
+import shutil
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.logging import get_logger
 from app.models.gene import Gene
@@ -40,8 +49,8 @@ def _parse_gtf_attributes(attr_str: str) -> tuple[dict[str, str], set[str]]:
     """
     attrs: dict[str, str] = {}
     tags: set[str] = set()
-    for field in attr_str.strip().rstrip(";").split("; "):
-        parts = field.split(" ", 1)
+    for attr in attr_str.strip().rstrip(";").split("; "):
+        parts = attr.split(" ", 1)
         if len(parts) != 2:
             continue
         key = parts[0]
@@ -53,6 +62,135 @@ def _parse_gtf_attributes(attr_str: str) -> tuple[dict[str, str], set[str]]:
     return attrs, tags
 
 
+# GTF files smaller than this are parsed in-process (pool start-up isn't worth it)
+_PARALLEL_GTF_MIN_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class _GtfFeatures:
+    """Gene, transcript and exon features collected from (a byte range of) a GTF file."""
+
+    genes: dict[str, dict[str, Any]] = field(default_factory=dict)  # gene_name → gene info
+    transcripts: dict[str, dict[str, Any]] = field(default_factory=dict)  # transcript_id → info
+    transcript_exons: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    gene_transcripts: dict[str, list[str]] = field(default_factory=dict)  # gene → [tx ids]
+    line_count: int = 0
+
+    def merge(self, later: "_GtfFeatures") -> None:
+        """Append the features of the byte range that follows this one.
+
+        Merging ranges in file order gives the same dicts (including key
+        order) as parsing the whole file in one pass: later gene and
+        transcript records replace earlier ones, lists are concatenated.
+        """
+        self.genes.update(later.genes)
+        self.transcripts.update(later.transcripts)
+        for transcript_id, exons in later.transcript_exons.items():
+            self.transcript_exons.setdefault(transcript_id, []).extend(exons)
+        for gene_name, transcript_ids in later.gene_transcripts.items():
+            self.gene_transcripts.setdefault(gene_name, []).extend(transcript_ids)
+        self.line_count += later.line_count
+
+
+def _gtf_byte_ranges(size: int, parts: int) -> list[tuple[int, int]]:
+    """Split *size* bytes into *parts* ranges; lines are assigned by their first byte."""
+    step = -(-size // max(parts, 1)) or 1
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _parse_gtf_range(path: str, start: int, end: int) -> _GtfFeatures:
+    """Parse the GTF lines that start within bytes ``[start, end)`` of *path*.
+
+    Module-level so that it can run in a worker process.
+    """
+    features = _GtfFeatures()
+    genes = features.genes
+    transcripts = features.transcripts
+    transcript_exons = features.transcript_exons
+    gene_transcripts = features.gene_transcripts
+
+    with open(path, "rb") as fh:
+        position = start
+        if start > 0:
+            # Skip the line that began in the previous range
+            fh.seek(start - 1)
+            position = start - 1 + len(fh.readline())
+
+        while position < end:
+            raw_line = fh.readline()
+            if not raw_line:
+                break
+            position += len(raw_line)
+            line = raw_line.decode("utf-8")
+            if line.startswith("#"):
+                continue
+            features.line_count += 1
+
+            parts = line.rstrip("\r\n").split("\t", 8)
+            if len(parts) < 9:
+                continue
+
+            chrom, _source, feature, start_col, end_col, _score, strand, _frame, attr_str = parts
+            attrs, tags = _parse_gtf_attributes(attr_str)
+
+            if feature == "gene":
+                gene_name = attrs.get("gene_name", "")
+                if not gene_name:
+                    continue
+                genes[gene_name] = {
+                    "chromosome": chrom,
+                    "start": int(start_col),
+                    "end": int(end_col),
+                    "strand": "+" if strand == "+" else "-",
+                    "gene_id": attrs.get("gene_id", ""),
+                    "biotype": attrs.get("gene_biotype", ""),
+                }
+                if gene_name not in gene_transcripts:
+                    gene_transcripts[gene_name] = []
+
+            elif feature == "transcript":
+                gene_name = attrs.get("gene_name", "")
+                transcript_id = attrs.get("transcript_id", "")
+                if not gene_name or not transcript_id:
+                    continue
+
+                is_mane_select = "MANE_Select" in tags
+                is_canonical = "Ensembl_canonical" in tags
+
+                transcripts[transcript_id] = {
+                    "transcript_id": transcript_id,
+                    "gene_name": gene_name,
+                    "biotype": attrs.get("transcript_biotype", ""),
+                    "start": int(start_col),
+                    "end": int(end_col),
+                    "display_name": attrs.get("transcript_name", ""),
+                    "is_mane_select": is_mane_select,
+                    "is_canonical": is_canonical,
+                    "length": int(end_col) - int(start_col) + 1,
+                }
+
+                if gene_name not in gene_transcripts:
+                    gene_transcripts[gene_name] = []
+                gene_transcripts[gene_name].append(transcript_id)
+
+            elif feature == "exon":
+                transcript_id = attrs.get("transcript_id", "")
+                if not transcript_id:
+                    continue
+                exon_data = {
+                    "exon_id": attrs.get("exon_id", ""),
+                    "exon_number": int(attrs.get("exon_number", "0")),
+                    "start": int(start_col),
+                    "end": int(end_col),
+                    "length": int(end_col) - int(start_col) + 1,
+                }
+                if transcript_id not in transcript_exons:
+                    transcript_exons[transcript_id] = []
+                transcript_exons[transcript_id].append(exon_data)
+
+    return features
+
+
 class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     """
     Ensembl gene structure annotation source.
@@ -75,6 +213,7 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     bulk_cache_ttl_hours = 168  # 7 days
     bulk_file_format = "gtf.gz"
     bulk_file_min_size_bytes = 80_000_000  # ~99 MB compressed expected
+    bulk_download_segments = 4
 
     # MANE summary file for Ensembl→RefSeq transcript mapping
     mane_file_url = (
@@ -85,6 +224,9 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     # Batch size for fetch_batch (dict lookups, so can be large)
     batch_size = 1000
 
+    # Processes used to parse the GTF (overridden by config / CPU count)
+    gtf_parse_workers = 1
+
     def __init__(self, session: Session) -> None:
         """Initialize the Ensembl annotation source."""
         super().__init__(session)
@@ -94,9 +236,12 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
 
         config = get_annotation_config("ensembl") or {}
         self.batch_size = config.get("batch_size", 1000)
+        self.gtf_parse_workers = max(
+            1, config.get("gtf_parse_workers", min(os.cpu_count() or 1, 8))
+        )
 
-        # MANE data dict (separate from _bulk_data which holds GTF data)
-        self._mane_data: dict[str, dict[str, Any]] | None = None
+        # MANE data by ENST (separate from _bulk_data which holds GTF data)
+        self._mane_data: Mapping[str, dict[str, Any]] | None = None
 
         # Update source configuration
         if self.source_record:
@@ -114,8 +259,9 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     def parse_bulk_file(self, path: Path) -> dict[str, dict[str, Any]]:
         """Parse the Ensembl GTF file into a gene-keyed annotation dict.
 
-        Streams the GTF line-by-line, collecting gene, transcript, and
-        exon features.  Selects a canonical transcript per gene using:
+        Collects gene, transcript, and exon features (in parallel byte
+        ranges for large files, see :meth:`_parse_gtf_features`).  Selects
+        a canonical transcript per gene using:
         1. MANE_Select tag
         2. Ensembl_canonical tag
         3. Longest protein-coding transcript
@@ -126,84 +272,15 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         Returns:
             Dict keyed by gene symbol → annotation data.
         """
-        # Intermediate storage during parsing
-        genes: dict[str, dict[str, Any]] = {}  # gene_name → gene info
-        transcripts: dict[str, dict[str, Any]] = {}  # transcript_id → transcript info
-        transcript_exons: dict[str, list[dict[str, Any]]] = {}  # transcript_id → exon list
-        gene_transcripts: dict[str, list[str]] = {}  # gene_name → [transcript_ids]
-
-        line_count = 0
-        with open(path) as fh:
-            for line in fh:
-                if line.startswith("#"):
-                    continue
-                line_count += 1
-
-                parts = line.rstrip("\n").split("\t", 8)
-                if len(parts) < 9:
-                    continue
-
-                chrom, _source, feature, start, end, _score, strand, _frame, attr_str = parts
-                attrs, tags = _parse_gtf_attributes(attr_str)
-
-                if feature == "gene":
-                    gene_name = attrs.get("gene_name", "")
-                    if not gene_name:
-                        continue
-                    genes[gene_name] = {
-                        "chromosome": chrom,
-                        "start": int(start),
-                        "end": int(end),
-                        "strand": "+" if strand == "+" else "-",
-                        "gene_id": attrs.get("gene_id", ""),
-                        "biotype": attrs.get("gene_biotype", ""),
-                    }
-                    if gene_name not in gene_transcripts:
-                        gene_transcripts[gene_name] = []
-
-                elif feature == "transcript":
-                    gene_name = attrs.get("gene_name", "")
-                    transcript_id = attrs.get("transcript_id", "")
-                    if not gene_name or not transcript_id:
-                        continue
-
-                    is_mane_select = "MANE_Select" in tags
-                    is_canonical = "Ensembl_canonical" in tags
-
-                    transcripts[transcript_id] = {
-                        "transcript_id": transcript_id,
-                        "gene_name": gene_name,
-                        "biotype": attrs.get("transcript_biotype", ""),
-                        "start": int(start),
-                        "end": int(end),
-                        "display_name": attrs.get("transcript_name", ""),
-                        "is_mane_select": is_mane_select,
-                        "is_canonical": is_canonical,
-                        "length": int(end) - int(start) + 1,
-                    }
-
-                    if gene_name not in gene_transcripts:
-                        gene_transcripts[gene_name] = []
-                    gene_transcripts[gene_name].append(transcript_id)
-
-                elif feature == "exon":
-                    transcript_id = attrs.get("transcript_id", "")
-                    if not transcript_id:
-                        continue
-                    exon_data = {
-                        "exon_id": attrs.get("exon_id", ""),
-                        "exon_number": int(attrs.get("exon_number", "0")),
-                        "start": int(start),
-                        "end": int(end),
-                        "length": int(end) - int(start) + 1,
-                    }
-                    if transcript_id not in transcript_exons:
-                        transcript_exons[transcript_id] = []
-                    transcript_exons[transcript_id].append(exon_data)
+        features = self._parse_gtf_features(path)
+        genes = features.genes
+        transcripts = features.transcripts
+        transcript_exons = features.transcript_exons
+        gene_transcripts = features.gene_transcripts
 
         logger.sync_info(
             "GTF file parsed",
-            lines_processed=line_count,
+            lines_processed=features.line_count,
             gene_count=len(genes),
             transcript_count=len(transcripts),
         )
@@ -264,6 +341,42 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         )
         return result
 
+    def _parse_gtf_features(self, path: Path) -> _GtfFeatures:
+        """Collect the features of a GTF file, in a process pool when it is large.
+
+        The file is split into one byte range per worker; ranges are parsed
+        in parallel and merged in file order, so the result is the same as
+        a single sequential pass.
+        """
+        size = path.stat().st_size
+        workers = self.gtf_parse_workers if size >= _PARALLEL_GTF_MIN_BYTES else 1
+        ranges = _gtf_byte_ranges(size, workers)
+        if len(ranges) <= 1:
+            return _parse_gtf_range(str(path), 0, size)
+
+        logger.sync_info("Parsing GTF in parallel", workers=workers, size_bytes=size)
+        try:
+            # spawn: the pipeline process runs threads that must not be forked
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                parts = list(
+                    pool.map(
+                        _parse_gtf_range,
+                        [str(path)] * len(ranges),
+                        [start for start, _ in ranges],
+                        [end for _, end in ranges],
+                    )
+                )
+        except (BrokenProcessPool, OSError) as exc:
+            logger.sync_warning("Parallel GTF parsing failed, parsing sequentially", error=str(exc))
+            return _parse_gtf_range(str(path), 0, size)
+
+        features = parts[0]
+        for part in parts[1:]:
+            features.merge(part)
+        return features
+
     @staticmethod
     def _select_canonical_transcript(
         transcript_ids: list[str],
@@ -373,6 +486,23 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     # Bulk data loading (two files)
     # ------------------------------------------------------------------
 
+    def _decompressed_bulk_path(self, path: Path, label: str, force: bool) -> Path:
+        """Return the path to parse for *path*, decompressing ``.gz`` files if needed."""
+        if path.suffix != ".gz":
+            return path
+
+        decompressed = path.with_suffix("")
+        if not decompressed.exists() or force:
+            logger.sync_info(
+                f"Decompressing {label} file",
+                src=str(path),
+                dest=str(decompressed),
+            )
+            with gzip.open(path, "rb") as f_in:
+                with open(decompressed, "wb") as f_out:
+                    shutil.copyfileobj(f_in, f_out)
+        return decompressed
+
     async def ensure_bulk_data_loaded(self, force: bool = False) -> None:
         """Download, decompress, parse, and cache both bulk files.
 
@@ -384,7 +514,8 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         up RefSeq ID from the MANE data.
 
         Args:
-            force: Force re-download and re-parse.
+            force: Force re-download and re-parse.  Files whose content is
+                unchanged are not re-parsed.
         """
         if self._bulk_data is not None and self._mane_data is not None and not force:
             return
@@ -393,28 +524,22 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         saved_url = self.bulk_file_url
         gtf_path = await self.download_bulk_file_streaming(force=force)
 
-        # Decompress GTF if gzipped
-        gtf_parse_path = gtf_path
-        if gtf_path.suffix == ".gz":
-            decompressed = gtf_path.with_suffix("")
-            if not decompressed.exists() or force:
-                import gzip as _gzip
-                import shutil
-
-                logger.sync_info(
-                    "Decompressing GTF file",
-                    src=str(gtf_path),
-                    dest=str(decompressed),
-                )
-                with _gzip.open(gtf_path, "rb") as f_in:
-                    with open(decompressed, "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            gtf_parse_path = decompressed
-
-        self._bulk_data = self.parse_bulk_file(gtf_parse_path)
+        gtf_data: Mapping[str, Any]
+        if self._bulk_data is not None and self._is_bulk_content_parsed(gtf_path):
+            logger.sync_info("GTF bulk file unchanged, keeping parsed data")
+            gtf_data = self._bulk_data
+        else:
+            gtf_data = await run_in_threadpool(
+                self._load_or_parse_bulk,
+                gtf_path,
+                lambda: self.parse_bulk_file(self._decompressed_bulk_path(gtf_path, "GTF", force)),
+                shared=False,  # Canonical transcripts are updated with RefSeq IDs below
+            )
+            self._mark_bulk_content_parsed(gtf_path)
+        self._bulk_data = gtf_data
         logger.sync_info(
             "GTF bulk data loaded",
-            gene_count=len(self._bulk_data),
+            gene_count=len(gtf_data),
         )
 
         # 2. Download and parse MANE summary
@@ -428,25 +553,18 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
         try:
             mane_path = await self.download_bulk_file(force=force)
 
-            # Decompress MANE if gzipped
-            mane_parse_path = mane_path
-            if mane_path.suffix == ".gz":
-                decompressed_mane = mane_path.with_suffix("")
-                if not decompressed_mane.exists() or force:
-                    import gzip as _gzip
-                    import shutil
-
-                    logger.sync_info(
-                        "Decompressing MANE file",
-                        src=str(mane_path),
-                        dest=str(decompressed_mane),
-                    )
-                    with _gzip.open(mane_path, "rb") as f_in:
-                        with open(decompressed_mane, "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-                mane_parse_path = decompressed_mane
-
-            self._mane_data = self.parse_mane_file(mane_parse_path)
+            mane_data = self._mane_data
+            if mane_data is not None and self._is_bulk_content_parsed(mane_path):
+                logger.sync_info("MANE bulk file unchanged, keeping parsed data")
+            else:
+                mane_data = self._load_or_parse_bulk(
+                    mane_path,
+                    lambda: self.parse_mane_file(
+                        self._decompressed_bulk_path(mane_path, "MANE", force)
+                    ),
+                )
+                self._mark_bulk_content_parsed(mane_path)
+            self._mane_data = mane_data
         finally:
             # Restore original URL and format
             self.bulk_file_url = saved_url
@@ -455,25 +573,25 @@ class EnsemblAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
 
         logger.sync_info(
             "MANE bulk data loaded",
-            transcript_count=len(self._mane_data),
+            transcript_count=len(mane_data),
         )
 
         # 3. Cross-reference: attach RefSeq IDs to canonical transcripts
         refseq_matches = 0
-        for _symbol, annotation in self._bulk_data.items():
+        for _symbol, annotation in gtf_data.items():
             canonical = annotation.get("canonical_transcript")
             if not canonical:
                 continue
             transcript_id = canonical.get("transcript_id", "")
             enst_unversioned = transcript_id.split(".")[0]
-            mane_entry = self._mane_data.get(enst_unversioned)
+            mane_entry = mane_data.get(enst_unversioned)
             if mane_entry:
                 canonical["refseq_transcript_id"] = mane_entry["refseq_nuc"]
                 refseq_matches += 1
 
         logger.sync_info(
             "Cross-referenced GTF with MANE",
-            total_genes=len(self._bulk_data),
+            total_genes=len(gtf_data),
             refseq_matches=refseq_matches,
         )
 
@@ -3,13 +3,27 @@ GTEx annotation source for gene expression data.
 
 Uses bulk GCT download of median gene expression for fast batch processing.
 No per-gene API calls — the GCT file covers all genes measured by GTEx.
+
+The GCT is read into a dense gene × tissue matrix in one vectorized pass.
+The matrix is also persisted next to the bulk file (see
+:class:`ExpressionMatrix`) so that tissue rankings, such as the most
+kidney-specific genes, can be computed without touching the JSONB
+annotations.
 """
 
 import csv
+import json
+import os
 import re
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pandas as pd
+from starlette.concurrency import run_in_threadpool
+
 from app.core.logging import get_logger
 from app.models.gene import Gene
 from app.pipeline.sources.annotations.base import BaseAnnotationSource
@@ -45,6 +59,180 @@ def _normalise_tissue_id(raw: str) -> str:
     return s.rstrip("_")
 
 
+# GTEx tissues of the kidney (API-style IDs)
+KIDNEY_TISSUES = ("Kidney_Cortex", "Kidney_Medulla")
+
+
+def _read_gct(path: Path) -> tuple[np.ndarray, np.ndarray, list[str], np.ndarray] | None:
+    """Read a GCT v1.x file into label vectors and a float64 TPM matrix.
+
+    Returns:
+        ``(gencode_ids, gene_symbols, tissue_ids, tpm)`` with stripped labels,
+        API-style tissue IDs and NaN for missing or non-numeric values, or
+        ``None`` if the file is not a GCT file.
+    """
+    with open(path, newline="") as f:
+        line1 = f.readline().strip()
+        if not line1.startswith("#1."):
+            logger.sync_warning("Unexpected GCT version line", line=line1)
+            return None
+        f.readline()  # dimensions line (num_genes\tnum_tissues)
+
+        # Columns: Name, Description, tissue1, tissue2, ...
+        frame = pd.read_csv(
+            f,
+            sep="\t",
+            dtype=str,
+            keep_default_na=False,
+            quoting=csv.QUOTE_NONE,
+        )
+
+    labels = frame.iloc[:, :2].fillna("")
+    gencode_ids = labels.iloc[:, 0].str.strip().to_numpy(dtype=str)
+    gene_symbols = labels.iloc[:, 1].str.strip().to_numpy(dtype=str)
+    # GCT uses human-readable names ("Kidney - Cortex") but the GTEx API /
+    # frontend expects tissueSiteDetailId format ("Kidney_Cortex")
+    tissue_ids = [_normalise_tissue_id(name) for name in frame.columns[2:]]
+    values = frame.iloc[:, 2:].apply(pd.to_numeric, errors="coerce")
+    tpm = values.to_numpy(dtype=np.float64, na_value=np.nan).reshape(len(frame), len(tissue_ids))
+    return gencode_ids, gene_symbols, tissue_ids, tpm
+
+
+def _gct_matrix(gct: tuple[np.ndarray, np.ndarray, list[str], np.ndarray]) -> "ExpressionMatrix":
+    """The :class:`ExpressionMatrix` of a :func:`_read_gct` result.
+
+    One row per gene symbol with expression data, taken from the symbol's
+    last such row.
+    """
+    gencode_ids, gene_symbols, tissue_ids, tpm = gct
+    keep = (gene_symbols != "") & ~np.isnan(tpm).all(axis=1)
+    rows = np.flatnonzero(keep)
+    last = ~pd.Series(gene_symbols[rows]).duplicated(keep="last").to_numpy()
+    rows = rows[last]
+    return ExpressionMatrix(
+        genes=gene_symbols[rows],
+        gencode_ids=gencode_ids[rows],
+        tissues=np.array(tissue_ids, dtype=str),
+        tpm=tpm[rows].astype(np.float32),
+    )
+
+
+@dataclass
+class ExpressionMatrix:
+    """Dense gene × tissue matrix of GTEx median TPM (NaN where not measured).
+
+    One row per gene symbol.  ``save`` writes the matrix as an ``.npy`` file
+    plus a JSON file with the labels, so ``load`` can memory-map it.
+    """
+
+    genes: np.ndarray  # gene symbols, one per row
+    gencode_ids: np.ndarray
+    tissues: np.ndarray  # API-style tissue IDs, one per column
+    tpm: np.ndarray  # float32, shape (len(genes), len(tissues))
+
+    def tissue_columns(self, tissues: tuple[str, ...] | list[str]) -> np.ndarray:
+        """Column indexes of *tissues* (tissues not in the matrix are ignored)."""
+        return np.flatnonzero(np.isin(self.tissues, list(tissues)))
+
+    def percentiles(self, tissue: str) -> np.ndarray:
+        """Per gene, the percentage of measured genes with lower TPM in *tissue*.
+
+        NaN for genes without a value in *tissue*.
+        """
+        columns = self.tissue_columns([tissue])
+        if not len(columns):
+            raise KeyError(tissue)
+        values = self.tpm[:, columns[0]]
+        measured = np.sort(values[~np.isnan(values)])
+        if not len(measured):
+            return np.full(len(values), np.nan)
+        lower = np.searchsorted(measured, values, side="left")
+        return np.where(np.isnan(values), np.nan, lower * (100.0 / len(measured)))
+
+    def specificity(self, tissues: tuple[str, ...] | list[str] = KIDNEY_TISSUES) -> np.ndarray:
+        """Per gene, log2 of (mean TPM in *tissues* + 1) / (mean TPM elsewhere + 1).
+
+        NaN for genes without a value in *tissues* or in any other tissue.
+        """
+        selected = np.zeros(len(self.tissues), dtype=bool)
+        selected[self.tissue_columns(tissues)] = True
+        measured = ~np.isnan(self.tpm)
+        filled = np.where(measured, self.tpm, 0.0)
+
+        def mean(columns: np.ndarray) -> np.ndarray:
+            counts = measured[:, columns].sum(axis=1)
+            totals = filled[:, columns].sum(axis=1, dtype=np.float64)
+            means = np.full(len(counts), np.nan)
+            np.divide(totals, counts, out=means, where=counts > 0)
+            return means
+
+        return np.log2((mean(selected) + 1.0) / (mean(~selected) + 1.0))
+
+    def top_specific_genes(
+        self, tissues: tuple[str, ...] | list[str] = KIDNEY_TISSUES, limit: int = 100
+    ) -> list[tuple[str, float]]:
+        """The *limit* genes most specific to *tissues*, as ``(symbol, score)``."""
+        scores = self.specificity(tissues)
+        candidates = np.flatnonzero(~np.isnan(scores))
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        ranked = candidates[np.lexsort((self.genes[candidates], -scores[candidates]))]
+        return [(str(self.genes[i]), float(scores[i])) for i in ranked]
+
+    def save(self, path: Path, key: str) -> None:
+        """Write ``<path>.npy`` and ``<path>.json`` (labels and *key*), atomically."""
+        values_path, labels_path = self.files(path)
+        labels = {
+            "key": key,
+            "shape": list(self.tpm.shape),
+            "genes": self.genes.tolist(),
+            "gencode_ids": self.gencode_ids.tolist(),
+            "tissues": self.tissues.tolist(),
+        }
+        for target, write in (
+            (values_path, lambda fh: np.save(fh, self.tpm.astype(np.float32, copy=False))),
+            (labels_path, lambda fh: fh.write(json.dumps(labels).encode())),
+        ):
+            tmp_path = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                with open(tmp_path, "wb") as fh:
+                    write(fh)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                tmp_path.replace(target)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+    @classmethod
+    def load(cls, path: Path, key: str) -> "ExpressionMatrix | None":
+        """Memory-map a matrix saved with *key*; ``None`` if missing or outdated."""
+        values_path, labels_path = cls.files(path)
+        try:
+            labels = json.loads(labels_path.read_bytes())
+            if labels.get("key") != key:
+                return None
+            tpm = np.load(values_path, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.sync_warning("Ignoring unreadable GTEx matrix", path=str(path), error=str(exc))
+            return None
+        if list(tpm.shape) != labels["shape"] or tpm.dtype != np.float32:
+            return None
+        return cls(
+            genes=np.array(labels["genes"], dtype=str),
+            gencode_ids=np.array(labels["gencode_ids"], dtype=str),
+            tissues=np.array(labels["tissues"], dtype=str),
+            tpm=tpm,
+        )
+
+    @staticmethod
+    def files(path: Path) -> tuple[Path, Path]:
+        return path.with_suffix(path.suffix + ".npy"), path.with_suffix(path.suffix + ".json")
+
+
 class GTExAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     """
     GTEx (Genotype-Tissue Expression) annotation source.
@@ -69,6 +257,11 @@ class GTExAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
     bulk_cache_ttl_hours = 168  # 7 days
     bulk_file_format = "gct.gz"
 
+    # Dense matrix of the bulk file, loaded by get_expression_matrix()
+    _expression_matrix: ExpressionMatrix | None = None
+    # Matrix built by the last parse_bulk_file(), so a cold load reads the GCT once
+    _parsed_matrix: ExpressionMatrix | None = None
+
     def parse_bulk_file(self, path: Path) -> dict[str, dict[str, Any]]:
         """Parse GTEx median gene expression GCT into gene-keyed dict.
 
@@ -79,62 +272,97 @@ class GTExAnnotationSource(BulkDataSourceMixin, BaseAnnotationSource):
           Line 4+: gencode_id<tab>gene_symbol<tab>tpm1<tab>tpm2<tab>...
 
         Field names match the output of ``_fetch_by_symbol()`` for data parity.
+        Values are parsed in one vectorized pass; when a symbol occurs more
+        than once, its last row with expression data wins.  The expression
+        matrix of the file is built from the same pass and kept for
+        :meth:`ensure_bulk_data_loaded`.
         """
         data: dict[str, dict[str, Any]] = {}
 
-        with open(path, newline="") as f:
-            # Skip GCT header lines
-            line1 = f.readline().strip()
-            if not line1.startswith("#1."):
-                logger.sync_warning("Unexpected GCT version line", line=line1)
-                return data
-
-            f.readline()  # dimensions line (num_genes\tnum_tissues)
-
-            # Read the column header to get tissue IDs
-            reader = csv.reader(f, delimiter="\t")
-            header = next(reader)
-            # Columns: Name, Description, tissue1, tissue2, ...
-            tissue_ids = header[2:]
-
-            for row in reader:
-                if len(row) < 3:
-                    continue
-
-                gencode_id = row[0].strip()
-                gene_symbol = row[1].strip()
-                if not gene_symbol:
-                    continue
-
-                # Build tissue expression map (same structure as API path)
-                # GCT uses human-readable names ("Kidney - Cortex") but the
-                # GTEx API / frontend expects tissueSiteDetailId format
-                # ("Kidney_Cortex"), so normalise: strip, replace " - " / " "
-                # with "_", then collapse parenthetical details.
-                tissues: dict[str, dict[str, Any]] = {}
-                for i, tissue_id in enumerate(tissue_ids):
-                    val = row[i + 2] if i + 2 < len(row) else ""
-                    if val and val != "NA":
-                        try:
-                            # Normalise GCT tissue name to API-style ID
-                            norm_id = _normalise_tissue_id(tissue_id)
-                            tissues[norm_id] = {
-                                "median_tpm": float(val),
-                                "unit": "TPM",
-                            }
-                        except ValueError:
-                            continue
-
-                if tissues:
-                    data[gene_symbol] = {
-                        "tissues": tissues,
-                        "dataset_version": "gtex_v8",
-                        "gencode_id": gencode_id,
-                        "gene_symbol": gene_symbol,
-                    }
+        gct = _read_gct(path)
+        if gct is None:
+            return data
+        gencode_ids, gene_symbols, tissue_ids, tpm = gct
+        self._parsed_matrix = _gct_matrix(gct)
+
+        measured = ~np.isnan(tpm)
+        rows = np.flatnonzero((gene_symbols != "") & measured.any(axis=1))
+        for row in rows.tolist():
+            columns = np.flatnonzero(measured[row])
+            gene_symbol = str(gene_symbols[row])
+            data[gene_symbol] = {
+                "tissues": {
+                    tissue_ids[column]: {"median_tpm": value, "unit": "TPM"}
+                    for column, value in zip(
+                        columns.tolist(), tpm[row, columns].tolist(), strict=True
+                    )
+                },
+                "dataset_version": "gtex_v8",
+                "gencode_id": str(gencode_ids[row]),
+                "gene_symbol": gene_symbol,
+            }
 
         return data
 
+    def build_expression_matrix(self, path: Path) -> ExpressionMatrix | None:
+        """Build the gene × tissue matrix of the GCT at *path*.
+
+        Rows match :meth:`parse_bulk_file`: one per gene symbol with
+        expression data, taken from the symbol's last such row.
+        """
+        gct = _read_gct(path)
+        return _gct_matrix(gct) if gct is not None else None
+
+    async def ensure_bulk_data_loaded(self, force: bool = False) -> None:
+        """Load the bulk data and keep the stored expression matrix in step with it.
+
+        When the bulk file is parsed, the matrix built alongside the
+        annotations is stored instead of reading the file a second time.
+        """
+        self._parsed_matrix = None
+        await super().ensure_bulk_data_loaded(force=force)
+        if force:
+            self._expression_matrix = None
+        parsed, self._parsed_matrix = self._parsed_matrix, None
+        try:
+            await self.get_expression_matrix(parsed=parsed)
+        except Exception as e:
+            # Annotations come from the bulk data; the matrix only serves rankings
+            logger.sync_warning("Failed to build GTEx expression matrix", error=str(e))
+
+    async def get_expression_matrix(
+        self, parsed: ExpressionMatrix | None = None
+    ) -> ExpressionMatrix | None:
+        """The expression matrix of the current bulk file, memory-mapped when possible.
+
+        The matrix is stored next to the bulk file and rebuilt when the
+        file content or ``bulk_parser_version`` changes.  *parsed* is a
+        matrix just built from the current bulk file; it is stored instead
+        of building a new one.
+        """
+        if self._expression_matrix is not None:
+            return self._expression_matrix
+
+        raw_path = await self.download_bulk_file()
+        key = self._bulk_artifact_key(raw_path)
+        matrix_path = raw_path.with_suffix(raw_path.suffix + ".matrix")
+        matrix = ExpressionMatrix.load(matrix_path, key) if key is not None else None
+        if matrix is None:
+            if parsed is None:
+                parsed = await run_in_threadpool(
+                    self.build_expression_matrix, self._decompress_bulk_file(raw_path)
+                )
+            matrix = parsed
+            if matrix is not None and key is not None:
+                try:
+                    matrix.save(matrix_path, key)
+                except OSError as exc:
+                    logger.sync_warning(
+                        "Could not store GTEx matrix", path=str(matrix_path), error=str(exc)
+                    )
+        self._expression_matrix = matrix
+        return matrix
+
     async def fetch_annotation(self, gene: Gene) -> dict[str, Any] | None:
         """Fetch GTEx expression data for a single gene via bulk lookup."""
         if not gene.approved_symbol:
@@ -2,7 +2,8 @@
 MPO/MGI Mouse Phenotype Annotation Source
 
 Identifies genes with kidney phenotypes in mouse models using:
-1. JAX Mammalian Phenotype Ontology (MPO) API for term collection
+1. The Mammalian Phenotype Ontology (local mp.obo release, JAX API as
+   fallback) for kidney term collection and term names
 2. MouseMine database for ortholog phenotype mapping
 """
 
@@ -10,10 +11,12 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import httpx
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.http_pool import create_async_client
 from app.core.logging import get_logger
+from app.core.ontology import OntologyIndex, get_ontology, ontology_data_dir
 from app.core.retry_utils import RetryConfig, retry_with_backoff
 from app.models.gene import Gene
 from app.pipeline.sources.annotations.base import BaseAnnotationSource
@@ -55,6 +58,9 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
         self.kidney_root_term = config.get("kidney_root_term", "MP:0005367")
         self.kidney_root_node = config.get("kidney_root_node", 117579)
 
+        # Local MP ontology, set by _load_mpo_terms when the release is available
+        self._mp_index: OntologyIndex | None = None
+
         # Cache for MPO terms (24-hour TTL)
         self._mpo_terms_cache: set[str] | None = None
         self._mpo_cache_timestamp: datetime | None = None
@@ -73,9 +79,22 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
             return True
         return datetime.now(timezone.utc) - self._mpo_cache_timestamp > self.mpo_cache_ttl
 
+    async def _mp_ontology(self) -> OntologyIndex | None:
+        """Process-wide index of the local MP release, or ``None`` if unavailable."""
+        return await get_ontology("MP", settings.MP_ONTOLOGY_URL, prefix="MP:")
+
+    def _mp_term_name(self, term_id: str) -> str | None:
+        """Name of an MP term from the local ontology (``None`` if not loaded or unknown)."""
+        return self._mp_index.name(term_id) if self._mp_index is not None else None
+
     async def _load_mpo_terms(self) -> None:
         """
-        Load kidney MPO terms from file cache, falling back to JAX API.
+        Load kidney MPO terms from the local MP ontology.
+
+        Each ontology load stores the closure under ``ONTOLOGY_DATA_DIR``
+        (only when it changed).  Without the ontology, falls back to that
+        derived file, then to the shipped file cache, and then to the
+        recursive JAX API crawl.
 
         Sets self._mpo_terms_cache and self._mpo_cache_timestamp.
         Used by both fetch_annotation() and fetch_batch() to ensure
@@ -91,29 +110,49 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
 
         backend_dir = Path(__file__).parent.parent.parent.parent
         cache_file = backend_dir / cache_file_relative
-
-        if cache_file.exists():
-
-            def read_json_file(path: Path) -> set[str]:
-                """Read and parse JSON file synchronously."""
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    return {str(item) for item in data}
-
-            loaded_terms: set[str] = await asyncio.to_thread(read_json_file, cache_file)
+        derived_file = ontology_data_dir() / "mp_kidney_terms.json"
+
+        def read_json_file(path: Path) -> set[str]:
+            """Read and parse JSON file synchronously."""
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+                return {str(item) for item in data}
+
+        def write_json_file(path: Path, data: set[str]) -> None:
+            """Write JSON file synchronously."""
+            path.parent.mkdir(exist_ok=True, parents=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(sorted(data), f, indent=2)
+
+        def refresh_json_file(path: Path, data: set[str]) -> None:
+            """Write JSON file synchronously unless it already holds *data*."""
+            try:
+                if read_json_file(path) == data:
+                    return
+            except (OSError, ValueError, TypeError):
+                pass
+            write_json_file(path, data)
+
+        self._mp_index = await self._mp_ontology()
+        if self._mp_index is not None and self.kidney_root_term in self._mp_index:
+            ontology_terms = self._mp_index.descendants(self.kidney_root_term, include_self=True)
+            self._mpo_terms_cache = ontology_terms
+            try:
+                await asyncio.to_thread(refresh_json_file, derived_file, ontology_terms)
+            except OSError as e:
+                logger.sync_warning("Could not store MPO kidney terms", error=str(e))
+            logger.sync_info(f"Loaded {len(ontology_terms)} MPO terms from local MP ontology")
+        elif derived_file.exists() or cache_file.exists():
+            terms_file = derived_file if derived_file.exists() else cache_file
+            loaded_terms: set[str] = await asyncio.to_thread(read_json_file, terms_file)
             self._mpo_terms_cache = loaded_terms
-            logger.sync_info(f"Loaded {len(loaded_terms)} MPO terms from cache file")
+            logger.sync_info(
+                f"Loaded {len(loaded_terms)} MPO terms from cache file", path=str(terms_file)
+            )
         else:
             logger.sync_info("MPO terms cache file not found, fetching from API...")
             fetched_terms = await self.fetch_kidney_mpo_terms()
             self._mpo_terms_cache = fetched_terms
-
-            def write_json_file(path: Path, data: set[str]) -> None:
-                """Write JSON file synchronously."""
-                path.parent.mkdir(exist_ok=True, parents=True)
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(sorted(data), f, indent=2)
-
             await asyncio.to_thread(write_json_file, cache_file, fetched_terms)
             logger.sync_info(f"Fetched {len(fetched_terms)} MPO terms and saved to cache")
 
@@ -137,9 +176,16 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
 
     async def fetch_kidney_mpo_terms(self) -> set[str]:
         """
-        Recursively fetch all descendant terms of kidney/urinary phenotype.
+        Fetch all descendant terms of kidney/urinary phenotype.
+
+        Uses the local MP ontology closure when available; otherwise walks
+        the JAX MP tree recursively (one request per term with children).
         Returns set of MPO term IDs.
         """
+        ontology = await self._mp_ontology()
+        if ontology is not None and self.kidney_root_term in ontology:
+            return ontology.descendants(self.kidney_root_term, include_self=True)
+
         all_terms = set()
         all_terms.add(self.kidney_root_term)  # Include root term
 
@@ -226,7 +272,7 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
             # Use the first mouse ortholog symbol to query genotype/phenotype data
             mouse_symbol = mouse_symbols[0]
 
-            async with httpx.AsyncClient() as client:
+            async with create_async_client() as client:
                 # Query the _Genotype_Phenotype template for zygosity-specific phenotypes
                 logger.sync_debug(f"Querying MouseMine for zygosity phenotypes of {mouse_symbol}")
                 url = f"{self.mousemine_url}/template/results"
@@ -266,7 +312,7 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
                 if len(row) >= 6:
                     zygosity = row[3]  # Zygosity column
                     mpo_id = row[4]  # MPO term ID
-                    mpo_name = row[5]  # MPO term name
+                    mpo_name = self._mp_term_name(mpo_id) or row[5]  # MPO term name
 
                     if mpo_id and mpo_name:
                         phenotype_entry = {"term": mpo_id, "name": mpo_name}
@@ -431,7 +477,7 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
                     human_sym = row[1]  # human gene symbol from result
                     mouse_sym = row[4]
                     mpo_id = row[6]
-                    mpo_name = row[7]
+                    mpo_name = self._mp_term_name(mpo_id) or row[7]
 
                     if human_sym not in gene_mouse_symbols:
                         gene_mouse_symbols[human_sym] = set()
@@ -534,7 +580,7 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
                     mouse_sym = row[1]
                     zygosity = row[3]
                     mpo_id = row[4]
-                    mpo_name = row[5]
+                    mpo_name = self._mp_term_name(mpo_id) or row[5]
 
                     resolved_human = mouse_to_human.get(mouse_sym)
                     if not resolved_human or not mpo_id or not mpo_name:
@@ -654,7 +700,7 @@ class MPOMGIAnnotationSource(BaseAnnotationSource):
                 if len(row) >= 8:
                     mouse_symbol = row[4]  # Mouse gene symbol
                     mpo_id = row[6]  # MPO term ID
-                    mpo_name = row[7]  # MPO term name
+                    mpo_name = self._mp_term_name(mpo_id) or row[7]  # MPO term name
 
                     if mouse_symbol:
                         mouse_symbols.add(mouse_symbol)
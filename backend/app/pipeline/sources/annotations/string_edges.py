@@ -0,0 +1,201 @@
+"""
+Compact, version-keyed store of STRING physical interactions.
+
+Reading the STRING release (protein info + physical links, several
+million rows) with ``pd.read_csv`` and mapping protein IDs to gene symbols
+takes tens of seconds.  The release is therefore converted once into a
+columnar edge store: integer node IDs (codes into a sorted symbol
+dictionary) and ``uint16`` combined scores, one ``.npy`` column each.
+Columns are memory-mapped when opened and filtered by score at read time,
+so the annotation source and the network analysis service can both use
+the same store with their own score thresholds.
+
+Store layout (a directory per STRING version)::
+
+    meta.json     format, STRING version, edge and symbol counts
+    symbols.json  node ID → gene symbol (sorted)
+    gene1.npy     uint32 node IDs, in links-file order
+    gene2.npy     uint32 node IDs
+    score.npy     uint16 combined_score
+
+Usage::
+
+    store = StringEdgeStore.open(path, "12.0") or StringEdgeStore.build(
+        path, "12.0", protein_info_path, links_path
+    )
+    gene1, gene2, scores = store.edges(min_score=400)
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+EDGE_STORE_FORMAT = 1
+
+_COLUMNS = {"gene1": np.uint32, "gene2": np.uint32, "score": np.uint16}
+
+
+def edge_store_path(data_dir: Path, version: str) -> Path:
+    """Directory of the edge store of STRING *version* in *data_dir*."""
+    return data_dir / f"9606.physical.edges.v{version}"
+
+
+@dataclass
+class StringEdgeStore:
+    """Memory-mapped STRING physical interactions between gene symbols."""
+
+    path: Path
+    version: str
+    symbols: np.ndarray  # node ID → gene symbol
+    gene1: np.ndarray
+    gene2: np.ndarray
+    scores: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @cached_property
+    def symbol_codes(self) -> dict[str, int]:
+        """Gene symbol → node ID."""
+        return {symbol: code for code, symbol in enumerate(self.symbols.tolist())}
+
+    def edges(self, min_score: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Node IDs and scores of the interactions with ``score >= min_score``."""
+        if min_score <= 0:
+            return self.gene1, self.gene2, self.scores
+        keep = self.scores >= min_score
+        return self.gene1[keep], self.gene2[keep], self.scores[keep]
+
+    @classmethod
+    def build(
+        cls, path: Path, version: str, protein_info_path: Path, links_path: Path
+    ) -> "StringEdgeStore":
+        """Convert a STRING release into an edge store at *path* and open it.
+
+        Interactions whose proteins have no gene symbol are dropped.  The
+        store is written to a temporary directory and moved into place.
+        """
+        logger.sync_info("Building STRING edge store", path=str(path), version=version)
+
+        info = pd.read_csv(
+            protein_info_path,
+            sep="\t",
+            usecols=["#string_protein_id", "preferred_name"],
+            dtype=str,
+        ).drop_duplicates("#string_protein_id", keep="last")
+        symbol_codes, symbols = pd.factorize(info["preferred_name"], sort=True)
+        proteins = pd.Index(info["#string_protein_id"])
+
+        links = pd.read_csv(
+            links_path,
+            sep=" ",
+            usecols=["protein1", "protein2", "combined_score"],
+            dtype={"protein1": str, "protein2": str, "combined_score": np.int64},
+        )
+        # Protein → symbol code; -1 for unknown proteins or proteins without a name
+        protein_codes = np.append(symbol_codes, -1)
+        gene1 = protein_codes[proteins.get_indexer(links["protein1"])]
+        gene2 = protein_codes[proteins.get_indexer(links["protein2"])]
+        mapped = (gene1 >= 0) & (gene2 >= 0)
+        columns = {
+            "gene1": gene1[mapped],
+            "gene2": gene2[mapped],
+            "score": links["combined_score"].to_numpy()[mapped],
+        }
+
+        meta: dict[str, Any] = {
+            "format": EDGE_STORE_FORMAT,
+            "version": version,
+            "edge_count": int(mapped.sum()),
+            "symbol_count": len(symbols),
+        }
+        tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        try:
+            tmp_path.mkdir(parents=True)
+            for name, dtype in _COLUMNS.items():
+                np.save(tmp_path / f"{name}.npy", columns[name].astype(dtype))
+            (tmp_path / "symbols.json").write_text(json.dumps(list(symbols)))
+            # meta.json last: a store without it is never opened
+            (tmp_path / "meta.json").write_text(json.dumps(meta))
+            shutil.rmtree(path, ignore_errors=True)
+            tmp_path.replace(path)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
+        logger.sync_info(
+            "Stored STRING edge store",
+            path=str(path),
+            edges=meta["edge_count"],
+            symbols=meta["symbol_count"],
+            dropped_unmapped=len(links) - meta["edge_count"],
+        )
+        store = cls.open(path, version)
+        if store is None:
+            raise OSError(f"Could not open the STRING edge store just written to {path}")
+        return store
+
+    @classmethod
+    def open(cls, path: Path, version: str) -> "StringEdgeStore | None":
+        """Memory-map the store at *path*; ``None`` if missing or not for *version*."""
+        try:
+            meta = json.loads((path / "meta.json").read_text())
+            if meta.get("format") != EDGE_STORE_FORMAT or meta.get("version") != version:
+                return None
+            columns: dict[str, np.ndarray] = {}
+            for name in _COLUMNS:
+                columns[name] = np.load(path / f"{name}.npy", mmap_mode="r")
+            symbols = np.array(json.loads((path / "symbols.json").read_text()), dtype=str)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.sync_warning(
+                "Ignoring unreadable STRING edge store", path=str(path), error=str(exc)
+            )
+            return None
+
+        for name, dtype in _COLUMNS.items():
+            if columns[name].dtype != dtype or len(columns[name]) != meta["edge_count"]:
+                logger.sync_warning("Ignoring inconsistent STRING edge store", path=str(path))
+                return None
+        if len(symbols) != meta["symbol_count"]:
+            logger.sync_warning("Ignoring inconsistent STRING edge store", path=str(path))
+            return None
+
+        return cls(
+            path=path,
+            version=version,
+            symbols=symbols,
+            gene1=columns["gene1"],
+            gene2=columns["gene2"],
+            scores=columns["score"],
+        )
+
+
+# Process-wide store for readers that never build it (e.g. the API)
+_store: StringEdgeStore | None = None
+
+
+def get_string_edge_store() -> StringEdgeStore | None:
+    """Open the edge store of the configured STRING release, if it has been built."""
+    global _store
+    if _store is None:
+        from app.core.config import settings
+
+        _store = StringEdgeStore.open(
+            edge_store_path(Path(settings.STRING_DATA_DIR), settings.STRING_VERSION),
+            settings.STRING_VERSION,
+        )
+    return _store
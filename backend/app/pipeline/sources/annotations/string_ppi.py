@@ -6,22 +6,82 @@ weighted by partner kidney evidence scores and normalized to avoid hub bias.
 """
 
 import asyncio
-import math
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import httpx
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.http_pool import create_async_client
 from app.core.logging import get_logger
 from app.models.gene import Gene
 from app.pipeline.sources.annotations.base import BaseAnnotationSource
+from app.pipeline.sources.annotations.string_edges import StringEdgeStore, edge_store_path
+from app.pipeline.sources.unified.ranged_download import (
+    DownloadIntegrityError,
+    download_resumable,
+)
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class InteractionGraph:
+    """
+    STRING interactions as an integer-coded CSR adjacency.
+
+    Gene symbols are coded ``0..n-1`` (sorted).  The partners of the gene
+    with code ``i`` are ``indices[indptr[i]:indptr[i + 1]]`` with their
+    ``combined_score`` in ``scores``, in the order of the links file.
+    Every interaction is listed under both of its genes (self-interactions
+    once).
+    """
+
+    symbols: np.ndarray  # code → gene symbol
+    indptr: np.ndarray  # int64, len(symbols) + 1
+    indices: np.ndarray  # partner code per edge
+    scores: np.ndarray  # combined_score per edge
+
+    @classmethod
+    def from_interactions(
+        cls, gene1: pd.Series, gene2: pd.Series, scores: pd.Series
+    ) -> "InteractionGraph":
+        """Build the adjacency from the gene columns of the links table."""
+        codes, symbols = pd.factorize(
+            pd.concat([gene1, gene2], ignore_index=True).astype(str), sort=True
+        )
+        count = len(gene1)
+        return cls.from_codes(np.asarray(symbols, dtype=str), codes[:count], codes[count:], scores)
+
+    @classmethod
+    def from_codes(
+        cls, symbols: np.ndarray, gene1: np.ndarray, gene2: np.ndarray, scores: Any
+    ) -> "InteractionGraph":
+        """Build the adjacency from interactions already coded into *symbols*."""
+        code1 = np.asarray(gene1, dtype=np.int64)
+        code2 = np.asarray(gene2, dtype=np.int64)
+        score = np.asarray(scores, dtype=np.int32)
+        row = np.arange(len(code1))
+
+        mirror = code1 != code2
+        source = np.concatenate([code1, code2[mirror]])
+        target = np.concatenate([code2, code1[mirror]])
+        order = np.lexsort((np.concatenate([row, row[mirror]]), source))
+
+        indptr = np.zeros(len(symbols) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source, minlength=len(symbols)), out=indptr[1:])
+        return cls(
+            symbols=symbols,
+            indptr=indptr,
+            indices=target[order].astype(np.int32),
+            scores=np.concatenate([score, score[mirror]])[order],
+        )
+
+
 class StringPPIAnnotationSource(BaseAnnotationSource):
     """
     STRING-DB Protein-Protein Interaction annotation source.
@@ -55,6 +115,8 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
         "https://stringdb-downloads.org/download/"
         "protein.physical.links.v12.0/9606.protein.physical.links.v12.0.txt.gz"
     )
+    # Parallel Range segments per download (the links file is several hundred MB)
+    download_segments = 4
 
     # Class-level flag for one-time warnings
     _percentile_warning_shown = False
@@ -63,12 +125,12 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
         """Initialize STRING PPI annotation source."""
         super().__init__(session)
 
-        # Cache for protein mappings and interaction data
-        self._protein_to_gene: dict[str, str] | None = None
-        self._gene_to_protein: dict[str, list[str]] | None = None
-        self._interactions: pd.DataFrame | None = None
+        # Cache for interaction data
+        self._interactions: InteractionGraph | None = None
         self._kidney_genes: set[str] | None = None
         self._gene_evidence_scores: dict[str, float] | None = None
+        # Per kidney gene: (raw score, annotation without percentile)
+        self._ppi_scores: dict[str, tuple[float, dict[str, Any]]] | None = None
 
     async def _download_string_file(self, url: str, dest_path: Path) -> None:
         """Download a STRING data file if it doesn't exist locally."""
@@ -85,12 +147,8 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
 
         for attempt in range(1, max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                    async with client.stream("GET", url) as response:
-                        response.raise_for_status()
-                        with open(tmp_path, "wb") as f:
-                            async for chunk in response.aiter_bytes(chunk_size=65536):
-                                f.write(chunk)
+                async with create_async_client(timeout=timeout, follow_redirects=True) as client:
+                    await download_resumable(client, url, tmp_path, segments=self.download_segments)
                 tmp_path.replace(dest_path)
                 logger.sync_info(
                     "STRING file downloaded",
@@ -98,10 +156,14 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
                     size_bytes=dest_path.stat().st_size,
                 )
                 return
-            except (httpx.TransportError, httpx.HTTPStatusError, OSError) as exc:
+            except (
+                httpx.TransportError,
+                httpx.HTTPStatusError,
+                OSError,
+                DownloadIntegrityError,
+            ) as exc:
+                # Partial data is kept and resumed by the next attempt
                 last_error = exc
-                if tmp_path.exists():
-                    tmp_path.unlink()
                 if attempt < max_retries:
                     wait = 2**attempt
                     logger.sync_warning(
@@ -139,72 +201,48 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
         if not links_exists:
             await self._download_string_file(self.physical_links_url, links_gz)
 
+    @property
+    def edge_store_path(self) -> Path:
+        """Directory of the compact edge store of this STRING release."""
+        return edge_store_path(self.data_dir, self.version)
+
+    def _data_file_path(self, filename: str) -> Path:
+        """Path of a STRING data file, plain or gzipped."""
+        path = self.data_dir / filename
+        if path.exists():
+            return path
+        gz_path = path.with_suffix(".txt.gz")
+        if gz_path.exists():
+            return gz_path
+        raise FileNotFoundError(f"STRING data file not found: {path}")
+
     async def _load_data(self) -> None:
-        """Load and prepare STRING data files."""
-        if self._protein_to_gene is not None:
-            return  # Already loaded
+        """Load STRING interactions above ``min_string_score`` from the edge store.
 
-        await self.ensure_data_files()
+        The store is built from the downloaded release on first use and
+        reused by later runs (and by the network analysis service).
+        """
+        if self._interactions is not None:
+            return  # Already loaded
 
-        logger.sync_info("Loading STRING data files", version=self.version)
+        store = StringEdgeStore.open(self.edge_store_path, self.version)
+        if store is None:
+            await self.ensure_data_files()
+            store = await asyncio.to_thread(
+                StringEdgeStore.build,
+                self.edge_store_path,
+                self.version,
+                self._data_file_path(self.protein_info_file),
+                self._data_file_path(self.physical_links_file),
+            )
 
-        # Load protein info file
-        protein_info_path = self.data_dir / self.protein_info_file
-        if not protein_info_path.exists():
-            # Try gzipped version
-            gz_path = protein_info_path.with_suffix(".txt.gz")
-            if gz_path.exists():
-                logger.sync_info("Loading gzipped protein info file")
-                df_info = pd.read_csv(gz_path, sep="\t", compression="gzip")
-            else:
-                raise FileNotFoundError(f"STRING protein info file not found: {protein_info_path}")
-        else:
-            df_info = pd.read_csv(protein_info_path, sep="\t")
-
-        # Create bidirectional mappings
-        df_info["protein_id"] = df_info["#string_protein_id"].str.replace("9606.", "")
-        self._protein_to_gene = dict(
-            zip(df_info["protein_id"], df_info["preferred_name"], strict=False)
+        gene1, gene2, scores = store.edges(min_score=self.min_string_score)
+        self._interactions = InteractionGraph.from_codes(store.symbols, gene1, gene2, scores)
+        logger.sync_info(
+            f"Loaded {len(scores)} interactions above threshold",
+            version=self.version,
+            min_score=self.min_string_score,
         )
-        self._gene_to_protein = {}
-        for protein, gene in self._protein_to_gene.items():
-            if gene not in self._gene_to_protein:
-                self._gene_to_protein[gene] = []
-            self._gene_to_protein[gene].append(protein)
-
-        logger.sync_info(f"Loaded {len(self._protein_to_gene)} protein mappings")
-
-        # Load physical links file
-        physical_links_path = self.data_dir / self.physical_links_file
-        if not physical_links_path.exists():
-            # Try gzipped version
-            gz_path = physical_links_path.with_suffix(".txt.gz")
-            if gz_path.exists():
-                logger.sync_info("Loading gzipped physical links file")
-                df_links = pd.read_csv(gz_path, sep=" ", compression="gzip")
-            else:
-                raise FileNotFoundError(
-                    f"STRING physical links file not found: {physical_links_path}"
-                )
-        else:
-            df_links = pd.read_csv(physical_links_path, sep=" ")
-
-        # Clean protein IDs
-        df_links["protein1"] = df_links["protein1"].str.replace("9606.", "")
-        df_links["protein2"] = df_links["protein2"].str.replace("9606.", "")
-
-        # Filter by minimum score
-        df_links = df_links[df_links["combined_score"] >= self.min_string_score]
-
-        # Map proteins to gene symbols
-        df_links["gene1"] = df_links["protein1"].map(self._protein_to_gene)
-        df_links["gene2"] = df_links["protein2"].map(self._protein_to_gene)
-
-        # Remove rows where mapping failed
-        df_links = df_links.dropna(subset=["gene1", "gene2"])
-
-        self._interactions = df_links
-        logger.sync_info(f"Loaded {len(self._interactions)} interactions above threshold")
 
     async def _load_kidney_genes(self) -> None:
         """Load kidney genes and their evidence scores from database."""
@@ -276,6 +314,11 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
 
         logger.sync_info(f"Processing {len(genes)} genes for PPI scores")
 
+        if self._ppi_scores is None:
+            self._ppi_scores = self._score_kidney_genes(
+                self._interactions, self._kidney_genes, self._gene_evidence_scores
+            )
+
         results: dict[int, dict[str, Any]] = {}
         raw_scores: dict[int, float] = {}
 
@@ -286,103 +329,16 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
             if gene_symbol not in self._kidney_genes:
                 continue
 
-            # Get all interactions for this gene
-            gene_interactions = self._interactions[
-                (self._interactions["gene1"] == gene_symbol)
-                | (self._interactions["gene2"] == gene_symbol)
-            ].copy()
-
-            if len(gene_interactions) == 0:
-                # No interactions found
+            scored = self._ppi_scores.get(str(gene_symbol))
+            if scored is None:
+                # No interactions with kidney genes
                 raw_scores[gene.id] = 0
                 results[gene.id] = self._format_annotation(gene_symbol, 0, 0, 0, [])
                 continue
 
-            # Identify partners
-            gene_interactions["partner"] = gene_interactions.apply(
-                lambda row, gs=gene_symbol: row["gene2"] if row["gene1"] == gs else row["gene1"],
-                axis=1,
-            )
-
-            # Filter for kidney gene partners only
-            gene_interactions = gene_interactions[
-                gene_interactions["partner"].isin(self._kidney_genes)
-            ]
-
-            if len(gene_interactions) == 0:
-                # No kidney gene interactions
-                raw_scores[gene.id] = 0
-                results[gene.id] = self._format_annotation(gene_symbol, 0, 0, 0, [])
-                continue
-
-            # Aggregate interactions by partner gene (handling multiple isoforms)
-            partner_interactions: dict[str, dict[str, Any]] = {}
-
-            for _, interaction in gene_interactions.iterrows():
-                partner = interaction["partner"]
-                string_score = interaction["combined_score"]
-                # _gene_evidence_scores is guaranteed to be loaded at this point (checked above)
-                partner_evidence = self._gene_evidence_scores.get(partner, 0)
-
-                # If we already have this partner, keep the highest scoring interaction
-                if partner in partner_interactions:
-                    if string_score > partner_interactions[partner]["string_score"]:
-                        partner_interactions[partner] = {
-                            "partner_symbol": partner,
-                            "string_score": string_score,
-                            "partner_evidence": round(partner_evidence, 1),
-                            "weighted_score": round((string_score / 1000) * partner_evidence, 2),
-                        }
-                else:
-                    partner_interactions[partner] = {
-                        "partner_symbol": partner,
-                        "string_score": string_score,
-                        "partner_evidence": round(partner_evidence, 1),
-                        "weighted_score": round((string_score / 1000) * partner_evidence, 2),
-                    }
-
-            # Convert to list and calculate total weighted sum
-            interaction_details = list(partner_interactions.values())
-            weighted_sum = sum(i["weighted_score"] for i in interaction_details)
-
-            # Calculate degree (number of UNIQUE kidney gene partners)
-            degree = len(partner_interactions)
-
-            # Apply hub bias correction
-            if degree > 0:
-                raw_score = weighted_sum / math.sqrt(degree)
-            else:
-                raw_score = 0
-
-            raw_scores[gene.id] = raw_score
-
-            # Sort interactions by weighted score and keep top N
-            interaction_details.sort(key=lambda x: x["weighted_score"], reverse=True)
-            top_interactions = interaction_details[: self.max_interactions_stored]
-
-            # Create summary statistics
-            summary = {
-                "total_interactions": degree,
-                "raw_sum": round(sum(i["string_score"] for i in interaction_details), 2),
-                "weighted_sum": round(weighted_sum, 2),
-                "avg_string_score": round(
-                    sum(i["string_score"] for i in interaction_details) / degree
-                    if degree > 0
-                    else 0,
-                    2,
-                ),
-                "strong_interactions": len(
-                    [i for i in interaction_details if i["string_score"] > 800]
-                ),
-            }
-
-            # Store preliminary results (will add percentile after getting global values)
-            results[gene.id] = {
-                "ppi_score": round(raw_score, 2),
-                "ppi_degree": degree,
-                "interactions": top_interactions,
-                "summary": summary,
-            }
+            # Copy: percentiles are added to the per-batch result below
+            raw_scores[gene.id], annotation = scored
+            results[gene.id] = dict(annotation)
 
         # NEW: Get global percentiles instead of calculating batch-relative
         if raw_scores:
@@ -434,6 +390,118 @@ class StringPPIAnnotationSource(BaseAnnotationSource):
 
         return results
 
+    def _score_kidney_genes(
+        self,
+        graph: InteractionGraph,
+        kidney_genes: set[str],
+        evidence_scores: dict[str, float],
+    ) -> dict[str, tuple[float, dict[str, Any]]]:
+        """
+        Score all kidney genes with kidney-gene partners in one vectorized pass.
+
+        Per gene, interactions with the same partner (from multiple
+        isoforms) are reduced to the highest-scoring one.  Partners keep
+        the order in which they first appear in the links file, and
+        interactions are ranked by weighted score in that order.
+
+        Returns:
+            Gene symbol → (raw PPI score, annotation without percentile)
+        """
+        is_kidney = np.isin(graph.symbols, list(kidney_genes))
+        evidence = (
+            pd.Series(graph.symbols).map(evidence_scores).fillna(0).to_numpy(dtype=np.float64)
+        )
+
+        source = np.repeat(np.arange(len(graph.symbols)), np.diff(graph.indptr))
+        keep = is_kidney[source] & is_kidney[graph.indices]
+        edges = pd.DataFrame(
+            {
+                "source": source[keep],
+                "partner": graph.indices[keep],
+                "score": graph.scores[keep],
+                "position": np.flatnonzero(keep),
+            }
+        )
+        # CSR positions are grouped by gene, so sorting by position keeps genes contiguous
+        pairs = (
+            edges.groupby(["source", "partner"], sort=False)
+            .agg(score=("score", "max"), position=("position", "min"))
+            .reset_index()
+            .sort_values("position", kind="stable")
+        )
+        if pairs.empty:
+            return {}
+
+        source = pairs["source"].to_numpy()
+        partner = pairs["partner"].to_numpy()
+        score = pairs["score"].to_numpy(dtype=np.int64)
+        partner_evidence = evidence[partner]
+        # Python round(), as stored before: np.round differs on halfway cents
+        weighted = np.fromiter(
+            (round(value, 2) for value in (score / 1000 * partner_evidence).tolist()),
+            dtype=np.float64,
+            count=len(score),
+        )
+
+        genes, starts, degrees = np.unique(source, return_index=True, return_counts=True)
+        weighted_sums = np.add.reduceat(weighted, starts)
+        score_sums = np.add.reduceat(score, starts)
+        strong = np.add.reduceat((score > 800).astype(np.int64), starts)
+        raw_scores = weighted_sums / np.sqrt(degrees)
+
+        # Per gene: interactions by weighted score, descending (stable)
+        ranked = np.lexsort((np.arange(len(pairs)), -weighted, source))
+        rank_in_gene = np.arange(len(pairs)) - np.repeat(starts, degrees)
+        top = ranked[rank_in_gene < self.max_interactions_stored]
+        top_genes = source[top]
+        top_starts = np.searchsorted(top_genes, genes)
+        top_ends = np.searchsorted(top_genes, genes, side="right")
+
+        interactions = [
+            {
+                "partner_symbol": symbol,
+                "string_score": string_score,
+                "partner_evidence": round(evidence_score, 1),
+                "weighted_score": weighted_score,
+            }
+            for symbol, string_score, evidence_score, weighted_score in zip(
+                graph.symbols[partner[top]].tolist(),
+                score[top].tolist(),
+                partner_evidence[top].tolist(),
+                weighted[top].tolist(),
+                strict=True,
+            )
+        ]
+
+        scored: dict[str, tuple[float, dict[str, Any]]] = {}
+        for symbol, degree, raw_score, weighted_sum, score_sum, n_strong, first, last in zip(
+            graph.symbols[genes].tolist(),
+            degrees.tolist(),
+            raw_scores.tolist(),
+            weighted_sums.tolist(),
+            score_sums.tolist(),
+            strong.tolist(),
+            top_starts.tolist(),
+            top_ends.tolist(),
+            strict=True,
+        ):
+            scored[symbol] = (
+                raw_score,
+                {
+                    "ppi_score": round(raw_score, 2),
+                    "ppi_degree": degree,
+                    "interactions": interactions[first:last],
+                    "summary": {
+                        "total_interactions": degree,
+                        "raw_sum": round(score_sum, 2),
+                        "weighted_sum": round(weighted_sum, 2),
+                        "avg_string_score": round(score_sum / degree, 2),
+                        "strong_interactions": n_strong,
+                    },
+                },
+            )
+        return scored
+
     def _format_annotation(
         self, gene_symbol: str, score: float, percentile: float, degree: int, interactions: list
     ) -> dict[str, Any]:
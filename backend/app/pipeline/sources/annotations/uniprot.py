@@ -13,8 +13,10 @@ from typing import Any
 import httpx
 from sqlalchemy.orm import Session
 
+from app.core.domain_rate_limiter import get_domain_rate_limiter_registry
+from app.core.http_pool import create_async_client
 from app.core.logging import get_logger
-from app.core.retry_utils import RetryConfig, SimpleRateLimiter, retry_with_backoff
+from app.core.retry_utils import RetryConfig, retry_with_backoff
 from app.models.gene import Gene
 from app.pipeline.sources.annotations.base import BaseAnnotationSource
 
@@ -72,8 +74,10 @@ class UniProtAnnotationSource(BaseAnnotationSource):
         # Apply UniProt-specific configuration
         self.batch_size = config.get("batch_size", 100)
 
-        # Initialize rate limiter (5 req/s for UniProt)
-        self.rate_limiter = SimpleRateLimiter(requests_per_second=self.requests_per_second)
+        # Shared adaptive per-domain limiter, starting at the configured rate
+        self.rate_limiter = get_domain_rate_limiter_registry().get_for_url(
+            self.base_url, max_rate=self.requests_per_second
+        )
 
         # Update source configuration
         if self.source_record:
@@ -399,7 +403,9 @@ class UniProtAnnotationSource(BaseAnnotationSource):
         """
         symbols = [g.approved_symbol for g in genes]
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(60.0), follow_redirects=True) as client:
+        async with create_async_client(
+            timeout=httpx.Timeout(60.0), follow_redirects=True
+        ) as client:
             # Step 1: Submit ID mapping job
             submit_response = await client.post(
                 f"{self.base_url}/idmapping/run",
@@ -183,9 +183,9 @@ class UnifiedDataSource(DataSourceClient, ABC):
         Fetch multiple items with intelligent caching.
 
         This method:
-        1. Checks cache for each item
+        1. Checks cache for all items with one batched lookup
         2. Fetches missing items in batch
-        3. Caches individual results
+        3. Caches individual results with one batched write per batch
 
         Args:
             items: List of items to fetch
@@ -200,19 +200,22 @@ class UnifiedDataSource(DataSourceClient, ABC):
         results = {}
         missing_items = []
 
-        # Check cache for each item
+        # Check cache for all items in one round trip
+        cached: dict[str, Any] = {}
+        if not self.force_refresh and self.cache_service and items:
+            try:
+                cached = await self.cache_service.get_many(
+                    [f"{self.namespace}:{cache_key_func(item)}" for item in items]
+                )
+            except Exception as e:
+                logger.sync_warning("Cache check failed", count=len(items), error=e)
+
         for item in items:
             cache_key = f"{self.namespace}:{cache_key_func(item)}"
-
-            if not self.force_refresh and self.cache_service:
-                try:
-                    cached = await self.cache_service.get(cache_key)
-                    if cached is not None:
-                        results[item] = cached
-                        self.stats["cache_hits"] += 1
-                        continue
-                except Exception as e:
-                    logger.sync_warning("Cache check failed", cache_key=cache_key, error=e)
+            if cached.get(cache_key) is not None:
+                results[item] = cached[cache_key]
+                self.stats["cache_hits"] += 1
+                continue
 
             missing_items.append(item)
             self.stats["cache_misses"] += 1
@@ -228,22 +231,23 @@ class UnifiedDataSource(DataSourceClient, ABC):
                         lambda b=batch: fetch_func(b)
                     )
 
-                    # Cache individual results
+                    # Cache individual results with one batched write
+                    to_cache = {}
                     for item in batch:
                         if item in batch_data:
                             data = batch_data[item]
                             results[item] = data
-
-                            if self.cache_service:
-                                cache_key = f"{self.namespace}:{cache_key_func(item)}"
-                                try:
-                                    await self.cache_service.set(
-                                        cache_key, data, namespace="default", ttl=effective_ttl
-                                    )
-                                except Exception as e:
-                                    logger.sync_warning(
-                                        "Failed to cache item", cache_key=cache_key, error=e
-                                    )
+                            to_cache[f"{self.namespace}:{cache_key_func(item)}"] = data
+
+                    if self.cache_service and to_cache:
+                        try:
+                            await self.cache_service.set_many(
+                                to_cache, namespace="default", ttl=effective_ttl
+                            )
+                        except Exception as e:
+                            logger.sync_warning(
+                                "Failed to cache items", count=len(to_cache), error=e
+                            )
 
                 except Exception as e:
                     self.stats["errors"] += 1
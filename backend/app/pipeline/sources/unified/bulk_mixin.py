@@ -3,7 +3,10 @@ Mixin for annotation sources that support bulk file downloads.
 
 Provides download, caching, decompression, parsing, and gene lookup
 for sources that distribute data as downloadable flat files (TSV, CSV,
-etc.) rather than per-gene API calls.
+etc.) rather than per-gene API calls.  Parsed results are stored as
+memory-mapped gene indexes next to the raw files: an unchanged file is
+parsed once, and every process on the host looks genes up in the same
+index pages instead of holding its own copy of the data.
 
 Usage::
 
@@ -19,14 +22,24 @@ import asyncio
 import gzip
 import hashlib
 import json
+import os
 import shutil
 import time
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from app.core.cache_codecs import CodecError
+from app.core.http_pool import create_async_client
 from app.core.logging import get_logger
+from app.pipeline.sources.unified.gene_index import GeneIndex
+from app.pipeline.sources.unified.ranged_download import (
+    DownloadIntegrityError,
+    download_resumable,
+    parse_md5_checksum,
+)
 
 logger = get_logger(__name__)
 
@@ -40,6 +53,8 @@ class BulkDataSourceMixin:
         bulk_cache_dir: Local directory for cached downloads.
         bulk_cache_ttl_hours: Hours before a cached file is stale.
         bulk_file_format: File extension used for the cached file.
+        bulk_parser_version: Version of the parsed output format; part of
+            the key of the parsed artifact stored next to the raw file.
     """
 
     bulk_file_url: str = ""
@@ -48,7 +63,15 @@ class BulkDataSourceMixin:
     bulk_file_format: str = "tsv"
     bulk_file_min_size_bytes: int = 0  # 0 = no minimum size check
 
-    _bulk_data: dict[str, dict[str, Any]] | None = None
+    # Bump when parse_bulk_file output changes, so stored artifacts are re-created
+    bulk_parser_version: str = "1"
+    # Store parsed results next to the raw file and reuse them for unchanged content
+    bulk_artifacts_enabled: bool = True
+
+    # Parsed data: a memory-mapped GeneIndex when an artifact exists, else a dict
+    _bulk_data: Mapping[str, dict[str, Any]] | None = None
+    # Content hash of each cache file as of its last parse, per instance
+    _bulk_parsed_hashes: dict[str, str | None] | None = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -59,7 +82,9 @@ class BulkDataSourceMixin:
 
         Uses a SHA-256 hash of the URL as part of the cache filename so
         different URLs never collide.  Re-downloads only when the local
-        copy is stale or *force* is ``True``.
+        copy is stale or *force* is ``True``, and then conditionally: if
+        the server answers ``304 Not Modified`` to the stored ETag /
+        Last-Modified, only the metadata is refreshed.
 
         Args:
             force: Re-download even if the cache is fresh.
@@ -84,8 +109,13 @@ class BulkDataSourceMixin:
             dest=str(cache_path),
         )
 
-        async with httpx.AsyncClient(timeout=120.0, follow_redirects=True) as client:
-            response = await client.get(self.bulk_file_url)
+        async with create_async_client(timeout=120.0, follow_redirects=True) as client:
+            response = await client.get(
+                self.bulk_file_url, headers=self._bulk_conditional_headers(cache_path)
+            )
+            if response.status_code == 304:
+                self._touch_bulk_cache(cache_path)
+                return cache_path
             response.raise_for_status()
             cache_path.write_bytes(response.content)
 
@@ -94,11 +124,17 @@ class BulkDataSourceMixin:
             url=self.bulk_file_url,
             size_bytes=cache_path.stat().st_size,
         )
-        self._write_bulk_meta(cache_path)
+        self._write_bulk_meta(
+            cache_path, response.headers, hashlib.sha256(response.content).hexdigest()
+        )
         return cache_path
 
     # Maximum retries for streaming downloads
     bulk_download_max_retries: int = 3
+    # Parallel Range segments for streaming downloads (1 = single resumable stream)
+    bulk_download_segments: int = 1
+    # Optional URL of an ``.md5`` checksum file published next to the bulk file
+    bulk_file_md5_url: str = ""
 
     async def download_bulk_file_streaming(self, force: bool = False) -> Path:
         """Download a large bulk file using streaming to avoid loading it into memory.
@@ -107,8 +143,14 @@ class BulkDataSourceMixin:
         chunks to disk instead of buffering the full response.  Suitable for
         files >100 MB (e.g. ClinVar variant_summary.txt.gz at ~414 MB).
 
-        Includes retry logic and partial-file cleanup for robustness on
-        unreliable connections.
+        Includes retry logic for robustness on unreliable connections.  When
+        the server supports range requests, the file is fetched in
+        ``bulk_download_segments`` parallel segments and an interrupted
+        download resumes from the partial ``.tmp`` data instead of starting
+        over; the result is verified against its size and, if
+        ``bulk_file_md5_url`` is set, the published MD5.  Like
+        :meth:`download_bulk_file`, stale files are re-fetched with a
+        conditional request.
 
         Args:
             force: Re-download even if the cache is fresh.
@@ -130,6 +172,8 @@ class BulkDataSourceMixin:
         # Use generous timeouts: short connect, long read for large files
         timeout = httpx.Timeout(connect=30.0, read=900.0, write=30.0, pool=30.0)
         tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        conditional_headers = self._bulk_conditional_headers(cache_path)
+        expected_md5 = await self._fetch_bulk_md5()
         last_error: Exception | None = None
 
         for attempt in range(1, self.bulk_download_max_retries + 1):
@@ -138,24 +182,21 @@ class BulkDataSourceMixin:
                 url=self.bulk_file_url,
                 dest=str(cache_path),
                 attempt=attempt,
+                segments=self.bulk_download_segments,
             )
             try:
-                bytes_written = 0
-                async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                    async with client.stream("GET", self.bulk_file_url) as response:
-                        response.raise_for_status()
-                        expected_size = response.headers.get("content-length")
-                        with open(tmp_path, "wb") as fh:
-                            async for chunk in response.aiter_bytes(chunk_size=65536):
-                                fh.write(chunk)
-                                bytes_written += len(chunk)
-
-                # Validate completeness when Content-Length was provided
-                if expected_size is not None:
-                    expected = int(expected_size)
-                    if bytes_written < expected:
-                        msg = f"Incomplete download: got {bytes_written} bytes, expected {expected}"
-                        raise httpx.TransportError(msg)
+                async with create_async_client(timeout=timeout, follow_redirects=True) as client:
+                    result = await download_resumable(
+                        client,
+                        self.bulk_file_url,
+                        tmp_path,
+                        segments=self.bulk_download_segments,
+                        headers=conditional_headers,
+                        expected_md5=expected_md5,
+                    )
+                if result.not_modified:
+                    self._touch_bulk_cache(cache_path)
+                    return cache_path
 
                 # Atomic rename: only replace cache once download is fully complete
                 tmp_path.replace(cache_path)
@@ -164,14 +205,17 @@ class BulkDataSourceMixin:
                     url=self.bulk_file_url,
                     size_bytes=cache_path.stat().st_size,
                 )
-                self._write_bulk_meta(cache_path)
+                self._write_bulk_meta(cache_path, result.headers, result.sha256)
                 return cache_path
 
-            except (httpx.TransportError, httpx.HTTPStatusError, OSError) as exc:
+            except (
+                httpx.TransportError,
+                httpx.HTTPStatusError,
+                OSError,
+                DownloadIntegrityError,
+            ) as exc:
+                # Partial data stays on disk and is resumed by the next attempt
                 last_error = exc
-                # Clean up partial file
-                if tmp_path.exists():
-                    tmp_path.unlink()
                 if attempt < self.bulk_download_max_retries:
                     wait = 2**attempt  # 2, 4 seconds
                     logger.sync_warning(
@@ -218,34 +262,36 @@ class BulkDataSourceMixin:
         parsed gene dict and :meth:`lookup_gene` is ready to use.
 
         Args:
-            force: Force re-download and re-parse.
+            force: Force re-download and re-parse.  The file is not
+                re-parsed if its content is unchanged.
         """
         if self._bulk_data is not None and not force:
             return
 
         raw_path = await self.download_bulk_file(force=force)
+        if self._bulk_data is not None and self._is_bulk_content_parsed(raw_path):
+            logger.sync_info("Bulk file unchanged, keeping parsed data", path=str(raw_path))
+            return
 
-        # Decompress .gz files to a sibling path
-        parse_path = raw_path
-        if raw_path.suffix == ".gz":
-            decompressed = raw_path.with_suffix("")
-            logger.sync_info(
-                "Decompressing bulk file",
-                src=str(raw_path),
-                dest=str(decompressed),
-            )
-            with gzip.open(raw_path, "rb") as f_in:
-                with open(decompressed, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
-            parse_path = decompressed
-
-        self._bulk_data = self.parse_bulk_file(parse_path)
+        self._bulk_data = self._load_or_parse_bulk(
+            raw_path, lambda: self.parse_bulk_file(self._decompress_bulk_file(raw_path))
+        )
+        self._mark_bulk_content_parsed(raw_path)
         logger.sync_info(
             "Bulk data loaded",
             gene_count=len(self._bulk_data),
             source=getattr(self, "source_name", self.__class__.__name__),
         )
 
+    def bulk_artifact_params(self) -> dict[str, Any]:
+        """Inputs besides the file content that the parsed result depends on.
+
+        Subclasses whose ``parse_bulk_file`` output depends on more than the
+        file (e.g. a set of target genes) return those inputs here, so a
+        parsed artifact is only reused when they are unchanged too.
+        """
+        return {}
+
     def lookup_gene(self, gene_key: str) -> dict | None:
         """Return annotation data for *gene_key*, or ``None``.
 
@@ -281,12 +327,19 @@ class BulkDataSourceMixin:
         if not cache_path.exists():
             return False
 
-        file_size = cache_path.stat().st_size
         age_hours = (time.time() - cache_path.stat().st_mtime) / 3600.0
-
         if age_hours >= self.bulk_cache_ttl_hours:
             return False
 
+        return self._is_bulk_cache_complete(cache_path)
+
+    def _is_bulk_cache_complete(self, cache_path: Path) -> bool:
+        """Check the size guards of an existing cached file, regardless of its age."""
+        if not cache_path.exists():
+            return False
+
+        file_size = cache_path.stat().st_size
+
         # Check minimum size guard
         if self.bulk_file_min_size_bytes > 0 and file_size < self.bulk_file_min_size_bytes:
             logger.sync_warning(
@@ -316,20 +369,210 @@ class BulkDataSourceMixin:
 
         return True
 
-    def _write_bulk_meta(self, cache_path: Path) -> None:
-        """Write a sidecar metadata file recording the size of a successful download."""
+    def _write_bulk_meta(
+        self,
+        cache_path: Path,
+        headers: httpx.Headers | None = None,
+        sha256: str | None = None,
+    ) -> None:
+        """Write a sidecar metadata file for a successful download.
+
+        Records the file size (integrity check), the validators needed for
+        conditional re-downloads, and the content hash.
+        """
+        meta: dict[str, Any] = {"size_bytes": cache_path.stat().st_size, "ts": time.time()}
+        if headers is not None:
+            meta["etag"] = headers.get("etag")
+            meta["last_modified"] = headers.get("last-modified")
+        if sha256 is not None:
+            if self._read_bulk_meta(cache_path).get("sha256") == sha256:
+                logger.sync_info("Downloaded bulk file is unchanged", path=str(cache_path))
+            elif cache_path.suffix == ".gz":
+                # A decompressed copy of the previous content must not be reused
+                cache_path.with_suffix("").unlink(missing_ok=True)
+            meta["sha256"] = sha256
+        self._save_bulk_meta(cache_path, meta)
+
+    def _read_bulk_meta(self, cache_path: Path) -> dict[str, Any]:
+        """Read the sidecar metadata of *cache_path* (empty if missing or corrupt)."""
         meta_path = self._bulk_meta_path(cache_path)
         try:
-            meta_path.write_text(
-                json.dumps({"size_bytes": cache_path.stat().st_size, "ts": time.time()})
-            )
+            meta = json.loads(meta_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return {}
+        return meta if isinstance(meta, dict) else {}
+
+    def _save_bulk_meta(self, cache_path: Path, meta: dict[str, Any]) -> None:
+        try:
+            self._bulk_meta_path(cache_path).write_text(json.dumps(meta))
         except OSError as exc:
             logger.sync_warning("Could not write bulk meta file", error=str(exc))
 
+    def _bulk_conditional_headers(self, cache_path: Path) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for re-validating a complete cached file."""
+        if not self._is_bulk_cache_complete(cache_path):
+            return {}
+        meta = self._read_bulk_meta(cache_path)
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _touch_bulk_cache(self, cache_path: Path) -> None:
+        """Handle 304 Not Modified: restart the TTL of the cached file and its metadata."""
+        os.utime(cache_path)
+        meta = self._read_bulk_meta(cache_path)
+        meta["ts"] = time.time()
+        self._save_bulk_meta(cache_path, meta)
+        logger.sync_info(
+            "Bulk file not modified, cache revalidated",
+            url=self.bulk_file_url,
+            path=str(cache_path),
+        )
+
+    def _is_bulk_content_parsed(self, cache_path: Path) -> bool:
+        """Whether the content of *cache_path* is what this instance last parsed."""
+        content_hash = self._read_bulk_meta(cache_path).get("sha256")
+        parsed = self._bulk_parsed_hashes or {}
+        return content_hash is not None and parsed.get(str(cache_path)) == content_hash
+
+    def _mark_bulk_content_parsed(self, cache_path: Path) -> None:
+        """Record the content hash of *cache_path* as parsed by this instance."""
+        if self._bulk_parsed_hashes is None:
+            self._bulk_parsed_hashes = {}
+        self._bulk_parsed_hashes[str(cache_path)] = self._read_bulk_meta(cache_path).get("sha256")
+
+    def _decompress_bulk_file(self, raw_path: Path) -> Path:
+        """Decompress a ``.gz`` file to a sibling path; return the path to parse."""
+        if raw_path.suffix != ".gz":
+            return raw_path
+        decompressed = raw_path.with_suffix("")
+        logger.sync_info(
+            "Decompressing bulk file",
+            src=str(raw_path),
+            dest=str(decompressed),
+        )
+        with gzip.open(raw_path, "rb") as f_in:
+            with open(decompressed, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        return decompressed
+
+    def _load_or_parse_bulk(
+        self,
+        raw_path: Path,
+        parse: Callable[[], dict[str, Any]],
+        shared: bool = True,
+    ) -> Mapping[str, Any]:
+        """Load the parsed result of *raw_path* from its artifact, or parse and store it.
+
+        The artifact is a memory-mapped :class:`GeneIndex` next to the raw
+        file, reused only if the file content hash, ``bulk_parser_version``
+        and :meth:`bulk_artifact_params` all match.  With *shared*, the
+        index itself is returned, so all processes on the host share its
+        pages; otherwise a dict copy is returned (for callers that modify
+        the parsed data).
+        """
+        key = self._bulk_artifact_key(raw_path) if self.bulk_artifacts_enabled else None
+        if key is None:
+            return parse()
+
+        index = self._open_bulk_artifact(raw_path, key)
+        if index is None:
+            data = parse()
+            if not self._write_bulk_artifact(raw_path, key, data):
+                return data
+            if not shared:
+                return data
+            index = self._open_bulk_artifact(raw_path, key)
+            if index is None:
+                return data
+        else:
+            logger.sync_info(
+                "Loaded parsed bulk data from artifact",
+                path=str(index.path),
+                gene_count=len(index),
+            )
+
+        if shared:
+            return index
+        try:
+            return dict(index.items())
+        finally:
+            index.close()
+
+    def _bulk_artifact_key(self, raw_path: Path) -> str | None:
+        content_hash = self._read_bulk_meta(raw_path).get("sha256")
+        if content_hash is None:
+            return None
+        key_parts = {
+            "source": self.__class__.__name__,
+            "parser_version": self.bulk_parser_version,
+            "content_sha256": content_hash,
+            "params": self.bulk_artifact_params(),
+        }
+        encoded = json.dumps(key_parts, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _open_bulk_artifact(self, raw_path: Path, key: str) -> GeneIndex | None:
+        artifact_path = self._bulk_artifact_path(raw_path)
+        try:
+            index = GeneIndex.open(artifact_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as exc:
+            # A broken or outdated artifact is simply re-created
+            logger.sync_warning(
+                "Ignoring unreadable parsed bulk artifact", path=str(artifact_path), error=str(exc)
+            )
+            return None
+        if index.header.get("key") != key:
+            index.close()
+            return None
+        return index
+
+    def _write_bulk_artifact(self, raw_path: Path, key: str, data: Mapping[str, Any]) -> bool:
+        artifact_path = self._bulk_artifact_path(raw_path)
+        try:
+            GeneIndex.write(artifact_path, data, key=key)
+        except (OSError, CodecError) as exc:
+            logger.sync_warning(
+                "Could not write parsed bulk artifact", path=str(artifact_path), error=str(exc)
+            )
+            return False
+        logger.sync_info(
+            "Stored parsed bulk artifact",
+            path=str(artifact_path),
+            size_bytes=artifact_path.stat().st_size,
+        )
+        return True
+
+    async def _fetch_bulk_md5(self) -> str | None:
+        """Fetch the published MD5 of the bulk file, if ``bulk_file_md5_url`` is set."""
+        if not self.bulk_file_md5_url:
+            return None
+        try:
+            async with create_async_client(timeout=30.0, follow_redirects=True) as client:
+                response = await client.get(self.bulk_file_md5_url)
+                response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.sync_warning(
+                "Could not fetch bulk file checksum, skipping verification",
+                url=self.bulk_file_md5_url,
+                error=str(exc),
+            )
+            return None
+        return parse_md5_checksum(response.text)
+
     @staticmethod
     def _bulk_meta_path(cache_path: Path) -> Path:
         return cache_path.with_suffix(cache_path.suffix + ".meta")
 
+    @staticmethod
+    def _bulk_artifact_path(cache_path: Path) -> Path:
+        return cache_path.with_suffix(cache_path.suffix + ".parsed")
+
     def _bulk_cache_path(self) -> Path:
         """Derive the local cache file path from *bulk_file_url*.
 
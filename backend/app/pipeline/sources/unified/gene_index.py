@@ -0,0 +1,170 @@
+"""
+Read-only, memory-mapped gene lookup index for parsed bulk data.
+
+A parsed bulk file (``{gene: annotation}``) is written once as a file with a
+sorted key index and offsets into a blob of msgpack-encoded values.  Every
+process opens it with ``mmap``, so the pages are shared through the OS page
+cache instead of each process holding its own dict of dicts.  A lookup is a
+binary search over the keys and decodes only the requested value.
+
+File layout (integers are little-endian uint64)::
+
+    header line    JSON object ending in "\\n" (``magic``, ``count``,
+                   ``value_format`` plus caller fields)
+    key offsets    count + 1 offsets into the key blob
+    value offsets  count + 1 offsets into the value blob
+    key blob       UTF-8 keys, sorted by their encoded bytes
+    value blob     msgpack-encoded values, in key order
+
+Usage::
+
+    GeneIndex.write(path, {"PKD1": {...}}, key="...")
+    index = GeneIndex.open(path)
+    index.get("PKD1")
+"""
+
+import json
+import mmap
+import os
+import struct
+import uuid
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from app.core.cache_codecs import CacheCodec
+
+INDEX_MAGIC = "kgdb-gene-index-v1"
+
+_OFFSET = struct.Struct("<Q")
+# msgpack, or the codec's fallback when it is not installed; recorded in the header
+_CODEC = CacheCodec(serializer="msgpack", compression="none")
+
+
+class GeneIndex(Mapping[str, Any]):
+    """Read-only mapping backed by a memory-mapped index file.
+
+    Values are decoded on every access, so callers get fresh objects and
+    changes to them are not stored.
+    """
+
+    def __init__(self, path: Path, fh: Any, buffer: mmap.mmap, header: dict[str, Any]):
+        self.path = path
+        self.header = header
+        self._fh = fh
+        self._buffer = buffer
+        self._count: int = header["count"]
+        self._value_format: str = header["value_format"]
+        self._key_offsets = header["header_size"]
+        self._value_offsets = self._key_offsets + (self._count + 1) * _OFFSET.size
+        self._keys_start = self._value_offsets + (self._count + 1) * _OFFSET.size
+        self._values_start = self._keys_start + self._offset(self._key_offsets, self._count)
+
+    @classmethod
+    def write(cls, path: Path, data: Mapping[str, Any], **header_fields: Any) -> None:
+        """Write *data* as an index file at *path* (atomically, via a temporary file).
+
+        Processes that still map a previous version keep reading it safely.
+        """
+        items = sorted((key.encode("utf-8"), value) for key, value in data.items())
+        key_offsets, value_offsets = [0], [0]
+        values = []
+        for key, value in items:
+            _, payload = _CODEC.encode(value)
+            values.append(payload)
+            key_offsets.append(key_offsets[-1] + len(key))
+            value_offsets.append(value_offsets[-1] + len(payload))
+
+        header = {
+            **header_fields,
+            "magic": INDEX_MAGIC,
+            "count": len(items),
+            "value_format": _CODEC.serializer,
+        }
+        # Unique per writer: other processes may be storing the same artifact
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as fh:
+                fh.write(json.dumps(header).encode() + b"\n")
+                for offsets in (key_offsets, value_offsets):
+                    fh.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+                fh.writelines(key for key, _ in items)
+                fh.writelines(values)
+                fh.flush()
+                os.fsync(fh.fileno())
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def open(cls, path: Path) -> "GeneIndex":
+        """Map an index file read-only.
+
+        Raises:
+            FileNotFoundError: If *path* does not exist.
+            ValueError: If *path* is not a gene index file.
+        """
+        fh = open(path, "rb")
+        try:
+            header_line = fh.readline()
+            header = json.loads(header_line)
+            if not isinstance(header, dict) or header.get("magic") != INDEX_MAGIC:
+                raise ValueError(f"{path} is not a gene index file")
+            header["header_size"] = len(header_line)
+            size = os.fstat(fh.fileno()).st_size
+            # An empty index still has its two offset arrays
+            if size <= len(header_line):
+                raise ValueError(f"{path} is truncated")
+            buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            fh.close()
+            raise
+        index = cls(path, fh, buffer, header)
+        if index._values_start + index._offset(index._value_offsets, index._count) != size:
+            index.close()
+            raise ValueError(f"{path} is truncated")
+        return index
+
+    def close(self) -> None:
+        self._buffer.close()
+        self._fh.close()
+
+    def __getitem__(self, key: str) -> Any:
+        position = self._find(key)
+        if position is None:
+            raise KeyError(key)
+        start = self._values_start + self._offset(self._value_offsets, position)
+        end = self._values_start + self._offset(self._value_offsets, position + 1)
+        return CacheCodec.decode(self._value_format, self._buffer[start:end])
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._key(position).decode("utf-8")
+
+    def _offset(self, table: int, position: int) -> int:
+        return int(_OFFSET.unpack_from(self._buffer, table + position * _OFFSET.size)[0])
+
+    def _key(self, position: int) -> bytes:
+        start = self._keys_start + self._offset(self._key_offsets, position)
+        end = self._keys_start + self._offset(self._key_offsets, position + 1)
+        return self._buffer[start:end]
+
+    def _find(self, key: str) -> int | None:
+        target = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key(low) == target:
+            return low
+        return None
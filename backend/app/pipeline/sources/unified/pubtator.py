@@ -17,8 +17,9 @@ from sqlalchemy.orm import Session
 from app.core.cache_service import CacheService
 from app.core.cached_http_client import CachedHttpClient
 from app.core.datasource_config import get_source_parameter
+from app.core.domain_rate_limiter import get_domain_rate_limiter_registry
 from app.core.logging import get_logger
-from app.core.retry_utils import RetryConfig, SimpleRateLimiter, retry_with_backoff
+from app.core.retry_utils import RetryConfig, handle_rate_limit_response, retry_with_backoff
 from app.models.gene import Gene, GeneEvidence
 from app.models.progress import DataSourceProgress
 from app.pipeline.sources.unified.base import UnifiedDataSource
@@ -87,9 +88,11 @@ class PubTatorUnifiedSource(UnifiedDataSource):
         self.filtering_enabled = get_source_parameter("PubTator", "min_publications_enabled", True)
         self.filter_after_complete = get_source_parameter("PubTator", "filter_after_complete", True)
 
-        # Rate limiting - CRITICAL for API compliance
-        self.rate_limiter = SimpleRateLimiter(
-            requests_per_second=get_source_parameter("PubTator", "requests_per_second", 3.0)
+        # Rate limiting - CRITICAL for API compliance.  The shared per-domain limiter
+        # starts at the configured rate and adapts to 429/503 responses.
+        self.rate_limiter = get_domain_rate_limiter_registry().get_for_url(
+            self.base_url,
+            max_rate=get_source_parameter("PubTator", "requests_per_second", 3.0),
         )
 
         self.sort_order = "score desc"
@@ -265,7 +268,8 @@ class PubTatorUnifiedSource(UnifiedDataSource):
         - Circuit breakers
         - Timeout handling
 
-        Rate limiting ensures compliance with PubTator3 API limits (3 req/s).
+        Rate limiting ensures compliance with PubTator3 API limits; the rate
+        adapts to throttling responses.
         """
         # Rate limit BEFORE making request - CRITICAL for API compliance
         await self.rate_limiter.wait()
@@ -282,6 +286,7 @@ class PubTatorUnifiedSource(UnifiedDataSource):
             params=params,
             timeout=30,  # CachedHttpClient respects this
         )
+        await handle_rate_limit_response(response)
 
         if response.status_code != 200:
             logger.sync_error(f"Bad status on page {page}: {response.status_code}")
@@ -0,0 +1,296 @@
+"""
+Resumable, optionally parallel HTTP downloads using Range requests.
+
+A download is written to a ``.tmp`` path.  When the server advertises
+``Accept-Ranges: bytes`` and a Content-Length, the file is split into
+segments that are fetched concurrently, each into its own part file.  An
+interrupted download resumes every part from its current size on the next
+attempt; ``If-Range`` guarantees that bytes of a changed remote file are
+never stitched onto stale ones.  The assembled file is checked against the
+expected size and, when one is known, an MD5 checksum.
+
+Usage::
+
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        result = await download_resumable(client, url, tmp_path, segments=4)
+    tmp_path.replace(cache_path)
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 65536
+# Files smaller than one segment are not split
+MIN_SEGMENT_BYTES = 8 * 1024 * 1024
+
+_MD5_PATTERN = re.compile(r"\b[0-9a-fA-F]{32}\b")
+
+
+class DownloadIntegrityError(Exception):
+    """The download does not match the remote file's size, checksum or validator."""
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of :func:`download_resumable`."""
+
+    headers: httpx.Headers
+    sha256: str | None = None
+    not_modified: bool = False
+
+
+async def download_resumable(
+    client: httpx.AsyncClient,
+    url: str,
+    dest: Path,
+    *,
+    segments: int = 1,
+    headers: dict[str, str] | None = None,
+    expected_md5: str | None = None,
+) -> DownloadResult:
+    """Download *url* to *dest*, resuming partial data left by an earlier attempt.
+
+    Args:
+        client: HTTP client used for all requests.
+        url: Remote file URL.
+        dest: Target path (normally a ``.tmp`` file renamed by the caller).
+        segments: Number of byte ranges fetched in parallel when the server
+            supports range requests.
+        headers: Conditional headers (If-None-Match / If-Modified-Since);
+            a ``304`` answer is returned as ``not_modified``.
+        expected_md5: Hex MD5 the assembled file must match.
+
+    Returns:
+        Response headers of the remote file and the SHA-256 of the download.
+
+    Raises:
+        DownloadIntegrityError: Size or checksum mismatch, or the remote file
+            changed mid-download.  Partial data is discarded in that case.
+        httpx.HTTPError: Network or HTTP errors.  Partial data is kept so the
+            next call resumes it.
+    """
+    try:
+        probe = await client.head(url, headers=headers)
+    except httpx.HTTPError as exc:
+        logger.sync_debug("HEAD request failed, not using ranges", url=url, error=str(exc))
+        probe = None
+
+    if probe is not None and probe.status_code == 304:
+        return DownloadResult(probe.headers, not_modified=True)
+
+    try:
+        if probe is None or not _supports_ranges(probe):
+            return await _download_whole(client, url, dest, headers, expected_md5)
+        return await _download_ranged(client, url, dest, probe.headers, segments, expected_md5)
+    except DownloadIntegrityError:
+        _discard_partial(dest)
+        raise
+
+
+def parse_md5_checksum(text: str) -> str | None:
+    """Extract the hex digest from an ``.md5`` file (``md5sum`` or BSD format)."""
+    match = _MD5_PATTERN.search(text)
+    return match.group(0).lower() if match else None
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+
+
+def _supports_ranges(probe: httpx.Response) -> bool:
+    return (
+        probe.is_success
+        and probe.headers.get("accept-ranges", "").lower() == "bytes"
+        and probe.headers.get("content-length", "").isdigit()
+        # Ranges address the encoded body, which httpx transparently decodes
+        and "content-encoding" not in probe.headers
+    )
+
+
+def _validator(headers: httpx.Headers) -> str | None:
+    """Validator usable in If-Range (weak ETags are not allowed there)."""
+    etag: str | None = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    last_modified: str | None = headers.get("last-modified")
+    return last_modified
+
+
+async def _download_whole(
+    client: httpx.AsyncClient,
+    url: str,
+    dest: Path,
+    headers: dict[str, str] | None,
+    expected_md5: str | None,
+) -> DownloadResult:
+    """Single streamed GET without resume, for servers that do not support ranges."""
+    _discard_partial(dest)
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return DownloadResult(response.headers, not_modified=True)
+        response.raise_for_status()
+        with open(dest, "wb") as fh:
+            async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                fh.write(chunk)
+
+    content_length = response.headers.get("content-length")
+    if content_length is not None and dest.stat().st_size < int(content_length):
+        # Incomplete transfer, not a corrupt file: retryable like any network error
+        msg = f"Incomplete download: got {dest.stat().st_size} bytes, expected {content_length}"
+        raise httpx.TransportError(msg)
+
+    sha256 = await asyncio.to_thread(_assemble, dest, [dest], None, expected_md5)
+    return DownloadResult(response.headers, sha256)
+
+
+async def _download_ranged(
+    client: httpx.AsyncClient,
+    url: str,
+    dest: Path,
+    headers: httpx.Headers,
+    segments: int,
+    expected_md5: str | None,
+) -> DownloadResult:
+    size = int(headers["content-length"])
+    segment_count = max(1, min(segments, size // MIN_SEGMENT_BYTES))
+    validator = _validator(headers)
+
+    # Part files are only resumed for the same remote file and the same split
+    state = {"url": url, "validator": validator, "size": size, "segments": segment_count}
+    if validator is None or _read_state(dest) != state:
+        _discard_partial(dest)
+    _state_path(dest).write_text(json.dumps(state))
+
+    bounds = _segment_bounds(size, segment_count)
+    parts = _part_paths(dest, segment_count)
+    resumed = sum(part.stat().st_size for part in parts if part.exists())
+    logger.sync_info(
+        "Ranged download",
+        url=url,
+        size_bytes=size,
+        segments=segment_count,
+        resumed_bytes=resumed,
+    )
+
+    results = await asyncio.gather(
+        *(
+            _fetch_segment(client, url, part, start, end, validator)
+            for part, (start, end) in zip(parts, bounds, strict=True)
+        ),
+        return_exceptions=True,
+    )
+    # Let every segment finish or fail first so its progress is on disk for the resume
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    sha256 = await asyncio.to_thread(_assemble, dest, parts, size, expected_md5)
+    _state_path(dest).unlink(missing_ok=True)
+    return DownloadResult(headers, sha256)
+
+
+async def _fetch_segment(
+    client: httpx.AsyncClient,
+    url: str,
+    part: Path,
+    start: int,
+    end: int,
+    validator: str | None,
+) -> None:
+    """Append bytes ``start..end`` (inclusive) of *url* to *part*, after what it holds."""
+    have = part.stat().st_size if part.exists() else 0
+    if have > end - start + 1:
+        part.unlink()
+        have = 0
+    if have == end - start + 1:
+        return
+
+    request_headers = {"Range": f"bytes={start + have}-{end}"}
+    if validator is not None:
+        request_headers["If-Range"] = validator
+
+    async with client.stream("GET", url, headers=request_headers) as response:
+        if response.status_code != 206:
+            response.raise_for_status()
+            msg = f"Range request answered with HTTP {response.status_code}; remote file changed"
+            raise DownloadIntegrityError(msg)
+        with open(part, "ab") as fh:
+            async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                fh.write(chunk)
+
+
+def _assemble(dest: Path, parts: list[Path], size: int | None, expected_md5: str | None) -> str:
+    """Concatenate *parts* into *dest* and verify it; returns the SHA-256 hex digest."""
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5(usedforsecurity=False) if expected_md5 else None
+
+    def consume(fh: Any, out: Any = None) -> None:
+        while chunk := fh.read(1024 * 1024):
+            sha256.update(chunk)
+            if md5 is not None:
+                md5.update(chunk)
+            if out is not None:
+                out.write(chunk)
+
+    if parts == [dest]:
+        with open(dest, "rb") as fh:
+            consume(fh)
+    else:
+        with open(dest, "wb") as out:
+            for part in parts:
+                with open(part, "rb") as fh:
+                    consume(fh, out)
+        for part in parts:
+            part.unlink()
+
+    actual_size = dest.stat().st_size
+    if size is not None and actual_size != size:
+        raise DownloadIntegrityError(f"Size mismatch: got {actual_size} bytes, expected {size}")
+    if md5 is not None and expected_md5 is not None and md5.hexdigest() != expected_md5.lower():
+        raise DownloadIntegrityError(
+            f"MD5 mismatch: got {md5.hexdigest()}, expected {expected_md5.lower()}"
+        )
+    return sha256.hexdigest()
+
+
+def _segment_bounds(size: int, count: int) -> list[tuple[int, int]]:
+    return [(size * i // count, size * (i + 1) // count - 1) for i in range(count)]
+
+
+def _part_paths(dest: Path, count: int) -> list[Path]:
+    # A single segment is downloaded straight into dest
+    if count == 1:
+        return [dest]
+    return [dest.with_name(f"{dest.name}.part{i}") for i in range(count)]
+
+
+def _state_path(dest: Path) -> Path:
+    return dest.with_name(dest.name + ".ranges")
+
+
+def _read_state(dest: Path) -> dict[str, Any] | None:
+    try:
+        state = json.loads(_state_path(dest).read_text())
+    except (json.JSONDecodeError, OSError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _discard_partial(dest: Path) -> None:
+    """Remove *dest*, its part files and resume state."""
+    dest.unlink(missing_ok=True)
+    _state_path(dest).unlink(missing_ok=True)
+    for part in dest.parent.glob(f"{dest.name}.part*"):
+        part.unlink(missing_ok=True)
@@ -13,7 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm.attributes import flag_modified
 
-from app.core.cache_service import get_cache_service
+from app.core.cache_service import gene_tag, get_cache_service
 from app.core.logging import get_logger
 from app.models.gene import GeneEvidence
 from app.models.static_sources import StaticSource, StaticSourceAudit
@@ -64,10 +64,7 @@ class HybridSourceManager(ABC):
     async def _invalidate_gene_caches(self, gene_ids: list[int]) -> None:
         """Invalidate caches for affected genes"""
         cache_service = get_cache_service(self.db)
-
-        for gene_id in gene_ids:
-            await cache_service.delete(f"{gene_id}:*", namespace="annotations")
-            await cache_service.delete(f"{gene_id}:*", namespace="evidence")
+        await cache_service.invalidate_tags([gene_tag(gene_id) for gene_id in gene_ids])
 
         await logger.info("Invalidated caches for affected genes", gene_count=len(gene_ids))
 
@@ -13,17 +13,23 @@ CRITICAL DESIGN PATTERNS:
 
 import asyncio
 import threading
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import igraph as ig
+import numpy as np
+import pandas as pd
 from cachetools import TTLCache  # type: ignore[import-untyped]
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db_context, get_thread_pool_executor
 from app.core.logging import get_logger
 from app.models.gene import Gene
 from app.models.gene_annotation import GeneAnnotation
 
+if TYPE_CHECKING:
+    from app.pipeline.sources.annotations.string_edges import StringEdgeStore
+
 logger = get_logger(__name__)
 
 
@@ -57,7 +63,11 @@ class NetworkAnalysisService:
         self, gene_ids: list[int], session: Session, min_string_score: int = 400
     ) -> ig.Graph:
         """
-        Construct igraph from STRING-DB annotations stored in database.
+        Construct igraph from STRING-DB physical interactions.
+
+        Edges come from the STRING edge store when it has been built by the
+        annotation pipeline, otherwise from the annotations stored in the
+        database.
 
         Args:
             gene_ids: List of gene IDs to include in network
@@ -71,8 +81,8 @@ class NetworkAnalysisService:
 
         Performance: <1s for 500 nodes, cached for 1 hour
         """
-        # Check cache first
-        cache_key = f"network:{len(gene_ids)}:{min_string_score}"
+        # Check cache first (store and annotation edges give different graphs)
+        cache_key = f"network:{len(gene_ids)}:{min_string_score}:{self.string_edge_source()}"
 
         with self._cache_lock:
             if cache_key in self._graph_cache:
@@ -100,18 +110,62 @@ class NetworkAnalysisService:
 
         return graph
 
+    @staticmethod
+    def string_edge_source() -> str:
+        """
+        Where network edges come from: ``store:<STRING version>`` or ``annotations``.
+
+        The edge store holds every physical interaction, the stored annotations
+        only each gene's top ``max_interactions_stored`` partners, so graphs
+        from the two must be cached apart.
+        """
+        from app.pipeline.sources.annotations.string_edges import get_string_edge_store
+
+        store = get_string_edge_store()
+        return f"store:{store.version}" if store is not None else "annotations"
+
     def _build_graph_sync(self, gene_ids: list[int], min_string_score: int) -> ig.Graph:
         """
         Synchronous graph construction (runs in thread pool).
 
         THREAD-SAFE: Creates fresh session using get_db_context()
         """
+        from app.pipeline.sources.annotations.string_edges import get_string_edge_store
+
+        store = get_string_edge_store()
         with get_db_context() as db:
             # Create empty igraph
             g = ig.Graph()
             g.add_vertices(len(gene_ids))
             g.vs["gene_id"] = gene_ids
 
+            if store is not None:
+                edges, string_scores = self._string_edges_from_store(
+                    db, store, gene_ids, min_string_score
+                )
+                if edges:
+                    g.add_edges(edges)
+                    g.es["weight"] = [score / 1000.0 for score in string_scores]
+                    g.es["string_score"] = string_scores
+
+                logger.sync_info(
+                    "Built network graph from STRING edge store",
+                    nodes=g.vcount(),
+                    edges=g.ecount(),
+                    components=len(g.connected_components()),
+                    min_score=min_string_score,
+                    string_version=store.version,
+                )
+                return g
+
+            # Without the store (the string_ppi source has not run on this
+            # host) edges come from the stored annotations, one query per partner
+            logger.sync_warning(
+                "STRING edge store not built, building network from stored annotations",
+                string_version=settings.STRING_VERSION,
+                string_data_dir=settings.STRING_DATA_DIR,
+            )
+
             # Query STRING annotations from JSONB (chunked to avoid memory spikes)
             NETWORK_BATCH_SIZE = 5000
             annotations = []
@@ -179,6 +233,51 @@ class NetworkAnalysisService:
 
             return g
 
+    @staticmethod
+    def _string_edges_from_store(
+        db: Session, store: "StringEdgeStore", gene_ids: list[int], min_string_score: int
+    ) -> tuple[list[tuple[int, int]], list[int]]:
+        """
+        Edges between *gene_ids* from the STRING edge store.
+
+        Isoform and reverse-direction duplicates are reduced to one edge per
+        gene pair with the highest score; self-interactions are dropped.
+
+        Returns:
+            (vertex index pairs, STRING scores)
+        """
+        NETWORK_BATCH_SIZE = 5000
+        rows: list[Any] = []
+        for i in range(0, len(gene_ids), NETWORK_BATCH_SIZE):
+            chunk = gene_ids[i : i + NETWORK_BATCH_SIZE]
+            rows.extend(db.query(Gene.id, Gene.approved_symbol).filter(Gene.id.in_(chunk)).all())
+
+        # Store node ID → vertex index (-1 for genes outside the network)
+        gene_id_to_idx = {gid: idx for idx, gid in enumerate(gene_ids)}
+        vertex = np.full(len(store.symbols), -1, dtype=np.int64)
+        for gene_id, symbol in rows:
+            code = store.symbol_codes.get(symbol)
+            if code is not None:
+                vertex[code] = gene_id_to_idx[gene_id]
+
+        gene1, gene2, scores = store.edges(min_score=min_string_score)
+        source, target = vertex[gene1], vertex[gene2]
+        keep = (source >= 0) & (target >= 0) & (source != target)
+        pairs = (
+            pd.DataFrame(
+                {
+                    "source": np.minimum(source[keep], target[keep]),
+                    "target": np.maximum(source[keep], target[keep]),
+                    "score": scores[keep].astype(np.int64),
+                }
+            )
+            .groupby(["source", "target"])["score"]
+            .max()
+            .reset_index()
+        )
+        edges = list(zip(pairs["source"].tolist(), pairs["target"].tolist(), strict=True))
+        return edges, pairs["score"].tolist()
+
     async def detect_communities(
         self, graph: ig.Graph, session: Session, algorithm: str = "leiden"
     ) -> tuple[dict[int, int], float]:
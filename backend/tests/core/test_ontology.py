@@ -0,0 +1,250 @@
+"""Tests for the local OBO ontology index and its use by the HPO client."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core import ontology as ontology_module
+from app.core.hpo.terms import HPOTerms
+from app.core.ontology import (
+    BACKEND_DIR,
+    OntologyIndex,
+    OntologyRelease,
+    get_ontology,
+    ontology_data_dir,
+    parse_obo,
+)
+
+# All (HP:0000001) > Phenotypic abnormality (HP:0000118) > genitourinary (HP:0000119)
+# and upper urinary tract (HP:0010935); Renal cyst (HP:0000107) has two parents:
+# kidney (HP:0000077, under HP:0000119) and HP:0010935.
+SAMPLE_OBO = """\
+format-version: 1.2
+ontology: hp
+
+[Term]
+id: HP:0000001
+name: All
+
+[Term]
+id: HP:0000118
+name: Phenotypic abnormality
+is_a: HP:0000001 ! All
+
+[Term]
+id: HP:0000119
+name: Abnormality of the genitourinary system
+def: "An abnormality of the \\"genitourinary\\" system." [HPO:probinson]
+synonym: "Genitourinary abnormality" EXACT []
+is_a: HP:0000118 ! Phenotypic abnormality
+
+[Term]
+id: HP:0010935
+name: Abnormality of the upper urinary tract
+is_a: HP:0000118 ! Phenotypic abnormality
+
+[Term]
+id: HP:0000077
+name: Abnormality of the kidney
+alt_id: HP:0004742
+is_a: HP:0000119 ! Abnormality of the genitourinary system
+
+[Term]
+id: HP:0000107
+name: Renal cyst
+is_a: HP:0000077 ! Abnormality of the kidney
+is_a: HP:0010935 {source="PMID:1"} ! Abnormality of the upper urinary tract
+is_a: UBERON:0002113 ! kidney
+
+[Term]
+id: HP:0000004
+name: obsolete Onset and clinical course
+is_obsolete: true
+replaced_by: HP:0000001
+
+[Typedef]
+id: part_of
+name: part of
+"""
+
+
+@pytest.fixture
+def ontology(tmp_path: Path) -> OntologyIndex:
+    path = tmp_path / "hp.obo"
+    path.write_text(SAMPLE_OBO)
+    return OntologyIndex(parse_obo(path, prefix="HP:"))
+
+
+@pytest.mark.unit
+class TestParseObo:
+    def test_terms_and_fields(self, tmp_path: Path) -> None:
+        path = tmp_path / "hp.obo"
+        path.write_text(SAMPLE_OBO)
+
+        terms = parse_obo(path, prefix="HP:")
+
+        assert len(terms) == 7
+        assert "part_of" not in terms
+        gu = terms["HP:0000119"]
+        assert gu["name"] == "Abnormality of the genitourinary system"
+        assert gu["definition"] == 'An abnormality of the "genitourinary" system.'
+        assert gu["synonyms"] == ["Genitourinary abnormality"]
+        # Cross-ontology parents are dropped
+        assert terms["HP:0000107"]["parents"] == ["HP:0000077", "HP:0010935"]
+        assert terms["HP:0000077"]["alt_ids"] == ["HP:0004742"]
+        assert terms["HP:0000004"]["is_obsolete"] is True
+        assert terms["HP:0000004"]["replaced_by"] == "HP:0000001"
+
+
+@pytest.mark.unit
+class TestOntologyIndex:
+    def test_descendant_closure(self, ontology: OntologyIndex) -> None:
+        assert ontology.descendants("HP:0000119") == {"HP:0000077", "HP:0000107"}
+        assert ontology.descendants("HP:0010935", include_self=True) == {
+            "HP:0010935",
+            "HP:0000107",
+        }
+        assert len(ontology.descendants("HP:0000001")) == 5
+        assert ontology.descendants("HP:9999999") == set()
+
+    def test_ancestor_closure_follows_all_parents(self, ontology: OntologyIndex) -> None:
+        assert ontology.ancestors("HP:0000107") == {
+            "HP:0000077",
+            "HP:0000119",
+            "HP:0010935",
+            "HP:0000118",
+            "HP:0000001",
+        }
+        assert ontology.ancestors("HP:0000001") == set()
+
+    def test_is_a(self, ontology: OntologyIndex) -> None:
+        assert ontology.is_a("HP:0000107", "HP:0000118")
+        assert ontology.is_a("HP:0000107", "HP:0000107")
+        assert not ontology.is_a("HP:0000077", "HP:0010935")
+        assert not ontology.is_a("HP:0000107", "HP:9999999")
+
+    def test_alt_ids_resolve_to_primary_term(self, ontology: OntologyIndex) -> None:
+        assert "HP:0004742" in ontology
+        assert ontology.resolve("HP:0004742") == "HP:0000077"
+        assert ontology.name("HP:0004742") == "Abnormality of the kidney"
+        assert ontology.descendants("HP:0004742", include_self=True) == {
+            "HP:0004742",
+            "HP:0000077",
+            "HP:0000107",
+        }
+
+    def test_term_lists_direct_relations(self, ontology: OntologyIndex) -> None:
+        term = ontology.term("HP:0000118")
+
+        assert term is not None
+        assert term["parents"] == ["HP:0000001"]
+        assert sorted(term["children"]) == ["HP:0000119", "HP:0010935"]
+        assert ontology.parents("HP:0000107") == ["HP:0000077", "HP:0010935"]
+
+    def test_descendants_of_any(self, ontology: OntologyIndex) -> None:
+        assert ontology.descendants_of_any(["HP:0000077", "HP:0010935"]) == {
+            "HP:0000077",
+            "HP:0010935",
+            "HP:0000107",
+        }
+
+
+@pytest.mark.unit
+class TestHPOTermsLocalOntology:
+    @pytest.mark.asyncio
+    async def test_hierarchy_is_served_locally(self, ontology: OntologyIndex) -> None:
+        terms = HPOTerms()
+        terms._get = AsyncMock(side_effect=AssertionError("no API calls expected"))
+
+        with patch("app.core.hpo.terms.get_hpo_ontology", AsyncMock(return_value=ontology)):
+            descendants = await terms.get_descendants("HP:0000119", include_self=True)
+            term = await terms.get_term("HP:0000107")
+            children = await terms.get_children("HP:0000077")
+            is_kidney = await terms.is_descendant_of("HP:0000107", "HP:0010935")
+
+        assert descendants == {"HP:0000119", "HP:0000077", "HP:0000107"}
+        assert term is not None and term.name == "Renal cyst"
+        assert term.parents == ["HP:0000077", "HP:0010935"]
+        assert children == ["HP:0000107"]
+        assert is_kidney
+
+    @pytest.mark.asyncio
+    async def test_unknown_terms_fall_back_to_api(self, ontology: OntologyIndex) -> None:
+        terms = HPOTerms()
+        terms._get = AsyncMock(return_value=[{"id": "HP:0200000"}])
+
+        with patch("app.core.hpo.terms.get_hpo_ontology", AsyncMock(return_value=ontology)):
+            descendants = await terms.get_descendants("HP:0100000")
+
+        assert descendants == {"HP:0100000", "HP:0200000"}
+        terms._get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_api_is_used_without_local_release(self) -> None:
+        terms = HPOTerms()
+        terms._get = AsyncMock(return_value=[{"id": "HP:0000107"}])
+
+        with patch("app.core.hpo.terms.get_hpo_ontology", AsyncMock(return_value=None)):
+            descendants = await terms.get_descendants("HP:0000077", include_self=False)
+
+        assert descendants == {"HP:0000107"}
+
+    @pytest.mark.asyncio
+    async def test_ancestors_agree_with_api_walk(self, ontology: OntologyIndex) -> None:
+        def parents(path: str, **kwargs: object) -> list[dict[str, str]]:
+            hpo_id = path.split("/")[2]
+            return [{"id": parent} for parent in ontology.parents(hpo_id)]
+
+        api_terms = HPOTerms()
+        api_terms._get = AsyncMock(side_effect=parents)
+        local_terms = HPOTerms()
+
+        with patch("app.core.hpo.terms.get_hpo_ontology", AsyncMock(return_value=None)):
+            from_api = await api_terms.get_ancestors("HP:0000107")
+        with patch("app.core.hpo.terms.get_hpo_ontology", AsyncMock(return_value=ontology)):
+            from_local = await local_terms.get_ancestors("HP:0000107")
+
+        assert from_api == from_local == sorted(ontology.ancestors("HP:0000107"))
+
+
+@pytest.mark.unit
+class TestGetOntology:
+    @pytest.fixture(autouse=True)
+    def _isolated_state(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setattr(ontology_module, "_indexes", {})
+        monkeypatch.setattr(ontology_module, "_load_failures", {})
+        monkeypatch.setattr(ontology_module.settings, "ONTOLOGY_DATA_DIR", str(tmp_path))
+
+    def test_relative_data_dir_is_anchored_to_backend(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(ontology_module.settings, "ONTOLOGY_DATA_DIR", "./data/ontologies")
+
+        assert ontology_data_dir() == BACKEND_DIR / "data" / "ontologies"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self, ontology: OntologyIndex) -> None:
+        async def slow_load() -> OntologyIndex:
+            await asyncio.sleep(0.01)
+            return ontology
+
+        load = AsyncMock(side_effect=slow_load)
+        with patch.object(OntologyRelease, "load", new=load):
+            results = await asyncio.gather(
+                *(get_ontology("HPO", "https://example.org/hp.obo", "HP:") for _ in range(5))
+            )
+
+        assert all(result is ontology for result in results)
+        load.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_retried_immediately(self) -> None:
+        load = AsyncMock(side_effect=OSError("unreachable"))
+        with patch.object(OntologyRelease, "load", new=load):
+            first = await get_ontology("HPO", "https://example.org/hp.obo", "HP:")
+            second = await get_ontology("HPO", "https://example.org/hp.obo", "HP:")
+
+        assert first is None and second is None
+        load.assert_called_once()
@@ -5,8 +5,13 @@ Verifies bulk file download, caching, parsing, and gene lookup
 functionality provided by the mixin.
 """
 
+import hashlib
+import os
+import time
 from pathlib import Path
+from typing import Any
 
+import httpx
 import pytest
 
 
@@ -204,3 +209,146 @@ class TestDownloadBulkFile:
         result = await source.download_bulk_file(force=False)
         assert result == cache_file
         assert cache_file.read_text() == "cached content"
+
+
+@pytest.mark.unit
+class TestConditionalDownload:
+    """Stale bulk files are re-validated with ETag / Last-Modified."""
+
+    ETAG = '"v1"'
+    LAST_MODIFIED = "Mon, 05 Oct 2026 10:00:00 GMT"
+
+    @pytest.fixture
+    def server(self, monkeypatch: pytest.MonkeyPatch) -> list[httpx.Request]:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == self.ETAG:
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content=b"gene\tscore\nPKD1\t1\n",
+                headers={"ETag": self.ETAG, "Last-Modified": self.LAST_MODIFIED},
+            )
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(**{**kwargs, "transport": httpx.MockTransport(handler)}),
+        )
+        return requests
+
+    @staticmethod
+    def make_source(tmp_path: Path) -> Any:
+        from app.pipeline.sources.unified.bulk_mixin import BulkDataSourceMixin
+
+        class CountingSource(BulkDataSourceMixin):
+            bulk_file_url = "https://example.com/data.tsv"
+            bulk_cache_dir = tmp_path
+            parses = 0
+
+            def parse_bulk_file(self, path: Path) -> dict[str, dict]:
+                self.parses += 1
+                return {"PKD1": {"score": 1}}
+
+        return CountingSource()
+
+    @staticmethod
+    def expire(path: Path) -> None:
+        old = time.time() - 8 * 24 * 3600
+        os.utime(path, (old, old))
+
+    async def test_download_records_validators_and_hash(
+        self, tmp_path: Path, server: list[httpx.Request]
+    ) -> None:
+        source = self.make_source(tmp_path)
+
+        path = await source.download_bulk_file()
+
+        meta = source._read_bulk_meta(path)
+        assert meta["etag"] == self.ETAG
+        assert meta["last_modified"] == self.LAST_MODIFIED
+        assert meta["sha256"] == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert "if-none-match" not in server[0].headers
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    async def test_not_modified_only_refreshes_metadata(
+        self, tmp_path: Path, server: list[httpx.Request], streaming: bool
+    ) -> None:
+        source = self.make_source(tmp_path)
+        download = source.download_bulk_file_streaming if streaming else source.download_bulk_file
+        path = await download()
+        content = path.read_bytes()
+        self.expire(path)
+
+        assert await download() == path
+
+        assert server[-1].headers["if-none-match"] == self.ETAG
+        assert server[-1].headers["if-modified-since"] == self.LAST_MODIFIED
+        assert path.read_bytes() == content
+        assert source._is_bulk_cache_fresh(path)
+
+    async def test_unchanged_content_is_not_reparsed(
+        self, tmp_path: Path, server: list[httpx.Request]
+    ) -> None:
+        source = self.make_source(tmp_path)
+        await source.ensure_bulk_data_loaded()
+
+        await source.ensure_bulk_data_loaded(force=True)
+
+        assert len(server) == 2
+        assert source.parses == 1
+
+    async def test_new_instance_loads_parsed_artifact(
+        self, tmp_path: Path, server: list[httpx.Request]
+    ) -> None:
+        first = self.make_source(tmp_path)
+        await first.ensure_bulk_data_loaded()
+
+        second = self.make_source(tmp_path)
+        await second.ensure_bulk_data_loaded()
+
+        assert first.parses == 1
+        assert second.parses == 0
+        assert second._bulk_data == {"PKD1": {"score": 1}}
+
+    async def test_artifact_is_keyed_by_parser_version(
+        self, tmp_path: Path, server: list[httpx.Request]
+    ) -> None:
+        await self.make_source(tmp_path).ensure_bulk_data_loaded()
+
+        source = self.make_source(tmp_path)
+        source.bulk_parser_version = "2"
+        await source.ensure_bulk_data_loaded()
+
+        assert source.parses == 1
+
+    async def test_corrupt_artifact_is_recreated(
+        self, tmp_path: Path, server: list[httpx.Request]
+    ) -> None:
+        first = self.make_source(tmp_path)
+        await first.ensure_bulk_data_loaded()
+        artifact = first._bulk_artifact_path(first._bulk_cache_path())
+        artifact.write_bytes(b"not an artifact")
+
+        second = self.make_source(tmp_path)
+        await second.ensure_bulk_data_loaded()
+        third = self.make_source(tmp_path)
+        await third.ensure_bulk_data_loaded()
+
+        assert second.parses == 1
+        assert third.parses == 0
+
+    async def test_parsed_data_is_served_from_shared_index(
+        self, tmp_path: Path, server: list[httpx.Request]
+    ) -> None:
+        from app.pipeline.sources.unified.gene_index import GeneIndex
+
+        source = self.make_source(tmp_path)
+        await source.ensure_bulk_data_loaded()
+
+        assert isinstance(source._bulk_data, GeneIndex)
+        assert source.lookup_gene("PKD1") == {"score": 1}
+        assert source.lookup_gene("NPHS1") is None
@@ -316,6 +316,105 @@ class TestClinVarBulkParsing:
         assert any("Polycystic" in t for t in trait_names)
 
 
+def _reference_parse(source: Any, path: Path, target_genes: set[str]) -> dict[str, Any]:
+    """Row-by-row two-pass parse (the original algorithm) used as an oracle."""
+    from app.pipeline.sources.annotations.clinvar import _ASSEMBLY_PRIORITY
+    from app.pipeline.sources.annotations.clinvar_utils import GeneAccumulator, parse_variant_row
+
+    confidence_levels = source._get_review_confidence_levels()
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh, delimiter="\t"))
+
+    dedup: dict[str, dict[int, int]] = {}
+    for row in rows:
+        if not row["GeneSymbol"] or not row["VariationID"].strip().isdigit():
+            continue
+        priority = _ASSEMBLY_PRIORITY.get(row["Assembly"], 0)
+        for gene in (g.strip() for g in row["GeneSymbol"].split(";")):
+            if gene in target_genes:
+                best = dedup.setdefault(gene, {}).get(int(row["VariationID"]))
+                if best is None or priority > best:
+                    dedup[gene][int(row["VariationID"])] = priority
+
+    accumulators = {gene: GeneAccumulator(confidence_levels, 200) for gene in dedup}
+    for row in rows:
+        if not row["GeneSymbol"] or not row["VariationID"].strip().isdigit():
+            continue
+        var_id = int(row["VariationID"])
+        priority = _ASSEMBLY_PRIORITY.get(row["Assembly"], 0)
+        for gene in (g.strip() for g in row["GeneSymbol"].split(";")):
+            if dedup.get(gene, {}).get(var_id) == priority:
+                accumulators[gene].add_variant(parse_variant_row(row, confidence_levels))
+                del dedup[gene][var_id]
+
+    result = {
+        gene: source._build_annotation(gene, acc.finalize()) for gene, acc in accumulators.items()
+    }
+    for gene in target_genes - result.keys():
+        result[gene] = source._empty_annotation(gene)
+    return result
+
+
+def _without_timestamps(parsed: dict[str, Any]) -> dict[str, Any]:
+    return {
+        gene: {k: v for k, v in ann.items() if k != "last_updated"} for gene, ann in parsed.items()
+    }
+
+
+@pytest.mark.unit
+class TestClinVarColumnarParser:
+    """The single-pass columnar parser must match the row-by-row result exactly."""
+
+    def test_matches_row_by_row_parse(self, tmp_path: Path, monkeypatch) -> None:
+        import random
+
+        import app.pipeline.sources.annotations.clinvar as clinvar_module
+
+        rng = random.Random(17)
+        genes = ["PKD1", "PKD2", "NPHS1", "COL4A5", "OTHER"]
+        names = [
+            "NM_000297.4(PKD1):c.{n}C>T (p.Arg{n}Trp)",
+            "NM_000297.4(PKD1):c.{n}del (p.Ala{n}ProfsTer38)",
+            "NM_000297.4(PKD1):c.{n}+1G>A",
+            "NM_000297.4(PKD1):c.{n}G>A (p.Gly{n}=)",
+            "NC_000016.10:g.{n}del",
+        ]
+        rows = []
+        for _ in range(3000):
+            symbol = rng.choice(genes)
+            if rng.random() < 0.1:
+                symbol = f"{symbol};{rng.choice(genes)}"
+            n = rng.randint(1, 5000)
+            rows.append(
+                {
+                    "VariationID": rng.choice([str(rng.randint(1, 900))] * 20 + ["", "x1"]),
+                    "Type": rng.choice(["single nucleotide variant", "Deletion"]),
+                    "Name": rng.choice(names).format(n=n),
+                    "GeneSymbol": symbol,
+                    "ClinicalSignificance": rng.choice(
+                        ["Pathogenic", "Likely pathogenic", "Benign", "Uncertain significance", ""]
+                    ),
+                    "Assembly": rng.choice(["GRCh38", "GRCh37", "na", ""]),
+                    "Chromosome": "16",
+                    "Start": rng.choice([str(n), "-"]),
+                    "Stop": str(n),
+                    "ReviewStatus": rng.choice(
+                        ["criteria provided, single submitter", "reviewed by expert panel"]
+                    ),
+                    "PhenotypeList": rng.choice(["Polycystic kidney disease|Alport", "-"]),
+                }
+            )
+        # Small chunks so duplicates span chunk boundaries
+        monkeypatch.setattr(clinvar_module, "_PARSE_CHUNK_ROWS", 128)
+        target = {"PKD1", "PKD2", "NPHS1", "COL4A5", "MISSING_GENE"}
+        source = _create_source_with_bulk(tmp_path, target, rows)
+        expected = _reference_parse(source, tmp_path / "variant_summary.txt.gz", target)
+
+        assert _without_timestamps(source._bulk_data) == _without_timestamps(expected)
+        assert list(source._bulk_data)[:4] == list(expected)[:4]
+        assert any(len(ann["protein_variants"]) == 200 for ann in source._bulk_data.values())
+
+
 @pytest.mark.unit
 class TestClinVarBulkFetchBatch:
     """Test fetch_batch with bulk data + API fallback."""
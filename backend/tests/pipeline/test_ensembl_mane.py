@@ -16,9 +16,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.pipeline.sources.annotations import ensembl
 from app.pipeline.sources.annotations.ensembl import (
     EnsemblAnnotationSource,
+    _gtf_byte_ranges,
     _parse_gtf_attributes,
+    _parse_gtf_range,
 )
 
 # ---------------------------------------------------------------------------
@@ -322,6 +325,57 @@ class TestGTFParsing:
         assert data["PKD1"]["description"] is None
 
 
+# ===========================================================================
+# Tests: Parallel GTF parsing
+# ===========================================================================
+
+
+@pytest.mark.unit
+class TestParallelGTFParsing:
+    """Byte-range parsing must give the same result as one sequential pass."""
+
+    def test_byte_ranges_cover_file(self) -> None:
+        """Ranges are contiguous and cover every byte."""
+        ranges = _gtf_byte_ranges(10, 3)
+        assert ranges == [(0, 4), (4, 8), (8, 10)]
+        assert _gtf_byte_ranges(0, 4) == []
+        assert _gtf_byte_ranges(5, 1) == [(0, 5)]
+
+    @pytest.mark.parametrize("parts", [2, 3, 7, 50, 10_000])
+    def test_merged_ranges_match_single_pass(self, tmp_path: Path, parts: int) -> None:
+        """Ranges split mid-line and merged in order equal a single-range parse."""
+        gtf_file = _create_gtf_file(tmp_path)
+        size = gtf_file.stat().st_size
+        expected = _parse_gtf_range(str(gtf_file), 0, size)
+
+        ranges = _gtf_byte_ranges(size, parts)
+        merged = _parse_gtf_range(str(gtf_file), *ranges[0])
+        for start, end in ranges[1:]:
+            merged.merge(_parse_gtf_range(str(gtf_file), start, end))
+
+        assert merged == expected
+        assert list(merged.genes) == list(expected.genes)
+        assert list(merged.gene_transcripts) == list(expected.gene_transcripts)
+        assert merged.line_count == 13
+
+    def test_process_pool_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """parse_bulk_file with a real worker pool returns the sequential result."""
+        gtf_file = _create_gtf_file(tmp_path)
+        sequential = _make_source().parse_bulk_file(gtf_file)
+
+        monkeypatch.setattr(ensembl, "_PARALLEL_GTF_MIN_BYTES", 0)
+        source = _make_source()
+        source.gtf_parse_workers = 2
+        parallel = source.parse_bulk_file(gtf_file)
+
+        for annotation in (*parallel.values(), *sequential.values()):
+            del annotation["last_updated"]
+        assert parallel == sequential
+        assert list(parallel) == list(sequential)
+
+
 # ===========================================================================
 # Tests: Canonical transcript selection
 # ===========================================================================
@@ -0,0 +1,99 @@
+"""Tests for the memory-mapped gene lookup index."""
+
+from pathlib import Path
+
+import pytest
+
+from app.pipeline.sources.unified.gene_index import GeneIndex
+
+DATA = {
+    "PKD1": {"score": 1, "variants": [{"position": 4206, "category": "pathogenic"}]},
+    "NPHS1": {"score": 2, "variants": []},
+    "COL4A5": {"score": None},
+    "ÄBC": {"unicode": True},
+}
+
+
+@pytest.mark.unit
+class TestGeneIndex:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "genes.idx"
+        GeneIndex.write(path, DATA, key="abc")
+
+        index = GeneIndex.open(path)
+
+        assert len(index) == 4
+        assert index["PKD1"] == DATA["PKD1"]
+        assert index.get("ÄBC") == {"unicode": True}
+        assert index.get("MISSING") is None
+        assert "NPHS1" in index and "MISSING" not in index
+        assert sorted(index) == sorted(DATA)
+        assert dict(index.items()) == DATA
+        assert index.header["key"] == "abc"
+        index.close()
+
+    def test_values_are_decoded_per_lookup(self, tmp_path: Path) -> None:
+        path = tmp_path / "genes.idx"
+        GeneIndex.write(path, DATA)
+        index = GeneIndex.open(path)
+
+        index["PKD1"]["score"] = 99
+
+        assert index["PKD1"]["score"] == 1
+        index.close()
+
+    def test_empty_index(self, tmp_path: Path) -> None:
+        path = tmp_path / "genes.idx"
+        GeneIndex.write(path, {})
+
+        index = GeneIndex.open(path)
+
+        assert len(index) == 0
+        assert index.get("PKD1") is None
+        index.close()
+
+    def test_rewrite_keeps_open_readers_valid(self, tmp_path: Path) -> None:
+        path = tmp_path / "genes.idx"
+        GeneIndex.write(path, DATA)
+        old = GeneIndex.open(path)
+
+        GeneIndex.write(path, {"PKD1": {"score": 5}})
+        new = GeneIndex.open(path)
+
+        assert old["PKD1"] == DATA["PKD1"]
+        assert new["PKD1"] == {"score": 5}
+        old.close()
+        new.close()
+
+    @pytest.mark.parametrize("content", [b"", b"not an index\n", b'{"magic": "other"}\n'])
+    def test_rejects_other_files(self, tmp_path: Path, content: bytes) -> None:
+        path = tmp_path / "genes.idx"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError):
+            GeneIndex.open(path)
+
+    def test_concurrent_writers_do_not_share_a_temp_file(self, tmp_path: Path) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        path = tmp_path / "genes.idx"
+
+        def write(_: int) -> None:
+            for _ in range(20):
+                GeneIndex.write(path, DATA, key="abc")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(write, range(4)))
+
+        index = GeneIndex.open(path)
+        assert dict(index.items()) == DATA
+        index.close()
+        assert [p.name for p in tmp_path.iterdir()] == ["genes.idx"]
+
+    def test_rejects_truncated_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "genes.idx"
+        GeneIndex.write(path, DATA)
+        path.write_bytes(path.read_bytes()[:-10])
+
+        with pytest.raises(ValueError, match="truncated"):
+            GeneIndex.open(path)
@@ -169,3 +169,209 @@ class TestGTExBulkLookup:
 
         result = source.lookup_gene("PKD1")
         assert result is None
+
+
+def _reference_parse(path: Path) -> dict:
+    """Row-at-a-time GCT parser that the vectorized parser replaced."""
+    import csv
+
+    from app.pipeline.sources.annotations.gtex import _normalise_tissue_id
+
+    data: dict = {}
+    with open(path, newline="") as f:
+        f.readline()
+        f.readline()
+        reader = csv.reader(f, delimiter="\t")
+        tissue_ids = next(reader)[2:]
+        for row in reader:
+            if len(row) < 3 or not row[1].strip():
+                continue
+            tissues = {}
+            for i, tissue_id in enumerate(tissue_ids):
+                val = row[i + 2] if i + 2 < len(row) else ""
+                if val and val != "NA":
+                    try:
+                        tissues[_normalise_tissue_id(tissue_id)] = {
+                            "median_tpm": float(val),
+                            "unit": "TPM",
+                        }
+                    except ValueError:
+                        continue
+            if tissues:
+                data[row[1].strip()] = {
+                    "tissues": tissues,
+                    "dataset_version": "gtex_v8",
+                    "gencode_id": row[0].strip(),
+                    "gene_symbol": row[1].strip(),
+                }
+    return data
+
+
+@pytest.mark.unit
+class TestGTExVectorizedParsing:
+    """The vectorized parser matches the row-at-a-time parser."""
+
+    def test_matches_reference_parser(self, tmp_path: Path) -> None:
+        """Random GCT with NA, blanks, junk and duplicate symbols parses identically."""
+        import random
+
+        from app.pipeline.sources.annotations.gtex import GTExAnnotationSource
+
+        rng = random.Random(7)
+        tissues = ["Kidney - Cortex", "Whole Blood", "Adipose - Visceral (Omentum)", "Liver"]
+        symbols = ["PKD1", "PKD2", "UMOD", "", "NPHS1", "NPHS2"]
+        rows = []
+        for i in range(300):
+            values = [
+                rng.choice(["NA", "", "x", "0", str(round(rng.uniform(0, 500), 3))])
+                for _ in tissues
+            ]
+            rows.append("\t".join([f"ENSG{i:011d}.1", rng.choice(symbols), *values]))
+        content = "#1.2\n300\t4\n" + "\t".join(["Name", "Description", *tissues]) + "\n"
+        gct_file = _create_gct(tmp_path, content + "\n".join(rows) + "\n")
+
+        source = GTExAnnotationSource.__new__(GTExAnnotationSource)
+        data = source.parse_bulk_file(gct_file)
+
+        expected = _reference_parse(gct_file)
+        assert data == expected
+        assert list(data) == list(expected)
+
+
+@pytest.mark.unit
+class TestGTExExpressionMatrix:
+    """Dense gene × tissue matrix and its rankings."""
+
+    def _matrix(self, tmp_path: Path):
+        from app.pipeline.sources.annotations.gtex import GTExAnnotationSource
+
+        source = GTExAnnotationSource.__new__(GTExAnnotationSource)
+        return source.build_expression_matrix(_create_gct(tmp_path))
+
+    def test_matrix_shape_and_dtype(self, tmp_path: Path) -> None:
+        """One float32 row per gene, one column per tissue."""
+        import numpy as np
+
+        matrix = self._matrix(tmp_path)
+
+        assert matrix.genes.tolist() == ["PKD1", "PKD2", "TP53"]
+        assert matrix.tissues.tolist() == ["Whole_Blood", "Brain_Cortex", "Kidney_Cortex", "Liver"]
+        assert matrix.tpm.dtype == np.float32
+        assert matrix.tpm[0, 2] == pytest.approx(12.34)
+
+    def test_percentiles(self, tmp_path: Path) -> None:
+        """Percentile is the share of genes with lower TPM in the tissue."""
+        matrix = self._matrix(tmp_path)
+
+        percentiles = matrix.percentiles("Kidney_Cortex")
+
+        assert percentiles.tolist() == pytest.approx([200 / 3, 100 / 3, 0.0])
+        with pytest.raises(KeyError):
+            matrix.percentiles("Kidney_Medulla")
+
+    def test_top_specific_genes(self, tmp_path: Path) -> None:
+        """Genes are ranked by kidney vs. other-tissue expression."""
+        import math
+
+        matrix = self._matrix(tmp_path)
+
+        top = matrix.top_specific_genes(limit=2)
+
+        assert [symbol for symbol, _ in top] == ["PKD1", "PKD2"]
+        other_mean = (5.123 + 0.456 + 0.001) / 3
+        assert top[0][1] == pytest.approx(math.log2(13.34 / (other_mean + 1)), rel=1e-5)
+
+    def test_save_and_load_memory_maps(self, tmp_path: Path) -> None:
+        """Saved matrix loads memory-mapped, and only with the same key."""
+        import numpy as np
+
+        from app.pipeline.sources.annotations.gtex import ExpressionMatrix
+
+        matrix = self._matrix(tmp_path)
+        matrix_path = tmp_path / "gtex.gct.gz.matrix"
+        matrix.save(matrix_path, key="abc")
+
+        loaded = ExpressionMatrix.load(matrix_path, key="abc")
+
+        assert loaded is not None
+        assert isinstance(loaded.tpm, np.memmap)
+        assert np.array_equal(loaded.tpm, matrix.tpm)
+        assert loaded.genes.tolist() == matrix.genes.tolist()
+        assert ExpressionMatrix.load(matrix_path, key="other") is None
+        assert ExpressionMatrix.load(tmp_path / "missing", key="abc") is None
+
+
+@pytest.mark.unit
+class TestGTExPipelineMatrix:
+    """Pipeline updates keep the stored expression matrix current."""
+
+    def _source(self):
+        from app.pipeline.sources.annotations.gtex import GTExAnnotationSource
+
+        source = GTExAnnotationSource.__new__(GTExAnnotationSource)
+        source._bulk_data = {}
+        return source
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_builds_matrix(self) -> None:
+        from unittest.mock import AsyncMock, patch
+
+        from app.pipeline.sources.unified.bulk_mixin import BulkDataSourceMixin
+
+        source = self._source()
+        source._expression_matrix = object()
+        source.get_expression_matrix = AsyncMock()
+
+        with patch.object(BulkDataSourceMixin, "ensure_bulk_data_loaded", new=AsyncMock()):
+            await source.fetch_batch([])
+            source.get_expression_matrix.assert_awaited_once()
+            assert source._expression_matrix is not None
+
+            # A forced update reloads the matrix for the new bulk file
+            await source.ensure_bulk_data_loaded(force=True)
+            assert source._expression_matrix is None
+
+    @pytest.mark.asyncio
+    async def test_matrix_failure_keeps_annotations(self) -> None:
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from app.pipeline.sources.unified.bulk_mixin import BulkDataSourceMixin
+
+        source = self._source()
+        source._bulk_data = {"PKD1": {"gene_symbol": "PKD1"}}
+        source.get_expression_matrix = AsyncMock(side_effect=OSError("disk full"))
+        gene = MagicMock(id=1, approved_symbol="PKD1")
+
+        with patch.object(BulkDataSourceMixin, "ensure_bulk_data_loaded", new=AsyncMock()):
+            results = await source.fetch_batch([gene])
+
+        assert results == {1: {"gene_symbol": "PKD1"}}
+
+    @pytest.mark.asyncio
+    async def test_cold_load_reads_gct_once(self, tmp_path: Path) -> None:
+        """Annotations and the stored matrix come from a single read of the file."""
+        import gzip
+        import hashlib
+        import json
+        from unittest.mock import AsyncMock, patch
+
+        from app.pipeline.sources.annotations import gtex
+        from app.pipeline.sources.annotations.gtex import ExpressionMatrix, GTExAnnotationSource
+
+        raw_path = tmp_path / "gtex.gct.gz"
+        raw_path.write_bytes(gzip.compress(SAMPLE_GCT_CONTENT.encode()))
+        sha256 = hashlib.sha256(raw_path.read_bytes()).hexdigest()
+        raw_path.with_suffix(".gz.meta").write_text(json.dumps({"sha256": sha256}))
+
+        source = GTExAnnotationSource.__new__(GTExAnnotationSource)
+        source.bulk_artifacts_enabled = False
+        source.download_bulk_file = AsyncMock(return_value=raw_path)
+
+        with patch.object(gtex, "_read_gct", wraps=gtex._read_gct) as read_gct:
+            await source.ensure_bulk_data_loaded()
+
+        assert read_gct.call_count == 1
+        assert source.lookup_gene("PKD1")["tissues"]["Kidney_Cortex"]["median_tpm"] == 12.34
+        assert source._expression_matrix.genes.tolist() == ["PKD1", "PKD2", "TP53"]
+        matrix_path = raw_path.with_suffix(raw_path.suffix + ".matrix")
+        assert ExpressionMatrix.load(matrix_path, source._bulk_artifact_key(raw_path)) is not None
@@ -0,0 +1,139 @@
+"""Tests for parallel, resumable Range downloads."""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+import httpx
+import pytest
+
+import app.pipeline.sources.unified.ranged_download as ranged_download
+from app.pipeline.sources.unified.ranged_download import (
+    DownloadIntegrityError,
+    download_resumable,
+    parse_md5_checksum,
+)
+
+CONTENT = bytes(range(256)) * 4  # 1 KiB
+URL = "https://example.com/data.txt.gz"
+
+
+class RangeServer:
+    """MockTransport handler serving CONTENT with Range / If-Range support."""
+
+    def __init__(self, content: bytes = CONTENT, etag: str = '"v1"', ranges: bool = True):
+        self.content = content
+        self.etag = etag
+        self.ranges = ranges
+        self.range_requests: list[str] = []
+        self.fail_once_at: int | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        headers = {"ETag": self.etag, "Content-Length": str(len(self.content))}
+        if self.ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+
+        range_header = request.headers.get("range")
+        if not self.ranges or range_header is None:
+            return httpx.Response(200, content=self.content, headers=headers)
+        if request.headers.get("if-range") != self.etag:
+            return httpx.Response(200, content=self.content, headers=headers)
+
+        self.range_requests.append(range_header)
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", range_header)
+        assert match is not None
+        start, end = int(match.group(1)), int(match.group(2))
+        if self.fail_once_at is not None and start <= self.fail_once_at <= end:
+            self.fail_once_at = None
+            raise httpx.ReadError("connection reset")
+        return httpx.Response(206, content=self.content[start : end + 1], headers=headers)
+
+
+@pytest.fixture(autouse=True)
+def small_segments(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ranged_download, "MIN_SEGMENT_BYTES", 64)
+
+
+async def download(server: RangeServer, dest: Path, **kwargs) -> ranged_download.DownloadResult:
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        return await download_resumable(client, URL, dest, **kwargs)
+
+
+@pytest.mark.unit
+class TestRangedDownload:
+    async def test_segments_are_fetched_and_assembled(self, tmp_path: Path) -> None:
+        server = RangeServer()
+        dest = tmp_path / "file.tmp"
+
+        result = await download(server, dest, segments=4)
+
+        assert dest.read_bytes() == CONTENT
+        assert result.sha256 == hashlib.sha256(CONTENT).hexdigest()
+        assert sorted(server.range_requests) == sorted(
+            ["bytes=0-255", "bytes=256-511", "bytes=512-767", "bytes=768-1023"]
+        )
+        assert list(tmp_path.iterdir()) == [dest]
+
+    async def test_interrupted_segment_is_resumed(self, tmp_path: Path) -> None:
+        server = RangeServer()
+        server.fail_once_at = 300
+        dest = tmp_path / "file.tmp"
+
+        with pytest.raises(httpx.ReadError):
+            await download(server, dest, segments=4)
+        # Completed segments are kept; only the failed one is fetched again
+        part1 = dest.with_name("file.tmp.part1")
+        part1.write_bytes(CONTENT[256:300])
+        server.range_requests.clear()
+
+        await download(server, dest, segments=4)
+
+        assert server.range_requests == ["bytes=300-511"]
+        assert dest.read_bytes() == CONTENT
+
+    async def test_parts_of_another_remote_version_are_not_resumed(self, tmp_path: Path) -> None:
+        dest = tmp_path / "file.tmp"
+        state = {"url": URL, "validator": '"v0"', "size": 1024, "segments": 4}
+        dest.with_name("file.tmp.ranges").write_text(json.dumps(state))
+        dest.with_name("file.tmp.part0").write_bytes(b"x" * 10)
+        server = RangeServer(etag='"v1"')
+
+        await download(server, dest, segments=4)
+
+        assert "bytes=0-255" in server.range_requests
+        assert dest.read_bytes() == CONTENT
+
+    async def test_checksum_mismatch_raises_and_discards(self, tmp_path: Path) -> None:
+        dest = tmp_path / "file.tmp"
+
+        with pytest.raises(DownloadIntegrityError, match="MD5 mismatch"):
+            await download(RangeServer(), dest, segments=4, expected_md5="0" * 32)
+
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_matching_checksum_passes(self, tmp_path: Path) -> None:
+        dest = tmp_path / "file.tmp"
+        md5 = hashlib.md5(CONTENT, usedforsecurity=False).hexdigest()
+
+        await download(RangeServer(), dest, segments=2, expected_md5=md5)
+
+        assert dest.read_bytes() == CONTENT
+
+    async def test_server_without_ranges_gets_single_download(self, tmp_path: Path) -> None:
+        server = RangeServer(ranges=False)
+        dest = tmp_path / "file.tmp"
+
+        result = await download(server, dest, segments=4)
+
+        assert server.range_requests == []
+        assert dest.read_bytes() == CONTENT
+        assert result.sha256 == hashlib.sha256(CONTENT).hexdigest()
+
+    def test_parse_md5_checksum_formats(self) -> None:
+        digest = "d41d8cd98f00b204e9800998ecf8427e"
+        assert parse_md5_checksum(f"{digest}  variant_summary.txt.gz\n") == digest
+        assert parse_md5_checksum(f"MD5 (variant_summary.txt.gz) = {digest.upper()}") == digest
+        assert parse_md5_checksum("not a checksum") is None
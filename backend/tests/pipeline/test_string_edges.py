@@ -0,0 +1,151 @@
+"""Tests for the version-keyed STRING edge store."""
+
+import gzip
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from app.pipeline.sources.annotations.string_edges import StringEdgeStore, edge_store_path
+from app.pipeline.sources.annotations.string_ppi import StringPPIAnnotationSource
+
+PROTEIN_INFO = (
+    "#string_protein_id\tpreferred_name\tprotein_size\tannotation\n"
+    "9606.ENSP01\tPKD1\t4303\tPolycystin-1\n"
+    "9606.ENSP02\tPKD2\t968\tPolycystin-2\n"
+    "9606.ENSP03\tNPHS1\t1241\tNephrin\n"
+    "9606.ENSP04\tPKD1\t4302\tPolycystin-1 isoform\n"
+)
+
+LINKS = (
+    "protein1 protein2 combined_score\n"
+    "9606.ENSP01 9606.ENSP02 999\n"
+    "9606.ENSP02 9606.ENSP01 999\n"
+    "9606.ENSP01 9606.ENSP03 350\n"
+    "9606.ENSP04 9606.ENSP03 450\n"
+    "9606.ENSP02 9606.ENSP99 800\n"
+)
+
+
+def _write_release(tmp_path: Path) -> tuple[Path, Path]:
+    info = tmp_path / "9606.protein.info.v12.0.txt.gz"
+    links = tmp_path / "9606.protein.physical.links.v12.0.txt"
+    info.write_bytes(gzip.compress(PROTEIN_INFO.encode()))
+    links.write_text(LINKS)
+    return info, links
+
+
+def _pairs(store: StringEdgeStore, min_score: int = 0) -> list[tuple[str, str, int]]:
+    gene1, gene2, scores = store.edges(min_score=min_score)
+    return list(
+        zip(
+            store.symbols[gene1].tolist(),
+            store.symbols[gene2].tolist(),
+            scores.tolist(),
+            strict=True,
+        )
+    )
+
+
+@pytest.mark.unit
+class TestStringEdgeStore:
+    def test_build_maps_proteins_to_symbol_codes(self, tmp_path: Path) -> None:
+        info, links = _write_release(tmp_path)
+
+        store = StringEdgeStore.build(tmp_path / "edges", "12.0", info, links)
+
+        assert store.symbols.tolist() == ["NPHS1", "PKD1", "PKD2"]
+        assert store.symbol_codes == {"NPHS1": 0, "PKD1": 1, "PKD2": 2}
+        # Unknown protein ENSP99 is dropped; isoforms share the symbol code
+        assert _pairs(store) == [
+            ("PKD1", "PKD2", 999),
+            ("PKD2", "PKD1", 999),
+            ("PKD1", "NPHS1", 350),
+            ("PKD1", "NPHS1", 450),
+        ]
+        assert store.gene1.dtype == np.uint32
+        assert store.scores.dtype == np.uint16
+
+    def test_edges_are_filtered_at_read_time(self, tmp_path: Path) -> None:
+        info, links = _write_release(tmp_path)
+        StringEdgeStore.build(tmp_path / "edges", "12.0", info, links)
+
+        store = StringEdgeStore.open(tmp_path / "edges", "12.0")
+
+        assert store is not None
+        assert len(store) == 4
+        assert [score for *_, score in _pairs(store, min_score=400)] == [999, 999, 450]
+        assert _pairs(store, min_score=1000) == []
+
+    def test_open_is_keyed_by_version(self, tmp_path: Path) -> None:
+        info, links = _write_release(tmp_path)
+        StringEdgeStore.build(tmp_path / "edges", "12.0", info, links)
+
+        assert StringEdgeStore.open(tmp_path / "edges", "11.5") is None
+        assert StringEdgeStore.open(tmp_path / "missing", "12.0") is None
+
+    def test_open_ignores_inconsistent_store(self, tmp_path: Path) -> None:
+        info, links = _write_release(tmp_path)
+        store = StringEdgeStore.build(tmp_path / "edges", "12.0", info, links)
+        np.save(store.path / "score.npy", np.zeros(1, dtype=np.uint16))
+
+        assert StringEdgeStore.open(tmp_path / "edges", "12.0") is None
+
+    def test_store_path_includes_version(self, tmp_path: Path) -> None:
+        assert edge_store_path(tmp_path, "12.0") != edge_store_path(tmp_path, "11.5")
+
+    def test_shared_store_is_opened_once_built(self, tmp_path: Path, monkeypatch) -> None:
+        from app.core.config import settings
+        from app.pipeline.sources.annotations import string_edges
+
+        monkeypatch.setattr(string_edges, "_store", None)
+        monkeypatch.setattr(settings, "STRING_DATA_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "STRING_VERSION", "12.0")
+
+        # Not built yet: readers fall back, and look again on the next call
+        assert string_edges.get_string_edge_store() is None
+
+        info, links = _write_release(tmp_path)
+        StringEdgeStore.build(edge_store_path(tmp_path, "12.0"), "12.0", info, links)
+        store = string_edges.get_string_edge_store()
+
+        assert store is not None
+        assert store.version == "12.0"
+        assert string_edges.get_string_edge_store() is store
+
+
+@pytest.mark.unit
+class TestAnnotationSourceLoad:
+    def _source(self, data_dir: Path) -> StringPPIAnnotationSource:
+        with patch.object(StringPPIAnnotationSource, "__init__", lambda self, s: None):
+            src = StringPPIAnnotationSource.__new__(StringPPIAnnotationSource)
+        src._interactions = None
+        src.data_dir = data_dir
+        src.version = "12.0"
+        src.min_string_score = 400
+        src.ensure_data_files = AsyncMock()
+        return src
+
+    @pytest.mark.asyncio
+    async def test_load_data_builds_store_once(self, tmp_path: Path) -> None:
+        _write_release(tmp_path)
+        src = self._source(tmp_path)
+
+        await src._load_data()
+
+        assert edge_store_path(tmp_path, "12.0").is_dir()
+        src.ensure_data_files.assert_called_once()
+        graph = src._interactions
+        assert graph is not None
+        assert graph.symbols.tolist() == ["NPHS1", "PKD1", "PKD2"]
+        # PKD1: PKD2 twice (both directions) and NPHS1 once above threshold
+        pkd1 = graph.indices[graph.indptr[1] : graph.indptr[2]]
+        assert graph.symbols[pkd1].tolist() == ["PKD2", "PKD2", "NPHS1"]
+
+        reloaded = self._source(tmp_path)
+        await reloaded._load_data()
+
+        reloaded.ensure_data_files.assert_not_called()
+        assert reloaded._interactions is not None
+        assert reloaded._interactions.scores.tolist() == graph.scores.tolist()
@@ -1,5 +1,6 @@
 """Tests for STRING PPI auto-download capability."""
 
+import asyncio
 import gzip
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -122,52 +123,72 @@ class TestDownloadStringFile:
             await source._download_string_file("http://example.com/file.gz", dest)
             mock_httpx.AsyncClient.assert_not_called()
 
+    @pytest.fixture
+    def transport(self, monkeypatch):
+        """Route httpx.AsyncClient through a MockTransport driven by ``transport.handler``."""
+        mock = MagicMock()
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(
+                **{
+                    **kwargs,
+                    "transport": httpx.MockTransport(lambda request: mock.handler(request)),
+                }
+            ),
+        )
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        return mock
+
     @pytest.mark.asyncio
-    async def test_download_creates_parent_dirs(self, source, tmp_path):
+    async def test_download_creates_parent_dirs(self, source, tmp_path, transport):
         """_download_string_file creates parent directories."""
         dest = tmp_path / "sub" / "dir" / "file.gz"
+        transport.handler = lambda request: httpx.Response(200, content=b"chunk1chunk2")
 
-        # Mock httpx streaming
-        mock_response = AsyncMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_response.aiter_bytes = lambda chunk_size: _async_iter([b"chunk1", b"chunk2"])
-
-        mock_client = AsyncMock()
-        mock_client.stream = MagicMock(return_value=_async_context_manager(mock_response))
-
-        with patch("app.pipeline.sources.annotations.string_ppi.httpx") as mock_httpx:
-            mock_httpx.Timeout = MagicMock(return_value="timeout_obj")
-            mock_httpx.AsyncClient = MagicMock(return_value=_async_context_manager(mock_client))
-            await source._download_string_file("http://example.com/file.gz", dest)
+        await source._download_string_file("http://example.com/file.gz", dest)
 
         assert dest.parent.exists()
         assert dest.exists()
         assert dest.read_bytes() == b"chunk1chunk2"
 
     @pytest.mark.asyncio
-    async def test_download_cleans_up_tmp_on_failure(self, source, tmp_path):
-        """Failed download must not leave partial files."""
+    async def test_failed_download_leaves_no_file(self, source, tmp_path, transport):
+        """A failed download must not leave a (partial) destination file."""
         dest = tmp_path / "file.txt.gz"
-        tmp_file = dest.with_suffix(".gz.tmp")
+        transport.handler = lambda request: httpx.Response(500)
 
-        mock_response = AsyncMock()
-        mock_response.raise_for_status = MagicMock(
-            side_effect=httpx.HTTPStatusError("fail", request=MagicMock(), response=MagicMock())
-        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await source._download_string_file("https://example.com/file.gz", dest)
 
-        mock_client = AsyncMock()
-        mock_client.stream = MagicMock(return_value=_async_context_manager(mock_response))
+        assert not dest.exists()
 
-        with patch("app.pipeline.sources.annotations.string_ppi.httpx") as mock_httpx:
-            mock_httpx.AsyncClient = MagicMock(return_value=_async_context_manager(mock_client))
-            mock_httpx.Timeout = httpx.Timeout
-            mock_httpx.TransportError = httpx.TransportError
-            mock_httpx.HTTPStatusError = httpx.HTTPStatusError
-            with pytest.raises(httpx.HTTPStatusError):
-                await source._download_string_file("https://example.com/file.gz", dest)
+    @pytest.mark.asyncio
+    async def test_interrupted_download_is_resumed(self, source, tmp_path, transport):
+        """A dropped connection resumes from the partial .tmp file."""
+        dest = tmp_path / "file.txt.gz"
+        content = b"0123456789" * 10
+        ranges = []
 
-        assert not dest.exists()
-        assert not tmp_file.exists()
+        def handler(request):
+            headers = {"Accept-Ranges": "bytes", "ETag": '"abc"'}
+            if request.method == "HEAD":
+                return httpx.Response(200, headers={**headers, "Content-Length": "100"})
+            ranges.append(request.headers["range"])
+            start = int(request.headers["range"].split("=")[1].split("-")[0])
+            if len(ranges) == 1:
+                # First attempt: deliver 40 bytes, then drop the connection
+                dest.with_suffix(".gz.tmp").write_bytes(content[:40])
+                raise httpx.ReadError("connection reset")
+            return httpx.Response(206, content=content[start:], headers=headers)
+
+        transport.handler = handler
+        await source._download_string_file("https://example.com/file.gz", dest)
+
+        assert ranges == ["bytes=0-99", "bytes=40-99"]
+        assert dest.read_bytes() == content
+        assert not dest.with_suffix(".gz.tmp").exists()
 
 
 @pytest.mark.unit
@@ -179,7 +200,7 @@ class TestLoadDataCallsEnsure:
         """_load_data calls ensure_data_files before loading files."""
         with patch.object(StringPPIAnnotationSource, "__init__", lambda self, s: None):
             src = StringPPIAnnotationSource.__new__(StringPPIAnnotationSource)
-            src._protein_to_gene = None  # Not loaded yet
+            src._interactions = None  # Not loaded yet
             src.data_dir = Path("/tmp/nonexistent")
             src.protein_info_file = "9606.protein.info.v12.0.txt"
             src.physical_links_file = "9606.protein.physical.links.v12.0.txt"
@@ -229,28 +250,3 @@ class TestValidateDataFiles:
 
             result = await src.validate_data_files()
             assert result is False
-
-
-# --- Helpers for async mocking ---
-
-
-class _async_context_manager:
-    """Helper to create an async context manager from a value."""
-
-    def __init__(self, value):
-        self.value = value
-
-    async def __aenter__(self):
-        return self.value
-
-    async def __aexit__(self, *args):
-        pass
-
-    def __call__(self, *args, **kwargs):
-        return self
-
-
-async def _async_iter(items):
-    """Helper to create an async iterator from a list."""
-    for item in items:
-        yield item
@@ -0,0 +1,172 @@
+"""Tests for STRING PPI scoring on the integer-coded interaction graph."""
+
+import math
+import random
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.pipeline.sources.annotations.string_ppi import (
+    InteractionGraph,
+    StringPPIAnnotationSource,
+)
+
+
+def _links(rows: list[tuple[str, str, int]]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["gene1", "gene2", "combined_score"])
+
+
+def _reference_scores(
+    links: pd.DataFrame, symbol: str, kidney: set[str], evidence: dict[str, float], top_n: int
+) -> dict[str, Any] | None:
+    """Per-gene DataFrame scan that the graph-based scoring replaced."""
+    rows = links[(links["gene1"] == symbol) | (links["gene2"] == symbol)]
+    partners: dict[str, dict[str, Any]] = {}
+    for gene1, gene2, string_score in rows.itertuples(index=False):
+        partner = gene2 if gene1 == symbol else gene1
+        if partner not in kidney:
+            continue
+        if partner in partners and string_score <= partners[partner]["string_score"]:
+            continue
+        partner_evidence = evidence.get(partner, 0)
+        partners[partner] = {
+            "partner_symbol": partner,
+            "string_score": string_score,
+            "partner_evidence": round(partner_evidence, 1),
+            "weighted_score": round((string_score / 1000) * partner_evidence, 2),
+        }
+    if not partners:
+        return None
+
+    details = list(partners.values())
+    weighted_sum = sum(i["weighted_score"] for i in details)
+    degree = len(details)
+    raw_score = weighted_sum / math.sqrt(degree)
+    details.sort(key=lambda x: x["weighted_score"], reverse=True)
+    return {
+        "ppi_score": round(raw_score, 2),
+        "ppi_degree": degree,
+        "interactions": details[:top_n],
+        "summary": {
+            "total_interactions": degree,
+            "raw_sum": round(sum(i["string_score"] for i in details), 2),
+            "weighted_sum": round(weighted_sum, 2),
+            "avg_string_score": round(sum(i["string_score"] for i in details) / degree, 2),
+            "strong_interactions": len([i for i in details if i["string_score"] > 800]),
+        },
+    }
+
+
+def _make_source(links: pd.DataFrame, kidney: set[str], evidence: dict[str, float]):
+    with patch.object(StringPPIAnnotationSource, "__init__", lambda self, s: None):
+        src = StringPPIAnnotationSource.__new__(StringPPIAnnotationSource)
+    src.session = MagicMock()
+    src.max_interactions_stored = 3
+    src._interactions = InteractionGraph.from_interactions(
+        links["gene1"], links["gene2"], links["combined_score"]
+    )
+    src._kidney_genes = kidney
+    src._gene_evidence_scores = evidence
+    src._ppi_scores = None
+    return src
+
+
+def _gene(gene_id: int, symbol: str) -> MagicMock:
+    gene = MagicMock(spec=["id", "approved_symbol"])
+    gene.id = gene_id
+    gene.approved_symbol = symbol
+    return gene
+
+
+@pytest.mark.unit
+class TestInteractionGraph:
+    """CSR adjacency built from the links table."""
+
+    def test_adjacency_lists_both_directions_in_file_order(self) -> None:
+        """Each interaction is listed under both genes, self-interactions once."""
+        links = _links([("B", "A", 500), ("A", "C", 700), ("C", "C", 900)])
+        graph = InteractionGraph.from_interactions(
+            links["gene1"], links["gene2"], links["combined_score"]
+        )
+
+        assert graph.symbols.tolist() == ["A", "B", "C"]
+        assert graph.indptr.tolist() == [0, 2, 3, 5]
+        partners = [graph.symbols[graph.indices[i]] for i in range(len(graph.indices))]
+        assert partners == ["B", "C", "A", "A", "C"]
+        assert graph.scores.tolist() == [500, 700, 500, 700, 900]
+
+
+@pytest.mark.unit
+class TestStringPPIFetchBatch:
+    """fetch_batch scoring matches the per-gene DataFrame algorithm."""
+
+    @pytest.mark.asyncio
+    async def test_matches_reference_scoring(self) -> None:
+        """Random links with isoform duplicates, self-loops and non-kidney partners."""
+        rng = random.Random(11)
+        symbols = [f"G{i}" for i in range(40)]
+        rows = [
+            (rng.choice(symbols), rng.choice(symbols), rng.randrange(400, 1000)) for _ in range(600)
+        ]
+        links = _links(rows)
+        kidney = set(symbols[:30]) | {"NO_LINKS"}
+        evidence = {symbol: round(rng.uniform(1, 100), 2) for symbol in sorted(kidney)}
+        source = _make_source(links, kidney, evidence)
+        genes = [_gene(i, symbol) for i, symbol in enumerate([*symbols, "NO_LINKS"])]
+
+        results = await source.fetch_batch(genes)
+
+        assert set(results) == set(range(30)) | {40}
+        for gene in genes:
+            if gene.id not in results:
+                continue
+            result = results[gene.id]
+            assert result.pop("ppi_percentile") is None
+            expected = _reference_scores(links, gene.approved_symbol, kidney, evidence, 3)
+            if expected is None:
+                assert result["ppi_degree"] == 0
+                assert result["interactions"] == []
+                continue
+            # Sums may differ from the sequential sum in the last rounded cent
+            assert result.pop("ppi_score") == pytest.approx(expected.pop("ppi_score"), abs=0.011)
+            assert result["summary"].pop("weighted_sum") == pytest.approx(
+                expected["summary"].pop("weighted_sum"), abs=0.011
+            )
+            assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_results_are_native_python_types(self) -> None:
+        """Annotations hold plain ints/floats (JSONB-serialisable), not NumPy scalars."""
+        links = _links([("PKD1", "PKD2", 999), ("PKD1", "PKD2", 950), ("PKD2", "TP53", 300)])
+        kidney = {"PKD1", "PKD2"}
+        source = _make_source(links, kidney, {"PKD1": 90.0, "PKD2": 80.0})
+
+        results = await source.fetch_batch([_gene(1, "PKD1"), _gene(3, "TP53")])
+
+        assert list(results) == [1]
+        result = results[1]
+        assert result["ppi_degree"] == 1
+        assert result["interactions"] == [
+            {
+                "partner_symbol": "PKD2",
+                "string_score": 999,
+                "partner_evidence": 80.0,
+                "weighted_score": 79.92,
+            }
+        ]
+        assert result["ppi_score"] == 79.92
+        assert result["summary"]["strong_interactions"] == 1
+
+        def walk(value: Any) -> None:
+            assert not isinstance(value, np.generic)
+            if isinstance(value, dict):
+                for item in value.values():
+                    walk(item)
+            elif isinstance(value, list):
+                for item in value:
+                    walk(item)
+
+        walk(result)
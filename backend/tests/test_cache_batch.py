@@ -0,0 +1,78 @@
+"""Tests for batched get_many/set_many/delete_many in CacheService."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.cache_service import CacheService
+
+
+@pytest.mark.unit
+class TestCacheBatchMemory:
+    """Batch operations against the L1 cache only."""
+
+    async def test_set_many_then_get_many(self):
+        cache = CacheService(db_session=None)
+        assert await cache.set_many({"PKD1": "HGNC:9008", "PKD2": "HGNC:9009"}, "hgnc")
+
+        result = await cache.get_many(["PKD1", "PKD2", "UMOD"], "hgnc")
+
+        assert result == {"PKD1": "HGNC:9008", "PKD2": "HGNC:9009"}
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 1
+        assert cache.stats.sets == 2
+
+    async def test_delete_many(self):
+        cache = CacheService(db_session=None)
+        await cache.set_many({"a": 1, "b": 2, "c": 3}, "test")
+
+        assert await cache.delete_many(["a", "b", "missing"], "test") == 2
+        assert await cache.get_many(["a", "b", "c"], "test") == {"c": 3}
+
+    async def test_empty_inputs(self):
+        cache = CacheService(db_session=None)
+        assert await cache.get_many([], "test") == {}
+        assert await cache.set_many({}, "test") is False
+        assert await cache.delete_many([], "test") == 0
+
+
+@pytest.mark.unit
+class TestCacheBatchDatabase:
+    """L1 misses are resolved with a single L2 round trip."""
+
+    async def test_get_many_uses_one_select_and_one_update(self):
+        session = MagicMock(spec=Session)
+        cache = CacheService(db_session=session)
+        keys = [cache._generate_cache_key(k, "hgnc") for k in ("PKD1", "PKD2", "UMOD")]
+        rows = [
+            MagicMock(cache_key=keys[0], data={"id": 1}, data_format=None, metadata={}),
+            MagicMock(cache_key=keys[1], data={"id": 2}, data_format=None, metadata={}),
+        ]
+        session.execute.return_value.fetchall.return_value = rows
+
+        result = await cache.get_many(["PKD1", "PKD2", "UMOD"], "hgnc")
+
+        assert result == {"PKD1": {"id": 1}, "PKD2": {"id": 2}}
+        # One SELECT for all misses plus one access-stats UPDATE
+        assert session.execute.call_count == 2
+        select_params = session.execute.call_args_list[0].args[1]
+        assert select_params == {"namespaces": ["hgnc"], "cache_keys": keys}
+
+        # Hits were promoted to L1, so a second call never touches the database
+        session.execute.reset_mock()
+        assert await cache.get_many(["PKD1", "PKD2"], "hgnc") == result
+        session.execute.assert_not_called()
+
+    async def test_set_many_uses_one_upsert_per_chunk(self, monkeypatch):
+        session = MagicMock(spec=Session)
+        cache = CacheService(db_session=session)
+        monkeypatch.setattr(CacheService, "DB_BATCH_SIZE", 2)
+
+        assert await cache.set_many({f"k{i}": {"v": i} for i in range(5)}, "test", ttl=60)
+
+        assert session.execute.call_count == 3
+        params = session.execute.call_args_list[0].args[1]
+        assert params["cache_keys"] == [cache._generate_cache_key(k, "test") for k in ("k0", "k1")]
+        assert params["data_formats"] == ["msgpack", "msgpack"]
+        assert all(size > 0 for size in params["data_sizes"])
@@ -0,0 +1,155 @@
+"""Tests for cross-process L1 invalidation via the cache invalidation bus."""
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import app.core.cache_service as cache_module
+from app.core.cache_bus import MAX_PAYLOAD_BYTES, CacheInvalidationBus
+from app.core.cache_service import CacheService
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    """A started bus whose NOTIFY sends are captured instead of executed."""
+    bus = CacheInvalidationBus(flush_delay=0.01)
+    bus._running = True
+    sent: list[dict] = []
+    monkeypatch.setattr(bus, "_send", lambda messages: sent.extend(messages))
+    bus.sent = sent
+    return bus
+
+
+@pytest.fixture
+def local_cache(monkeypatch):
+    cache = CacheService(db_session=None)
+    monkeypatch.setattr(cache_module, "cache_service", cache)
+    return cache
+
+
+@pytest.mark.unit
+class TestEvictLocal:
+    async def test_evicts_keys_namespace_and_all(self):
+        cache = CacheService(db_session=None)
+        await cache.set("a", 1, "ns1")
+        await cache.set("b", 2, "ns1")
+        await cache.set("c", 3, "ns2")
+
+        assert cache.evict_local(cache_keys=[cache._generate_cache_key("a", "ns1")]) == 1
+        assert cache.evict_local(namespace="ns1") == 1
+        assert len(cache.memory_cache) == 1
+        assert cache.evict_local() == 1
+        assert len(cache.memory_cache) == 0
+
+
+@pytest.mark.unit
+class TestReceiving:
+    """Notifications from other processes are applied to the local L1."""
+
+    def _notify(self, **message):
+        return SimpleNamespace(payload=json.dumps(message))
+
+    async def test_applies_remote_invalidations_and_skips_own(self, bus, local_cache):
+        await local_cache.set("PKD1", "x", "hgnc")
+        await local_cache.set("PKD2", "y", "hgnc")
+        key = local_cache._generate_cache_key("PKD1", "hgnc")
+
+        bus._conn = SimpleNamespace(
+            notifies=[
+                self._notify(origin=bus.origin, op="namespace", namespace="hgnc"),
+                self._notify(origin="other", op="keys", keys=[key]),
+            ]
+        )
+        bus._drain()
+
+        assert bus.received == 1
+        assert await local_cache.get("PKD1", "hgnc") is None
+        assert await local_cache.get("PKD2", "hgnc") == "y"
+
+    async def test_namespace_invalidation(self, bus, local_cache):
+        await local_cache.set("PKD1", "x", "hgnc")
+        bus._conn = SimpleNamespace(
+            notifies=[self._notify(origin="other", op="namespace", namespace="hgnc")]
+        )
+        bus._drain()
+        assert len(local_cache.memory_cache) == 0
+
+
+@pytest.mark.unit
+class TestPublishing:
+    """Local mutations are published, key invalidations coalesced."""
+
+    async def test_key_invalidations_are_coalesced(self, bus, monkeypatch):
+        import app.core.cache_service as service_module
+
+        monkeypatch.setattr(service_module, "cache_bus", bus)
+        bus._loop = asyncio.get_running_loop()
+        cache = CacheService(db_session=None)
+
+        await cache.set("a", 1, "test")
+        await cache.set_many({"b": 2, "c": 3}, "test")
+        await cache.delete("a", "test")
+        await asyncio.sleep(0.1)
+
+        assert len(bus.sent) == 1
+        assert bus.sent[0]["op"] == "keys"
+        assert len(bus.sent[0]["keys"]) == 3
+
+    async def test_clear_namespace_is_published(self, bus, monkeypatch):
+        import app.core.cache_service as service_module
+
+        threads: list[int] = []
+
+        def send(messages):
+            threads.append(threading.get_ident())
+            bus.sent.extend(messages)
+
+        monkeypatch.setattr(bus, "_send", send)
+        monkeypatch.setattr(service_module, "cache_bus", bus)
+        bus._loop = asyncio.get_running_loop()
+
+        await CacheService(db_session=None).clear_namespace("annotations")
+        bus.publish_all()
+        await asyncio.sleep(0.1)
+
+        assert {"op": "namespace", "namespace": "annotations"} in bus.sent
+        assert {"op": "all"} in bus.sent
+        assert len(threads) == 2 and threading.get_ident() not in threads
+
+    async def test_tag_invalidations_are_sent_off_the_loop(self, bus, monkeypatch):
+        import app.core.cache_service as service_module
+
+        threads: list[int] = []
+
+        def send(messages):
+            threads.append(threading.get_ident())
+            bus.sent.extend(messages)
+
+        monkeypatch.setattr(bus, "_send", send)
+        monkeypatch.setattr(service_module, "cache_bus", bus)
+        bus._loop = asyncio.get_running_loop()
+
+        await CacheService(db_session=None).invalidate_tags(["gene:1"])
+        await asyncio.sleep(0.1)
+
+        assert bus.sent == [{"op": "tags", "tags": ["gene:1"]}]
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_not_started_bus_does_not_publish(self, monkeypatch):
+        bus = CacheInvalidationBus()
+        monkeypatch.setattr(bus, "_send", lambda messages: pytest.fail("should not send"))
+        bus.publish_keys(["k"])
+        bus.publish_namespace("ns")
+
+    def test_large_key_sets_are_split_under_payload_limit(self):
+        bus = CacheInvalidationBus()
+        keys = [f"annotations:{'x' * 60}{i}" for i in range(500)]
+
+        messages = bus._chunk_keys(keys)
+
+        assert len(messages) > 1
+        assert sum(len(m["keys"]) for m in messages) == 500
+        assert all(len(json.dumps(m)) < MAX_PAYLOAD_BYTES + 100 for m in messages)
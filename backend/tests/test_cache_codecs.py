@@ -0,0 +1,119 @@
+"""Tests for the L2 cache codecs and their use in CacheService."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from app.core.cache_codecs import CacheCodec, CodecError
+from app.core.cache_service import CacheService
+
+
+@pytest.mark.unit
+class TestCacheCodec:
+    """Round trips and format tags."""
+
+    @pytest.mark.parametrize("serializer", ["msgpack", "orjson", "json"])
+    def test_round_trip(self, serializer):
+        codec = CacheCodec(serializer=serializer, compression="none")
+        value = {"gene": "PKD1", "scores": [1.5, 2.0], "nested": {"ok": True, "n": None}}
+
+        data_format, payload = codec.encode(value)
+
+        assert data_format in ("msgpack", "orjson", "json")
+        assert CacheCodec.decode(data_format, payload) == value
+
+    def test_large_payload_is_compressed_and_tagged(self):
+        codec = CacheCodec(compression="zlib", min_compress_bytes=1024)
+        value = [{"symbol": f"GENE{i}", "source": "PubTator"} for i in range(2000)]
+
+        data_format, payload = codec.encode(value)
+
+        assert data_format == "msgpack+zlib"
+        assert len(payload) < len(codec.encode(value[:1])[1]) * 2000
+        assert CacheCodec.decode(data_format, payload) == value
+
+    def test_small_payload_is_not_compressed(self):
+        codec = CacheCodec(compression="zlib", min_compress_bytes=1024)
+        assert codec.encode({"a": 1})[0] == "msgpack"
+
+    def test_unsupported_types_fall_back_to_strings(self):
+        codec = CacheCodec(compression="none")
+        when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        data_format, payload = codec.encode({"when": when, "tags": {"x"}})
+
+        assert CacheCodec.decode(data_format, payload) == {
+            "when": when.isoformat(),
+            "tags": ["x"],
+        }
+
+    def test_dataframe_round_trip(self):
+        codec = CacheCodec(compression="none")
+        df = pd.DataFrame({"gene": ["PKD1", "PKD2"], "score": [0.9, 0.8]})
+
+        data_format, payload = codec.encode(df)
+
+        assert data_format in ("arrow", "dataframe")
+        pd.testing.assert_frame_equal(CacheCodec.decode(data_format, payload), df)
+
+    def test_dataframe_without_arrow_or_msgpack_raises(self, monkeypatch):
+        from app.core import cache_codecs
+
+        monkeypatch.setattr(cache_codecs, "_HAS_PYARROW", False)
+        monkeypatch.setitem(cache_codecs._AVAILABLE, "dataframe", False)
+        codec = CacheCodec(serializer="json", compression="none")
+
+        with pytest.raises(CodecError):
+            codec.encode(pd.DataFrame({"gene": ["PKD1"]}))
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(CodecError):
+            CacheCodec.decode("pickle", b"\x80")
+
+    def test_corrupted_payload_raises(self):
+        with pytest.raises(CodecError):
+            CacheCodec.decode("msgpack+zlib", b"not compressed")
+
+
+@pytest.mark.unit
+class TestCacheServiceCodec:
+    """CacheService writes tagged binary rows and still reads legacy JSONB rows."""
+
+    def test_encodes_binary_payload(self):
+        cache = CacheService(db_session=None)
+
+        data, data_format, data_blob, data_size = cache._encode_db_value({"id": 1})
+
+        assert data == "null"
+        assert data_format == "msgpack"
+        assert data_size == len(data_blob)
+        assert cache._decode_db_row(
+            MagicMock(data=None, data_format=data_format, data_blob=data_blob)
+        ) == {"id": 1}
+
+    def test_decodes_legacy_jsonb_rows(self):
+        cache = CacheService(db_session=None)
+
+        assert cache._decode_db_row(MagicMock(data={"id": 1}, data_format=None)) == {"id": 1}
+        legacy_df = {"_type": "dataframe", "data": [{"gene": "PKD1"}], "columns": ["gene"]}
+        decoded = cache._decode_db_row(MagicMock(data=legacy_df, data_format=None))
+        assert isinstance(decoded, pd.DataFrame)
+
+    def test_jsonb_codec_keeps_legacy_format(self, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "CACHE_CODEC", "jsonb")
+        cache = CacheService(db_session=None)
+
+        data, data_format, data_blob, _ = cache._encode_db_value({"id": 1})
+
+        assert data == '{"id": 1}'
+        assert data_format is None
+        assert data_blob is None
+
+    def test_corrupted_binary_row_decodes_to_none(self):
+        cache = CacheService(db_session=None)
+        row = MagicMock(data=None, data_format="msgpack+zlib", data_blob=b"garbage")
+        assert cache._decode_db_row(row) is None
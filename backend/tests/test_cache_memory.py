@@ -0,0 +1,137 @@
+"""Tests for the size-aware L1 memory cache."""
+
+import pytest
+
+from app.core.cache_memory import FrequencySketch, SizeAwareLRUCache, estimate_size
+from app.core.cache_service import CacheEntry, CacheService
+
+
+def _entry(namespace: str, value: object) -> CacheEntry:
+    return CacheEntry("k", value, namespace, ttl=60)
+
+
+@pytest.mark.unit
+class TestEstimateSize:
+    """Size estimation is roughly proportional to payload size."""
+
+    def test_large_blob_is_much_larger_than_small_value(self):
+        small = {"symbol": "PKD1", "hgnc_id": "HGNC:9008"}
+        large = {"nodes": [{"id": i, "label": f"GENE{i}"} for i in range(5000)]}
+        assert estimate_size(large) > 100 * estimate_size(small)
+
+    def test_cache_entry_sized_by_value(self):
+        value = ["x" * 100] * 10
+        assert estimate_size(_entry("hgnc", value)) == estimate_size(value)
+
+
+@pytest.mark.unit
+class TestFrequencySketch:
+    def test_estimates_track_increments(self):
+        sketch = FrequencySketch(width=64, sample_size=10_000)
+        for _ in range(5):
+            sketch.increment("hot")
+        sketch.increment("cold")
+        assert sketch.estimate("hot") >= 5
+        assert sketch.estimate("hot") > sketch.estimate("cold")
+
+    def test_aging_halves_counters(self):
+        sketch = FrequencySketch(width=64, sample_size=8)
+        for _ in range(8):
+            sketch.increment("hot")
+        assert sketch.estimate("hot") == 4
+
+
+@pytest.mark.unit
+class TestSizeAwareLRUCache:
+    """Byte budget, namespace quotas and admission."""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = SizeAwareLRUCache(max_bytes=300, getsizeof=lambda e: e.value, admission=False)
+        cache["a"] = _entry("hgnc", 100)
+        cache["b"] = _entry("hgnc", 100)
+        cache["c"] = _entry("hgnc", 100)
+        cache.get("a")  # a becomes most recently used
+        cache["d"] = _entry("hgnc", 100)
+
+        assert "b" not in cache
+        assert {"a", "c", "d"} <= set(cache)
+        assert cache.currsize == 300
+        assert cache.evictions == 1
+
+    def test_namespace_quota_only_evicts_own_namespace(self):
+        cache = SizeAwareLRUCache(
+            max_bytes=10_000,
+            namespace_quotas={"network_analysis": 500},
+            getsizeof=lambda e: e.value,
+            admission=False,
+        )
+        for i in range(20):
+            cache[f"hgnc{i}"] = _entry("hgnc", 10)
+        cache["net1"] = _entry("network_analysis", 400)
+        cache["net2"] = _entry("network_analysis", 400)
+
+        assert "net1" not in cache
+        assert "net2" in cache
+        assert all(f"hgnc{i}" in cache for i in range(20))
+        usage = cache.namespace_usage()
+        assert usage["network_analysis"] == {"entries": 1, "bytes": 400, "quota_bytes": 500}
+        assert usage["hgnc"]["bytes"] == 200
+
+    def test_entry_larger_than_quota_is_rejected(self):
+        cache = SizeAwareLRUCache(
+            max_bytes=10_000, namespace_quotas={"annotations": 100}, getsizeof=lambda e: e.value
+        )
+        cache["big"] = _entry("annotations", 500)
+        assert "big" not in cache
+        assert cache.rejections == 1
+
+    def test_admission_protects_frequently_used_entries(self):
+        cache = SizeAwareLRUCache(max_bytes=1000, getsizeof=lambda e: e.value)
+        for i in range(10):
+            cache[f"hot{i}"] = _entry("hgnc", 100)
+            for _ in range(3):
+                cache.get(f"hot{i}")
+
+        # A one-off large blob would displace many hot entries: not admitted
+        cache.get("blob")
+        cache["blob"] = _entry("network_analysis", 500)
+        assert "blob" not in cache
+        assert len(cache) == 10
+
+        # Once it is requested more often than its victims it gets in
+        for _ in range(10):
+            cache.get("blob")
+        cache["blob"] = _entry("network_analysis", 500)
+        assert "blob" in cache
+
+    def test_entry_cap_still_applies(self):
+        cache = SizeAwareLRUCache(
+            max_bytes=10_000, max_entries=3, getsizeof=lambda e: 1, admission=False
+        )
+        for i in range(5):
+            cache[f"k{i}"] = _entry("hgnc", i)
+        assert len(cache) == 3
+        assert cache.maxsize == 3
+
+    def test_update_replaces_accounting(self):
+        cache = SizeAwareLRUCache(max_bytes=1000, getsizeof=lambda e: e.value)
+        cache["k"] = _entry("hgnc", 100)
+        cache["k"] = _entry("hgnc", 300)
+        assert cache.currsize == 300
+        del cache["k"]
+        assert cache.currsize == 0
+        assert cache.namespace_usage() == {}
+
+
+@pytest.mark.unit
+class TestCacheServiceMemoryStats:
+    async def test_stats_report_memory_usage(self):
+        cache = CacheService(db_session=None)
+        await cache.set("PKD1", {"hgnc_id": "HGNC:9008"}, "hgnc")
+
+        stats = await cache.get_stats()
+
+        assert stats["memory_entries"] == 1
+        assert stats["memory_bytes"] > 0
+        assert stats["memory_max_bytes"] > stats["memory_bytes"]
+        assert stats["memory_namespaces"]["hgnc"]["entries"] == 1
@@ -0,0 +1,126 @@
+"""Tests for partition-aware clearing and expired-entry reclamation of cache_entries."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.cache_service import CacheService
+
+PARTITIONS = [
+    SimpleNamespace(namespace="hgnc", partition_name="cache_entries_hgnc"),
+    SimpleNamespace(namespace="gtex", partition_name="cache_entries_gtex"),
+    SimpleNamespace(namespace=None, partition_name="cache_entries_default"),
+]
+
+
+class FakeSession:
+    """Records statements and answers the catalog and count queries."""
+
+    def __init__(self, expired=None, live=(), delete_rowcounts=()):
+        self.session = MagicMock(spec=Session)
+        self.session.execute.side_effect = self._execute
+        self.statements: list[str] = []
+        self.expired = expired or {}
+        self.live = set(live)
+        self.delete_rowcounts = list(delete_rowcounts)
+
+    def _execute(self, query, params=None):
+        sql = " ".join(str(query).split())
+        self.statements.append(sql)
+        result = MagicMock()
+        if "FROM cache_partitions" in sql:
+            result.fetchall.return_value = PARTITIONS
+        elif "pg_stat_user_tables" in sql:
+            result.scalar.return_value = 7
+        elif sql.startswith("SELECT count(*) FROM"):
+            result.scalar.return_value = self.expired.get(sql.split()[3], 0)
+        elif sql.startswith("SELECT EXISTS"):
+            result.scalar.return_value = sql.split()[5] in self.live
+        elif sql.startswith("DELETE"):
+            result.rowcount = self.delete_rowcounts.pop(0) if self.delete_rowcounts else 0
+        return result
+
+
+@pytest.mark.unit
+class TestPartitionedKeys:
+    def test_namespace_is_derived_from_cache_key(self):
+        cache = CacheService(db_session=None)
+        keys = [cache._generate_cache_key("PKD1", "hgnc"), cache._generate_cache_key(1, "a:b")]
+
+        assert [cache._namespace_of(k) for k in keys] == ["hgnc", "a:b"]
+        assert cache._namespaces_of(keys + keys) == ["a:b", "hgnc"]
+
+    async def test_single_key_lookup_filters_on_partition_key(self):
+        fake = FakeSession()
+        cache = CacheService(db_session=fake.session)
+
+        await cache.get("PKD1", "hgnc")
+
+        query, params = fake.session.execute.call_args.args
+        assert "namespace = :namespace" in str(query)
+        assert params["namespace"] == "hgnc"
+
+
+@pytest.mark.unit
+class TestClearNamespace:
+    async def test_dedicated_partition_is_truncated(self):
+        fake = FakeSession()
+        cache = CacheService(db_session=fake.session)
+
+        assert await cache.clear_namespace("hgnc") == 7
+
+        assert "TRUNCATE cache_entries_hgnc" in fake.statements
+        assert not any(s.startswith("DELETE") for s in fake.statements)
+
+    async def test_namespace_without_partition_is_deleted(self):
+        fake = FakeSession()
+        cache = CacheService(db_session=fake.session)
+
+        await cache.clear_namespace("default")
+
+        assert not any(s.startswith("TRUNCATE") for s in fake.statements)
+        assert fake.statements[-1] == "DELETE FROM cache_entries WHERE namespace = :namespace"
+
+    def test_sync_clear_truncates_partition(self):
+        fake = FakeSession()
+        cache = CacheService(db_session=fake.session)
+
+        assert cache.clear_namespace_sync("gtex") == 7
+        assert "TRUNCATE cache_entries_gtex" in fake.statements
+
+
+@pytest.mark.unit
+class TestExpiredReclamation:
+    async def test_fully_expired_partition_is_truncated_and_others_chunked(self, monkeypatch):
+        monkeypatch.setattr(CacheService, "CLEANUP_CHUNK_SIZE", 2)
+        monkeypatch.setattr(CacheService, "CLEANUP_CHUNK_PAUSE", 0)
+        fake = FakeSession(
+            expired={"cache_entries_hgnc": 5, "cache_entries_gtex": 3},
+            live={"cache_entries_gtex"},
+            delete_rowcounts=[2, 1],
+        )
+        cache = CacheService(db_session=fake.session)
+
+        assert await cache._cleanup_expired_from_db() == 8
+
+        assert "TRUNCATE cache_entries_hgnc" in fake.statements
+        assert "TRUNCATE cache_entries_gtex" not in fake.statements
+        deletes = [s for s in fake.statements if s.startswith("DELETE")]
+        assert len(deletes) == 2
+        assert all(s.startswith("DELETE FROM cache_entries_gtex") for s in deletes)
+        # The default partition had nothing expired and was left alone
+        assert not any(
+            s.startswith(("TRUNCATE", "DELETE")) and "cache_entries_default" in s
+            for s in fake.statements
+        )
+
+    async def test_partitions_are_loaded_once(self):
+        fake = FakeSession()
+        cache = CacheService(db_session=fake.session)
+
+        await cache._cleanup_expired_from_db()
+        await cache._cleanup_expired_from_db()
+
+        assert sum("FROM cache_partitions" in s for s in fake.statements) == 1
@@ -0,0 +1,119 @@
+"""Tests for single-flight request coalescing in CacheService.get_or_set."""
+
+import asyncio
+
+import pytest
+
+from app.core.cache_service import CacheService
+
+
+@pytest.mark.unit
+class TestGetOrSetCoalescing:
+    """Concurrent misses for the same key must share one computation."""
+
+    async def test_concurrent_misses_run_fetch_once(self):
+        cache = CacheService(db_session=None)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"value": 42}
+
+        results = await asyncio.gather(
+            *[cache.get_or_set("hot", fetch, namespace="test") for _ in range(20)]
+        )
+
+        assert calls == 1
+        assert all(r == {"value": 42} for r in results)
+        assert cache.stats.coalesced == 19
+        assert cache._inflight == {}
+
+    async def test_different_keys_are_not_coalesced(self):
+        cache = CacheService(db_session=None)
+        calls: list[str] = []
+
+        async def fetch_for(key: str):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        results = await asyncio.gather(
+            cache.get_or_set("a", lambda: fetch_for("a"), namespace="test"),
+            cache.get_or_set("b", lambda: fetch_for("b"), namespace="test"),
+        )
+
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_leader_exception_propagates_to_followers(self):
+        cache = CacheService(db_session=None)
+        calls = 0
+
+        async def failing_fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            *[cache.get_or_set("bad", failing_fetch, namespace="test") for _ in range(5)],
+            return_exceptions=True,
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache._inflight == {}
+
+        # A later call retries instead of reusing the failure
+        assert await cache.get_or_set("bad", lambda: "recovered", namespace="test") == "recovered"
+
+    async def test_cancelled_leader_hands_over_to_follower(self):
+        cache = CacheService(db_session=None)
+        started = asyncio.Event()
+
+        async def slow_fetch():
+            started.set()
+            await asyncio.sleep(10)
+            return "slow"
+
+        leader = asyncio.create_task(cache.get_or_set("k", slow_fetch, namespace="test"))
+        await started.wait()
+        follower = asyncio.create_task(
+            cache.get_or_set("k", lambda: "from follower", namespace="test")
+        )
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "from follower"
+
+    async def test_sync_fetch_function_supported(self):
+        cache = CacheService(db_session=None)
+        assert await cache.get_or_set("sync", lambda: [1, 2, 3], namespace="test") == [1, 2, 3]
+        # Second call is served from L1
+        assert await cache.get_or_set("sync", lambda: [9], namespace="test") == [1, 2, 3]
+
+
+@pytest.mark.unit
+class TestCacheDecoratorCoalescing:
+    """The @cache decorator routes through get_or_set."""
+
+    async def test_decorated_function_runs_once_under_concurrency(self, monkeypatch):
+        import app.core.cache_service as cache_module
+        from app.core.cache_decorator import cache
+
+        monkeypatch.setattr(cache_module, "cache_service", CacheService(db_session=None))
+        calls = 0
+
+        @cache(namespace="test_decorator", ttl=60)
+        async def build(gene_ids: list[int]):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"nodes": gene_ids}
+
+        results = await asyncio.gather(*[build([1, 2, 3]) for _ in range(10)])
+
+        assert calls == 1
+        assert all(r == {"nodes": [1, 2, 3]} for r in results)
@@ -0,0 +1,108 @@
+"""Tests for stale-while-revalidate mode in CacheService."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.core.cache_service import CacheService
+
+
+def _make_stale(cache: CacheService, key: str, namespace: str) -> None:
+    cache_key = cache._generate_cache_key(key, namespace)
+    cache.memory_cache[cache_key].stale_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+
+@pytest.mark.unit
+class TestStaleWhileRevalidate:
+    """Entries past the soft TTL are served stale and refreshed in the background."""
+
+    async def test_fresh_entry_does_not_refresh(self):
+        cache = CacheService(db_session=None)
+        calls = 0
+
+        def loader(key):
+            nonlocal calls
+            calls += 1
+            return "new"
+
+        cache.register_loader("swr", loader, soft_ttl=60, ttl=600)
+        await cache.set("k", "old", "swr")
+
+        assert await cache.get("k", "swr") == "old"
+        await asyncio.sleep(0.05)
+        assert calls == 0
+
+    async def test_stale_entry_served_then_refreshed(self):
+        cache = CacheService(db_session=None)
+        release = asyncio.Event()
+
+        async def loader(key):
+            await release.wait()
+            return f"fresh-{key}"
+
+        cache.register_loader("swr", loader, soft_ttl=60, ttl=600)
+        await cache.set("k", "old", "swr")
+        _make_stale(cache, "k", "swr")
+
+        # Stale value returned immediately; concurrent stale reads schedule one refresh
+        assert await cache.get("k", "swr") == "old"
+        assert await cache.get("k", "swr") == "old"
+        assert len(cache._refresh_tasks) == 1
+
+        release.set()
+        await asyncio.gather(*cache._refresh_tasks)
+
+        assert await cache.get("k", "swr") == "fresh-k"
+        assert cache.stats.stale_hits == 2
+        assert cache.stats.refreshes == 1
+
+    async def test_sync_loader_runs_in_thread(self):
+        cache = CacheService(db_session=None)
+        cache.register_loader("swr", lambda key: {"key": key}, soft_ttl=60, ttl=600)
+        await cache.set("k", {"key": "old"}, "swr")
+        _make_stale(cache, "k", "swr")
+
+        assert await cache.get("k", "swr") == {"key": "old"}
+        await asyncio.gather(*cache._refresh_tasks)
+        assert await cache.get("k", "swr") == {"key": "k"}
+
+    async def test_failed_refresh_keeps_stale_value(self):
+        cache = CacheService(db_session=None)
+
+        def loader(key):
+            raise RuntimeError("database unavailable")
+
+        cache.register_loader("swr", loader, soft_ttl=60, ttl=600)
+        await cache.set("k", "old", "swr")
+        _make_stale(cache, "k", "swr")
+
+        assert await cache.get("k", "swr") == "old"
+        await asyncio.gather(*cache._refresh_tasks)
+        assert cache._refreshing == set()
+        assert cache.stats.refreshes == 0
+        assert await cache.get("k", "swr") == "old"
+
+    async def test_namespace_without_loader_has_no_soft_ttl(self):
+        cache = CacheService(db_session=None)
+        await cache.set("k", "v", "plain")
+
+        entry = cache.memory_cache[cache._generate_cache_key("k", "plain")]
+        assert entry.stale_at is None
+        assert "stale_at" not in entry.metadata
+
+    async def test_startup_registers_expensive_namespaces(self):
+        from app.api.endpoints.genes import METADATA_CACHE_NAMESPACE
+        from app.api.endpoints.statistics import SUMMARY_CACHE_NAMESPACE, SUMMARY_CACHE_SOFT_TTL
+        from app.core.startup import register_cache_loaders
+
+        cache = CacheService(db_session=None)
+        with (
+            patch("app.api.endpoints.genes.get_cache_service", return_value=cache),
+            patch("app.api.endpoints.statistics.get_cache_service", return_value=cache),
+        ):
+            register_cache_loaders()
+
+        assert set(cache._loaders) == {METADATA_CACHE_NAMESPACE, SUMMARY_CACHE_NAMESPACE}
+        assert cache.namespace_soft_ttls[SUMMARY_CACHE_NAMESPACE] == SUMMARY_CACHE_SOFT_TTL
@@ -0,0 +1,114 @@
+"""Tests for tag-based cache invalidation."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+import app.core.cache_service as cache_module
+from app.core.cache_bus import CacheInvalidationBus
+from app.core.cache_service import CacheEntry, CacheService, annotation_tags, gene_tag
+from app.core.cache_write_behind import WriteBehindBuffer
+
+
+@pytest.mark.unit
+class TestLocalTagInvalidation:
+    """Only entries carrying an invalidated tag are evicted."""
+
+    async def test_invalidates_only_tagged_entries(self):
+        cache = CacheService(db_session=None)
+        await cache.set("1:all", {"gene": 1}, "annotations", tags=annotation_tags(1))
+        await cache.set("1:gnomad", {"gene": 1}, "annotations", tags=annotation_tags(1, "gnomad"))
+        await cache.set("2:all", {"gene": 2}, "annotations", tags=annotation_tags(2))
+        await cache.set("untagged", {"x": 1}, "annotations")
+
+        assert await cache.invalidate_tags([gene_tag(1)]) == 2
+
+        assert await cache.get("1:all", "annotations") is None
+        assert await cache.get("1:gnomad", "annotations") is None
+        assert await cache.get("2:all", "annotations") == {"gene": 2}
+        assert await cache.get("untagged", "annotations") == {"x": 1}
+
+    async def test_source_tag_spans_genes(self):
+        cache = CacheService(db_session=None)
+        await cache.set_many(
+            {"1:gnomad": 1, "2:gnomad": 2, "2:gtex": 3},
+            "annotations",
+            tags={
+                "1:gnomad": annotation_tags(1, "gnomad"),
+                "2:gnomad": annotation_tags(2, "gnomad"),
+                "2:gtex": annotation_tags(2, "gtex"),
+            },
+        )
+
+        assert cache.invalidate_tags_sync(["source:gnomad"]) == 2
+        assert await cache.get_many(["1:gnomad", "2:gnomad", "2:gtex"], "annotations") == {
+            "2:gtex": 3
+        }
+
+    async def test_tags_survive_l2_round_trip(self):
+        cache = CacheService(db_session=None)
+        entry = cache._new_entry("1:all", {"gene": 1}, "annotations", 60, None, [gene_tag(1)])
+
+        restored = cache._entry_from_db("1:all", {"gene": 1}, "annotations", 60, entry.metadata)
+
+        assert restored.tags == frozenset({"gene:1"})
+
+
+@pytest.mark.unit
+class TestDatabaseTagInvalidation:
+    async def test_l2_rows_are_written_and_deleted_by_tag(self):
+        session = MagicMock(spec=Session)
+        session.execute.return_value.rowcount = 3
+        cache = CacheService(db_session=session)
+
+        await cache.set("1:all", {"gene": 1}, "annotations", tags=[gene_tag(1)])
+        insert_params = session.execute.call_args.args[1]
+        assert insert_params["tags"] == ["gene:1"]
+
+        assert await cache.invalidate_tags([gene_tag(1), gene_tag(2)]) == 3
+        query, params = session.execute.call_args.args
+        assert "tags &&" in str(query)
+        assert params == {"tags": ["gene:1", "gene:2"]}
+
+    def test_batch_upsert_params_carry_tags(self):
+        cache = CacheService(db_session=None)
+        entry = CacheEntry("k", 1, "annotations", 60, tags=["gene:2", "gene:1"])
+
+        params = cache._build_upsert_params([("annotations:k", entry)])
+
+        assert json.loads(params["tags"][0]) == ["gene:1", "gene:2"]
+
+
+@pytest.mark.unit
+class TestTagPropagation:
+    async def test_pending_writes_with_tag_are_discarded(self):
+        flushed: list[dict] = []
+
+        async def flush(writes, access):
+            flushed.append(writes)
+
+        buffer = WriteBehindBuffer(interval=60)
+        buffer.start(flush)
+        buffer.add_write("a", CacheEntry("a", 1, "annotations", tags=["gene:1"]))
+        buffer.add_write("b", CacheEntry("b", 2, "annotations", tags=["gene:2"]))
+        buffer.discard_tags(["gene:1"])
+        await buffer.stop()
+
+        assert list(flushed[0]) == ["b"]
+
+    async def test_remote_tag_invalidation_is_applied(self, monkeypatch):
+        cache = CacheService(db_session=None)
+        monkeypatch.setattr(cache_module, "cache_service", cache)
+        await cache.set("1:all", 1, "annotations", tags=[gene_tag(1)])
+        await cache.set("2:all", 2, "annotations", tags=[gene_tag(2)])
+
+        bus = CacheInvalidationBus()
+        payload = json.dumps({"origin": "other", "op": "tags", "tags": ["gene:1"]})
+        bus._conn = SimpleNamespace(notifies=[SimpleNamespace(payload=payload)])
+        bus._drain()
+
+        assert await cache.get("1:all", "annotations") is None
+        assert await cache.get("2:all", "annotations") == 2
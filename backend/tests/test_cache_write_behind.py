@@ -0,0 +1,150 @@
+"""Tests for write-behind batching of L2 cache writes and access statistics."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.cache_service import CacheEntry, CacheService
+from app.core.cache_write_behind import WriteBehindBuffer
+
+
+class FlushRecorder:
+    def __init__(self) -> None:
+        self.calls: list[tuple[dict, dict]] = []
+
+    async def __call__(self, writes: dict, access: dict) -> None:
+        self.calls.append((writes, access))
+
+
+@pytest.mark.unit
+class TestWriteBehindBuffer:
+    async def test_not_started_buffer_writes_through(self):
+        buffer = WriteBehindBuffer()
+        assert buffer.add_write("k", "v") is False
+        assert buffer.add_access(["k"]) is False
+
+    async def test_coalesces_writes_and_access_counts(self):
+        recorder = FlushRecorder()
+        buffer = WriteBehindBuffer(interval=60)
+        buffer.start(recorder)
+
+        assert buffer.add_write("k", "v1")
+        assert buffer.add_write("k", "v2")
+        buffer.add_access(["a", "b"])
+        buffer.add_access(["a"])
+        await buffer.stop()
+
+        assert recorder.calls == [({"k": "v2"}, {"a": 2, "b": 1})]
+
+    async def test_full_buffer_falls_back_and_flushes_early(self):
+        recorder = FlushRecorder()
+        buffer = WriteBehindBuffer(interval=60, max_pending=2)
+        buffer.start(recorder)
+
+        assert buffer.add_write("a", 1)
+        assert buffer.add_write("b", 2)
+        assert buffer.add_write("c", 3) is False
+        assert buffer.add_write("a", 10)  # Updates of pending keys are accepted
+        await asyncio.sleep(0.01)
+
+        assert recorder.calls == [({"a": 10, "b": 2}, {})]
+        assert buffer.write_throughs == 1
+        await buffer.stop()
+
+    async def test_discard_prevents_resurrecting_deleted_keys(self):
+        recorder = FlushRecorder()
+        buffer = WriteBehindBuffer(interval=60)
+        buffer.start(recorder)
+
+        buffer.add_write("a", CacheEntry("a", 1, "ns1"))
+        buffer.add_write("b", CacheEntry("b", 2, "ns2"))
+        buffer.add_write("c", CacheEntry("c", 3, "ns2"))
+        buffer.discard(["a"])
+        buffer.discard_namespace("ns2")
+        await buffer.stop()
+
+        assert recorder.calls == []
+
+    async def test_discard_during_slow_flush_deletes_after_commit(self):
+        started, release = asyncio.Event(), asyncio.Event()
+        deleted: list[list[str]] = []
+
+        async def slow_flush(writes: dict, access: dict) -> None:
+            started.set()
+            await release.wait()
+
+        async def delete(cache_keys: list[str]) -> None:
+            deleted.append(cache_keys)
+
+        buffer = WriteBehindBuffer(interval=60)
+        buffer.start(slow_flush, delete)
+        buffer.add_write("a", CacheEntry("a", 1, "ns1", tags={"gene:1"}))
+        buffer.add_write("b", CacheEntry("b", 2, "ns2"))
+        buffer.add_write("c", CacheEntry("c", 3, "ns1"))
+        flush = asyncio.create_task(buffer.flush())
+        await started.wait()
+
+        # The in-flight batch is still readable until it is committed
+        assert buffer.get("a").value == 1
+        buffer.discard(["b"])
+        buffer.discard_tags(["gene:1"])
+        assert buffer.get("a") is None
+        assert buffer.get("b") is None
+        assert buffer.get("c").value == 3
+        assert deleted == []
+
+        release.set()
+        await flush
+        assert deleted == [["a", "b"]]
+        assert buffer.get("c") is None
+        await buffer.stop()
+
+
+@pytest.mark.unit
+class TestCacheServiceWriteBehind:
+    """With write-behind running, sets and L2 hits don't write synchronously."""
+
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        session = MagicMock(spec=Session)
+        cache = CacheService(db_session=session)
+        recorder = FlushRecorder()
+        monkeypatch.setattr(cache, "_flush_write_behind", recorder)
+        cache.recorder = recorder
+        return cache
+
+    async def test_set_is_buffered_and_flushed_on_stop(self, cache):
+        await cache.start_write_behind()
+
+        await cache.set("PKD1", {"id": 1}, "hgnc")
+        await cache.set("PKD1", {"id": 2}, "hgnc")
+        cache.db_session.execute.assert_not_called()
+
+        await cache.stop_write_behind()
+
+        writes, _ = cache.recorder.calls[0]
+        assert [entry.value for entry in writes.values()] == [{"id": 2}]
+
+    async def test_pending_write_is_readable_after_l1_eviction(self, cache):
+        await cache.start_write_behind()
+        await cache.set("PKD1", {"id": 1}, "hgnc")
+        cache.memory_cache.clear()
+
+        assert await cache.get("PKD1", "hgnc") == {"id": 1}
+        cache.db_session.execute.assert_not_called()
+        await cache.stop_write_behind()
+
+    async def test_l2_hit_access_stats_are_buffered(self, cache):
+        await cache.start_write_behind()
+        row = MagicMock(data={"id": 1}, data_format=None, metadata={})
+        cache.db_session.execute.return_value.fetchone.return_value = row
+
+        assert await cache.get("PKD1", "hgnc") == {"id": 1}
+
+        # Only the SELECT ran; the access-count UPDATE waits for the flush
+        assert cache.db_session.execute.call_count == 1
+        await cache.stop_write_behind()
+        _, access = cache.recorder.calls[0]
+        assert access == {cache._generate_cache_key("PKD1", "hgnc"): 1}
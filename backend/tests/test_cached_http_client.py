@@ -1,6 +1,7 @@
-"""Tests for CachedHttpClient redirect and resilience behavior."""
+"""Tests for CachedHttpClient redirect, resilience and request coalescing behavior."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -25,3 +26,73 @@ class TestCachedHttpClientRedirects:
             assert client.http_client.follow_redirects is True, (
                 "CachedHttpClient must create httpx.AsyncClient with follow_redirects=True"
             )
+
+
+def make_client(handler) -> CachedHttpClient:
+    with patch("app.core.cached_http_client.get_cache_service") as mock_cache:
+        mock_cache.return_value = AsyncMock()
+        client = CachedHttpClient(max_retries=0)
+    client.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.unit
+class TestCachedHttpClientCoalescing:
+    """Identical concurrent GETs share one upstream request."""
+
+    @pytest.fixture
+    def upstream(self):
+        calls: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            await asyncio.sleep(0.01)
+            if request.url.path == "/fail":
+                raise httpx.ReadError("boom", request=request)
+            return httpx.Response(200, json={"url": str(request.url)})
+
+        return calls, handler
+
+    async def test_identical_gets_share_one_request(self, upstream):
+        calls, handler = upstream
+        client = make_client(handler)
+
+        responses = await asyncio.gather(
+            *(
+                client.get("https://rest.example.org/genes", params={"symbol": "PKD1"})
+                for _ in range(3)
+            )
+        )
+
+        assert len(calls) == 1
+        assert all(r is responses[0] for r in responses)
+        assert client.coalesced_requests == 2
+        assert client._inflight == {}
+
+    async def test_different_params_and_force_refresh_are_not_shared(self, upstream):
+        calls, handler = upstream
+        client = make_client(handler)
+        url = "https://rest.example.org/genes"
+
+        await asyncio.gather(
+            client.get(url, params={"symbol": "PKD1"}),
+            client.get(url, params={"symbol": "PKD2"}),
+            client.get(url, params={"symbol": "PKD1"}, force_refresh=True),
+        )
+
+        assert len(calls) == 3
+        assert client.coalesced_requests == 0
+
+    async def test_followers_receive_leader_error(self, upstream):
+        calls, handler = upstream
+        client = make_client(handler)
+
+        results = await asyncio.gather(
+            client.get("https://rest.example.org/fail"),
+            client.get("https://rest.example.org/fail"),
+            return_exceptions=True,
+        )
+
+        assert len(calls) == 1
+        assert all(isinstance(r, httpx.RequestError) for r in results)
+        assert client._inflight == {}
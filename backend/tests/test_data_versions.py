@@ -0,0 +1,143 @@
+"""Tests for the data-version registry and data-versioned cache keys."""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import app.core.cache_service as cache_module
+import app.core.database as database_module
+from app.core.cache_bus import CacheInvalidationBus
+from app.core.cache_service import CacheService
+from app.core.data_versions import GENE_SCORES, GENES, DataVersionRegistry, etag_matches
+
+
+def make_registry(**versions: int) -> DataVersionRegistry:
+    """A registry with a fresh local snapshot (no database reads)."""
+    registry = DataVersionRegistry(refresh_interval=3600)
+    registry._versions = dict(versions)
+    registry._loaded_at = time.monotonic()
+    return registry
+
+
+@pytest.mark.unit
+class TestDataVersionRegistry:
+    def test_snapshot_defaults_untracked_versions_to_zero(self):
+        registry = make_registry(genes=3)
+        assert registry.snapshot([GENES, GENE_SCORES]) == {"genes": 3, "gene_scores": 0}
+
+    def test_token_and_etag_change_with_versions(self):
+        registry = make_registry(genes=1, gene_scores=1)
+        token = registry.token([GENE_SCORES, GENES])
+        etag = registry.etag([GENES], "/api/genes", "page[number]=1")
+
+        assert token == "gene_scores=1,genes=1"
+        assert etag.startswith('W/"')
+        assert registry.etag([GENES], "/api/genes", "page[number]=2") != etag
+
+        registry._versions["genes"] = 2
+        assert registry.token([GENE_SCORES, GENES]) != token
+        assert registry.etag([GENES], "/api/genes", "page[number]=1") != etag
+
+    def test_stale_snapshot_is_reloaded(self, monkeypatch):
+        registry = make_registry(genes=1)
+        registry.refresh_interval = 0
+        engine = MagicMock()
+        conn = engine.connect.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = [SimpleNamespace(name="genes", version=7)]
+        monkeypatch.setattr(database_module, "engine", engine)
+
+        assert registry.get(GENES) == 7
+
+    async def test_async_reads_reload_stale_snapshot(self, monkeypatch):
+        registry = make_registry(genes=1)
+        registry.invalidate()
+        engine = MagicMock()
+        conn = engine.connect.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = [SimpleNamespace(name="genes", version=7)]
+        monkeypatch.setattr(database_module, "engine", engine)
+
+        assert await registry.token_async([GENES]) == "genes=7"
+        assert await registry.etag_async([GENES], "/api/genes") == registry.etag(
+            [GENES], "/api/genes"
+        )
+        assert engine.connect.call_count == 1
+
+    def test_failed_reload_keeps_last_snapshot(self, monkeypatch):
+        registry = make_registry(genes=4)
+        registry.invalidate()
+        engine = MagicMock()
+        engine.connect.side_effect = RuntimeError("database unavailable")
+        monkeypatch.setattr(database_module, "engine", engine)
+
+        assert registry.get(GENES) == 4
+        # The failed load is not retried until the interval has passed
+        assert registry.get(GENES) == 4
+        assert engine.connect.call_count == 1
+
+    def test_bump_updates_local_snapshot_and_notifies(self, monkeypatch):
+        import app.core.cache_bus as bus_module
+
+        registry = make_registry(genes=1)
+        engine = MagicMock()
+        conn = engine.begin.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = [SimpleNamespace(name="genes", version=2)]
+        monkeypatch.setattr(database_module, "engine", engine)
+        bus = MagicMock()
+        monkeypatch.setattr(bus_module, "cache_bus", bus)
+
+        assert registry.bump(GENES, GENES) == {"genes": 2}
+        assert conn.execute.call_args.args[1] == {"names": ["genes"]}
+        assert registry.get(GENES) == 2
+        bus.publish_data_versions.assert_called_once()
+
+    def test_etag_matches_if_none_match_lists(self):
+        etag = 'W/"abc"'
+        assert etag_matches('W/"abc"', etag)
+        assert etag_matches('"abc"', etag)  # Weak comparison
+        assert etag_matches('W/"old", W/"abc"', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('W/"old"', etag)
+        assert not etag_matches(None, etag)
+
+    def test_remote_bump_forces_reload(self, monkeypatch):
+        import app.core.data_versions as versions_module
+
+        registry = make_registry(genes=1)
+        monkeypatch.setattr(versions_module, "data_versions", registry)
+        bus = CacheInvalidationBus()
+        payload = json.dumps({"origin": "other", "op": "data_versions"})
+        bus._conn = SimpleNamespace(notifies=[SimpleNamespace(payload=payload)])
+
+        bus._drain()
+
+        assert registry._loaded_at is None
+
+
+@pytest.mark.unit
+class TestVersionedCacheKeys:
+    async def test_get_or_set_recomputes_after_version_bump(self, monkeypatch):
+        registry = make_registry(genes=1)
+        monkeypatch.setattr(cache_module, "data_versions", registry)
+        cache = CacheService(db_session=None)
+        calls = []
+
+        def count_genes():
+            calls.append(1)
+            return len(calls) * 100
+
+        assert await cache.get_or_set("total", count_genes, "gene_count", depends_on=[GENES]) == 100
+        assert await cache.get_or_set("total", count_genes, "gene_count", depends_on=[GENES]) == 100
+
+        registry._versions["genes"] = 2
+        assert await cache.get_or_set("total", count_genes, "gene_count", depends_on=[GENES]) == 200
+        assert len(calls) == 2
+
+    def test_versioned_key_normalizes_structured_keys(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "data_versions", make_registry(genes=5))
+
+        key = CacheService.versioned_key({"b": 1, "a": 2}, [GENES])
+
+        assert key == '{"a": 2, "b": 1}@genes=5'
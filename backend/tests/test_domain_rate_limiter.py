@@ -1,11 +1,19 @@
 """Tests for per-domain rate limiter registry."""
 
 import asyncio
+import json
 import time
+from email.utils import formatdate
 
+import httpx
 import pytest
 
-from app.core.domain_rate_limiter import DomainLimiter, DomainRateLimiterRegistry
+from app.core.domain_rate_limiter import (
+    LOCAL_RESPONSE,
+    DomainLimiter,
+    DomainRateLimiterRegistry,
+    parse_retry_after,
+)
 
 
 class TestDomainRateLimiterRegistry:
@@ -130,3 +138,145 @@ class TestDomainRateLimiterRegistry:
         limiter = DomainLimiter(max_rate=10.0, max_concurrent=5)
         assert limiter.max_rate == 10.0
         assert not limiter.is_paused
+
+
+class TestAdaptiveRate:
+    """AIMD rate adaptation, Retry-After handling and persisted learned rates."""
+
+    @pytest.mark.unit
+    def test_additive_increase_after_sustained_success(self):
+        limiter = DomainLimiter(max_rate=2.0, rate_ceiling=3.0, increase_step=0.5, increase_after=3)
+
+        for _ in range(2):
+            limiter.record_response(200)
+        assert limiter.max_rate == 2.0
+
+        limiter.record_response(404)  # A normal answer, not throttling
+        assert limiter.max_rate == 2.5
+
+        for _ in range(9):
+            limiter.record_response(200)
+        assert limiter.max_rate == 3.0  # Capped at the ceiling
+
+    @pytest.mark.unit
+    def test_multiplicative_decrease_once_per_burst(self):
+        limiter = DomainLimiter(max_rate=8.0, min_rate=1.5)
+
+        limiter.record_response(429, retry_after="2")
+        limiter.record_response(429)  # Same burst of concurrent requests
+        assert limiter.max_rate == 4.0
+        assert limiter.is_paused
+
+        limiter._last_decrease -= 10
+        limiter.record_response(503)
+        limiter._last_decrease -= 10
+        limiter.record_response(503)
+        assert limiter.max_rate == 1.5  # Floored at min_rate
+
+    @pytest.mark.unit
+    def test_server_errors_do_not_change_rate(self):
+        limiter = DomainLimiter(max_rate=4.0, rate_ceiling=8.0, increase_after=1)
+        limiter.record_response(500)
+        assert limiter.max_rate == 4.0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sub_one_per_second_rate(self):
+        limiter = DomainLimiter(max_rate=4.0, min_rate=0.25)
+        limiter._set_rate(0.25)
+
+        start = time.monotonic()
+        await limiter.wait()
+        assert time.monotonic() - start < 0.5
+        assert limiter.min_interval == 4.0
+
+    @pytest.mark.unit
+    def test_parse_retry_after(self):
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        in_a_minute = formatdate(time.time() + 60, usegmt=True)
+        assert 55 <= parse_retry_after(in_a_minute) <= 60
+
+    @pytest.mark.unit
+    def test_learned_rates_persist_between_runs(self, tmp_path):
+        state_path = tmp_path / "rate_limits.json"
+        configs = {"api.example.com": {"max_rate": 2.0, "rate_ceiling": 10.0}}
+        registry = DomainRateLimiterRegistry(domain_configs=configs, state_path=state_path)
+        limiter = registry.get("api.example.com")
+        limiter.increase_after = 1
+
+        limiter.record_success()
+        limiter.record_success()
+
+        assert json.loads(state_path.read_text())["api.example.com"]["max_rate"] == 2.4
+        restarted = DomainRateLimiterRegistry(domain_configs=configs, state_path=state_path)
+        assert restarted.get("api.example.com").max_rate == 2.4
+
+    @pytest.mark.unit
+    async def test_rate_changes_are_saved_in_batches_off_the_loop(self, tmp_path, monkeypatch):
+        import threading
+
+        state_path = tmp_path / "rate_limits.json"
+        configs = {"api.example.com": {"max_rate": 2.0, "rate_ceiling": 10.0}}
+        registry = DomainRateLimiterRegistry(
+            domain_configs=configs, state_path=state_path, save_delay=0.05
+        )
+        limiter = registry.get("api.example.com")
+        limiter.increase_after = 1
+        save_state = registry.save_state
+        threads: list[int] = []
+
+        def recording_save() -> None:
+            threads.append(threading.get_ident())
+            save_state()
+
+        monkeypatch.setattr(registry, "save_state", recording_save)
+
+        for _ in range(3):
+            limiter.record_success()
+        assert not state_path.exists()
+        await asyncio.sleep(0.2)
+
+        assert len(threads) == 1 and threads[0] != threading.get_ident()
+        assert json.loads(state_path.read_text())["api.example.com"]["max_rate"] == 2.6
+        assert [p.name for p in tmp_path.iterdir()] == ["rate_limits.json"]
+
+    @pytest.mark.unit
+    def test_saving_keeps_rates_of_other_processes(self, tmp_path):
+        state_path = tmp_path / "rate_limits.json"
+        configs = {
+            "a.example.com": {"max_rate": 4.0},
+            "b.example.com": {"max_rate": 4.0},
+        }
+        first = DomainRateLimiterRegistry(domain_configs=configs, state_path=state_path)
+        second = DomainRateLimiterRegistry(domain_configs=configs, state_path=state_path)
+        first.get("a.example.com")
+        second.get("a.example.com")
+
+        first.get("a.example.com").record_throttle()
+        second.get("b.example.com").record_throttle()
+
+        state = json.loads(state_path.read_text())
+        assert state["a.example.com"]["max_rate"] == 2.0
+        assert state["b.example.com"]["max_rate"] == 2.0
+
+    @pytest.mark.unit
+    def test_record_response_feeds_the_domain_limiter(self):
+        registry = DomainRateLimiterRegistry(domain_configs={"api.example.com": {"max_rate": 4.0}})
+        limiter = registry.get("api.example.com")
+        request = httpx.Request("GET", "https://api.example.com/x")
+
+        replayed = httpx.Response(
+            429, request=request, extensions={"cassette": "replay", LOCAL_RESPONSE: True}
+        )
+        registry.record_response(replayed)
+        assert limiter.max_rate == 4.0
+
+        registry.record_response(httpx.Response(429, request=request))
+        assert limiter.max_rate == 2.0
+
+        # Domains without a limiter in use are ignored
+        other = httpx.Request("GET", "https://other.example.com/x")
+        registry.record_response(httpx.Response(429, request=other))
+        assert "other.example.com" not in registry._limiters
@@ -33,6 +33,8 @@ class TestHGNCClientCached:
         cache_service = MagicMock()
         cache_service.get = AsyncMock(return_value=None)
         cache_service.set = AsyncMock()
+        cache_service.get_many = AsyncMock(return_value={})
+        cache_service.set_many = AsyncMock(return_value=True)
         cache_service.get_or_set = AsyncMock()
         cache_service.clear_namespace = AsyncMock(return_value=0)
         cache_service.get_stats = AsyncMock(return_value={})
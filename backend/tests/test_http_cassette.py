@@ -0,0 +1,109 @@
+"""Tests for the HTTP record/replay cassette transport."""
+
+import gzip
+import time
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.domain_rate_limiter import LOCAL_RESPONSE
+from app.core.http_cassette import CassetteTransport
+from app.core.http_pool import create_async_client
+
+
+def upstream(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/graphql":
+        return httpx.Response(200, json={"echo": request.content.decode()})
+    if request.url.path == "/gzip":
+        return httpx.Response(
+            200, content=gzip.compress(b"compressed"), headers={"Content-Encoding": "gzip"}
+        )
+    return httpx.Response(200, text=f"page {request.url.params.get('page')}")
+
+
+async def record(tmp_path, *requests):
+    transport = CassetteTransport("record", tmp_path, httpx.MockTransport(upstream))
+    async with httpx.AsyncClient(transport=transport) as client:
+        return [await client.request(*args, **kwargs) for args, kwargs in requests]
+
+
+@pytest.mark.unit
+class TestCassetteTransport:
+    async def test_replay_serves_recorded_responses_offline(self, tmp_path):
+        recorded = await record(
+            tmp_path,
+            (("GET", "https://api.example.com/search"), {"params": {"page": 1}}),
+            (("GET", "https://api.example.com/search"), {"params": {"page": 2}}),
+        )
+        assert [r.text for r in recorded] == ["page 1", "page 2"]
+
+        replay = CassetteTransport("replay", tmp_path)
+        async with httpx.AsyncClient(transport=replay) as client:
+            response = await client.get("https://api.example.com/search", params={"page": 2})
+
+        assert response.status_code == 200
+        assert response.text == "page 2"
+        assert response.extensions["cassette"] == "replay"
+        # Replays must not feed the adaptive rate limiter
+        assert response.extensions[LOCAL_RESPONSE] is True
+        assert LOCAL_RESPONSE not in recorded[0].extensions
+
+    async def test_request_bodies_are_matched(self, tmp_path):
+        await record(
+            tmp_path,
+            (("POST", "https://api.example.com/graphql"), {"content": b"query A"}),
+            (("POST", "https://api.example.com/graphql"), {"content": b"query B"}),
+        )
+
+        async with httpx.AsyncClient(transport=CassetteTransport("replay", tmp_path)) as client:
+            response = await client.post("https://api.example.com/graphql", content=b"query B")
+
+        assert response.json() == {"echo": "query B"}
+
+    async def test_encoded_bodies_round_trip(self, tmp_path):
+        (recorded,) = await record(tmp_path, (("GET", "https://api.example.com/gzip"), {}))
+        assert recorded.content == b"compressed"
+
+        async with httpx.AsyncClient(transport=CassetteTransport("replay", tmp_path)) as client:
+            response = await client.get("https://api.example.com/gzip")
+
+        assert response.content == b"compressed"
+
+    async def test_missing_recording_fails_like_being_offline(self, tmp_path):
+        async with httpx.AsyncClient(transport=CassetteTransport("replay", tmp_path)) as client:
+            with pytest.raises(httpx.ConnectError, match="No cassette recording"):
+                await client.get("https://api.example.com/unknown")
+
+    async def test_replay_latency_is_injected(self, tmp_path):
+        await record(tmp_path, (("GET", "https://api.example.com/search"), {}))
+        replay = CassetteTransport("replay", tmp_path, latency=0.2)
+
+        start = time.monotonic()
+        async with httpx.AsyncClient(transport=replay) as client:
+            await client.get("https://api.example.com/search")
+
+        assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.unit
+class TestCreateAsyncClient:
+    async def test_off_creates_a_plain_client(self, monkeypatch):
+        monkeypatch.setattr(settings, "HTTP_CASSETTE_MODE", "off")
+        async with create_async_client(timeout=5.0) as client:
+            assert not isinstance(client._transport, CassetteTransport)
+
+    async def test_replay_mode_uses_the_configured_archive(self, monkeypatch, tmp_path):
+        await record(tmp_path, (("GET", "https://api.example.com/search"), {}))
+        monkeypatch.setattr(settings, "HTTP_CASSETTE_MODE", "replay")
+        monkeypatch.setattr(settings, "HTTP_CASSETTE_DIR", str(tmp_path))
+
+        async with create_async_client(follow_redirects=True) as client:
+            response = await client.get("https://api.example.com/search")
+
+        assert response.text == "page None"
+
+    def test_unknown_mode_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(settings, "HTTP_CASSETTE_MODE", "rewind")
+        with pytest.raises(ValueError, match="HTTP_CASSETTE_MODE"):
+            create_async_client()
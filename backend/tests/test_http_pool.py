@@ -0,0 +1,187 @@
+"""Tests for the shared per-domain HTTP connection pool."""
+
+import asyncio
+
+import httpcore
+import httpx
+import pytest
+from httpcore._backends.auto import AutoBackend
+
+import app.core.http_pool as http_pool_module
+from app.core.config import settings
+from app.core.http_pool import SharedHttpPool, create_async_client, get_shared_http_pool
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Mock per-domain pool that counts requests and tracks whether it was closed."""
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        self.requests = 0
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return httpx.Response(200, text=self.domain, request=request)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FakeStream(httpcore.AsyncNetworkStream):
+    """TLS-less stream that answers every HTTP/1.1 request with a short 206."""
+
+    def __init__(self) -> None:
+        self._responses = 0
+        self._requests = 0
+
+    async def read(self, max_bytes: int, timeout: float | None = None) -> bytes:
+        if self._responses == self._requests:
+            return b""
+        self._responses += 1
+        return b"HTTP/1.1 206 Partial Content\r\nContent-Length: 2\r\n\r\nok"
+
+    async def write(self, buffer: bytes, timeout: float | None = None) -> None:
+        if buffer.startswith(b"GET"):
+            self._requests += 1
+
+    async def aclose(self) -> None:
+        pass
+
+    async def start_tls(self, ssl_context, server_hostname=None, timeout=None):
+        return self
+
+    def get_extra_info(self, info: str):
+        return None
+
+
+def make_pool(**kwargs) -> tuple[SharedHttpPool, dict[str, RecordingTransport]]:
+    created: dict[str, RecordingTransport] = {}
+
+    def factory(domain: str) -> RecordingTransport:
+        created[domain] = RecordingTransport(domain)
+        return created[domain]
+
+    return SharedHttpPool(transport_factory=factory, **kwargs), created
+
+
+@pytest.mark.unit
+class TestSharedHttpPool:
+    async def test_clients_share_one_pool_per_domain(self):
+        pool, created = make_pool()
+
+        for _ in range(3):
+            async with httpx.AsyncClient(transport=pool.transport()) as client:
+                await client.get("https://a.example.com/x")
+                await client.get("https://b.example.com/y")
+
+        assert set(created) == {"a.example.com", "b.example.com"}
+        assert created["a.example.com"].requests == 3
+        assert pool.domains() == ["a.example.com", "b.example.com"]
+
+    async def test_closing_a_client_keeps_the_pool_open(self):
+        pool, created = make_pool()
+        async with httpx.AsyncClient(transport=pool.transport()) as client:
+            await client.get("https://a.example.com/x")
+
+        assert not created["a.example.com"].closed
+
+        await pool.aclose()
+        assert created["a.example.com"].closed
+        assert pool.domains() == []
+
+    def test_pools_are_not_shared_across_event_loops(self):
+        pool, _ = make_pool()
+
+        async def get_transport():
+            return pool.get("a.example.com")
+
+        first = asyncio.run(get_transport())
+        second = asyncio.run(get_transport())
+
+        assert first is not second
+
+    async def test_pools_are_created_with_http2(self, monkeypatch):
+        created: list[dict] = []
+
+        def transport(**kwargs):
+            created.append(kwargs)
+            return RecordingTransport("a.example.com")
+
+        monkeypatch.setattr(http_pool_module, "HTTP2_AVAILABLE", True)
+        monkeypatch.setattr(httpx, "AsyncHTTPTransport", transport)
+        monkeypatch.setattr(settings, "HTTP_POOL_HTTP2", True)
+        monkeypatch.setattr(http_pool_module, "_pool", None)
+
+        pool = get_shared_http_pool()
+        pool.get("a.example.com")
+
+        assert pool.http2 is True
+        assert created[0]["http2"] is True
+
+    async def test_bulk_hosts_open_one_connection_per_segment(self, monkeypatch):
+        connections = 0
+
+        async def connect_tcp(self, host, port, timeout=None, **kwargs):
+            nonlocal connections
+            connections += 1
+            await asyncio.sleep(0.01)  # Keep the connections pending together
+            return FakeStream()
+
+        monkeypatch.setattr(http_pool_module, "HTTP2_AVAILABLE", True)
+        monkeypatch.setattr(AutoBackend, "connect_tcp", connect_tcp)
+        pool = SharedHttpPool(http2=True, domain_limits=http_pool_module.DEFAULT_DOMAIN_LIMITS)
+        segments = 4
+        try:
+            async with httpx.AsyncClient(transport=pool.transport()) as client:
+                responses = await asyncio.gather(
+                    *(
+                        client.get(
+                            "https://ftp.ncbi.nlm.nih.gov/pub/clinvar/variant_summary.txt.gz",
+                            headers={"Range": f"bytes={i * 2}-{i * 2 + 1}"},
+                        )
+                        for i in range(segments)
+                    )
+                )
+        finally:
+            await pool.aclose()
+
+        assert [r.status_code for r in responses] == [206] * segments
+        assert connections == segments
+
+    async def test_domain_limits_override_defaults(self):
+        pool = SharedHttpPool(
+            http2=False,
+            max_connections=20,
+            domain_limits={"ftp.example.org": {"max_connections": 32}},
+        )
+        try:
+            bulk = pool.get("ftp.example.org")
+            api = pool.get("api.example.org")
+            assert bulk._pool._max_connections == 32
+            assert api._pool._max_connections == 20
+        finally:
+            await pool.aclose()
+
+
+@pytest.mark.unit
+class TestCreateAsyncClientPooling:
+    async def test_clients_use_the_shared_pool(self, monkeypatch):
+        pool, created = make_pool()
+        monkeypatch.setattr(settings, "HTTP_CASSETTE_MODE", "off")
+        monkeypatch.setattr("app.core.http_pool.get_shared_http_pool", lambda: pool)
+
+        async with create_async_client(timeout=5.0) as client:
+            response = await client.get("https://a.example.com/x")
+
+        assert response.text == "a.example.com"
+        assert not created["a.example.com"].closed
+
+    async def test_explicit_transport_bypasses_the_pool(self, monkeypatch):
+        monkeypatch.setattr(settings, "HTTP_CASSETTE_MODE", "off")
+        transport = httpx.MockTransport(lambda request: httpx.Response(204))
+
+        async with create_async_client(transport=transport) as client:
+            response = await client.get("https://a.example.com/x")
+
+        assert response.status_code == 204
@@ -1,11 +1,13 @@
 """Tests for MPO/MGI bulk MouseMine query optimisation."""
 
 import json
+import os
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from app.core.ontology import OntologyIndex
 from app.pipeline.sources.annotations.mpo_mgi import MPOMGIAnnotationSource
 
 # ── Fixtures ────────────────────────────────────────────────────────────
@@ -21,6 +23,16 @@ def source():
     return src
 
 
+@pytest.fixture
+def ontology_dir(tmp_path, monkeypatch):
+    """Point ONTOLOGY_DATA_DIR at a temporary directory."""
+    from app.core.config import settings
+
+    path = tmp_path / "ontologies"
+    monkeypatch.setattr(settings, "ONTOLOGY_DATA_DIR", str(path))
+    return path
+
+
 def _make_gene(gene_id: int, symbol: str) -> MagicMock:
     """Create a mock Gene with id and approved_symbol."""
     g = MagicMock()
@@ -467,7 +479,7 @@ async def test_batch_result_structure_matches_single(source):
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_load_mpo_terms_uses_file_cache(source, tmp_path):
+async def test_load_mpo_terms_uses_file_cache(source, tmp_path, ontology_dir):
     """_load_mpo_terms loads from file cache when it exists."""
     source._mpo_terms_cache = None
     source._mpo_cache_timestamp = None
@@ -482,11 +494,14 @@ async def test_load_mpo_terms_uses_file_cache(source, tmp_path):
         "app.core.datasource_config.ANNOTATION_SOURCE_CONFIG",
         {"mpo_mgi": {"mpo_kidney_terms_file": str(cache_file)}},
     ):
-        with patch.object(
-            source,
-            "fetch_kidney_mpo_terms",
-            new_callable=AsyncMock,
-        ) as mock_api:
+        with (
+            patch.object(source, "_mp_ontology", new_callable=AsyncMock, return_value=None),
+            patch.object(
+                source,
+                "fetch_kidney_mpo_terms",
+                new_callable=AsyncMock,
+            ) as mock_api,
+        ):
             await source._load_mpo_terms()
 
     # API should NOT have been called — the file cache was used
@@ -497,7 +512,7 @@ async def test_load_mpo_terms_uses_file_cache(source, tmp_path):
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_load_mpo_terms_falls_back_to_api(source, tmp_path):
+async def test_load_mpo_terms_falls_back_to_api(source, tmp_path, ontology_dir):
     """_load_mpo_terms falls back to API when file cache doesn't exist."""
     source._mpo_terms_cache = None
     source._mpo_cache_timestamp = None
@@ -509,12 +524,15 @@ async def test_load_mpo_terms_falls_back_to_api(source, tmp_path):
         "app.core.datasource_config.ANNOTATION_SOURCE_CONFIG",
         {"mpo_mgi": {"mpo_kidney_terms_file": str(tmp_path / "nonexistent.json")}},
     ):
-        with patch.object(
-            source,
-            "fetch_kidney_mpo_terms",
-            new_callable=AsyncMock,
-            return_value=mock_terms,
-        ) as mock_api:
+        with (
+            patch.object(source, "_mp_ontology", new_callable=AsyncMock, return_value=None),
+            patch.object(
+                source,
+                "fetch_kidney_mpo_terms",
+                new_callable=AsyncMock,
+                return_value=mock_terms,
+            ) as mock_api,
+        ):
             await source._load_mpo_terms()
 
     mock_api.assert_called_once()
@@ -524,3 +542,115 @@ async def test_load_mpo_terms_falls_back_to_api(source, tmp_path):
     written = tmp_path / "nonexistent.json"
     assert written.exists()
     assert set(json.loads(written.read_text())) == mock_terms
+
+
+def _mp_ontology() -> OntologyIndex:
+    """MP:0005367 (renal/urinary) > MP:0000519 > MP:0000520; MP:0001262 elsewhere."""
+
+    def term(name: str, parents: list[str]) -> dict:
+        return {"name": name, "parents": parents, "alt_ids": []}
+
+    return OntologyIndex(
+        {
+            "MP:0000001": term("mammalian phenotype", []),
+            "MP:0005367": term("renal/urinary system phenotype", ["MP:0000001"]),
+            "MP:0000519": term("hydronephrosis", ["MP:0005367"]),
+            "MP:0000520": term("absent kidney", ["MP:0000519"]),
+            "MP:0001262": term("decreased body weight", ["MP:0000001"]),
+        }
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_load_mpo_terms_uses_local_ontology(source, tmp_path, ontology_dir):
+    """The kidney closure comes from the MP ontology and is stored outside the shipped file."""
+    source._mpo_terms_cache = None
+    source._mpo_cache_timestamp = None
+    cache_file = tmp_path / "mpo_kidney_terms.json"
+    cache_file.write_text(json.dumps(["MP:9999999"]))  # Shipped snapshot
+
+    with patch(
+        "app.core.datasource_config.ANNOTATION_SOURCE_CONFIG",
+        {"mpo_mgi": {"mpo_kidney_terms_file": str(cache_file)}},
+    ):
+        with (
+            patch.object(
+                source, "_mp_ontology", new_callable=AsyncMock, return_value=_mp_ontology()
+            ),
+            patch.object(source, "get_http_client") as mock_http,
+        ):
+            await source._load_mpo_terms()
+
+    mock_http.assert_not_called()
+    expected = {"MP:0005367", "MP:0000519", "MP:0000520"}
+    assert source._mpo_terms_cache == expected
+    assert json.loads(cache_file.read_text()) == ["MP:9999999"]
+    derived_file = ontology_dir / "mp_kidney_terms.json"
+    assert set(json.loads(derived_file.read_text())) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_load_mpo_terms_skips_unchanged_derived_file(source, tmp_path, ontology_dir):
+    """An up-to-date derived terms file is not rewritten on the next load."""
+    derived_file = ontology_dir / "mp_kidney_terms.json"
+    ontology_dir.mkdir()
+    derived_file.write_text(json.dumps(["MP:0000519", "MP:0000520", "MP:0005367"]))
+    os.utime(derived_file, ns=(0, 0))
+
+    with patch(
+        "app.core.datasource_config.ANNOTATION_SOURCE_CONFIG",
+        {"mpo_mgi": {"mpo_kidney_terms_file": str(tmp_path / "mpo_kidney_terms.json")}},
+    ):
+        with patch.object(
+            source, "_mp_ontology", new_callable=AsyncMock, return_value=_mp_ontology()
+        ):
+            await source._load_mpo_terms()
+
+    assert derived_file.stat().st_mtime_ns == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_load_mpo_terms_prefers_derived_file(source, tmp_path, ontology_dir):
+    """Without the ontology, the last derived closure wins over the shipped snapshot."""
+    source._mpo_terms_cache = None
+    cache_file = tmp_path / "mpo_kidney_terms.json"
+    cache_file.write_text(json.dumps(["MP:9999999"]))
+    ontology_dir.mkdir()
+    (ontology_dir / "mp_kidney_terms.json").write_text(json.dumps(["MP:0000519"]))
+
+    with patch(
+        "app.core.datasource_config.ANNOTATION_SOURCE_CONFIG",
+        {"mpo_mgi": {"mpo_kidney_terms_file": str(cache_file)}},
+    ):
+        with patch.object(source, "_mp_ontology", new_callable=AsyncMock, return_value=None):
+            await source._load_mpo_terms()
+
+    assert source._mpo_terms_cache == {"MP:0000519"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_zygosity_names_terms_from_ontology(source):
+    """Term names come from the local ontology; rows without a name are kept."""
+    source._mp_index = _mp_ontology()
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "results": [
+            ["MGI:1", "Pkd1", "B6", "hm", "MP:0000520", ""],
+            ["MGI:1", "Pkd1", "B6", "ht", "MP:0000519", "old hydronephrosis label"],
+        ]
+    }
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_response
+
+    with patch.object(source, "get_http_client", return_value=mock_client):
+        with patch.object(source, "apply_rate_limit", new_callable=AsyncMock):
+            result = await source._bulk_query_zygosity({"PKD1": ["Pkd1"]}, source._mpo_terms_cache)
+
+    zyg = result["PKD1"]
+    assert zyg["homozygous"]["phenotypes"] == [{"term": "MP:0000520", "name": "absent kidney"}]
+    assert zyg["heterozygous"]["phenotypes"] == [{"term": "MP:0000519", "name": "hydronephrosis"}]
@@ -0,0 +1,107 @@
+"""Tests for building PPI graphs from the STRING edge store."""
+
+import gzip
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import igraph as ig
+import pytest
+
+from app.pipeline.sources.annotations.string_edges import StringEdgeStore
+from app.services.network_analysis_service import NetworkAnalysisService
+
+PROTEIN_INFO = (
+    "#string_protein_id\tpreferred_name\tprotein_size\tannotation\n"
+    "9606.ENSP01\tPKD1\t4303\tPolycystin-1\n"
+    "9606.ENSP02\tPKD2\t968\tPolycystin-2\n"
+    "9606.ENSP03\tNPHS1\t1241\tNephrin\n"
+    "9606.ENSP04\tPKD1\t4302\tPolycystin-1 isoform\n"
+    "9606.ENSP05\tNPHS2\t383\tPodocin\n"
+)
+
+LINKS = (
+    "protein1 protein2 combined_score\n"
+    "9606.ENSP01 9606.ENSP02 900\n"
+    "9606.ENSP02 9606.ENSP04 950\n"
+    "9606.ENSP01 9606.ENSP04 990\n"
+    "9606.ENSP03 9606.ENSP01 350\n"
+    "9606.ENSP03 9606.ENSP05 800\n"
+)
+
+# Gene ID → symbol; NPHS2 is in the store but not in the network
+GENES = {1: "PKD1", 2: "PKD2", 3: "NPHS1"}
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> StringEdgeStore:
+    info = tmp_path / "9606.protein.info.v12.0.txt.gz"
+    links = tmp_path / "9606.protein.physical.links.v12.0.txt"
+    info.write_bytes(gzip.compress(PROTEIN_INFO.encode()))
+    links.write_text(LINKS)
+    return StringEdgeStore.build(tmp_path / "edges", "12.0", info, links)
+
+
+def _db(gene_ids: list[int]) -> MagicMock:
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        (gene_id, GENES[gene_id]) for gene_id in gene_ids
+    ]
+    return db
+
+
+def _edges(store: StringEdgeStore, gene_ids: list[int], min_score: int = 0):
+    edges, scores = NetworkAnalysisService._string_edges_from_store(
+        _db(gene_ids), store, gene_ids, min_score
+    )
+    pairs = [(gene_ids[a], gene_ids[b]) for a, b in edges]
+    return sorted((min(pair), max(pair), score) for pair, score in zip(pairs, scores, strict=True))
+
+
+@pytest.mark.unit
+class TestStringEdgesFromStore:
+    def test_isoform_and_reverse_duplicates_keep_highest_score(self, store) -> None:
+        # ENSP01/ENSP04 are both PKD1: PKD1-PKD2 at 900 and (reversed) 950
+        assert _edges(store, [1, 2, 3]) == [(1, 2, 950), (1, 3, 350)]
+
+    def test_self_interactions_are_dropped(self, store) -> None:
+        # The PKD1 isoform pair (990) maps to one gene
+        assert _edges(store, [1]) == []
+
+    def test_min_score_filters_edges(self, store) -> None:
+        assert _edges(store, [1, 2, 3], min_score=400) == [(1, 2, 950)]
+        assert _edges(store, [1, 2, 3], min_score=960) == []
+
+    def test_genes_outside_the_network_are_ignored(self, store) -> None:
+        # NPHS1-NPHS2 (800) has no vertex for NPHS2
+        assert _edges(store, [3, 2]) == []
+
+
+@pytest.mark.unit
+class TestStringEdgeSource:
+    def test_source_names_store_version(self, store) -> None:
+        with patch(
+            "app.pipeline.sources.annotations.string_edges.get_string_edge_store",
+            return_value=store,
+        ):
+            assert NetworkAnalysisService.string_edge_source() == "store:12.0"
+
+    def test_source_without_store_is_annotations(self) -> None:
+        with patch(
+            "app.pipeline.sources.annotations.string_edges.get_string_edge_store",
+            return_value=None,
+        ):
+            assert NetworkAnalysisService.string_edge_source() == "annotations"
+
+    async def test_graph_cache_is_keyed_by_edge_source(self) -> None:
+        service = NetworkAnalysisService()
+        service._build_graph_sync = MagicMock(side_effect=lambda ids, score: ig.Graph(len(ids)))
+
+        with patch.object(NetworkAnalysisService, "string_edge_source", return_value="annotations"):
+            fallback = await service.build_network_from_string_data([1, 2], session=None)
+        with patch.object(NetworkAnalysisService, "string_edge_source", return_value="store:12.0"):
+            from_store = await service.build_network_from_string_data([1, 2], session=None)
+            cached = await service.build_network_from_string_data([1, 2], session=None)
+
+        assert from_store is not fallback
+        assert cached is from_store
+        assert service._build_graph_sync.call_count == 2
@@ -416,3 +416,23 @@ class TestHelperFunctions:
         assert len(colors) == 25
         # Colors should cycle: color[0] == color[20]
         assert colors[0] == colors[20]
+
+    def test_network_cache_key_uses_body_and_edge_source(self):
+        """Graph responses are cached per request body and STRING edge source."""
+        from app.api.endpoints import network_analysis
+        from app.schemas.network import NetworkBuildRequest
+
+        func = inspect.unwrap(network_analysis.build_network)
+        body = NetworkBuildRequest(gene_ids=[2, 1], min_string_score=400)
+
+        def key(source: str, **kwargs) -> str:
+            with patch.object(
+                network_analysis.network_service, "string_edge_source", return_value=source
+            ):
+                return network_analysis.network_cache_key(func, **kwargs)
+
+        store_key = key("store:12.0", request=MagicMock(), response=MagicMock(), body=body)
+
+        # Request objects do not make every key unique
+        assert store_key == key("store:12.0", request=MagicMock(), response=None, body=body)
+        assert store_key != key("annotations", request=MagicMock(), response=None, body=body)